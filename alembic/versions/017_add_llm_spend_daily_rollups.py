@@ -0,0 +1,73 @@
+"""add_llm_spend_daily_rollups
+
+Revision ID: 017
+Revises: f031ea488d6d
+Create Date: 2025-11-24
+
+Description: Add llm_spend_daily_rollups (daily spend per tenant, model group
+and agent tag) and llm_spend_rollup_state (rollup high-water mark). The cost
+dashboard reads complete days from the rollup instead of aggregating
+LiteLLM_SpendLogs on every load.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, Sequence[str], None] = 'f031ea488d6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create rollup and state tables.
+    """
+    op.create_table(
+        'llm_spend_daily_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('tenant_id', sa.String(length=255), nullable=False),
+        sa.Column('model_group', sa.String(length=255), nullable=False),
+        sa.Column('agent_tag', sa.String(length=255), nullable=False),
+        sa.Column('spend', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('prompt_tokens', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('completion_tokens', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('total_tokens', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('request_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()'),
+        ),
+        sa.PrimaryKeyConstraint('day', 'tenant_id', 'model_group', 'agent_tag'),
+    )
+    op.create_index(
+        'idx_llm_spend_rollups_tenant_day',
+        'llm_spend_daily_rollups',
+        ['tenant_id', 'day'],
+    )
+
+    op.create_table(
+        'llm_spend_rollup_state',
+        sa.Column('name', sa.String(length=50), primary_key=True),
+        sa.Column('high_water_mark', sa.DateTime(timezone=False), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()'),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop rollup and state tables.
+    """
+    op.drop_table('llm_spend_rollup_state')
+    op.drop_index('idx_llm_spend_rollups_tenant_day', table_name='llm_spend_daily_rollups')
+    op.drop_table('llm_spend_daily_rollups')
@@ -0,0 +1,149 @@
+"""add_llm_spend_attributions
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-11-25
+
+Description: Add llm_spend_attributions, an indexed mirror of the agent tags
+("agent:", "agent_id:", "execution:") on LiteLLM_SpendLogs, and an AFTER
+INSERT trigger that fills it at ingestion time. Per-agent cost queries read
+this table instead of unnesting request_tags.
+
+Existing spend logs are backfilled by the spend rollup task, which sweeps
+each window into this table as well (ON CONFLICT DO NOTHING).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, Sequence[str], None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create attribution table and capture trigger.
+
+    The trigger swallows its own errors so attribution can never block
+    LiteLLM from writing spend logs; missed rows are picked up by the sweep.
+    LiteLLM creates its tables on proxy startup, so the trigger is only
+    attached if LiteLLM_SpendLogs already exists.
+    """
+    op.create_table(
+        'llm_spend_attributions',
+        sa.Column('request_id', sa.String(length=255), primary_key=True),
+        sa.Column('start_time', sa.DateTime(timezone=False), nullable=False),
+        sa.Column('tenant_id', sa.String(length=255), nullable=True),
+        sa.Column('agent_name', sa.String(length=255), nullable=False),
+        sa.Column('agent_id', sa.String(length=36), nullable=True),
+        sa.Column('execution_id', sa.String(length=255), nullable=True),
+        sa.Column('model_group', sa.String(length=255), nullable=True),
+        sa.Column('spend', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completion_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_tokens', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index(
+        'idx_llm_spend_attr_tenant_agent_time',
+        'llm_spend_attributions',
+        ['tenant_id', 'agent_name', 'start_time'],
+    )
+    op.create_index(
+        'idx_llm_spend_attr_agent_time',
+        'llm_spend_attributions',
+        ['agent_name', 'start_time'],
+    )
+    op.create_index(
+        'idx_llm_spend_attr_execution',
+        'llm_spend_attributions',
+        ['execution_id'],
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION llm_spend_attribution_capture()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            v_tags JSONB;
+            v_agent TEXT;
+            v_agent_id TEXT;
+            v_execution_id TEXT;
+        BEGIN
+            IF NEW.request_tags IS NULL THEN
+                RETURN NEW;
+            END IF;
+            v_tags := NEW.request_tags::jsonb;
+            IF jsonb_typeof(v_tags) <> 'array' THEN
+                RETURN NEW;
+            END IF;
+
+            SELECT substr(t, 7) INTO v_agent
+            FROM jsonb_array_elements_text(v_tags) AS t
+            WHERE t LIKE 'agent:%' LIMIT 1;
+            IF v_agent IS NULL THEN
+                RETURN NEW;
+            END IF;
+
+            SELECT substr(t, 10) INTO v_agent_id
+            FROM jsonb_array_elements_text(v_tags) AS t
+            WHERE t LIKE 'agent\\_id:%' LIMIT 1;
+            SELECT substr(t, 11) INTO v_execution_id
+            FROM jsonb_array_elements_text(v_tags) AS t
+            WHERE t LIKE 'execution:%' LIMIT 1;
+
+            BEGIN
+                INSERT INTO llm_spend_attributions (
+                    request_id, start_time, tenant_id, agent_name, agent_id,
+                    execution_id, model_group, spend,
+                    prompt_tokens, completion_tokens, total_tokens
+                ) VALUES (
+                    NEW.request_id, NEW."startTime", NEW.end_user, v_agent,
+                    left(v_agent_id, 36), v_execution_id, NEW.model_group,
+                    COALESCE(NEW.spend, 0), COALESCE(NEW.prompt_tokens, 0),
+                    COALESCE(NEW.completion_tokens, 0), COALESCE(NEW.total_tokens, 0)
+                )
+                ON CONFLICT (request_id) DO NOTHING;
+            EXCEPTION WHEN OTHERS THEN
+                RAISE WARNING 'llm_spend_attribution_capture failed: %', SQLERRM;
+            END;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('"LiteLLM_SpendLogs"') IS NOT NULL THEN
+                DROP TRIGGER IF EXISTS trg_llm_spend_attribution ON "LiteLLM_SpendLogs";
+                CREATE TRIGGER trg_llm_spend_attribution
+                    AFTER INSERT ON "LiteLLM_SpendLogs"
+                    FOR EACH ROW EXECUTE FUNCTION llm_spend_attribution_capture();
+            END IF;
+        END;
+        $$
+    """)
+
+
+def downgrade() -> None:
+    """
+    Drop capture trigger, function and attribution table.
+    """
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('"LiteLLM_SpendLogs"') IS NOT NULL THEN
+                DROP TRIGGER IF EXISTS trg_llm_spend_attribution ON "LiteLLM_SpendLogs";
+            END IF;
+        END;
+        $$
+    """)
+    op.execute("DROP FUNCTION IF EXISTS llm_spend_attribution_capture()")
+    op.drop_index('idx_llm_spend_attr_execution', table_name='llm_spend_attributions')
+    op.drop_index('idx_llm_spend_attr_agent_time', table_name='llm_spend_attributions')
+    op.drop_index('idx_llm_spend_attr_tenant_agent_time', table_name='llm_spend_attributions')
+    op.drop_table('llm_spend_attributions')
@@ -0,0 +1,144 @@
+"""partition_mcp_server_metrics
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-11-26
+
+Description: Convert mcp_server_metrics into a table range-partitioned by
+check_timestamp with one partition per UTC day. Retention then detaches and
+drops whole partitions (src/services/mcp_metrics_partitions.py) instead of
+running a bulk DELETE, and time-bounded aggregations only scan the partitions
+they need.
+
+The primary key becomes (id, check_timestamp) because a partitioned table's
+unique constraints must include the partition key. Metrics inside the 7-day
+retention window are copied across; older rows are discarded.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, Sequence[str], None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Days of existing metrics kept (retention + 1 for the partial cutoff day)
+KEEP_DAYS = 8
+# Days of partitions created ahead (the maintenance task keeps this topped up)
+DAYS_AHEAD = 7
+
+COLUMNS = (
+    "id, mcp_server_id, tenant_id, response_time_ms, check_timestamp, status, "
+    "error_message, error_type, check_type, transport_type, created_at"
+)
+
+INDEXES = (
+    ('idx_mcp_metrics_server_time', 'mcp_server_id, check_timestamp DESC'),
+    ('idx_mcp_metrics_tenant', 'tenant_id'),
+    ('idx_mcp_metrics_status_time', 'status, check_timestamp DESC'),
+)
+
+
+def _rename_indexes(suffix_from: str, suffix_to: str) -> None:
+    for name, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name}{suffix_from} RENAME TO {name}{suffix_to}")
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON mcp_server_metrics ({columns})")
+
+
+def upgrade() -> None:
+    """
+    Rebuild mcp_server_metrics as a daily range-partitioned table.
+    """
+    op.execute("ALTER TABLE mcp_server_metrics RENAME TO mcp_server_metrics_legacy")
+    op.execute(
+        "ALTER TABLE mcp_server_metrics_legacy "
+        "RENAME CONSTRAINT mcp_server_metrics_pkey TO mcp_server_metrics_legacy_pkey"
+    )
+    _rename_indexes('', '_legacy')
+
+    op.execute("""
+        CREATE TABLE mcp_server_metrics (
+            id UUID NOT NULL DEFAULT uuid_generate_v4(),
+            mcp_server_id UUID NOT NULL
+                REFERENCES mcp_servers(id) ON DELETE CASCADE,
+            tenant_id VARCHAR(100) NOT NULL
+                REFERENCES tenant_configs(tenant_id) ON DELETE CASCADE,
+            response_time_ms INTEGER NOT NULL,
+            check_timestamp TIMESTAMPTZ NOT NULL DEFAULT now(),
+            status VARCHAR(20) NOT NULL,
+            error_message TEXT,
+            error_type VARCHAR(100),
+            check_type VARCHAR(50) NOT NULL,
+            transport_type VARCHAR(20) NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, check_timestamp)
+        ) PARTITION BY RANGE (check_timestamp)
+    """)
+
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=KEEP_DAYS)
+    for offset in range(KEEP_DAYS + DAYS_AHEAD + 1):
+        day = first_day + timedelta(days=offset)
+        op.execute(
+            f'CREATE TABLE "mcp_server_metrics_p{day:%Y%m%d}" PARTITION OF mcp_server_metrics '
+            f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+            f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+        )
+
+    _create_indexes()
+
+    op.execute(
+        f"INSERT INTO mcp_server_metrics ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM mcp_server_metrics_legacy "
+        f"WHERE check_timestamp >= '{first_day.isoformat()} 00:00:00+00' "
+        f"AND check_timestamp < '{(today + timedelta(days=DAYS_AHEAD + 1)).isoformat()} 00:00:00+00'"
+    )
+    op.drop_table('mcp_server_metrics_legacy')
+
+
+def downgrade() -> None:
+    """
+    Restore mcp_server_metrics as a plain table, keeping current metrics.
+    """
+    op.execute("ALTER TABLE mcp_server_metrics RENAME TO mcp_server_metrics_partitioned")
+    _rename_indexes('', '_partitioned')
+
+    op.create_table(
+        'mcp_server_metrics',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True,
+                  server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('mcp_server_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('mcp_servers.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('tenant_id', sa.String(100),
+                  sa.ForeignKey('tenant_configs.tenant_id', ondelete='CASCADE',
+                                name='mcp_server_metrics_tenant_id_fkey'),
+                  nullable=False),
+        sa.Column('response_time_ms', sa.Integer(), nullable=False),
+        sa.Column('check_timestamp', sa.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.text('now()')),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('error_type', sa.String(100), nullable=True),
+        sa.Column('check_type', sa.String(50), nullable=False),
+        sa.Column('transport_type', sa.String(20), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.text('now()')),
+    )
+    _create_indexes()
+
+    op.execute(
+        f"INSERT INTO mcp_server_metrics ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM mcp_server_metrics_partitioned"
+    )
+    # Dropping the parent drops all attached partitions
+    op.execute("DROP TABLE mcp_server_metrics_partitioned")
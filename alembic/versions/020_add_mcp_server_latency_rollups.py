@@ -0,0 +1,56 @@
+"""add_mcp_server_latency_rollups
+
+Revision ID: 020
+Revises: 019
+Create Date: 2025-11-27
+
+Description: Add mcp_server_latency_rollups, a per-server, per-minute
+latency histogram written alongside each health metric. Dashboard
+percentiles merge these histograms instead of running PERCENTILE_CONT over
+raw mcp_server_metrics rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '020'
+down_revision: Union[str, Sequence[str], None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create mcp_server_latency_rollups.
+
+    The (mcp_server_id, bucket_start) primary key serves both the per-minute
+    upsert and the per-server time-window dashboard queries.
+    """
+    op.create_table(
+        'mcp_server_latency_rollups',
+        sa.Column(
+            'mcp_server_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('mcp_servers.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('bucket_start', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column('tenant_id', sa.String(100), nullable=False),
+        sa.Column('check_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('success_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sum_response_time_ms', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('max_response_time_ms', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('histogram', postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.PrimaryKeyConstraint('mcp_server_id', 'bucket_start'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop mcp_server_latency_rollups.
+    """
+    op.drop_table('mcp_server_latency_rollups')
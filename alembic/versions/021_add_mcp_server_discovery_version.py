@@ -0,0 +1,41 @@
+"""add_mcp_server_discovery_version
+
+Revision ID: 021
+Revises: 020
+Create Date: 2025-11-28
+
+Description: Add mcp_servers.discovery_version, bumped whenever discovery or
+the health monitor observes changed capabilities. Worker-local capability
+caches key on (server id, discovery_version) so agent runs build tool
+wrappers from the stored capabilities without contacting the server.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '021'
+down_revision: Union[str, Sequence[str], None] = '020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add discovery_version (existing rows start at 0)."""
+    op.add_column(
+        'mcp_servers',
+        sa.Column(
+            'discovery_version',
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text('0'),
+            comment='Incremented when discovered tools/resources/prompts change',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop discovery_version."""
+    op.drop_column('mcp_servers', 'discovery_version')
@@ -0,0 +1,42 @@
+"""add_mcp_server_tool_cache_policies
+
+Revision ID: 022
+Revises: 021
+Create Date: 2025-11-29
+
+Description: Add mcp_servers.tool_cache_policies, a JSONB object mapping tool
+names to result cache policies ({"read_only": true, "ttl_seconds": 300,
+"scope": "tenant"}). Calls to tools marked read-only are answered from the
+Redis result cache for identical arguments until the TTL expires.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '022'
+down_revision: Union[str, Sequence[str], None] = '021'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add tool_cache_policies (existing rows cache nothing)."""
+    op.add_column(
+        'mcp_servers',
+        sa.Column(
+            'tool_cache_policies',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+            comment='Per-tool result cache policies keyed by tool name',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop tool_cache_policies."""
+    op.drop_column('mcp_servers', 'tool_cache_policies')
@@ -0,0 +1,103 @@
+"""convert_agent_memory_embedding_to_vector
+
+Revision ID: 023
+Revises: 022
+Create Date: 2025-11-30
+
+Description: Store agent memory embeddings in a native pgvector vector(1536)
+column with an HNSW cosine index. Semantic memory search previously cast a
+text column to vector on every query and scanned all rows.
+
+The text column is renamed to embedding_legacy instead of being converted in
+place, so the migration takes no table rewrite and cannot fail on malformed
+rows. Existing embeddings are moved into the new column by the
+backfill_memory_embeddings task (src/services/agent_memory_backfill.py),
+which reads them through the partial index idx_agent_memory_embedding_legacy.
+
+Search defaults are set on the database: hnsw.ef_search = 100 and, with
+pgvector 0.8+, hnsw.iterative_scan = relaxed_order, so searches filtered by
+agent and memory type keep scanning the graph until enough rows match.
+Requires the pgvector extension to be available (pgvector/pgvector image).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '023'
+down_revision: Union[str, Sequence[str], None] = '022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add vector column and indexes, keep text embeddings for the backfill.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+
+    op.alter_column('agent_memory', 'embedding', new_column_name='embedding_legacy')
+    op.execute('ALTER TABLE agent_memory ADD COLUMN embedding vector(1536)')
+
+    # The new column is empty, so building the index takes no time; backfilled
+    # rows are inserted into the graph as they are converted
+    op.execute("""
+        CREATE INDEX idx_agent_memory_embedding_hnsw
+        ON agent_memory USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+    op.create_index(
+        'idx_agent_memory_embedding_legacy',
+        'agent_memory',
+        ['id'],
+        postgresql_where=sa.text('embedding_legacy IS NOT NULL'),
+    )
+
+    op.execute("""
+        DO $$
+        BEGIN
+            EXECUTE format('ALTER DATABASE %I SET hnsw.ef_search = 100', current_database());
+            IF (
+                SELECT string_to_array(extversion, '.')::int[] >= ARRAY[0, 8]
+                FROM pg_extension WHERE extname = 'vector'
+            ) THEN
+                EXECUTE format(
+                    'ALTER DATABASE %I SET hnsw.iterative_scan = relaxed_order',
+                    current_database()
+                );
+            END IF;
+        EXCEPTION WHEN insufficient_privilege THEN
+            RAISE WARNING 'Cannot set HNSW search defaults on database %', current_database();
+        END;
+        $$
+    """)
+
+
+def downgrade() -> None:
+    """
+    Restore the text embedding column (converting backfilled vectors back).
+    """
+    op.execute("""
+        DO $$
+        BEGIN
+            EXECUTE format('ALTER DATABASE %I RESET hnsw.iterative_scan', current_database());
+            EXECUTE format('ALTER DATABASE %I RESET hnsw.ef_search', current_database());
+        EXCEPTION WHEN insufficient_privilege THEN
+            RAISE WARNING 'Cannot reset HNSW search defaults on database %', current_database();
+        END;
+        $$
+    """)
+
+    op.execute("""
+        UPDATE agent_memory
+        SET embedding_legacy = embedding::text
+        WHERE embedding IS NOT NULL
+    """)
+    op.drop_index('idx_agent_memory_embedding_legacy', table_name='agent_memory')
+    op.drop_index('idx_agent_memory_embedding_hnsw', table_name='agent_memory')
+    op.drop_column('agent_memory', 'embedding')
+    op.alter_column('agent_memory', 'embedding_legacy', new_column_name='embedding')
+
+    # Note: pgvector extension is not dropped to avoid breaking other potential uses
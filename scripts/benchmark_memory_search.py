@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Agent Memory Vector Search Benchmark
+
+Measures recall and latency of the HNSW cosine index that serves semantic
+agent memory search (migration 023) at production scale, by default 1M
+memories of 1536 dimensions.
+
+Synthetic memories are loaded into a scratch table shaped like agent_memory
+(agent_id, memory_type, vector(1536) embedding) with the same HNSW index
+(m = 16, ef_construction = 64) and a btree index on agent_id. Embeddings are
+drawn around random cluster centres, so neighbourhoods are as uneven as real
+embeddings; queries are fresh draws from the same distribution. For each
+hnsw.ef_search value the script reports, for searches over all memories and
+searches filtered to one agent (MemoryConfigService.retrieve_memory):
+
+- recall@k: share of the exact top-k (index scans disabled) found by the index
+- p50/p95/p99 latency of the search query
+- whether the planner used the HNSW index
+
+The exact searches are also timed; they are a lower bound for the previous
+implementation, which additionally parsed every row's text embedding.
+
+The scratch table lives in the database of AI_AGENTS_DATABASE_URL and is
+dropped afterwards unless --keep is given; agent_memory is not touched.
+Loading 1M rows writes about 6 GB and building the index takes a while; use
+--keep and --reuse to rerun queries against an already built table.
+
+Usage:
+    python scripts/benchmark_memory_search.py
+    python scripts/benchmark_memory_search.py --rows 100000 --ef-search 40 100 200
+    python scripts/benchmark_memory_search.py --keep
+    python scripts/benchmark_memory_search.py --reuse --queries 500 --json-output results.json
+
+Exit Codes:
+    0 = Benchmark completed
+    1 = Invalid arguments or database not configured
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from time import perf_counter
+from typing import Any, Dict, List
+
+import asyncpg
+import numpy as np
+from pgvector.asyncpg import register_vector
+
+TABLE = "agent_memory_search_benchmark"
+DIMENSIONS = 1536
+LOAD_CHUNK_ROWS = 10_000
+
+_SEARCH_SQL = f"""
+    SELECT id FROM {TABLE}
+    WHERE memory_type = 'long_term'
+    ORDER BY embedding <=> $1
+    LIMIT $2
+"""
+_FILTERED_SEARCH_SQL = f"""
+    SELECT id FROM {TABLE}
+    WHERE agent_id = $3 AND memory_type = 'long_term'
+    ORDER BY embedding <=> $1
+    LIMIT $2
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark recall and latency of agent memory vector search"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Memories to load")
+    parser.add_argument("--agents", type=int, default=1_000, help="Agents owning the memories")
+    parser.add_argument("--clusters", type=int, default=2_000, help="Embedding cluster centres")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per measurement")
+    parser.add_argument("-k", type=int, default=5, help="Results per search (retrieve_memory limit)")
+    parser.add_argument(
+        "--ef-search", type=int, nargs="+", default=[40, 100, 200], help="hnsw.ef_search values"
+    )
+    parser.add_argument(
+        "--maintenance-work-mem", default="4GB", help="maintenance_work_mem for the index build"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch table")
+    parser.add_argument("--reuse", action="store_true", help="Reuse a table kept by --keep")
+    parser.add_argument("--json-output", help="Write results as JSON to this path")
+    return parser.parse_args()
+
+
+def database_url() -> str:
+    """Database URL in asyncpg form (without the SQLAlchemy driver suffix)."""
+    url = os.getenv("AI_AGENTS_DATABASE_URL")
+    if not url:
+        print("AI_AGENTS_DATABASE_URL is not set", file=sys.stderr)
+        sys.exit(1)
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def embeddings(rng: np.random.Generator, centres: np.ndarray, count: int) -> np.ndarray:
+    """Unit vectors scattered around randomly chosen cluster centres."""
+    points = centres[rng.integers(0, len(centres), count)]
+    points = points + rng.normal(scale=0.6 / np.sqrt(DIMENSIONS), size=points.shape)
+    return (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(np.float32)
+
+
+async def load(conn: asyncpg.Connection, args: argparse.Namespace, rng, centres) -> float:
+    """Create and fill the scratch table, then build its indexes; returns build seconds."""
+    await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    await conn.execute(
+        f"""
+        CREATE UNLOGGED TABLE {TABLE} (
+            id bigserial PRIMARY KEY,
+            agent_id integer NOT NULL,
+            memory_type varchar(20) NOT NULL,
+            embedding vector({DIMENSIONS})
+        )
+        """
+    )
+
+    loaded = 0
+    while loaded < args.rows:
+        count = min(LOAD_CHUNK_ROWS, args.rows - loaded)
+        vectors = embeddings(rng, centres, count)
+        agents = rng.integers(0, args.agents, count)
+        await conn.copy_records_to_table(
+            TABLE,
+            records=[
+                (int(agent), "long_term", vector) for agent, vector in zip(agents, vectors)
+            ],
+            columns=["agent_id", "memory_type", "embedding"],
+        )
+        loaded += count
+        print(f"\rLoaded {loaded:,}/{args.rows:,} memories", end="", flush=True)
+    print()
+
+    await conn.execute(f"CREATE INDEX ON {TABLE} (agent_id)")
+    await conn.execute(f"SET maintenance_work_mem = '{args.maintenance_work_mem}'")
+    started = perf_counter()
+    await conn.execute(
+        f"""
+        CREATE INDEX {TABLE}_hnsw ON {TABLE}
+        USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)
+        """
+    )
+    build_seconds = perf_counter() - started
+    await conn.execute(f"ANALYZE {TABLE}")
+    print(f"Built HNSW index in {build_seconds:.1f}s")
+    return build_seconds
+
+
+async def exact_results(
+    conn: asyncpg.Connection, sql: str, params: List[tuple]
+) -> tuple[List[set], List[float]]:
+    """Exact top-k per query (index scans off, so no HNSW) and their latencies."""
+    results, latencies = [], []
+    async with conn.transaction():
+        await conn.execute("SET LOCAL enable_indexscan = off")
+        for query_params in params:
+            started = perf_counter()
+            rows = await conn.fetch(sql, *query_params)
+            latencies.append(perf_counter() - started)
+            results.append({row["id"] for row in rows})
+    return results, latencies
+
+
+async def measure(
+    conn: asyncpg.Connection, sql: str, params: List[tuple], exact: List[set], k: int
+) -> Dict[str, Any]:
+    """Recall and latency of index searches against exact results."""
+    for query_params in params[:10]:  # Warm up caches
+        await conn.fetch(sql, *query_params)
+
+    recalls, latencies = [], []
+    for query_params, expected in zip(params, exact):
+        started = perf_counter()
+        rows = await conn.fetch(sql, *query_params)
+        latencies.append(perf_counter() - started)
+        recalls.append(len({row["id"] for row in rows} & expected) / min(k, len(expected) or 1))
+
+    plan = "\n".join(row[0] for row in await conn.fetch(f"EXPLAIN {sql}", *params[0]))
+    return {
+        "recall": float(np.mean(recalls)),
+        "uses_hnsw": f"{TABLE}_hnsw" in plan,
+        **latency_summary(latencies),
+    }
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = np.random.default_rng(args.seed)
+    centres = rng.normal(size=(args.clusters, DIMENSIONS))
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+
+    conn = await asyncpg.connect(database_url())
+    try:
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        await register_vector(conn)
+        version = await conn.fetchval("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+
+        build_seconds = None
+        if not args.reuse:
+            build_seconds = await load(conn, args, rng, centres)
+        rows = await conn.fetchval(f"SELECT count(*) FROM {TABLE}")
+
+        queries = embeddings(rng, centres, args.queries)
+        agents = rng.integers(0, args.agents, args.queries)
+        searches = {
+            "all_memories": (_SEARCH_SQL, [(q, args.k) for q in queries]),
+            "one_agent": (
+                _FILTERED_SEARCH_SQL,
+                [(q, args.k, int(a)) for q, a in zip(queries, agents)],
+            ),
+        }
+
+        results: Dict[str, Any] = {
+            "rows": rows,
+            "dimensions": DIMENSIONS,
+            "k": args.k,
+            "queries": args.queries,
+            "pgvector_version": version,
+            "index_build_seconds": build_seconds,
+            "searches": {},
+        }
+
+        try:
+            await conn.execute("SET hnsw.iterative_scan = relaxed_order")
+            results["iterative_scan"] = "relaxed_order"
+        except asyncpg.PostgresError:
+            # pgvector < 0.8: filtered searches may return fewer than k rows
+            results["iterative_scan"] = None
+
+        for name, (sql, params) in searches.items():
+            exact, exact_latencies = await exact_results(conn, sql, params)
+            search = {"exact": latency_summary(exact_latencies), "hnsw": {}}
+            for ef_search in args.ef_search:
+                await conn.execute(f"SET hnsw.ef_search = {int(ef_search)}")
+                search["hnsw"][ef_search] = await measure(conn, sql, params, exact, args.k)
+            results["searches"][name] = search
+
+        if not args.keep:
+            await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        return results
+    finally:
+        await conn.close()
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    print(
+        f"\n{results['rows']:,} memories x {results['dimensions']} dims, k={results['k']}, "
+        f"{results['queries']} queries, pgvector {results['pgvector_version']}, "
+        f"iterative scan: {results['iterative_scan']}"
+    )
+    for name, search in results["searches"].items():
+        exact = search["exact"]
+        print(f"\n{name}")
+        print(f"  {'ef_search':>10} {'recall':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  index")
+        print(
+            f"  {'exact':>10} {1.0:>8.3f} {exact['p50_ms']:>9.2f} "
+            f"{exact['p95_ms']:>9.2f} {exact['p99_ms']:>9.2f}  -"
+        )
+        for ef_search, m in search["hnsw"].items():
+            print(
+                f"  {ef_search:>10} {m['recall']:>8.3f} {m['p50_ms']:>9.2f} "
+                f"{m['p95_ms']:>9.2f} {m['p99_ms']:>9.2f}  {'hnsw' if m['uses_hnsw'] else 'other'}"
+            )
+
+
+def main() -> None:
+    args = parse_args()
+    if args.rows < 1 or args.queries < 1 or args.k < 1:
+        print("--rows, --queries and -k must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    results = asyncio.run(run(args))
+    print_report(results)
+    if args.json_output:
+        with open(args.json_output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
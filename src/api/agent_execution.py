@@ -5,6 +5,7 @@ Provides REST API for executing agents with MCP tool support.
 
 Endpoints:
 - POST /api/agent-execution/execute - Execute agent with user message
+- POST /api/agent-execution/{execution_id}/cancel - Cancel a queued or running execution
 - GET /api/agent-execution/{execution_id}/status - Get execution status (async)
 
 Implements:
@@ -14,6 +15,9 @@ Implements:
 - Structured response format
 - Error handling with appropriate HTTP status codes
 
+Streamed executions (agent_execution_stream.py) and asynchronous jobs
+(agent_execution_jobs.py) have their own routers under the same prefix.
+
 References:
 - Story 11.1.7: MCP Tool Invocation in Agent Execution
 - AC#8: REST API endpoint for agent execution
@@ -29,10 +33,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_tenant_db
 from src.exceptions import BudgetExceededError
+from src.services.agent_execution import jobs
 from src.services.agent_execution_service import (
     AgentExecutionError,
     AgentExecutionService,
 )
+from src.services.execution_cancellation import request_cancellation
 
 router = APIRouter(prefix="/api/agent-execution", tags=["agent-execution"])
 
@@ -125,6 +131,13 @@ class BudgetExceededResponse(BaseModel):
     grace_threshold: float = Field(..., description="Grace threshold percentage (e.g., 110.0)")
 
 
+class ExecutionCancelResponse(BaseModel):
+    """Response schema for an accepted cancel request."""
+
+    execution_id: UUID = Field(..., description="Execution ID")
+    status: str = Field(..., description="cancelling - stops at its next LLM turn or tool call")
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -357,6 +370,53 @@ async def execute_agent(
         )
 
 
+@router.post(
+    "/{execution_id}/cancel",
+    response_model=ExecutionCancelResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Cancel agent execution",
+    description="""
+    Request cancellation of a queued job or running execution (job or
+    stream, by the execution_id of its start event).
+
+    Cancellation is cooperative: the execution stops before its next LLM
+    turn or tool call, releases its MCP processes and is recorded with
+    status cancelled. A queued job is cancelled when a worker picks it up.
+
+    Errors:
+    - 409 Conflict: Job has already finished
+    - 503 Service Unavailable: Cancel request could not be stored
+    """,
+)
+async def cancel_execution(
+    execution_id: UUID,
+    x_tenant_id: str = Header(..., description="Tenant identifier for isolation"),
+    db: AsyncSession = Depends(get_tenant_db),
+) -> ExecutionCancelResponse:
+    """
+    Request cancellation of an agent execution.
+
+    Raises:
+        HTTPException(409): Job has already finished
+        HTTPException(503): Cancel request could not be stored
+    """
+    # Streamed executions have no record until they finish; only jobs do
+    record = await jobs.get_job(db, x_tenant_id, execution_id)
+    if record is not None and record.status in jobs.TERMINAL_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Execution has already finished (status: {record.status})",
+        )
+
+    if not await request_cancellation(x_tenant_id, execution_id):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Cancel request could not be stored, please retry",
+        )
+
+    return ExecutionCancelResponse(execution_id=execution_id, status="cancelling")
+
+
 @router.get(
     "/health",
     status_code=status.HTTP_200_OK,
@@ -379,5 +439,7 @@ async def health_check() -> Dict[str, Any]:
             "mcp-tool-support",
             "budget-enforcement",
             "multi-tenant-isolation",
+            "async-jobs",
+            "cancellation",
         ],
     }
@@ -0,0 +1,285 @@
+"""
+Agent Execution Job API Endpoints
+
+Endpoints:
+- POST /api/agent-execution/jobs - Queue agent execution on Celery (returns execution ID)
+- GET /api/agent-execution/jobs/{execution_id} - Job status (optional long-poll)
+- GET /api/agent-execution/jobs/{execution_id}/result - Result of a finished job
+
+Jobs run the same execution as POST /execute on the execute_agent Celery
+task instead of inside the API process (see
+src/services/agent_execution/jobs.py). Cancel them with
+POST /api/agent-execution/{execution_id}/cancel.
+
+References:
+- src/api/agent_execution.py (POST /execute, request schema)
+- src/workers/tasks.py (execute_agent)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
+from loguru import logger
+from pydantic import BaseModel, Field, HttpUrl
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.agent_execution import AgentExecutionRequest
+from src.api.dependencies import get_tenant_db
+from src.services.agent_execution import jobs
+from src.services.agent_service import AgentService
+
+router = APIRouter(prefix="/api/agent-execution", tags=["agent-execution"])
+
+
+# ============================================================================
+# Request/Response Schemas
+# ============================================================================
+
+
+class AgentExecutionJobRequest(AgentExecutionRequest):
+    """Request schema for queuing an agent execution job."""
+
+    callback_url: Optional[HttpUrl] = Field(
+        default=None,
+        description="Public http(s) URL the job result is POSTed to once the job has "
+        "finished, signed with the tenant's webhook secret in X-ServiceDesk-Signature",
+    )
+
+
+class AgentExecutionJobResponse(BaseModel):
+    """Response schema for a queued agent execution job."""
+
+    execution_id: UUID = Field(..., description="Execution (job) ID")
+    status: str = Field(..., description="Job status (queued)")
+    status_url: str = Field(..., description="Job status endpoint")
+    result_url: str = Field(..., description="Job result endpoint")
+
+
+class AgentExecutionJobStatus(BaseModel):
+    """Response schema for agent execution job status."""
+
+    execution_id: UUID = Field(..., description="Execution (job) ID")
+    agent_id: UUID = Field(..., description="Executed agent")
+    status: str = Field(
+        ...,
+        description="queued, running, retrying, or final: success, failed, cancelled",
+    )
+    finished: bool = Field(..., description="Whether the status is final")
+    created_at: Optional[datetime] = Field(default=None, description="When the job was queued")
+
+
+class JobToolCall(BaseModel):
+    """Tool call recorded in a job's execution trace."""
+
+    tool_name: str = Field(..., description="Name of the tool invoked")
+    tool_args: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
+    tool_result: str = Field(..., description="Tool output (truncated)")
+
+
+class AgentExecutionJobResult(BaseModel):
+    """Response schema for the result of a finished agent execution job."""
+
+    execution_id: UUID = Field(..., description="Execution (job) ID")
+    status: str = Field(..., description="Final job status")
+    success: bool = Field(..., description="Whether execution succeeded")
+    response: str = Field(..., description="Agent's final response text")
+    tool_calls: list[JobToolCall] = Field(..., description="Tool invocations during execution")
+    model_used: str = Field(..., description="LLM model used")
+    duration_ms: int = Field(..., description="Total execution time in milliseconds")
+    error: Optional[str] = Field(default=None, description="Error message if success=False")
+
+
+# ============================================================================
+# API Endpoints
+# ============================================================================
+
+
+# Longest a status request may wait for a job to finish (long-poll)
+JOB_MAX_WAIT_SECONDS = 30
+
+
+@router.post(
+    "/jobs",
+    response_model=AgentExecutionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue agent execution job",
+    description="""
+    Queue an agent execution on the Celery workers and return its execution
+    ID immediately, instead of holding the request open like POST /execute.
+
+    Follow the job with GET /jobs/{execution_id} (pass wait=N to long-poll
+    until it finishes) and fetch GET /jobs/{execution_id}/result, or give a
+    callback_url the result is POSTed to when the job finishes. The callback
+    body is signed like inbound webhooks: X-ServiceDesk-Signature carries the
+    HMAC-SHA256 hex digest of the raw body keyed with the tenant's webhook
+    secret. Callback hosts must resolve to public addresses.
+    Executions are limited to 240 seconds on the workers.
+
+    Errors:
+    - 400 Bad Request: Agent is not active, or callback_url is not public
+    - 404 Not Found: Agent not found or belongs to different tenant
+    - 503 Service Unavailable: Job could not be queued
+    """,
+)
+async def create_execution_job(
+    request: AgentExecutionJobRequest,
+    x_tenant_id: str = Header(..., description="Tenant identifier for isolation"),
+    db: AsyncSession = Depends(get_tenant_db),
+) -> AgentExecutionJobResponse:
+    """
+    Queue an agent execution job.
+
+    Args:
+        request: AgentExecutionJobRequest (execution request plus callback_url)
+        x_tenant_id: Tenant identifier from X-Tenant-ID header
+        db: Database session dependency
+
+    Returns:
+        AgentExecutionJobResponse with the execution ID and job URLs
+
+    Raises:
+        HTTPException(400): Agent is not active or callback_url is not public
+        HTTPException(404): Agent not found or tenant mismatch
+        HTTPException(503): Job could not be queued
+    """
+    from src.workers.tasks import execute_agent as execute_agent_task
+
+    callback_url = str(request.callback_url) if request.callback_url else None
+    if callback_url:
+        try:
+            await jobs.check_callback_url(callback_url)
+        except jobs.CallbackURLError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    agent = await AgentService().get_agent_snapshot(x_tenant_id, request.agent_id, db)
+    if agent.status != "active":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Agent is not active (status: {agent.status})",
+        )
+
+    execution_id = uuid4()
+    record = await jobs.create_job(
+        db,
+        execution_id=execution_id,
+        agent_id=request.agent_id,
+        tenant_id=x_tenant_id,
+        payload={"user_message": request.user_message, "context": request.context},
+    )
+    await db.commit()
+
+    try:
+        execute_agent_task.apply_async(
+            args=[str(request.agent_id), request.context or {}],
+            kwargs={
+                "execution_id": str(execution_id),
+                "user_message": request.user_message,
+                "timeout_seconds": request.timeout_seconds,
+                "callback_url": callback_url,
+            },
+            task_id=str(execution_id),
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to enqueue agent execution job: {e}",
+            extra={"agent_id": str(request.agent_id), "execution_id": str(execution_id)},
+        )
+        record.status = "failed"
+        record.errors = {"error_type": type(e).__name__, "message": "Failed to enqueue job"}
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to enqueue agent execution job",
+        )
+
+    await jobs.publish_status(execution_id, jobs.JOB_QUEUED)
+    logger.info(
+        "Agent execution job queued",
+        extra={
+            "agent_id": str(request.agent_id),
+            "tenant_id": x_tenant_id,
+            "execution_id": str(execution_id),
+        },
+    )
+
+    job_url = f"{router.prefix}/jobs/{execution_id}"
+    return AgentExecutionJobResponse(
+        execution_id=execution_id,
+        status=jobs.JOB_QUEUED,
+        status_url=job_url,
+        result_url=f"{job_url}/result",
+    )
+
+
+@router.get(
+    "/jobs/{execution_id}",
+    response_model=AgentExecutionJobStatus,
+    summary="Get agent execution job status",
+    description="""
+    Status of an execution job. With wait > 0 the request is held until the
+    job finishes or wait seconds pass (long-poll), whichever comes first.
+    """,
+    responses={404: {"description": "Job not found"}},
+)
+async def get_execution_job(
+    execution_id: UUID,
+    wait: float = Query(
+        default=0,
+        ge=0,
+        le=JOB_MAX_WAIT_SECONDS,
+        description="Seconds to wait for the job to finish (long-poll)",
+    ),
+    x_tenant_id: str = Header(..., description="Tenant identifier for isolation"),
+    db: AsyncSession = Depends(get_tenant_db),
+) -> AgentExecutionJobStatus:
+    """
+    Get the status of an agent execution job, optionally long-polling.
+
+    Raises:
+        HTTPException(404): Job not found or belongs to different tenant
+    """
+    record = await jobs.wait_for_job(db, x_tenant_id, execution_id, wait)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    return AgentExecutionJobStatus(
+        execution_id=record.id,
+        agent_id=record.agent_id,
+        status=record.status,
+        finished=record.status in jobs.TERMINAL_STATUSES,
+        created_at=record.created_at,
+    )
+
+
+@router.get(
+    "/jobs/{execution_id}/result",
+    response_model=AgentExecutionJobResult,
+    summary="Get agent execution job result",
+    responses={
+        404: {"description": "Job not found"},
+        409: {"description": "Job has not finished yet"},
+    },
+)
+async def get_execution_job_result(
+    execution_id: UUID,
+    x_tenant_id: str = Header(..., description="Tenant identifier for isolation"),
+    db: AsyncSession = Depends(get_tenant_db),
+) -> AgentExecutionJobResult:
+    """
+    Get the result of a finished agent execution job.
+
+    Raises:
+        HTTPException(404): Job not found or belongs to different tenant
+        HTTPException(409): Job has not finished yet
+    """
+    record = await jobs.get_job(db, x_tenant_id, execution_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    if record.status not in jobs.TERMINAL_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job has not finished (status: {record.status})",
+        )
+    return AgentExecutionJobResult(**jobs.job_result(record))
@@ -0,0 +1,244 @@
+"""
+Streaming Agent Execution API Endpoint
+
+Endpoints:
+- POST /api/agent-execution/execute/stream - Execute agent, streaming Server-Sent Events
+
+The stream outlives the request handler, so the execution runs on its own
+session and is recorded in agent execution history when the stream ends,
+also when the client disconnects.
+
+References:
+- src/api/agent_execution.py (POST /execute, request schema)
+- src/services/agent_execution/streaming.py
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID, uuid4
+
+import anyio
+from fastapi import APIRouter, Depends, Header, status
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.agent_execution import AgentExecutionRequest
+from src.api.dependencies import get_tenant_db
+from src.database.session import get_async_session_maker
+from src.database.tenant_context import set_db_tenant_context
+from src.services.agent_execution.execution_record import build_execution_record
+from src.services.agent_execution_service import AgentExecutionService
+from src.services.agent_service import AgentService
+from src.services.execution_cancellation import CANCELLED_STATUS, record_cancellation
+
+router = APIRouter(prefix="/api/agent-execution", tags=["agent-execution"])
+
+
+# Streamed events carrying agent output; the first one is time-to-first-byte
+_OUTPUT_EVENTS = frozenset({"token", "tool_start", "tool_end"})
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Frame one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post(
+    "/execute/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Execute agent, streaming events",
+    description="""
+    Execute an agent like POST /execute, streaming its progress as
+    Server-Sent Events (text/event-stream) instead of waiting for the result.
+
+    Events (data is JSON):
+    - start: {execution_id, agent_id} - sent immediately
+    - token: {text} - LLM output as it is generated
+    - tool_start: {run_id, tool_name, tool_input}
+    - tool_end: {run_id, tool_name, tool_output}
+    - error: {type, message, ...} - budget_exceeded errors carry the 402 details;
+      type cancelled after POST /{execution_id}/cancel
+    - result: same body as POST /execute - always the last event
+
+    Disconnecting cancels the execution and releases its MCP processes, as
+    does cancelling it with the start event's execution_id. The
+    execution is recorded in agent execution history either way (status
+    success, failed or cancelled) under the start event's execution_id.
+
+    Errors (before the stream starts):
+    - 404 Not Found: Agent not found or belongs to different tenant
+    """,
+    responses={
+        200: {
+            "description": "Event stream of the execution",
+            "content": {"text/event-stream": {}},
+        },
+        404: {"description": "Agent not found or tenant mismatch"},
+    },
+)
+async def stream_agent_execution(
+    request: AgentExecutionRequest,
+    x_tenant_id: str = Header(..., description="Tenant identifier for isolation"),
+    db: AsyncSession = Depends(get_tenant_db),
+) -> StreamingResponse:
+    """
+    Execute agent and stream its events.
+
+    Args:
+        request: AgentExecutionRequest with agent_id, user_message, context, timeout
+        x_tenant_id: Tenant identifier from X-Tenant-ID header
+        db: Database session dependency
+
+    Returns:
+        StreamingResponse of Server-Sent Events
+
+    Raises:
+        HTTPException(404): Agent not found or tenant mismatch
+    """
+    requested_at = time.perf_counter()
+    logger.info(
+        "Streaming agent execution request",
+        extra={
+            "agent_id": str(request.agent_id),
+            "tenant_id": x_tenant_id,
+            "message_length": len(request.user_message),
+            "timeout_seconds": request.timeout_seconds,
+        },
+    )
+
+    # Unknown agents get a plain 404 while a status code can still be sent
+    await AgentService().get_agent_snapshot(x_tenant_id, request.agent_id, db)
+
+    return StreamingResponse(
+        _execution_events(request, x_tenant_id, requested_at),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _execution_events(
+    request: AgentExecutionRequest,
+    tenant_id: str,
+    requested_at: float,
+) -> AsyncIterator[str]:
+    """
+    Body of a streamed execution.
+
+    Uses its own session, as the stream outlives the request handler. On
+    client disconnect Starlette cancels this generator; the execution is
+    cancelled with it and the record is still saved (shielded).
+    """
+    from src.monitoring.metrics import agent_stream_time_to_first_byte_seconds
+
+    execution_id = uuid4()
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+    cancelled = False
+    first_output = True
+
+    async with get_async_session_maker()() as session:
+        await set_db_tenant_context(session, tenant_id)
+        yield _sse("start", {"execution_id": str(execution_id), "agent_id": str(request.agent_id)})
+
+        try:
+            events = AgentExecutionService(session).stream_agent(
+                agent_id=request.agent_id,
+                tenant_id=tenant_id,
+                user_message=request.user_message,
+                context=request.context,
+                timeout_seconds=request.timeout_seconds,
+                execution_id=execution_id,
+            )
+            async with contextlib.aclosing(events):
+                async for event in events:
+                    if first_output and event["event"] in _OUTPUT_EVENTS:
+                        first_output = False
+                        agent_stream_time_to_first_byte_seconds.observe(
+                            time.perf_counter() - requested_at
+                        )
+                    if event["event"] == "error" and event["data"]["type"] == CANCELLED_STATUS:
+                        cancelled = True
+                    if event["event"] == "result":
+                        result = event["data"]
+                    yield _sse(event["event"], event["data"])
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            with anyio.CancelScope(shield=True):
+                await _save_streamed_execution(
+                    session, execution_id, request, tenant_id, result, error, requested_at,
+                    cancelled=cancelled,
+                )
+
+
+async def _save_streamed_execution(
+    session: AsyncSession,
+    execution_id: UUID,
+    request: AgentExecutionRequest,
+    tenant_id: str,
+    result: Optional[Dict[str, Any]],
+    error: Optional[BaseException],
+    requested_at: float,
+    cancelled: bool = False,
+) -> None:
+    """Persist a streamed execution like the execute_agent worker task does."""
+    from src.monitoring.metrics import agent_stream_executions_total
+
+    record_status = None
+    errors = None
+    if cancelled:
+        record_status = CANCELLED_STATUS
+        errors = {"error_type": "ExecutionCancelled", "message": "Execution cancelled on request"}
+        record_cancellation("agent")
+    elif result is None:
+        if error is None or isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+            record_status = "cancelled"
+            errors = {
+                "error_type": "ClientDisconnected",
+                "message": "Client disconnected before the execution completed",
+            }
+        else:
+            record_status = "failed"
+            errors = {"error_type": type(error).__name__, "message": str(error)}
+
+    record = build_execution_record(
+        execution_id=execution_id,
+        agent_id=request.agent_id,
+        tenant_id=tenant_id,
+        payload={"user_message": request.user_message, "context": request.context},
+        service_result=result or {},
+        total_duration_ms=int((time.perf_counter() - requested_at) * 1000),
+        status=record_status,
+        errors=errors,
+    )
+    agent_stream_executions_total.labels(status=record.status).inc()
+
+    try:
+        session.add(record)
+        await session.commit()
+    except Exception as e:
+        logger.error(
+            f"Failed to save streamed execution: {e}",
+            extra={
+                "execution_id": str(execution_id),
+                "agent_id": str(request.agent_id),
+                "tenant_id": tenant_id,
+                "error_type": type(e).__name__,
+            },
+        )
+        return
+
+    logger.info(
+        "Streaming agent execution finished",
+        extra={
+            "execution_id": str(execution_id),
+            "agent_id": str(request.agent_id),
+            "tenant_id": tenant_id,
+            "status": record.status,
+        },
+    )
@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.dependencies import get_tenant_id
 from src.database.session import get_async_session
 from src.schemas.llm_cost import (
+    AgentExecutionSpendPageDTO,
     AgentSpendDTO,
     BudgetUtilizationDTO,
     CostSummaryDTO,
@@ -120,6 +121,44 @@ async def get_spend_by_agent(
         raise HTTPException(status_code=500, detail="Failed to fetch agent spend")
 
 
+@router.get("/by-agent/{agent_name}/executions", response_model=AgentExecutionSpendPageDTO)
+async def get_agent_execution_spend(
+    db: Annotated[AsyncSession, Depends(get_async_session)],
+    tenant_id: Annotated[UUID, Depends(get_tenant_id)],
+    agent_name: str,
+    start_date: Annotated[date, Query(description="Start date (YYYY-MM-DD)")],
+    end_date: Annotated[date, Query(description="End date (YYYY-MM-DD)")],
+    page: Annotated[int, Query(ge=1, description="Page number (1-indexed)")] = 1,
+    page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+) -> AgentExecutionSpendPageDTO:
+    """
+    Drill down into one agent's spend per execution (AC#6).
+
+    Returns executions most recent first with:
+    - Execution ID
+    - First/last LLM call time
+    - LLM call count
+    - Total tokens and cost
+
+    **Tenant Isolation**: Filters by authenticated tenant
+    """
+    try:
+        cost_service = LLMCostService(db)
+        executions, total = await cost_service.get_agent_execution_spend(
+            agent_name, start_date, end_date, tenant_id, page, page_size
+        )
+        return AgentExecutionSpendPageDTO(
+            agent_name=agent_name,
+            executions=executions,
+            total=total,
+            page=page,
+            page_size=page_size,
+        )
+    except Exception as e:
+        logger.error(f"Error fetching execution spend for agent {agent_name}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch agent execution spend")
+
+
 @router.get("/by-model", response_model=List[ModelSpendDTO])
 async def get_spend_by_model(
     db: Annotated[AsyncSession, Depends(get_async_session)],
@@ -25,6 +25,7 @@ from src.schemas.memory import (
     MemoryState,
 )
 from src.services.memory_config_service import MemoryConfigService
+from src.services.memory_embeddings import embedding_to_text
 from src.utils.logger import logger
 
 # Create API router with prefix
@@ -406,7 +407,7 @@ async def get_memory_history(
                     "agent_id": m.agent_id,
                     "memory_type": m.memory_type,
                     "content": m.content,
-                    "embedding": m.embedding,
+                    "embedding": embedding_to_text(m.embedding),
                     "retention_days": m.retention_days,
                     "created_at": m.created_at,
                     "updated_at": m.updated_at,
@@ -6,6 +6,9 @@ from ServiceDesk Plus. The endpoint validates payloads, logs requests, and retur
 202 Accepted immediately while queuing processing for workers.
 
 Story 7.3: Updated to use Plugin Manager for multi-tool webhook validation.
+
+Enhancement jobs can be cancelled by the job_id the webhook response
+returns (POST /webhook/servicedesk/jobs/{job_id}/cancel, signed like the webhook).
 """
 
 import uuid
@@ -16,11 +19,17 @@ from pydantic import ValidationError
 from typing import Optional
 
 from src.schemas.webhook import WebhookPayload, ResolvedTicketWebhook, WebhookResponse
-from src.services.webhook_validator import validate_webhook_signature, validate_signature
+from src.services.webhook_validator import (
+    compute_hmac_signature,
+    secure_compare,
+    validate_signature,
+    validate_webhook_signature,
+)
 from src.services.queue_service import QueueService, get_queue_service
 from src.monitoring import enhancement_requests_total
 from src.services.ticket_storage_service import store_webhook_resolved_ticket
 from src.services.tenant_service import TenantService
+from src.services.execution_cancellation import request_cancellation
 from src.database.session import get_async_session
 from src.api.dependencies import get_tenant_db, get_tenant_config_dep
 from src.config import get_settings
@@ -304,6 +313,93 @@ async def receive_webhook(
         )
 
 
+@router.post(
+    "/servicedesk/jobs/{job_id}/cancel",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Cancel a queued or running enhancement job",
+    description="Requests cancellation of the enhancement job with the job_id returned by POST /webhook/servicedesk. "
+    "The worker stops before its next phase (context gathering, LLM synthesis, ticket update), leaves the ticket "
+    "untouched and records the enhancement as cancelled. The JSON body {tenant_id, job_id} must be signed with the "
+    "tenant's webhook secret in the X-ServiceDesk-Signature header.",
+    response_model=WebhookResponse,
+)
+async def cancel_enhancement_job(
+    job_id: uuid.UUID,
+    request: Request,
+    tenant_config: TenantConfigInternal = Depends(get_tenant_config_dep),
+    x_servicedesk_signature: Optional[str] = Header(None, alias="X-ServiceDesk-Signature"),
+) -> WebhookResponse:
+    """
+    Request cancellation of an enhancement job.
+
+    The request is signed like the webhook that queued the job: the JSON body
+    {"tenant_id": ..., "job_id": ...} carries an HMAC-SHA256 signature made with
+    the tenant's webhook secret in the X-ServiceDesk-Signature header. The signed
+    job_id must match the path, so a captured request cannot cancel other jobs.
+
+    Args:
+        job_id: Enhancement job ID from the webhook response
+        request: FastAPI Request object (signed JSON body)
+        tenant_config: Configuration of the tenant the job was queued for
+        x_servicedesk_signature: HMAC-SHA256 signature of the request body
+
+    Returns:
+        WebhookResponse with status "cancelling"
+
+    Raises:
+        HTTPException: 401 if the signature header is missing or invalid
+        HTTPException: 400 if the signed job_id does not match the path
+        HTTPException: 503 if the cancel request could not be stored
+    """
+    tenant_id = tenant_config.tenant_id
+
+    if not x_servicedesk_signature:
+        logger.warning(
+            f"Cancel request received without signature header for tenant: {tenant_id}",
+            extra={"tenant_id": tenant_id, "job_id": str(job_id), "event_type": "missing_signature_header"},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing signature header",
+        )
+
+    raw_body = await request.body()
+    if not secure_compare(
+        compute_hmac_signature(tenant_config.webhook_signing_secret, raw_body),
+        x_servicedesk_signature,
+    ):
+        logger.error(
+            f"Cancel request signature validation failed for tenant: {tenant_id}",
+            extra={"tenant_id": tenant_id, "job_id": str(job_id), "event_type": "signature_validation_failed"},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature"
+        )
+
+    body = await request.json()
+    if str(body.get("job_id")) != str(job_id):
+        logger.warning(
+            "Cancel request rejected: signed job_id does not match path",
+            extra={"tenant_id": tenant_id, "job_id": str(job_id)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Signed job_id does not match the job being cancelled",
+        )
+
+    if not await request_cancellation(tenant_id, job_id):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Cancel request could not be stored, please retry",
+        )
+
+    return {
+        "status": "cancelling",
+        "job_id": str(job_id),
+        "message": "Enhancement job will stop before its next phase",
+    }
+
+
 @router.post(
     "/servicedesk/resolved-ticket",
     status_code=status.HTTP_202_ACCEPTED,
@@ -560,24 +656,15 @@ async def agent_webhook_endpoint(
         validate_hmac_signature,
         validate_payload_schema,
     )
-    from src.utils.encryption import decrypt
-    from src.database.models import Agent, AgentTrigger
-    from src.schemas.agent import AgentStatus, TriggerType
-    from sqlalchemy import select, and_
-    from sqlalchemy.orm import selectinload
+    from src.services.agent_execution.agent_snapshot import get_agent_snapshot
+    from src.schemas.agent import AgentStatus
 
     execution_id = str(uuid.uuid4())
     logger.bind(execution_id=execution_id)
 
     try:
-        # Fetch agent with triggers (eager load to avoid N+1)
-        query = (
-            select(Agent)
-            .where(Agent.id == agent_id)
-            .options(selectinload(Agent.triggers))
-        )
-        result = await db.execute(query)
-        agent = result.scalar_one_or_none()
+        # Cached execution snapshot: agent, triggers and decrypted HMAC secret
+        agent = await get_agent_snapshot(db, agent_id)
 
         if not agent:
             logger.warning(
@@ -604,12 +691,8 @@ async def agent_webhook_endpoint(
                 detail=f"Agent is {agent.status}, only ACTIVE agents can be triggered",
             )
 
-        # Find webhook trigger for this agent
-        webhook_trigger = None
-        for trigger in agent.triggers:
-            if trigger.trigger_type == TriggerType.WEBHOOK:
-                webhook_trigger = trigger
-                break
+        # Webhook trigger for this agent
+        webhook_trigger = agent.webhook
 
         if not webhook_trigger:
             logger.error(
@@ -636,12 +719,11 @@ async def agent_webhook_endpoint(
                 detail="Missing X-Hub-Signature-256 header",
             )
 
-        # Decrypt HMAC secret from database
-        try:
-            hmac_secret = decrypt(webhook_trigger.hmac_secret)
-        except Exception as e:
+        # HMAC secret was decrypted when the snapshot was built (None on failure)
+        hmac_secret = webhook_trigger.hmac_secret
+        if hmac_secret is None:
             logger.error(
-                f"Failed to decrypt HMAC secret: {e}",
+                "Agent webhook secret unavailable",
                 extra={"agent_id": str(agent_id), "execution_id": execution_id},
             )
             raise HTTPException(
@@ -263,6 +263,70 @@ class Settings(BaseSettings):
         le=120,
     )
 
+    # LLM Request Hedging (opt-in)
+    # Fallback chains are expressed as LiteLLM model names (the DB-backed
+    # fallback_chains tables were retired in Story 9.2).
+    llm_hedging_enabled: bool = Field(
+        default=False,
+        description="Race the next model in the fallback chain when the primary is slow to respond",
+    )
+    llm_hedge_fallback_models: list[str] = Field(
+        default=[],
+        description="Ordered LiteLLM model names used as hedges after llm_model",
+    )
+    llm_hedge_default_delay_seconds: float = Field(
+        default=2.0,
+        description="Hedge delay used until enough first-token samples exist for a p95 estimate",
+        ge=0.05,
+        le=60.0,
+    )
+    llm_hedge_min_samples: int = Field(
+        default=20,
+        description="Minimum first-token samples per model before the p95 delay is used",
+        ge=1,
+        le=10000,
+    )
+
+    # Adaptive LLM Concurrency Limiting (per provider/model, AIMD)
+    llm_concurrency_limiter_enabled: bool = Field(
+        default=True,
+        description="Queue LLM calls locally behind an adaptive per-model concurrency limit",
+    )
+    llm_concurrency_initial_limit: int = Field(
+        default=8,
+        description="Initial per-worker concurrent LLM calls per provider/model",
+        ge=1,
+        le=256,
+    )
+    llm_concurrency_min_limit: int = Field(
+        default=1,
+        description="Lower bound for the adaptive concurrency limit",
+        ge=1,
+        le=64,
+    )
+    llm_concurrency_max_limit: int = Field(
+        default=64,
+        description="Upper bound for the adaptive concurrency limit",
+        ge=1,
+        le=1024,
+    )
+    llm_concurrency_redis_enabled: bool = Field(
+        default=True,
+        description="Coordinate a cluster-wide in-flight limit across workers through Redis",
+    )
+    llm_concurrency_cluster_limit: int = Field(
+        default=32,
+        description="Initial cluster-wide concurrent LLM calls per provider/model",
+        ge=1,
+        le=4096,
+    )
+    llm_concurrency_lease_ttl_seconds: int = Field(
+        default=150,
+        description="Expiry for Redis concurrency leases (reclaims slots from crashed workers)",
+        ge=10,
+        le=3600,
+    )
+
     # LiteLLM Proxy Configuration (Story 8.9)
     litellm_proxy_url: str = Field(
         default="http://litellm:4000",
@@ -274,6 +338,81 @@ class Settings(BaseSettings):
         min_length=10,
     )
 
+    # Budget spend ledger (Redis mirror of LiteLLM spend for local budget checks)
+    budget_ledger_enabled: bool = Field(
+        default=True,
+        description="Check budgets against the Redis spend ledger instead of querying LiteLLM per call",
+    )
+    budget_ledger_ttl_seconds: int = Field(
+        default=300,
+        description="Ledger entry lifetime; entries not reconciled within this window fall back to LiteLLM",
+        ge=30,
+        le=86400,
+    )
+    budget_ledger_reconcile_concurrency: int = Field(
+        default=10,
+        description="Concurrent LiteLLM spend queries during ledger reconciliation",
+        ge=1,
+        le=100,
+    )
+    budget_admission_enabled: bool = Field(
+        default=True,
+        description="Reserve each LLM call's estimated cost in the spend ledger and reject calls that would cross the grace limit",
+    )
+    budget_reservation_ttl_seconds: int = Field(
+        default=600,
+        description="Expiry for in-flight cost reservations (reclaims reservations from crashed workers)",
+        ge=30,
+        le=7200,
+    )
+    budget_estimator_default_input_cost_per_token: float = Field(
+        default=0.000005,
+        description="Input price (USD/token) for models without LiteLLM pricing",
+        ge=0,
+    )
+    budget_estimator_default_output_cost_per_token: float = Field(
+        default=0.000015,
+        description="Output price (USD/token) for models without LiteLLM pricing",
+        ge=0,
+    )
+    budget_estimator_default_max_output_tokens: int = Field(
+        default=1000,
+        description="Output token bound for requests that do not set max_tokens",
+        ge=1,
+    )
+    budget_job_batch_size: int = Field(
+        default=500,
+        description="Rows per batch in the budget reset and override expiry jobs",
+        ge=1,
+        le=10000,
+    )
+    budget_job_concurrency: int = Field(
+        default=20,
+        description="Concurrent LiteLLM key updates in the budget reset and override expiry jobs",
+        ge=1,
+        le=200,
+    )
+
+    # LLM spend rollup (cost dashboard)
+    llm_spend_rollup_lag_seconds: int = Field(
+        default=600,
+        description="Spend logs newer than this are left for a later rollup run (allows for LiteLLM's batched writes)",
+        ge=0,
+        le=86400,
+    )
+    llm_spend_rollup_window_hours: int = Field(
+        default=24,
+        description="Maximum startTime span folded into the rollup per transaction",
+        ge=1,
+        le=168,
+    )
+    llm_spend_rollup_max_windows: int = Field(
+        default=30,
+        description="Maximum rollup windows processed per run (bounds backfill work)",
+        ge=1,
+        le=1000,
+    )
+
     # CORS Configuration (Story 1C)
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://localhost:5173"],
@@ -322,60 +461,283 @@ class Settings(BaseSettings):
         description="Secret for validating LiteLLM webhook callbacks",
     )
 
-    # MCP Connection Pool Configuration (Story 11.2.3)
-    # NOTE: Bridge-level pooling implementation uses simpler approach
-    # These fields are reserved for future full connection pool enhancement
-    # Current implementation: module-level dict in agent_execution_service.py
-    # Future enhancement: Full MCPConnectionPool class with these configuration options
-    #
-    # mcp_pool_max_clients_per_server: int = Field(
-    #     default=10,
-    #     description="Maximum MCP clients per server",
-    #     ge=1,
-    #     le=100,
-    # )
-    # mcp_pool_max_total_clients: int = Field(
-    #     default=100,
-    #     description="Maximum total MCP clients across all servers",
-    #     ge=1,
-    #     le=1000,
-    # )
-    # mcp_pool_client_ttl_seconds: int = Field(
-    #     default=300,
-    #     description="MCP client idle timeout in seconds (5 min default)",
-    #     ge=60,
-    #     le=3600,
-    # )
-    # mcp_pool_cleanup_interval_seconds: int = Field(
-    #     default=60,
-    #     description="MCP pool cleanup interval in seconds (1 min default)",
-    #     ge=10,
-    #     le=300,
-    # )
-    # mcp_pool_max_stdio_processes: int = Field(
-    #     default=50,
-    #     description="Maximum concurrent MCP stdio subprocess clients",
-    #     ge=1,
-    #     le=200,
-    # )
-    # mcp_pool_http_max_connections: int = Field(
-    #     default=100,
-    #     description="Maximum HTTP connections in MCP pool",
-    #     ge=10,
-    #     le=500,
-    # )
-    # mcp_pool_http_max_keepalive_connections: int = Field(
-    #     default=20,
-    #     description="Maximum persistent HTTP connections in MCP pool",
-    #     ge=5,
-    #     le=100,
-    # )
-    # mcp_pool_http_pool_timeout: float = Field(
-    #     default=5.0,
-    #     description="Timeout waiting for connection from MCP HTTP pool (seconds)",
-    #     ge=1.0,
-    #     le=30.0,
-    # )
+    # MCP Health Metrics Storage (partitioned mcp_server_metrics)
+    mcp_metrics_retention_days: int = Field(
+        default=7,
+        description="Days of MCP health metrics kept before their daily partitions are dropped",
+        ge=1,
+        le=90,
+    )
+    mcp_metrics_partition_days_ahead: int = Field(
+        default=7,
+        description="Days of mcp_server_metrics partitions created ahead of time",
+        ge=1,
+        le=60,
+    )
+
+    # MCP Health Check Cycle
+    mcp_health_check_concurrency: int = Field(
+        default=50,
+        description="Maximum MCP server health checks run concurrently per cycle",
+        ge=1,
+        le=500,
+    )
+    mcp_health_check_timeout_seconds: float = Field(
+        default=10.0,
+        description="Deadline for a single MCP server health check (seconds)",
+        ge=1.0,
+        le=30.0,
+    )
+
+    # MCP stdio Warm Pool (src/services/mcp_stdio_pool.py)
+    # Long-lived, initialized stdio server processes shared across executions
+    mcp_pool_enabled: bool = Field(
+        default=True,
+        description="Serve MCP stdio tools from the worker-level warm process pool",
+    )
+    mcp_pool_min_clients_per_server: int = Field(
+        default=1,
+        description="MCP stdio processes kept warm per server configuration",
+        ge=0,
+        le=10,
+    )
+    mcp_pool_max_clients_per_server: int = Field(
+        default=4,
+        description="Maximum MCP stdio processes per server configuration",
+        ge=1,
+        le=100,
+    )
+    mcp_pool_max_stdio_processes: int = Field(
+        default=50,
+        description="Maximum pooled MCP stdio processes per worker process",
+        ge=1,
+        le=200,
+    )
+    mcp_pool_client_ttl_seconds: int = Field(
+        default=300,
+        description="Idle time after which pooled MCP processes above the minimum are evicted",
+        ge=60,
+        le=3600,
+    )
+    mcp_pool_cleanup_interval_seconds: int = Field(
+        default=60,
+        description="Interval between MCP pool eviction/health probe passes (seconds)",
+        ge=10,
+        le=300,
+    )
+    mcp_pool_acquire_timeout_seconds: float = Field(
+        default=30.0,
+        description="Maximum wait for a pooled MCP process when the pool is at capacity (seconds)",
+        ge=1.0,
+        le=120.0,
+    )
+
+    # Agent tool-call concurrency (tool calls from one assistant message)
+    agent_parallel_tool_calls_enabled: bool = Field(
+        default=True,
+        description="Run independent tool calls from one assistant message concurrently",
+    )
+    agent_max_parallel_tool_calls: int = Field(
+        default=4,
+        description="Default per-agent cap on concurrently running tool calls "
+        "(overridable per agent via llm_config.max_parallel_tool_calls)",
+        ge=1,
+        le=32,
+    )
+
+    # Compiled agent executor cache (src/services/agent_execution/executor_cache.py)
+    agent_executor_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse compiled agent executors across executions of an unchanged agent",
+    )
+    agent_executor_cache_max_entries: int = Field(
+        default=256,
+        description="Maximum compiled agent executors kept per worker",
+        ge=1,
+        le=10000,
+    )
+
+    # Cluster-wide tool catalog cache (src/services/tool_catalog_cache.py)
+    # Redis L2 behind UnifiedToolService's in-process cache, invalidated via pub/sub
+    tool_catalog_cache_enabled: bool = Field(
+        default=True,
+        description="Share tenant tool catalogs through Redis and publish invalidations",
+    )
+    tool_catalog_cache_ttl_seconds: int = Field(
+        default=600,
+        description="Expiry of tool catalogs cached in Redis (seconds)",
+        ge=30,
+        le=86400,
+    )
+
+    # Agent execution snapshots (src/services/agent_execution/agent_snapshot.py)
+    agent_snapshot_cache_enabled: bool = Field(
+        default=True,
+        description="Cache immutable agent execution snapshots in process memory",
+    )
+    agent_snapshot_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Maximum age of a cached agent snapshot (seconds); bounds staleness when Redis is down",
+        ge=5,
+        le=3600,
+    )
+    agent_snapshot_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum agent snapshots kept per process",
+        ge=1,
+        le=100000,
+    )
+
+    # Asynchronous agent execution jobs (src/services/agent_execution/jobs.py)
+    agent_job_status_ttl_seconds: int = Field(
+        default=3600,
+        description="How long job statuses are kept in Redis for long-polling clients (seconds)",
+        ge=60,
+        le=86400,
+    )
+    agent_job_callback_timeout_seconds: float = Field(
+        default=10.0,
+        description="Timeout of the HTTP POST to a job's callback URL (seconds)",
+        gt=0,
+        le=60,
+    )
+    agent_job_callback_allow_private_hosts: bool = Field(
+        default=False,
+        description="Allow job callback URLs resolving to loopback, private or link-local "
+        "addresses (development only)",
+    )
+    agent_job_stale_after_seconds: int = Field(
+        default=1800,
+        description="Age after which an unfinished job is failed as lost (seconds); must exceed "
+        "all execute_agent attempts (4 x 300s hard limit) plus retry backoff and queueing",
+        ge=600,
+        le=86400,
+    )
+
+    # Write-behind execution history persistence (src/services/write_behind.py)
+    write_behind_enabled: bool = Field(
+        default=True,
+        description="Batch worker writes of enhancement history and execution trace rows",
+    )
+    write_behind_flush_interval_seconds: float = Field(
+        default=1.0,
+        description="Longest a buffered row waits before it is flushed (seconds)",
+        gt=0,
+        le=30,
+    )
+    write_behind_max_batch_rows: int = Field(
+        default=200,
+        description="Buffered rows that trigger a flush before the interval elapses",
+        ge=1,
+        le=5000,
+    )
+
+    # Agent memory embedding backfill (src/services/agent_memory_backfill.py)
+    agent_memory_backfill_batch_size: int = Field(
+        default=500,
+        description="Legacy text embeddings converted to vectors per transaction",
+        ge=1,
+        le=5000,
+    )
+    agent_memory_backfill_max_batches: int = Field(
+        default=60,
+        description="Maximum backfill batches per run (bounds work per task run)",
+        ge=1,
+        le=1000,
+    )
+
+    # Cooperative cancellation (src/services/execution_cancellation.py)
+    execution_cancel_ttl_seconds: int = Field(
+        default=3600,
+        description="How long a cancel request stays in Redis; covers time spent queued (seconds)",
+        ge=60,
+        le=86400,
+    )
+
+    # MCP HTTP Connection Pool Configuration (Story 11.2.3)
+    # Shared HTTP/2 clients for streamable-HTTP servers (src/services/mcp_http_pool.py)
+    mcp_pool_http_enabled: bool = Field(
+        default=True,
+        description="Share keep-alive HTTP/2 connections across MCP HTTP sessions",
+    )
+    mcp_pool_http_max_connections: int = Field(
+        default=100,
+        description="Maximum HTTP connections per pooled MCP endpoint client",
+        ge=10,
+        le=500,
+    )
+    mcp_pool_http_max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum persistent HTTP connections per pooled MCP endpoint client",
+        ge=5,
+        le=100,
+    )
+    mcp_pool_http_pool_timeout: float = Field(
+        default=5.0,
+        description="Timeout waiting for connection from MCP HTTP pool (seconds)",
+        ge=1.0,
+        le=30.0,
+    )
+    mcp_pool_http_keepalive_expiry_seconds: float = Field(
+        default=60.0,
+        description="Idle time before a kept-alive MCP HTTP connection is closed (seconds)",
+        ge=5.0,
+        le=600.0,
+    )
+    mcp_pool_http_idle_ttl_seconds: int = Field(
+        default=300,
+        description="Close a pooled MCP endpoint client unused for this long (seconds)",
+        ge=30,
+        le=3600,
+    )
+
+    # MCP Tool Result Cache (src/services/mcp_tool_result_cache.py)
+    # Opt-in per tool via mcp_servers.tool_cache_policies; this is the global switch
+    mcp_tool_result_cache_enabled: bool = Field(
+        default=True,
+        description="Serve repeated read-only MCP tool calls from the Redis result cache",
+    )
+    mcp_tool_result_cache_max_bytes: int = Field(
+        default=256 * 1024,
+        description="Largest tool result stored in the result cache (bytes)",
+        ge=1024,
+        le=4 * 1024 * 1024,
+    )
+
+    # MCP Large Tool Results (src/services/mcp_large_result_store.py)
+    # Oversized results are spilled to compressed paged files; the LLM gets a preview + handle
+    mcp_large_result_enabled: bool = Field(
+        default=True,
+        description="Spill oversized MCP tool results and give the LLM a paged view",
+    )
+    mcp_large_result_threshold_bytes: int = Field(
+        default=32 * 1024,
+        description="Tool results larger than this are spilled instead of inlined (bytes)",
+        ge=1024,
+        le=16 * 1024 * 1024,
+    )
+    mcp_large_result_preview_chars: int = Field(
+        default=4000,
+        description="Characters of a spilled result shown inline to the LLM",
+        ge=200,
+        le=100000,
+    )
+    mcp_large_result_page_chars: int = Field(
+        default=16000,
+        description="Characters per page returned by read_mcp_result_page",
+        ge=1000,
+        le=200000,
+    )
+    mcp_large_result_ttl_seconds: int = Field(
+        default=3600,
+        description="Spilled results older than this are deleted (seconds)",
+        ge=60,
+        le=86400,
+    )
+    mcp_large_result_dir: str = Field(
+        default="",
+        description="Directory for spill files (empty: system temp directory)",
+    )
 
     @field_validator("jwt_secret_key")
     @classmethod
@@ -7,13 +7,16 @@ Models support async operations and multi-tenant isolation via row-level securit
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     CheckConstraint,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -27,7 +30,7 @@ from sqlalchemy import (
     text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, JSONB
 from sqlalchemy.orm import declarative_base, relationship
 import uuid
 
@@ -373,7 +376,7 @@ class EnhancementHistory(Base):
         id: UUID primary key (globally unique)
         tenant_id: Tenant identifier for multi-tenant isolation
         ticket_id: ServiceDesk ticket being enhanced
-        status: Current status (pending, completed, failed)
+        status: Current status (pending, completed, failed, cancelled)
         context_gathered: JSON object containing gathered context from all sources
         llm_output: Full LLM response text
         error_message: Error details if status=failed
@@ -407,7 +410,7 @@ class EnhancementHistory(Base):
         String(50),
         nullable=False,
         index=True,
-        doc="Enhancement status: pending, completed, failed",
+        doc="Enhancement status: pending, completed, failed, cancelled",
     )
     context_gathered: Optional[dict] = Column(
         JSON,
@@ -1215,7 +1218,8 @@ class AgentMemory(Base):
         tenant_id: Tenant identifier for isolation
         memory_type: Type of memory (short_term, long_term, agentic)
         content: JSONB content (flexible structure)
-        embedding: Vector embedding for similarity search (1536 dims)
+        embedding: Vector embedding for similarity search (pgvector, 1536 dims)
+        embedding_legacy: Text embedding awaiting backfill into embedding
         retention_days: Days before auto-deletion
         created_at: Timestamp when memory was created
         updated_at: Timestamp when memory was last updated
@@ -1254,10 +1258,15 @@ class AgentMemory(Base):
         nullable=False,
         doc="Memory content as JSONB (flexible structure for different memory types)",
     )
-    embedding: Optional[str] = Column(
+    embedding: Optional[Any] = Column(
+        Vector(1536),
+        nullable=True,
+        doc="Vector embedding for semantic search (1536 dims, read as a numpy array)",
+    )
+    embedding_legacy: Optional[str] = Column(
         Text,
         nullable=True,
-        doc="Vector embedding for semantic search (text format for pgvector, 1536 dims)",
+        doc="Text embedding stored before migration 023, cleared once backfilled into embedding",
     )
     retention_days: int = Column(
         Integer,
@@ -1279,9 +1288,22 @@ class AgentMemory(Base):
         doc="Timestamp when memory was last updated",
     )
 
-    # Composite index for agent_id, memory_type, created_at DESC
+    # Composite index for agent_id, memory_type, created_at DESC; HNSW index
+    # for cosine similarity search; partial index of rows awaiting backfill
     __table_args__ = (
         Index("idx_agent_memory_agent_type", "agent_id", "memory_type", desc("created_at")),
+        Index(
+            "idx_agent_memory_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        Index(
+            "idx_agent_memory_embedding_legacy",
+            "id",
+            postgresql_where=text("embedding_legacy IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1883,6 +1905,8 @@ class MCPServer(Base):
         discovered_tools: Tools from MCP tools/list endpoint (JSONB array)
         discovered_resources: Resources from resources/list (JSONB array)
         discovered_prompts: Prompts from prompts/list (JSONB array)
+        discovery_version: Bumped when discovered capabilities change (cache key)
+        tool_cache_policies: Opt-in result caching for read-only tools (JSONB object)
         status: Current health status ('active', 'inactive', 'error')
         last_health_check: Timestamp of last health verification
         error_message: Latest error details if status='error'
@@ -2007,6 +2031,22 @@ class MCPServer(Base):
         server_default=func.cast(func.text("'[]'"), JSONB),
         doc="Prompts from MCP prompts/list endpoint (array of prompt templates)"
     )
+
+    discovery_version = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=func.text("0"),
+        doc="Incremented whenever discovered capabilities change (capability cache key)"
+    )
+
+    tool_cache_policies = Column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=func.cast(func.text("'{}'"), JSONB),
+        doc="Per-tool result cache policies: {tool_name: {read_only, ttl_seconds, scope}}"
+    )
     
     # Health and status tracking
     status = Column(
@@ -2123,6 +2163,12 @@ class MCPServerMetric(Base):
 
     Retention: 7 days (managed by Celery cleanup task)
 
+    Partitioning (migration 019): range-partitioned by check_timestamp into
+    daily partitions (mcp_server_metrics_pYYYYMMDD). Retention detaches and
+    drops whole partitions; see src/services/mcp_metrics_partitions.py. The
+    primary key includes check_timestamp because PostgreSQL requires the
+    partition key in every unique constraint of a partitioned table.
+
     Relationships:
         - Many-to-one with MCPServer (CASCADE delete)
         - Many-to-one with TenantConfig (CASCADE delete)
@@ -2172,9 +2218,10 @@ class MCPServerMetric(Base):
     )
     check_timestamp = Column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
-        doc="When the health check was performed"
+        doc="When the health check was performed (partition key)"
     )
 
     # Status metrics
@@ -2224,7 +2271,8 @@ class MCPServerMetric(Base):
         back_populates="mcp_metrics",
     )
 
-    # Indexes defined in Alembic migration 012:
+    # Indexes defined in Alembic migration 012 (recreated on the partitioned
+    # parent by migration 019):
     # - idx_mcp_metrics_server_time (mcp_server_id, check_timestamp DESC)
     # - idx_mcp_metrics_tenant (tenant_id)
     # - idx_mcp_metrics_status_time (status, check_timestamp DESC)
@@ -2240,3 +2288,178 @@ class MCPServerMetric(Base):
             f"timestamp={self.check_timestamp}"
             f")>"
         )
+
+
+class MCPServerLatencyRollup(Base):
+    """
+    Per-server, per-minute health check latency rollup.
+
+    Written alongside every MCPServerMetric row (see
+    src/services/mcp_latency_rollups.py). Holds counts, latency sum/max and a
+    fixed log-scale histogram so dashboard percentiles merge histograms
+    instead of running PERCENTILE_CONT over raw metric rows.
+
+    Retention: same as mcp_server_metrics (pruned by the cleanup task)
+    """
+
+    __tablename__ = "mcp_server_latency_rollups"
+
+    mcp_server_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("mcp_servers.id", ondelete="CASCADE"),
+        primary_key=True,
+        doc="MCP server this rollup belongs to"
+    )
+    bucket_start = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        doc="Start of the minute covered by this rollup"
+    )
+    tenant_id = Column(
+        String(100),
+        nullable=False,
+        doc="Tenant identifier"
+    )
+    check_count = Column(Integer, nullable=False, default=0, doc="Health checks in the minute")
+    success_count = Column(Integer, nullable=False, default=0, doc="Successful checks")
+    sum_response_time_ms = Column(
+        BigInteger, nullable=False, default=0, doc="Sum of response times (ms)"
+    )
+    max_response_time_ms = Column(
+        Integer, nullable=False, default=0, doc="Maximum response time (ms)"
+    )
+    histogram = Column(
+        ARRAY(Integer),
+        nullable=False,
+        doc="Log-scale latency bucket counts (layout in mcp_latency_rollups)"
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"<MCPServerLatencyRollup(server_id={self.mcp_server_id}, "
+            f"bucket_start={self.bucket_start}, checks={self.check_count})>"
+        )
+
+
+class LLMSpendDailyRollup(Base):
+    """
+    Daily LLM spend rollup derived from LiteLLM_SpendLogs.
+
+    One row per (day, tenant, model_group, agent tag), maintained
+    incrementally by the tasks.rollup_llm_spend beat task. The cost dashboard
+    reads complete days from here and only scans raw spend logs for days at
+    or after the rollup high-water mark (see LLMSpendRollupState).
+
+    Empty strings stand in for missing tenant/agent so the composite primary
+    key can serve ON CONFLICT upserts.
+    """
+
+    __tablename__ = "llm_spend_daily_rollups"
+
+    day = Column(Date, primary_key=True, doc="UTC day of LiteLLM startTime")
+    tenant_id = Column(
+        String(255),
+        primary_key=True,
+        doc="LiteLLM end_user (tenant identifier), '' when absent",
+    )
+    model_group = Column(String(255), primary_key=True, doc="LiteLLM model group")
+    agent_tag = Column(
+        String(255),
+        primary_key=True,
+        doc="First 'agent:<name>' request tag, '' when absent",
+    )
+    spend = Column(Float, nullable=False, default=0.0, doc="Total cost in USD")
+    prompt_tokens = Column(BigInteger, nullable=False, default=0, doc="Total input tokens")
+    completion_tokens = Column(BigInteger, nullable=False, default=0, doc="Total output tokens")
+    total_tokens = Column(BigInteger, nullable=False, default=0, doc="Total tokens")
+    request_count = Column(Integer, nullable=False, default=0, doc="Number of requests")
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Last time the row was incremented",
+    )
+
+    __table_args__ = (
+        Index("idx_llm_spend_rollups_tenant_day", "tenant_id", "day"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"<LLMSpendDailyRollup(day={self.day}, tenant_id='{self.tenant_id}', "
+            f"model_group='{self.model_group}', spend={self.spend})>"
+        )
+
+
+class LLMSpendAttribution(Base):
+    """
+    Agent attribution for LiteLLM spend logs.
+
+    Mirrors the agent-related request tags of each spend log ("agent:<name>",
+    "agent_id:<uuid>", "execution:<id>") into indexed columns so per-agent
+    cost queries never unnest request_tags. Rows are written at ingestion
+    time by the llm_spend_attribution_capture trigger on LiteLLM_SpendLogs
+    and re-swept by the spend rollup task (idempotent on request_id).
+    """
+
+    __tablename__ = "llm_spend_attributions"
+
+    request_id = Column(
+        String(255), primary_key=True, doc="LiteLLM_SpendLogs.request_id"
+    )
+    start_time = Column(
+        DateTime(timezone=False),
+        nullable=False,
+        doc="LiteLLM startTime (naive UTC)",
+    )
+    tenant_id = Column(String(255), nullable=True, doc="LiteLLM end_user (tenant identifier)")
+    agent_name = Column(String(255), nullable=False, doc="Agent name from the 'agent:' tag")
+    agent_id = Column(String(36), nullable=True, doc="Agent UUID from the 'agent_id:' tag")
+    execution_id = Column(
+        String(255), nullable=True, doc="Execution ID from the 'execution:' tag"
+    )
+    model_group = Column(String(255), nullable=True, doc="LiteLLM model group")
+    spend = Column(Float, nullable=False, default=0.0, doc="Cost in USD")
+    prompt_tokens = Column(Integer, nullable=False, default=0, doc="Input tokens")
+    completion_tokens = Column(Integer, nullable=False, default=0, doc="Output tokens")
+    total_tokens = Column(Integer, nullable=False, default=0, doc="Total tokens")
+
+    __table_args__ = (
+        Index("idx_llm_spend_attr_tenant_agent_time", "tenant_id", "agent_name", "start_time"),
+        Index("idx_llm_spend_attr_agent_time", "agent_name", "start_time"),
+        Index("idx_llm_spend_attr_execution", "execution_id"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"<LLMSpendAttribution(request_id='{self.request_id}', "
+            f"agent_name='{self.agent_name}', spend={self.spend})>"
+        )
+
+
+class LLMSpendRollupState(Base):
+    """
+    High-water mark for the LLM spend rollup.
+
+    Spend logs with startTime < high_water_mark have been folded into
+    llm_spend_daily_rollups. Updated in the same transaction as each rollup
+    window so runs are resumable.
+    """
+
+    __tablename__ = "llm_spend_rollup_state"
+
+    name = Column(String(50), primary_key=True, doc="Rollup name ('daily')")
+    high_water_mark = Column(
+        DateTime(timezone=False),
+        nullable=False,
+        doc="Exclusive upper bound of rolled-up startTime (naive UTC, like LiteLLM)",
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Last rollup run timestamp",
+    )
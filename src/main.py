@@ -14,7 +14,7 @@ from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import make_asgi_app
 
-from src.api import health, webhooks, feedback, plugins, agents, prompts, budget, llm_providers, llm_models, fallback_chains, byok, agent_testing, memory, llm_costs, agent_performance, tenant_spend, executions, openapi_tools, mcp_servers, agent_execution, unified_tools, metrics, tenants
+from src.api import health, webhooks, feedback, plugins, agents, prompts, budget, llm_providers, llm_models, fallback_chains, byok, agent_testing, memory, llm_costs, agent_performance, tenant_spend, executions, openapi_tools, mcp_servers, agent_execution, agent_execution_jobs, agent_execution_stream, unified_tools, metrics, tenants
 from src.api import auth, users  # Story 1C: Authentication endpoints
 from src.api.admin import tenants as admin_tenants
 from src.api.exception_handlers import setup_exception_handlers  # Story 1C
@@ -104,6 +104,8 @@ app.include_router(tenant_spend.router)  # Story 9.3: Tenant spend tracking and
 app.include_router(executions.router, prefix="/api/executions")  # Story 10.1: Execution details API endpoint
 app.include_router(mcp_servers.router)  # Story 11.1.4: MCP Server Management API endpoints
 app.include_router(agent_execution.router)  # Story 11.1.7: Agent execution with MCP tool invocation
+app.include_router(agent_execution_stream.router)  # Streamed agent execution (Server-Sent Events)
+app.include_router(agent_execution_jobs.router)  # Asynchronous agent execution jobs on Celery
 app.include_router(unified_tools.router)  # Story 11.1.5: Unified tool discovery for OpenAPI and MCP tools
 app.include_router(metrics.router)  # Metrics API endpoints for dashboard monitoring
 app.include_router(tenants.router)  # Public tenants API endpoints (session-authenticated)
@@ -111,11 +111,8 @@ worker_active_count: Gauge = Gauge(
 # ============================================================================
 # MCP BRIDGE POOLING METRICS (Story 11.2.3)
 # ============================================================================
-# NOTE: These metrics are defined but NOT yet instrumented in the bridge pooling code.
-# Story 11.2.3 implements simplified bridge pooling (per-execution context lifecycle)
-# without the full MCPConnectionPool class that would use these metrics.
-# These are marked as FUTURE ENHANCEMENT for potential instrumentation if monitoring
-# requirements emerge or if full connection pool manager is implemented later.
+# Populated by the MCP stdio warm pool (src/services/mcp_stdio_pool.py) with
+# transport_type="stdio". Reuse ratio = reuses / acquisitions.
 # ============================================================================
 
 # GAUGE: mcp_pool_total_clients
@@ -190,6 +187,24 @@ mcp_pool_wait_time_seconds: Histogram = Histogram(
     buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
 )
 
+# ===== MCP Tool Result Cache and Spill Metrics =====
+# Hit rate = hits / (hits + misses) for tools with a read-only cache policy.
+
+# COUNTER: mcp_tool_result_cache_lookups_total
+mcp_tool_result_cache_lookups_total: Counter = Counter(
+    name="mcp_tool_result_cache_lookups_total",
+    documentation="MCP tool result cache lookups by outcome (hit, miss, error)",
+    labelnames=["server_id", "tool_name", "outcome"],
+)
+
+# COUNTER: mcp_tool_results_spilled_total
+# outcome="spilled" (paged handle given to the LLM) or "truncated" (spill failed)
+mcp_tool_results_spilled_total: Counter = Counter(
+    name="mcp_tool_results_spilled_total",
+    documentation="Oversized MCP tool results replaced by a bounded view",
+    labelnames=["tool_name", "outcome"],
+)
+
 # ===== MCP Server Health Monitoring Metrics (Story 11.2.4) =====
 # These metrics track detailed health check results for MCP servers,
 # enabling performance analysis, failure detection, and trend monitoring.
@@ -229,3 +244,206 @@ mcp_health_check_duration_seconds: Histogram = Histogram(
     labelnames=["server_id", "server_name", "transport_type"],
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, float("inf")),
 )
+
+# HISTOGRAM: mcp_health_check_cycle_duration_seconds
+# A cycle checks every active/error server; compare against the 30s beat interval.
+mcp_health_check_cycle_duration_seconds: Histogram = Histogram(
+    name="mcp_health_check_cycle_duration_seconds",
+    documentation="Duration of a full MCP health check cycle across all servers",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 20.0, 25.0, 30.0, 60.0, float("inf")),
+)
+
+# GAUGE: mcp_health_check_cycle_servers
+mcp_health_check_cycle_servers: Gauge = Gauge(
+    name="mcp_health_check_cycle_servers",
+    documentation="Servers checked in the most recent health check cycle",
+)
+
+# ===== Tool Argument Model Cache Metrics =====
+# Pydantic models generated from tool JSON Schemas (UnifiedToolService).
+
+# COUNTER: tool_schema_model_cache_lookups_total
+tool_schema_model_cache_lookups_total: Counter = Counter(
+    name="tool_schema_model_cache_lookups_total",
+    documentation="Tool argument model cache lookups by outcome (hit, miss)",
+    labelnames=["outcome"],
+)
+
+# GAUGE: tool_schema_model_cache_size
+tool_schema_model_cache_size: Gauge = Gauge(
+    name="tool_schema_model_cache_size",
+    documentation="Generated tool argument models cached in this process",
+)
+
+# ===== Tool Catalog Cache Metrics =====
+# In-process L1 + Redis L2 tenant tool catalogs (services/tool_catalog_cache.py).
+
+# COUNTER: tool_catalog_cache_lookups_total
+tool_catalog_cache_lookups_total: Counter = Counter(
+    name="tool_catalog_cache_lookups_total",
+    documentation="Tool catalog cache lookups by level (l1, l2) and outcome (hit, miss, error)",
+    labelnames=["level", "outcome"],
+)
+
+# COUNTER: tool_catalog_invalidations_total
+tool_catalog_invalidations_total: Counter = Counter(
+    name="tool_catalog_invalidations_total",
+    documentation="Tenant tool catalog invalidations published by this process",
+)
+
+# ===== Agent Executor Cache Metrics =====
+# Per-worker LRU of compiled agent executors (agent_execution/executor_cache.py).
+
+# COUNTER: agent_executor_cache_lookups_total
+agent_executor_cache_lookups_total: Counter = Counter(
+    name="agent_executor_cache_lookups_total",
+    documentation="Compiled agent executor cache lookups by outcome (hit, miss)",
+    labelnames=["outcome"],
+)
+
+# GAUGE: agent_executor_cache_size
+agent_executor_cache_size: Gauge = Gauge(
+    name="agent_executor_cache_size",
+    documentation="Compiled agent executors cached in this worker",
+)
+
+# ===== Agent Snapshot Cache Metrics =====
+# Per-process agent execution snapshots (agent_execution/agent_snapshot.py).
+
+# COUNTER: agent_snapshot_cache_lookups_total
+agent_snapshot_cache_lookups_total: Counter = Counter(
+    name="agent_snapshot_cache_lookups_total",
+    documentation="Agent snapshot cache lookups by outcome (hit, miss, stale)",
+    labelnames=["outcome"],
+)
+
+# ===== Streaming Agent Execution Metrics =====
+# POST /api/agent-execution/execute/stream (Server-Sent Events).
+
+# HISTOGRAM: agent_stream_time_to_first_byte_seconds
+agent_stream_time_to_first_byte_seconds: Histogram = Histogram(
+    name="agent_stream_time_to_first_byte_seconds",
+    documentation="Time from request to the first streamed agent output (token or tool event)",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0),
+)
+
+# COUNTER: agent_stream_executions_total
+agent_stream_executions_total: Counter = Counter(
+    name="agent_stream_executions_total",
+    documentation="Streamed agent executions by final status (success/failed/cancelled)",
+    labelnames=["status"],
+)
+
+# ===== Agent Execution Job Metrics =====
+# POST /api/agent-execution/jobs, executed by the execute_agent Celery task.
+
+# COUNTER: agent_execution_jobs_total
+agent_execution_jobs_total: Counter = Counter(
+    name="agent_execution_jobs_total",
+    documentation="Agent execution jobs by status reached (queued/success/failed/cancelled)",
+    labelnames=["status"],
+)
+
+# ===== Execution Cancellation Metrics =====
+# Cancel requests that stopped a running or queued execution, by kind (agent/enhancement).
+
+# COUNTER: execution_cancellations_total
+execution_cancellations_total: Counter = Counter(
+    name="execution_cancellations_total",
+    documentation="Agent and enhancement executions aborted by a cancel request",
+    labelnames=["kind"],
+)
+
+# ===== Write-Behind Persistence Metrics =====
+# Execution history rows flushed by worker write-behind buffers (src/services/write_behind.py).
+
+# COUNTER: write_behind_rows_total
+write_behind_rows_total: Counter = Counter(
+    name="write_behind_rows_total",
+    documentation="Row states flushed by write-behind buffers, by table and outcome (written/dropped)",
+    labelnames=["table", "outcome"],
+)
+
+# HISTOGRAM: write_behind_flush_duration_seconds
+write_behind_flush_duration_seconds: Histogram = Histogram(
+    name="write_behind_flush_duration_seconds",
+    documentation="Duration of successful write-behind flush transactions",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# ===== LLM Request Hedging Metrics =====
+# Hedge rate = llm_hedged_requests_total{outcome!="not_hedged"} / sum(llm_hedged_requests_total).
+# Cost overhead is approximated by tokens streamed by cancelled (losing) attempts.
+
+# COUNTER: llm_hedged_requests_total
+llm_hedged_requests_total: Counter = Counter(
+    name="llm_hedged_requests_total",
+    documentation="Hedging-enabled LLM requests by primary model and outcome",
+    labelnames=["primary_model", "outcome"],
+)
+
+# COUNTER: llm_hedge_overhead_tokens_total
+llm_hedge_overhead_tokens_total: Counter = Counter(
+    name="llm_hedge_overhead_tokens_total",
+    documentation="Approximate tokens consumed by cancelled hedge attempts",
+    labelnames=["model"],
+)
+
+# HISTOGRAM: llm_first_token_seconds
+llm_first_token_seconds: Histogram = Histogram(
+    name="llm_first_token_seconds",
+    documentation="Time to first streamed token per LLM model (seconds)",
+    labelnames=["model"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0),
+)
+
+# ===== Adaptive LLM Concurrency Limiter Metrics =====
+# Per (provider, model) AIMD limiter wrapping every LLM HTTP call.
+
+# GAUGE: llm_concurrency_limit
+llm_concurrency_limit: Gauge = Gauge(
+    name="llm_concurrency_limit",
+    documentation="Current adaptive concurrency limit per provider/model (this worker)",
+    labelnames=["provider", "model"],
+)
+
+# GAUGE: llm_concurrency_in_flight
+llm_concurrency_in_flight: Gauge = Gauge(
+    name="llm_concurrency_in_flight",
+    documentation="LLM calls currently in flight per provider/model (this worker)",
+    labelnames=["provider", "model"],
+)
+
+# HISTOGRAM: llm_concurrency_queue_seconds
+llm_concurrency_queue_seconds: Histogram = Histogram(
+    name="llm_concurrency_queue_seconds",
+    documentation="Time LLM calls waited for a concurrency slot (seconds)",
+    labelnames=["provider", "model"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# COUNTER: llm_concurrency_throttled_total
+llm_concurrency_throttled_total: Counter = Counter(
+    name="llm_concurrency_throttled_total",
+    documentation="LLM calls rejected by the provider as overloaded (HTTP 429/503)",
+    labelnames=["provider", "model"],
+)
+
+# ===== Budget Maintenance Job Metrics =====
+# tasks.reset_tenant_budgets (job="reset") and tasks.expire_budget_overrides
+# (job="expire_overrides").
+
+# HISTOGRAM: budget_job_duration_seconds
+budget_job_duration_seconds: Histogram = Histogram(
+    name="budget_job_duration_seconds",
+    documentation="Duration of budget maintenance job runs (seconds)",
+    labelnames=["job"],
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+# COUNTER: budget_job_rows_total
+budget_job_rows_total: Counter = Counter(
+    name="budget_job_rows_total",
+    documentation="Rows processed by budget maintenance jobs by outcome (success/failed)",
+    labelnames=["job", "outcome"],
+)
@@ -82,6 +82,8 @@ class LLMConfig(BaseModel):
         model: Model identifier (e.g., gpt-4, claude-3-5-sonnet)
         temperature: Sampling temperature (0.0-2.0, default 0.7)
         max_tokens: Maximum tokens in response (1-32000, default 4096)
+        max_parallel_tool_calls: Cap on tool calls from one assistant message
+            run concurrently (1 = sequential; default from platform settings)
 
     Example:
         {
@@ -96,6 +98,7 @@ class LLMConfig(BaseModel):
     model: str = Field(..., min_length=1, max_length=100)
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int = Field(default=4096, ge=1, le=32000)
+    max_parallel_tool_calls: Optional[int] = Field(default=None, ge=1, le=32)
 
     @field_validator("model", mode="after")
     @classmethod
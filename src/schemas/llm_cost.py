@@ -56,6 +56,34 @@ class AgentSpendDTO(BaseModel):
         return v or 0.0
 
 
+class AgentExecutionSpendDTO(BaseModel):
+    """
+    Spend of a single agent execution (drill-down row for AC#6).
+
+    Spend logs without an execution tag are reported per LLM call, keyed by
+    their LiteLLM request_id.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    execution_id: str = Field(description="Execution ID (or request_id if untagged)")
+    first_call_at: datetime = Field(description="First LLM call start time (UTC)")
+    last_call_at: datetime = Field(description="Last LLM call start time (UTC)")
+    call_count: int = Field(ge=0, description="Number of LLM calls")
+    total_tokens: int = Field(ge=0, description="Total tokens consumed")
+    total_cost: float = Field(ge=0.0, description="Total cost in USD")
+
+
+class AgentExecutionSpendPageDTO(BaseModel):
+    """Paginated per-execution spend for one agent."""
+
+    agent_name: str
+    executions: List[AgentExecutionSpendDTO]
+    total: int = Field(ge=0, description="Total executions in range")
+    page: int = Field(ge=1, description="Page number (1-indexed)")
+    page_size: int = Field(ge=1, description="Items per page")
+
+
 class ModelSpendDTO(BaseModel):
     """
     Model spend summary.
@@ -21,7 +21,7 @@ Following 2025 best practices from Context7 MCP research.
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict
+from typing import Any, Dict
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -132,6 +132,11 @@ class MCPHealthMetric(BaseModel):
         description="Transport protocol: 'stdio' or 'http_sse'",
         pattern="^(stdio|http_sse)$",
     )
+    tools: list[dict[str, Any]] | None = Field(
+        None,
+        exclude=True,
+        description="Tools returned by a successful tools/list probe (not persisted)",
+    )
 
     @field_validator("response_time_ms")
     @classmethod
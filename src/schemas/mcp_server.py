@@ -16,6 +16,7 @@ Following 2025 Pydantic v2 best practices:
 """
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -235,6 +236,33 @@ class MCPDiscoveredPrompt(BaseModel):
     )
 
 
+class MCPToolCachePolicy(BaseModel):
+    """
+    Result cache policy for one MCP tool (opt-in, keyed by tool name).
+
+    Calls to a read-only tool with identical arguments are answered from the
+    result cache until ttl_seconds elapse. Tools with side effects must never
+    be marked read-only.
+
+    Attributes:
+        read_only: Tool has no side effects; results may be cached
+        ttl_seconds: How long a cached result is served
+        scope: "tenant" shares results across the tenant's executions,
+            "execution" only within a single execution
+
+    Example:
+        {"read_only": true, "ttl_seconds": 300, "scope": "tenant"}
+    """
+
+    read_only: bool = Field(default=False, description="Tool has no side effects")
+    ttl_seconds: int = Field(
+        default=300, ge=1, le=86400, description="Cached result lifetime (seconds)"
+    )
+    scope: Literal["tenant", "execution"] = Field(
+        default="tenant", description="Share cached results across the tenant or one execution"
+    )
+
+
 # =============================================================================
 # MCP Server CRUD Schemas (AC1, AC2, AC3, AC7)
 # =============================================================================
@@ -333,6 +361,11 @@ class MCPServerCreate(BaseModel):
         description="HTTP headers for authentication",
         examples=[{"Authorization": "Bearer ghp_xxxxxxxxxxxx"}, {"X-API-Key": "secret_key_here"}],
     )
+    tool_cache_policies: dict[str, MCPToolCachePolicy] = Field(
+        default_factory=dict,
+        description="Opt-in result cache policies keyed by tool name",
+        examples=[{"jira_get_issue": {"read_only": True, "ttl_seconds": 300, "scope": "tenant"}}],
+    )
 
     @model_validator(mode="after")
     def validate_transport_fields(self) -> "MCPServerCreate":
@@ -460,6 +493,9 @@ class MCPServerUpdate(BaseModel):
     env: dict[str, str] | None = Field(None, description="Environment variables object for stdio")
     url: str | None = Field(None, max_length=500, description="Base URL for HTTP+SSE transport")
     headers: dict[str, str] | None = Field(None, description="HTTP headers for authentication")
+    tool_cache_policies: dict[str, MCPToolCachePolicy] | None = Field(
+        None, description="Opt-in result cache policies keyed by tool name"
+    )
 
     @model_validator(mode="after")
     def validate_transport_fields(self) -> "MCPServerUpdate":
@@ -589,6 +625,9 @@ class MCPServerResponse(BaseModel):
     headers: dict[str, str] = Field(
         default_factory=dict, description="HTTP headers (empty for stdio)"
     )
+    tool_cache_policies: dict[str, MCPToolCachePolicy] = Field(
+        default_factory=dict, description="Result cache policies keyed by tool name"
+    )
 
     # Discovered capabilities (JSONB arrays)
     discovered_tools: list[MCPDiscoveredTool] = Field(
@@ -618,6 +657,12 @@ class MCPServerResponse(BaseModel):
     created_at: datetime = Field(..., description="Server registration timestamp (ISO 8601)")
     updated_at: datetime = Field(..., description="Last update timestamp (ISO 8601)")
 
+    @field_validator("tool_cache_policies", mode="before")
+    @classmethod
+    def default_tool_cache_policies(cls, v: dict | None) -> dict:
+        """Rows not yet flushed carry None instead of the column default."""
+        return v or {}
+
 
 class MCPTestConnectionResponse(BaseModel):
     """
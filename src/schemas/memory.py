@@ -39,7 +39,7 @@ class MemoryItem(BaseModel):
     content: dict[str, Any] = Field(..., description="Memory content (flexible structure)")
     embedding: Optional[str] = Field(
         None,
-        description="Vector embedding (text format for pgvector, 1536 dims)",
+        description="Vector embedding as JSON text (1536 dims)",
     )
     retention_days: int = Field(
         default=90,
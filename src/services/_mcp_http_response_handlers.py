@@ -38,8 +38,57 @@ class MCPServerError(MCPError):
     pass
 
 
+# MCP session assigned by the server on initialize (MCP 2025-03-26)
+MCP_SESSION_HEADER = "Mcp-Session-Id"
+
+
+def session_headers(session_id: str | None) -> dict[str, str] | None:
+    """
+    Per-request headers echoing the MCP session ID, if the server assigned one.
+
+    Args:
+        session_id: Mcp-Session-Id from the initialize response, or None.
+
+    Returns:
+        Headers dict for post_request / handle_sse_stream, or None.
+    """
+    return {MCP_SESSION_HEADER: session_id} if session_id else None
+
+
+def response_session_id(response: httpx.Response, current: str | None) -> str | None:
+    """
+    Return the session ID a response assigns, else the current one.
+
+    Args:
+        response: httpx.Response from the MCP server.
+        current: Session ID already held by the client.
+
+    Returns:
+        Session ID to send on later requests.
+    """
+    return response.headers.get(MCP_SESSION_HEADER) or current
+
+
+async def terminate_session(client: httpx.AsyncClient, url: str, session_id: str) -> None:
+    """
+    End an MCP session with an explicit DELETE (best effort, never raises).
+
+    Args:
+        client: httpx.AsyncClient the session was opened on.
+        url: MCP server URL endpoint.
+        session_id: Mcp-Session-Id to terminate.
+    """
+    try:
+        await client.delete(url, headers={MCP_SESSION_HEADER: session_id})
+    except Exception as e:
+        logger.debug("MCP session termination failed", url=url, error=str(e))
+
+
 async def handle_sse_stream(
-    client: httpx.AsyncClient, url: str, jsonrpc_payload: dict[str, Any]
+    client: httpx.AsyncClient,
+    url: str,
+    jsonrpc_payload: dict[str, Any],
+    request_headers: dict[str, str] | None = None,
 ) -> tuple[dict[str, Any], str | None]:
     """
     Handle SSE stream response mode (text/event-stream).
@@ -48,6 +97,7 @@ async def handle_sse_stream(
         client: httpx.AsyncClient instance for making requests.
         url: MCP server URL endpoint.
         jsonrpc_payload: JSON-RPC request payload to send.
+        request_headers: Per-request headers (e.g. Mcp-Session-Id).
 
     Returns:
         Tuple of (JSON-RPC result dict, last event ID).
@@ -61,7 +111,9 @@ async def handle_sse_stream(
     last_event_id: str | None = None
 
     try:
-        async with aconnect_sse(client, "POST", url, json=jsonrpc_payload) as event_source:
+        async with aconnect_sse(
+            client, "POST", url, json=jsonrpc_payload, headers=dict(request_headers or {})
+        ) as event_source:
             async for event in event_source.aiter_sse():
                 cumulative_events += 1
 
@@ -142,6 +194,7 @@ async def post_request(
     jsonrpc_payload: dict[str, Any],
     headers: dict[str, str],
     redact_func: callable,
+    request_headers: dict[str, str] | None = None,
 ) -> httpx.Response:
     """
     Send HTTP POST request to MCP server with comprehensive error handling.
@@ -152,6 +205,8 @@ async def post_request(
         jsonrpc_payload: JSON-RPC request payload.
         headers: HTTP headers dict.
         redact_func: Function to redact sensitive headers for logging.
+        request_headers: Per-request headers (e.g. Mcp-Session-Id) sent in
+            addition to the client's default headers.
 
     Returns:
         httpx.Response object.
@@ -174,7 +229,7 @@ async def post_request(
     )
 
     try:
-        response = await client.post(url, json=jsonrpc_payload)
+        response = await client.post(url, json=jsonrpc_payload, headers=request_headers)
         response.raise_for_status()
 
         # Log response
@@ -3,9 +3,17 @@ Agent Execution Submodule
 
 Modular components for agent execution workflow:
 - mcp_bridge_pooler: MCP bridge connection pooling and lifecycle management
+- executor_cache: Per-worker LRU of compiled agent executors
+- agent_snapshot: Cached immutable agent snapshots for webhooks and execution
 - tool_converter: Tool conversion from unified format to LangChain tools
 - message_builder: Message construction with variable substitution
+- preparation: Execution steps up to invoking the executor
 - result_extractor: Result parsing from LangGraph execution output
+- event_stream: LangGraph streaming events translated for the streaming API
+- streaming: Streamed executions run in their own task
+- execution_record: AgentTestExecution records of finished executions
+- jobs: Asynchronous execution jobs run by the execute_agent Celery task
+- cancellation: Cancel flag checks before LLM turns and tool calls
 
 This module was refactored from agent_execution_service.py in Story 12.7
 to comply with 2025 Python best practices (150-500 line file size sweet spot).
@@ -16,19 +24,35 @@ References:
 - WebSearch: "Right-Sizing Python Files for AI Code Editors" (Medium, Sep 2025)
 """
 
+from .agent_snapshot import (
+    AgentSnapshot,
+    get_agent_snapshot,
+    invalidate_agent_snapshot,
+)
+from .cancellation import CancellationCallbackHandler
+from .event_stream import StreamEventTranslator, error_event
+from .execution_record import build_execution_record
 from .mcp_bridge_pooler import (
     cleanup_mcp_bridge,
+    detach_mcp_bridge,
+    get_mcp_bridge,
     get_or_create_mcp_bridge,
     get_pool_size,
 )
 from .message_builder import build_messages
-from .result_extractor import extract_response, extract_tool_calls
+from .result_extractor import extract_response, extract_tool_calls, failure_result, success_result
 from .tool_converter import convert_tools_to_langchain
 
 __all__ = [
+    # Agent Snapshots
+    "AgentSnapshot",
+    "get_agent_snapshot",
+    "invalidate_agent_snapshot",
     # MCP Bridge Pooling
     "get_or_create_mcp_bridge",
     "cleanup_mcp_bridge",
+    "detach_mcp_bridge",
+    "get_mcp_bridge",
     "get_pool_size",
     # Tool Conversion
     "convert_tools_to_langchain",
@@ -37,4 +61,13 @@ __all__ = [
     # Result Extraction
     "extract_response",
     "extract_tool_calls",
+    "success_result",
+    "failure_result",
+    # Streaming Events
+    "StreamEventTranslator",
+    "error_event",
+    # Execution Records
+    "build_execution_record",
+    # Cancellation
+    "CancellationCallbackHandler",
 ]
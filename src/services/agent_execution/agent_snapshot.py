@@ -0,0 +1,324 @@
+"""
+Agent Execution Snapshot Cache
+
+One webhook event used to load the agent with its triggers and decrypt the
+HMAC secret in the API, then load the agent again in the worker (agent row,
+triggers, OpenAPI tool assignments) before executing it: several queries
+plus a Fernet decryption per event for data that changes rarely.
+
+An AgentSnapshot is an immutable copy of everything both paths need: the
+agent's status, current system prompt (kept in sync with the current prompt
+version by PromptVersionService), LLM config, cognitive architecture, tool
+assignments and its webhook trigger with the HMAC secret already decrypted.
+Snapshots are cached in process memory (API and workers alike) for up to
+agent_snapshot_cache_ttl_seconds.
+
+Cross-process invalidation uses a per-agent version counter in Redis
+(agent_snapshot:{agent_id}:version). The agent and prompt services INCR it
+after committing a change; a cached snapshot is only used while its
+version matches. The version is read before the database load, so a
+snapshot loaded from data that changes meanwhile is stale on its next use.
+Redis errors fail open to the local TTL.
+
+Functions:
+    - get_agent_snapshot(): Cached snapshot of an agent, loaded on a miss
+    - invalidate_agent_snapshot(): Drop an agent's snapshot in every process
+
+References:
+- src/api/webhooks.py (agent_webhook_endpoint)
+- src/services/agent_execution_service.py
+- src/services/agent_execution/executor_cache.py (same LRU pattern)
+"""
+
+import copy
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.config import settings
+from src.database.models import Agent
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "agent_snapshot"
+
+
+@dataclass(frozen=True)
+class WebhookTriggerSnapshot:
+    """
+    Webhook trigger of an agent.
+
+    Attributes:
+        trigger_id: AgentTrigger UUID
+        hmac_secret: Decrypted HMAC secret (None if missing or undecryptable)
+        payload_schema: JSON Schema payloads are validated against (a private
+            copy kept as a dict for jsonschema; treat as read-only)
+    """
+
+    trigger_id: UUID
+    hmac_secret: Optional[str]
+    payload_schema: Optional[dict]
+
+
+@dataclass(frozen=True)
+class AgentSnapshot:
+    """
+    Immutable execution view of one agent version.
+
+    Attribute names match the Agent model, so snapshots can be passed where
+    execution code reads an agent (executor_stamp, build_messages inputs).
+
+    Attributes:
+        id: Agent UUID
+        tenant_id: Owning tenant
+        name: Agent name (spend attribution tags)
+        status: Agent status
+        system_prompt: Current system prompt
+        llm_config: LLM configuration (read-only mapping)
+        cognitive_architecture: Executor architecture
+        updated_at: Agent row version
+        openapi_tool_ids: Assigned OpenAPI tool IDs
+        assigned_mcp_tools: Assigned MCP tools (as stored on the agent)
+        webhook: Webhook trigger, if the agent has one
+        version: Redis invalidation version the snapshot was loaded at
+        loaded_at: time.monotonic() when the snapshot was loaded
+    """
+
+    id: UUID
+    tenant_id: str
+    name: str
+    status: str
+    system_prompt: str
+    llm_config: Mapping[str, Any]
+    cognitive_architecture: str
+    updated_at: Optional[datetime]
+    openapi_tool_ids: Tuple[str, ...]
+    assigned_mcp_tools: Tuple[Mapping[str, Any], ...]
+    webhook: Optional[WebhookTriggerSnapshot]
+    version: Optional[int] = None
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def cacheable(self) -> bool:
+        """False when the webhook secret could not be decrypted (retry next time)."""
+        return self.webhook is None or self.webhook.hmac_secret is not None
+
+
+def _frozen(value: Any) -> Mapping[str, Any]:
+    return MappingProxyType(copy.deepcopy(dict(value or {})))
+
+
+def _webhook_snapshot(agent: Agent) -> Optional[WebhookTriggerSnapshot]:
+    from src.utils.encryption import decrypt
+
+    trigger = next((t for t in agent.triggers if t.trigger_type == "webhook"), None)
+    if trigger is None:
+        return None
+
+    secret = None
+    if trigger.hmac_secret:
+        try:
+            secret = decrypt(trigger.hmac_secret)
+        except Exception as e:
+            logger.error(
+                f"Failed to decrypt HMAC secret: {e}",
+                extra={"agent_id": str(agent.id), "error_type": type(e).__name__},
+            )
+    return WebhookTriggerSnapshot(
+        trigger_id=trigger.id,
+        hmac_secret=secret,
+        payload_schema=copy.deepcopy(trigger.payload_schema) or None,
+    )
+
+
+def build_snapshot(agent: Agent, version: Optional[int] = None) -> AgentSnapshot:
+    """
+    Snapshot an agent row loaded with its triggers and tools.
+
+    Args:
+        agent: Agent with triggers and tools relationships loaded
+        version: Invalidation version read before the row was loaded
+
+    Returns:
+        AgentSnapshot holding copies, never references to the ORM row
+    """
+    return AgentSnapshot(
+        id=agent.id,
+        tenant_id=agent.tenant_id,
+        name=agent.name,
+        status=agent.status,
+        system_prompt=agent.system_prompt,
+        llm_config=_frozen(agent.llm_config),
+        cognitive_architecture=getattr(agent, "cognitive_architecture", None) or "react",
+        updated_at=agent.updated_at,
+        openapi_tool_ids=tuple(agent_tool.tool_id for agent_tool in agent.tools or []),
+        assigned_mcp_tools=tuple(_frozen(tool) for tool in agent.assigned_mcp_tools or []),
+        webhook=_webhook_snapshot(agent),
+        version=version,
+    )
+
+
+class AgentSnapshotCache:
+    """
+    Bounded LRU of agent snapshots keyed by agent ID.
+
+    Entries are served while younger than ttl_seconds and, when Redis is
+    reachable, only while their version is still current.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, AgentSnapshot]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, agent_id: UUID, version: Optional[int]) -> Optional[AgentSnapshot]:
+        """
+        Cached snapshot still valid at `version` (None: version unknown).
+        """
+        from src.monitoring.metrics import agent_snapshot_cache_lookups_total
+
+        entry = self._entries.get(agent_id)
+        if entry is None:
+            agent_snapshot_cache_lookups_total.labels(outcome="miss").inc()
+            return None
+        expired = time.monotonic() - entry.loaded_at >= self.ttl_seconds
+        if expired or (version is not None and entry.version != version):
+            del self._entries[agent_id]
+            agent_snapshot_cache_lookups_total.labels(outcome="stale").inc()
+            return None
+        self._entries.move_to_end(agent_id)
+        agent_snapshot_cache_lookups_total.labels(outcome="hit").inc()
+        return entry
+
+    def put(self, snapshot: AgentSnapshot) -> None:
+        """Store a snapshot, replacing the agent's previous one."""
+        self._entries[snapshot.id] = snapshot
+        self._entries.move_to_end(snapshot.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, agent_id: UUID) -> None:
+        self._entries.pop(agent_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache: Optional[AgentSnapshotCache] = None
+
+
+def get_snapshot_cache() -> AgentSnapshotCache:
+    """Process-wide snapshot cache, created on first use."""
+    global _cache
+
+    if _cache is None:
+        _cache = AgentSnapshotCache(
+            max_entries=settings.agent_snapshot_cache_max_entries,
+            ttl_seconds=settings.agent_snapshot_cache_ttl_seconds,
+        )
+    return _cache
+
+
+def _version_key(agent_id: UUID) -> str:
+    return f"{KEY_PREFIX}:{agent_id}:version"
+
+
+def _redis():
+    from src.cache.redis_client import get_shared_redis
+
+    return get_shared_redis()
+
+
+async def _current_version(agent_id: UUID) -> Optional[int]:
+    """Agent's invalidation version, or None if Redis is unavailable."""
+    try:
+        return int(await _redis().get(_version_key(agent_id)) or 0)
+    except Exception as e:
+        logger.warning(
+            f"Agent snapshot version read failed, using local expiry: {e}",
+            extra={"agent_id": str(agent_id), "error_type": type(e).__name__},
+        )
+        return None
+
+
+async def get_agent_snapshot(
+    db: AsyncSession,
+    agent_id: UUID,
+    tenant_id: Optional[str] = None,
+) -> Optional[AgentSnapshot]:
+    """
+    Execution snapshot of an agent, from the cache or the database.
+
+    Args:
+        db: Session used to load the agent on a miss
+        agent_id: Agent UUID
+        tenant_id: If given, agents of other tenants are reported as missing
+
+    Returns:
+        AgentSnapshot, or None if the agent does not exist (for the tenant)
+    """
+    if not settings.agent_snapshot_cache_enabled:
+        snapshot = await _load(db, agent_id, None)
+    else:
+        cache = get_snapshot_cache()
+        version = await _current_version(agent_id)
+        snapshot = cache.get(agent_id, version)
+        if snapshot is None:
+            snapshot = await _load(db, agent_id, version)
+            if snapshot is not None and snapshot.cacheable:
+                cache.put(snapshot)
+
+    if snapshot is None or (tenant_id is not None and snapshot.tenant_id != tenant_id):
+        return None
+    return snapshot
+
+
+async def _load(db: AsyncSession, agent_id: UUID, version: Optional[int]) -> Optional[AgentSnapshot]:
+    query = (
+        select(Agent)
+        .where(Agent.id == agent_id)
+        .options(selectinload(Agent.triggers), selectinload(Agent.tools))
+    )
+    result = await db.execute(query)
+    agent = result.scalar_one_or_none()
+    return build_snapshot(agent, version) if agent is not None else None
+
+
+async def invalidate_agent_snapshot(agent_id: UUID) -> None:
+    """
+    Drop an agent's snapshot in this process and, via Redis, in every other.
+
+    Call after committing a change to the agent, its triggers, tool
+    assignments or prompt.
+    """
+    get_snapshot_cache().invalidate(agent_id)
+    try:
+        await _redis().incr(_version_key(agent_id))
+    except Exception as e:
+        logger.warning(
+            f"Failed to publish agent snapshot invalidation: {e}",
+            extra={"agent_id": str(agent_id), "error_type": type(e).__name__},
+        )
+
+
+__all__ = [
+    "AgentSnapshot",
+    "AgentSnapshotCache",
+    "WebhookTriggerSnapshot",
+    "build_snapshot",
+    "get_agent_snapshot",
+    "get_snapshot_cache",
+    "invalidate_agent_snapshot",
+]
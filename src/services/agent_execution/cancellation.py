@@ -0,0 +1,56 @@
+"""
+Cancellation Checks for Agent Executions
+
+LangChain callback handler that checks an execution's cancel flag (see
+src/services/execution_cancellation.py) whenever the ReAct loop is about to
+start an LLM turn or a tool call. With raise_error set, the
+ExecutionCancelledError it raises propagates out of the graph run, so the
+execution stops before spending more tokens and its usual cleanup releases
+the MCP bridge.
+
+Only async callbacks abort the run: MCP and OpenAPI tools are coroutines,
+so their on_tool_start runs on the async callback manager.
+
+References:
+- src/services/agent_execution_service.py (execute_agent, stream_agent)
+- LangChain callbacks (AsyncCallbackHandler.raise_error)
+"""
+
+from typing import Any, Dict, List
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from src.services.execution_cancellation import raise_if_cancelled
+
+
+class CancellationCallbackHandler(AsyncCallbackHandler):
+    """
+    Aborts an execution at its next LLM turn or tool call once cancelled.
+
+    Attributes:
+        tenant_id: Tenant the execution runs for
+        execution_id: Execution ID the cancel flag is set under
+    """
+
+    # Exceptions raised by this handler abort the run instead of being logged
+    raise_error = True
+
+    def __init__(self, tenant_id: str, execution_id: UUID | str) -> None:
+        self.tenant_id = tenant_id
+        self.execution_id = str(execution_id)
+
+    async def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List[List[Any]], **kwargs: Any
+    ) -> None:
+        """Check the cancel flag before each LLM turn."""
+        await raise_if_cancelled(self.tenant_id, self.execution_id)
+
+    async def on_tool_start(
+        self, serialized: Dict[str, Any], input_str: str, **kwargs: Any
+    ) -> None:
+        """Check the cancel flag before each tool call."""
+        await raise_if_cancelled(self.tenant_id, self.execution_id)
+
+
+__all__ = ["CancellationCallbackHandler"]
@@ -0,0 +1,140 @@
+"""
+Streaming Events for Agent Execution
+
+Translates LangGraph astream_events(version="v2") output into the small set
+of events the streaming execution API forwards to clients:
+
+- token: {"text": str} - a chunk of LLM output text
+- tool_start: {"run_id", "tool_name", "tool_input"} - a tool call began
+- tool_end: {"run_id", "tool_name", "tool_output"} - a tool call returned
+- error: {"type", "message", ...} - the execution failed or was cancelled
+- result: the execute_agent() result dict, always the last event
+
+Every other LangGraph event (chain/node bookkeeping, prompt events) is
+dropped. The final graph state is captured from the root run's
+on_chain_end event, so the result is extracted exactly like ainvoke()'s.
+
+References:
+- src/services/agent_execution/streaming.py (stream_agent)
+- src/api/agent_execution_stream.py (POST /execute/stream)
+- LangChain streaming events (astream_events v2)
+"""
+
+from typing import Any, Dict, Optional
+
+from src.exceptions import BudgetExceededError
+from src.services.execution_cancellation import CANCELLED_STATUS, ExecutionCancelledError
+
+# Tool output characters forwarded in tool_end events (full output is in the result)
+TOOL_OUTPUT_PREVIEW_CHARS = 2000
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text of an AIMessageChunk (content may be a str or content blocks)."""
+    content = getattr(chunk, "content", "")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return ""
+
+
+def _tool_output(output: Any) -> str:
+    """Tool output as text (ToolMessage content or the raw return value)."""
+    text = str(getattr(output, "content", output))
+    return text[:TOOL_OUTPUT_PREVIEW_CHARS]
+
+
+class StreamEventTranslator:
+    """
+    Stateful translator for one execution's LangGraph event stream.
+
+    Attributes:
+        final_state: Graph output of the root run, once it has finished
+    """
+
+    def __init__(self) -> None:
+        self.final_state: Optional[Dict[str, Any]] = None
+
+    def translate(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Map one LangGraph event to a client event.
+
+        Args:
+            event: StreamEvent dict from astream_events(version="v2")
+
+        Returns:
+            {"event": name, "data": dict}, or None for events not forwarded
+        """
+        kind = event.get("event")
+        data = event.get("data") or {}
+
+        if kind == "on_chat_model_stream":
+            text = _chunk_text(data.get("chunk"))
+            return {"event": "token", "data": {"text": text}} if text else None
+
+        if kind == "on_tool_start":
+            return {
+                "event": "tool_start",
+                "data": {
+                    "run_id": str(event.get("run_id", "")),
+                    "tool_name": event.get("name", "unknown"),
+                    "tool_input": data.get("input"),
+                },
+            }
+
+        if kind == "on_tool_end":
+            return {
+                "event": "tool_end",
+                "data": {
+                    "run_id": str(event.get("run_id", "")),
+                    "tool_name": event.get("name", "unknown"),
+                    "tool_output": _tool_output(data.get("output")),
+                },
+            }
+
+        if kind == "on_chain_end" and not event.get("parent_ids"):
+            output = data.get("output")
+            if isinstance(output, dict):
+                self.final_state = output
+
+        return None
+
+
+def error_event(error: Exception) -> Dict[str, Any]:
+    """
+    Client event describing an execution failure.
+
+    Budget errors carry the same details as the 402 response of
+    POST /execute, since a stream cannot change its status code.
+    Cancelled executions report type "cancelled".
+    """
+    if isinstance(error, BudgetExceededError):
+        return {
+            "event": "error",
+            "data": {
+                "type": "budget_exceeded",
+                "message": str(error),
+                "current_spend": error.current_spend,
+                "max_budget": error.max_budget,
+                "grace_threshold": error.grace_threshold,
+            },
+        }
+    if isinstance(error, ExecutionCancelledError):
+        return {
+            "event": "error",
+            "data": {"type": CANCELLED_STATUS, "message": str(error)},
+        }
+    return {
+        "event": "error",
+        "data": {"type": type(error).__name__, "message": str(error)},
+    }
+
+
+__all__ = [
+    "StreamEventTranslator",
+    "error_event",
+]
@@ -0,0 +1,112 @@
+"""
+Execution Records for Agent Runs
+
+Builds the AgentTestExecution row persisted for every agent execution,
+whether it ran in the execute_agent Celery task or was streamed by the
+agent execution API, so execution history looks the same for both.
+
+The execution trace holds one tool_call step per tool invocation (with
+cache_hit set when the result came from the MCP tool result cache) and a
+final llm_response step, built from the execute_agent() result dict.
+
+References:
+- src/workers/tasks.py (_execute_agent_async)
+- src/api/agent_execution_stream.py (POST /execute/stream)
+"""
+
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from src.database.models import AgentTestExecution
+
+# Characters of each tool result kept in the execution trace
+TOOL_RESULT_TRACE_CHARS = 500
+
+
+def build_execution_record(
+    *,
+    execution_id: UUID | str,
+    agent_id: UUID,
+    tenant_id: str,
+    payload: Dict[str, Any],
+    service_result: Dict[str, Any],
+    total_duration_ms: int,
+    task_id: Optional[str] = None,
+    status: Optional[str] = None,
+    errors: Optional[Dict[str, Any]] = None,
+) -> AgentTestExecution:
+    """
+    AgentTestExecution for an execute_agent() result.
+
+    Args:
+        execution_id: Execution UUID (primary key of the record)
+        agent_id: Executed agent
+        tenant_id: Tenant the agent ran for
+        payload: Execution input (webhook payload or API request)
+        service_result: Result dict of AgentExecutionService.execute_agent()
+        total_duration_ms: Wall time of the whole execution
+        task_id: Celery task ID for correlation, if run by a worker
+        status: Explicit status (default: success/failed from the result)
+        errors: Explicit error details (default: from the result's error)
+
+    Returns:
+        Unsaved AgentTestExecution
+    """
+    tool_calls = service_result.get("tool_calls", [])
+    execution_trace = {
+        "steps": [],
+        "total_duration_ms": total_duration_ms,
+        "model_used": service_result.get("model_used", "unknown"),
+        "tool_calls_count": len(tool_calls),
+    }
+
+    # Add tool calls to trace (MCP tools invoked during ReAct loop)
+    for tool_call in tool_calls:
+        execution_trace["steps"].append({
+            "step_type": "tool_call",
+            "tool_name": tool_call.get("tool_name", "unknown"),
+            "tool_args": tool_call.get("tool_input", {}),
+            "tool_result": str(tool_call.get("tool_output", ""))[:TOOL_RESULT_TRACE_CHARS],
+            "cache_hit": bool(tool_call.get("cache_hit", False)),
+        })
+
+    # Add final LLM response to trace
+    execution_trace["steps"].append({
+        "step_type": "llm_response",
+        "response": service_result.get("response", ""),
+        "duration_ms": int(service_result.get("execution_time_seconds", 0) * 1000),
+    })
+
+    # Token usage (if available from service_result)
+    # Note: AgentExecutionService doesn't currently expose token usage
+    token_usage = {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "total_tokens": 0,
+        "estimated_cost_usd": 0.0,
+    }
+
+    succeeded = bool(service_result.get("success"))
+    if status is None:
+        status = "success" if succeeded else "failed"
+    if errors is None and not succeeded:
+        errors = {
+            "error_type": "AgentExecutionError",
+            "message": service_result.get("error") or "Unknown error",
+        }
+
+    return AgentTestExecution(
+        id=execution_id,
+        agent_id=agent_id,
+        tenant_id=tenant_id,
+        payload=payload,
+        execution_trace=execution_trace,
+        token_usage=token_usage,
+        execution_time={"total_duration_ms": total_duration_ms},
+        errors=errors,
+        status=status,
+        task_id=task_id,
+    )
+
+
+__all__ = ["build_execution_record"]
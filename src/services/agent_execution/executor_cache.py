@@ -0,0 +1,210 @@
+"""
+Compiled Agent Executor Cache
+
+Per-worker LRU of compiled LangGraph agent executors. Building an executor
+(converting tools, create_react_agent compilation) costs hundreds of
+milliseconds, while an agent's configuration changes rarely; hot agents
+reuse the executor compiled on their first execution.
+
+Entries are keyed by agent ID and a version stamp hashed from everything the
+compiled graph depends on: the agent row (updated_at covers agent updates,
+MCP tool assignments and prompt changes), its cognitive architecture, the
+resolved tool list (OpenAPI assignments), and the id/discovery_version/
+updated_at of every active MCP server. Any change yields a new stamp, so
+the old entry misses and is replaced.
+
+Per-execution state is not baked into cached graphs:
+- The chat model (tenant virtual key, spend tags with the execution ID) is
+  built per execution and handed to the graph through LangGraph's runtime
+  context (AgentRunContext); graphs use context_model() as a dynamic model.
+- MCP tool wrappers resolve the execution from
+  mcp_tool_bridge.current_execution_context_id.
+
+Executors whose tools hold per-execution MCP sessions (legacy
+MultiServerMCPClient path) are never cached. Like the MCP pools, the cache
+is bound to the event loop it was filled on.
+
+References:
+- src/services/agent_execution_service.py
+- src/services/mcp_capability_cache.py (same keyed-by-version pattern)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import inspect as sa_inspect
+
+from src.config import settings
+from src.database.models import MCPServer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AgentRunContext:
+    """
+    LangGraph runtime context for one execution of a cached executor.
+
+    Attributes:
+        model: Chat model for this execution, with the agent's tools bound
+    """
+
+    model: Any
+
+
+def context_model(state: Any, runtime: Any) -> Any:
+    """Dynamic model for cached executors: the model of the current run."""
+    return runtime.context.model
+
+
+@dataclass
+class CachedExecutor:
+    """
+    A compiled executor and the tools it was built with.
+
+    Attributes:
+        agent_id: Agent UUID
+        stamp: Version stamp the executor was built for
+        executor: Compiled LangGraph graph (model resolved via context_model)
+        tools: LangChain tools bound into the graph
+        cached_at: time.monotonic() when the entry was stored
+    """
+
+    agent_id: UUID
+    stamp: str
+    executor: Any
+    tools: List[Any]
+    cached_at: float = field(default_factory=time.monotonic)
+
+
+def executor_stamp(
+    agent: Any,
+    unified_tools: List[Dict[str, Any]],
+    mcp_servers: List[Any],
+) -> str:
+    """
+    Version stamp of everything a compiled executor depends on.
+
+    Args:
+        agent: Agent row
+        unified_tools: Tool list from AgentService.get_agent_tools()
+        mcp_servers: Active MCP server rows for the tenant
+
+    Returns:
+        str: 16-hex-digit SHA-256 prefix
+    """
+    payload = {
+        "updated_at": agent.updated_at,
+        "architecture": getattr(agent, "cognitive_architecture", None),
+        "system_prompt": agent.system_prompt,
+        "tools": unified_tools,
+        "servers": sorted(
+            (
+                str(server.id),
+                getattr(server, "discovery_version", None) or 0,
+                str(getattr(server, "updated_at", None)),
+            )
+            for server in mcp_servers
+        ),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def detached_servers(mcp_servers: List[MCPServer]) -> List[MCPServer]:
+    """
+    Transient copies of MCP server rows.
+
+    Cached tool wrappers outlive the database session that loaded the rows;
+    copies never expire or lazy-load after that session is closed.
+    """
+    columns = [attr.key for attr in sa_inspect(MCPServer).column_attrs]
+    return [
+        MCPServer(**{key: getattr(server, key) for key in columns}) for server in mcp_servers
+    ]
+
+
+class AgentExecutorCache:
+    """
+    Bounded LRU of compiled executors keyed by agent ID and version stamp.
+
+    Only the newest stamp per agent is kept. Not thread-safe; used from the
+    worker's agent event loop.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, CachedExecutor]" = OrderedDict()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, agent_id: UUID, stamp: str) -> Optional[CachedExecutor]:
+        """Cached executor for exactly this stamp, or None."""
+        from src.monitoring.metrics import agent_executor_cache_lookups_total
+
+        entry = self._entries.get(agent_id)
+        if entry is None or entry.stamp != stamp:
+            agent_executor_cache_lookups_total.labels(outcome="miss").inc()
+            return None
+        self._entries.move_to_end(agent_id)
+        agent_executor_cache_lookups_total.labels(outcome="hit").inc()
+        return entry
+
+    def put(self, entry: CachedExecutor) -> None:
+        """Store an executor, replacing any other version for the agent."""
+        from src.monitoring.metrics import agent_executor_cache_size
+
+        self._entries[entry.agent_id] = entry
+        self._entries.move_to_end(entry.agent_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        agent_executor_cache_size.set(len(self._entries))
+
+    def invalidate(self, agent_id: UUID) -> None:
+        """Drop the cached executor of an agent."""
+        from src.monitoring.metrics import agent_executor_cache_size
+
+        self._entries.pop(agent_id, None)
+        agent_executor_cache_size.set(len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache: Optional[AgentExecutorCache] = None
+
+
+def get_executor_cache() -> AgentExecutorCache:
+    """
+    Executor cache for the running event loop, created on first use.
+
+    Executors filled on another loop are dropped: their pooled MCP sessions
+    belong to that loop's stdio pool.
+    """
+    global _cache
+
+    loop = asyncio.get_running_loop()
+    if _cache is None or _cache.loop is not loop:
+        _cache = AgentExecutorCache(max_entries=settings.agent_executor_cache_max_entries)
+        _cache.loop = loop
+    return _cache
+
+
+__all__ = [
+    "AgentExecutorCache",
+    "AgentRunContext",
+    "CachedExecutor",
+    "context_model",
+    "detached_servers",
+    "executor_stamp",
+    "get_executor_cache",
+]
@@ -0,0 +1,471 @@
+"""
+Asynchronous Agent Execution Jobs
+
+POST /api/agent-execution/execute runs the agent inside the API process, so
+every request holds a uvicorn worker for the whole LLM round trip. Jobs run
+the same execution on the Celery execute_agent task instead:
+
+1. The API creates the job's AgentTestExecution record (status queued) and
+   enqueues execute_agent with the record ID as execution and Celery task ID.
+2. The worker marks the record running, then stores the finished execution
+   on the same record (success/failed; retrying between failed attempts).
+3. Clients poll the status, optionally long-polling until it is final, and
+   fetch the result; or get it POSTed to a callback URL.
+
+Callback URLs are tenant-supplied, so both job creation and delivery reject
+hosts that resolve to loopback, private, link-local or other non-public
+addresses (agent_job_callback_allow_private_hosts lifts this for local
+development). Redirects are not followed. The callback body is signed with
+the tenant's webhook secret in X-ServiceDesk-Signature, the HMAC-SHA256 hex
+digest the inbound webhooks verify.
+
+Every status change is also published under agent_execution:{id}:status in
+Redis, so long-polling clients wait on a cheap key read instead of querying
+the database every interval. Without Redis they poll the database.
+
+A worker killed at the hard time limit or by a crash never stores a final
+status. Reads therefore fail jobs that are still unfinished
+agent_job_stale_after_seconds after creation, longer than all attempts of
+execute_agent together can take.
+
+Functions:
+    - create_job(): Queued execution record of a new job
+    - get_job(): A tenant's job record, freshly read (stale jobs failed)
+    - wait_for_job(): Long-poll a job until its status is final
+    - mark_job_running(): Worker-side transition to running
+    - publish_status(): Publish a status change to long-polling clients
+    - job_result(): Result body of a job record
+    - finish_job(): Publish a finished job and deliver its callback
+    - check_callback_url(): Reject callback URLs of non-public hosts
+    - deliver_callback(): POST a signed finished job to its callback URL
+
+References:
+- src/api/agent_execution_jobs.py (/jobs endpoints)
+- src/workers/tasks.py (execute_agent)
+- src/services/agent_execution/execution_record.py
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import socket
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from uuid import UUID
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database.models import AgentTestExecution
+from src.database.tenant_context import set_db_tenant_context
+from src.services.webhook_validator import compute_hmac_signature
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_RETRYING = "retrying"
+TERMINAL_STATUSES = frozenset({"success", "failed", "cancelled"})
+CALLBACK_SIGNATURE_HEADER = "X-ServiceDesk-Signature"
+
+
+class CallbackURLError(ValueError):
+    """Callback URL that is malformed or points to a non-public host."""
+
+KEY_PREFIX = "agent_execution"
+
+# Seconds between status checks of a long-polling client
+POLL_INTERVAL_SECONDS = 0.5
+
+
+def _status_key(execution_id: UUID | str) -> str:
+    return f"{KEY_PREFIX}:{execution_id}:status"
+
+
+def _redis():
+    from src.cache.redis_client import get_shared_redis
+
+    return get_shared_redis()
+
+
+def _record_job(status: str) -> None:
+    from src.monitoring.metrics import agent_execution_jobs_total
+
+    agent_execution_jobs_total.labels(status=status).inc()
+
+
+async def publish_status(execution_id: UUID | str, status: str) -> None:
+    """Publish a job's status for long-polling clients (best effort)."""
+    try:
+        await _redis().set(
+            _status_key(execution_id), status, ex=settings.agent_job_status_ttl_seconds
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to publish agent job status: {e}",
+            extra={"execution_id": str(execution_id), "error_type": type(e).__name__},
+        )
+
+
+async def create_job(
+    db: AsyncSession,
+    execution_id: UUID,
+    agent_id: UUID,
+    tenant_id: str,
+    payload: Dict[str, Any],
+) -> AgentTestExecution:
+    """
+    Add the queued execution record of a new job (caller commits).
+
+    Args:
+        db: Tenant session
+        execution_id: Job/execution UUID (also the Celery task ID)
+        agent_id: Agent to execute
+        tenant_id: Tenant identifier
+        payload: Execution input ({"user_message", "context"})
+
+    Returns:
+        The added AgentTestExecution
+    """
+    record = AgentTestExecution(
+        id=execution_id,
+        agent_id=agent_id,
+        tenant_id=tenant_id,
+        payload=payload,
+        execution_trace={"steps": [], "total_duration_ms": 0},
+        token_usage={
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+            "estimated_cost_usd": 0.0,
+        },
+        execution_time={"total_duration_ms": 0},
+        status=JOB_QUEUED,
+        task_id=str(execution_id),
+    )
+    db.add(record)
+    _record_job(JOB_QUEUED)
+    return record
+
+
+async def _read_job(
+    db: AsyncSession, tenant_id: str, execution_id: UUID
+) -> Optional[AgentTestExecution]:
+    result = await db.execute(
+        select(AgentTestExecution)
+        .where(
+            AgentTestExecution.id == execution_id,
+            AgentTestExecution.tenant_id == tenant_id,
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+def _is_stale(record: AgentTestExecution) -> bool:
+    """Whether an unfinished job is past the time any worker could finish it."""
+    if record.status in TERMINAL_STATUSES or record.created_at is None:
+        return False
+    age = datetime.now(timezone.utc) - record.created_at
+    return age.total_seconds() > settings.agent_job_stale_after_seconds
+
+
+async def fail_stale_job(db: AsyncSession, record: AgentTestExecution) -> bool:
+    """
+    Mark an unfinished job failed once it is stale (commits).
+
+    The update only applies while the record is still unfinished, so a
+    worker storing a final status concurrently wins.
+
+    Returns:
+        True if the job was marked failed
+    """
+    if not _is_stale(record):
+        return False
+
+    result = await db.execute(
+        update(AgentTestExecution)
+        .where(
+            AgentTestExecution.id == record.id,
+            AgentTestExecution.status.notin_(TERMINAL_STATUSES),
+        )
+        .values(
+            status="failed",
+            errors={
+                "error_type": "JobTimeout",
+                "message": (
+                    f"Job did not finish within {settings.agent_job_stale_after_seconds}s; "
+                    "its worker was stopped or lost"
+                ),
+            },
+        )
+    )
+    await db.commit()
+    if not result.rowcount:
+        return False
+
+    logger.warning(
+        "Stale agent job marked failed",
+        extra={"execution_id": str(record.id), "last_status": record.status},
+    )
+    _record_job("failed")
+    await publish_status(record.id, "failed")
+    return True
+
+
+async def get_job(
+    db: AsyncSession, tenant_id: str, execution_id: UUID
+) -> Optional[AgentTestExecution]:
+    """Job record of a tenant, re-read from the database (None if missing)."""
+    record = await _read_job(db, tenant_id, execution_id)
+    if record is not None and await fail_stale_job(db, record):
+        record = await _read_job(db, tenant_id, execution_id)
+    return record
+
+
+async def _sleep_until_changed(execution_id: UUID, known_status: str, deadline: float) -> None:
+    """Sleep until the published status differs from known_status or deadline."""
+    while True:
+        await asyncio.sleep(max(0.0, min(POLL_INTERVAL_SECONDS, deadline - time.monotonic())))
+        if time.monotonic() >= deadline:
+            return
+        try:
+            published = await _redis().get(_status_key(execution_id))
+        except Exception:
+            # Fall back to one database read per interval
+            return
+        if published != known_status:
+            return
+
+
+async def wait_for_job(
+    db: AsyncSession,
+    tenant_id: str,
+    execution_id: UUID,
+    wait_seconds: float,
+) -> Optional[AgentTestExecution]:
+    """
+    Job record once its status is final, or after wait_seconds.
+
+    The transaction is ended before every wait, so a waiting client does not
+    keep a pooled connection idle in transaction; the tenant context is set
+    again before the next read.
+
+    Args:
+        db: Tenant session
+        tenant_id: Tenant identifier
+        execution_id: Job/execution UUID
+        wait_seconds: Maximum time to wait (0 returns immediately)
+
+    Returns:
+        Latest job record, or None if the job does not exist
+    """
+    deadline = time.monotonic() + wait_seconds
+    record = await get_job(db, tenant_id, execution_id)
+    while (
+        record is not None
+        and record.status not in TERMINAL_STATUSES
+        and time.monotonic() < deadline
+    ):
+        known_status = record.status
+        await db.rollback()
+        await _sleep_until_changed(execution_id, known_status, deadline)
+        await set_db_tenant_context(db, tenant_id)
+        record = await get_job(db, tenant_id, execution_id)
+    return record
+
+
+async def mark_job_running(db: AsyncSession, execution_id: UUID | str) -> bool:
+    """
+    Mark a job's record running at the start of an attempt (commits).
+
+    Returns:
+        False if no job record exists (execution not started as a job)
+    """
+    result = await db.execute(
+        update(AgentTestExecution)
+        .where(AgentTestExecution.id == UUID(str(execution_id)))
+        .values(status=JOB_RUNNING)
+    )
+    await db.commit()
+    if not result.rowcount:
+        return False
+    await publish_status(execution_id, JOB_RUNNING)
+    return True
+
+
+def job_result(record: AgentTestExecution) -> Dict[str, Any]:
+    """
+    Result body of a job record, built from its execution trace.
+
+    Args:
+        record: AgentTestExecution of the job
+
+    Returns:
+        Dict with execution_id, status, success, response, tool_calls,
+        model_used, duration_ms and error
+    """
+    trace = record.execution_trace or {}
+    steps = trace.get("steps", [])
+    response = next(
+        (step.get("response", "") for step in reversed(steps) if step.get("step_type") == "llm_response"),
+        "",
+    )
+    return {
+        "execution_id": str(record.id),
+        "status": record.status,
+        "success": record.status == "success",
+        "response": response,
+        "tool_calls": [
+            {
+                "tool_name": step.get("tool_name", "unknown"),
+                "tool_args": step.get("tool_args", {}),
+                "tool_result": step.get("tool_result", ""),
+            }
+            for step in steps
+            if step.get("step_type") == "tool_call"
+        ],
+        "model_used": trace.get("model_used", ""),
+        "duration_ms": (record.execution_time or {}).get("total_duration_ms", 0),
+        "error": (record.errors or {}).get("message"),
+    }
+
+
+async def _resolve(host: str, port: int) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+    """IP addresses a host name (or literal) resolves to."""
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return [ipaddress.ip_address(sockaddr[0]) for *_, sockaddr in infos]
+
+
+async def check_callback_url(callback_url: str) -> None:
+    """
+    Reject callback URLs whose host is not a public address.
+
+    Every address the host resolves to is checked, so a public name with a
+    private A record is rejected as well.
+
+    Raises:
+        CallbackURLError: If the URL is not http(s), its host does not
+            resolve, or it resolves to a non-public address
+    """
+    parts = urlsplit(callback_url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise CallbackURLError("callback_url must be an http(s) URL with a host")
+    if settings.agent_job_callback_allow_private_hosts:
+        return
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        addresses = await _resolve(parts.hostname, port)
+    except (OSError, ValueError) as e:
+        raise CallbackURLError(f"callback_url host {parts.hostname} does not resolve") from e
+    for address in addresses:
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if not address.is_global:
+            raise CallbackURLError(
+                f"callback_url host {parts.hostname} resolves to non-public address {address}"
+            )
+
+
+async def _signing_secret(db: AsyncSession, tenant_id: str) -> Optional[str]:
+    """The tenant's webhook signing secret, or None if it cannot be loaded."""
+    from src.services.tenant_service import TenantService
+
+    try:
+        return await TenantService(db, _redis()).get_webhook_secret(tenant_id)
+    except Exception as e:
+        logger.warning(
+            f"Cannot load webhook secret to sign job callback: {e}",
+            extra={"tenant_id": tenant_id, "error_type": type(e).__name__},
+        )
+        return None
+
+
+async def finish_job(
+    db: AsyncSession, record: AgentTestExecution, callback_url: Optional[str]
+) -> None:
+    """
+    Publish a job's final status and deliver its callback (worker side).
+
+    The callback is skipped if the tenant's webhook secret cannot be
+    loaded, since an unsigned body could not be told apart from a forgery.
+
+    Args:
+        db: Session the record was saved with
+        record: Saved final AgentTestExecution of the job
+        callback_url: Callback URL given when the job was created
+    """
+    await publish_status(record.id, record.status)
+    if record.status in TERMINAL_STATUSES:
+        _record_job(record.status)
+        if callback_url:
+            secret = await _signing_secret(db, record.tenant_id)
+            if secret:
+                await deliver_callback(callback_url, job_result(record), secret)
+
+
+async def deliver_callback(callback_url: str, body: Dict[str, Any], secret: str) -> bool:
+    """
+    POST a finished job's result to its callback URL (one attempt).
+
+    The host is checked again at delivery, since its DNS records may have
+    changed since the job was created.
+
+    Args:
+        callback_url: Callback URL given when the job was created
+        body: Result body (job_result())
+        secret: Tenant webhook secret the body is signed with
+
+    Returns:
+        True if the callback answered with a 2xx status
+    """
+    payload = json.dumps(body).encode("utf-8")
+    try:
+        await check_callback_url(callback_url)
+        async with httpx.AsyncClient(timeout=settings.agent_job_callback_timeout_seconds) as client:
+            response = await client.post(
+                callback_url,
+                content=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Execution-Id": body["execution_id"],
+                    CALLBACK_SIGNATURE_HEADER: compute_hmac_signature(secret, payload),
+                },
+            )
+        response.raise_for_status()
+        return True
+    except Exception as e:
+        logger.warning(
+            f"Agent job callback failed: {e}",
+            extra={
+                "execution_id": body["execution_id"],
+                "callback_url": callback_url,
+                "error_type": type(e).__name__,
+            },
+        )
+        return False
+
+
+__all__ = [
+    "CALLBACK_SIGNATURE_HEADER",
+    "CallbackURLError",
+    "JOB_QUEUED",
+    "JOB_RETRYING",
+    "JOB_RUNNING",
+    "TERMINAL_STATUSES",
+    "check_callback_url",
+    "create_job",
+    "deliver_callback",
+    "fail_stale_job",
+    "finish_job",
+    "get_job",
+    "job_result",
+    "mark_job_running",
+    "publish_status",
+    "wait_for_job",
+]
@@ -28,11 +28,12 @@ Usage:
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from opentelemetry import trace
 
 from src.database.models import MCPServer
+from src.services.mcp_large_result_store import get_large_result_store
 from src.services.mcp_tool_bridge import MCPToolBridge
 
 logger = logging.getLogger(__name__)
@@ -148,6 +149,9 @@ async def cleanup_mcp_bridge(execution_context_id: str) -> None:
     global _mcp_bridge_pool
 
     if execution_context_id not in _mcp_bridge_pool:
+        # Bridge detached for a cached executor (or never created); spilled
+        # tool results of this execution are still removed
+        get_large_result_store().purge(execution_context_id)
         return
 
     # Story 12.8 AC3: Parent span for cleanup operation
@@ -214,3 +218,24 @@ def get_pool_size() -> int:
         >>> logger.info(f"Current pool size: {size}")
     """
     return len(_mcp_bridge_pool)
+
+
+def detach_mcp_bridge(execution_context_id: str) -> Optional[MCPToolBridge]:
+    """
+    Remove an execution's bridge from the pool without cleaning it up.
+
+    Used when the bridge's tools outlive the execution (cached agent
+    executors); such bridges hold no per-execution sessions.
+
+    Args:
+        execution_context_id: Execution context the bridge was created for
+
+    Returns:
+        The detached bridge, or None if the context has no bridge
+    """
+    return _mcp_bridge_pool.pop(execution_context_id, None)
+
+
+def get_mcp_bridge(execution_context_id: str) -> Optional[MCPToolBridge]:
+    """Bridge created for an execution context, if any (no side effects)."""
+    return _mcp_bridge_pool.get(execution_context_id)
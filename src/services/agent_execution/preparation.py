@@ -0,0 +1,387 @@
+"""
+Agent Execution Preparation
+
+Steps 1-8 of an agent execution, shared by execute_agent() and
+stream_agent(): everything up to invoking the executor.
+
+1. Load the agent's execution snapshot with tenant isolation
+2. Get the tenant's virtual key (budget check, Story 8.10)
+3. Load the agent's OpenAPI + MCP tools
+4. Convert them to LangChain tools, or reuse the executor compiled for the
+   same agent version (executor_cache)
+5-6. Build the ChatOpenAI model behind the LiteLLM proxy
+7. Create the executor for the agent's cognitive architecture
+8. Build the system prompt + user message
+
+References:
+- src/services/agent_execution_service.py (AgentExecutionService)
+- src/services/agent_execution/executor_cache.py
+- Story 11.1.7: MCP Tool Invocation in Agent Execution
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from uuid import UUID
+
+from langchain_openai import ChatOpenAI
+from sqlalchemy import select
+
+from src.config import settings
+from src.database.models import MCPServer
+from src.exceptions import BudgetExceededError
+from src.schemas.agent import CognitiveArchitecture
+from src.services.agent_execution.cancellation import CancellationCallbackHandler
+from src.services.agent_execution.executor_cache import (
+    AgentRunContext,
+    CachedExecutor,
+    context_model,
+    detached_servers,
+    executor_stamp,
+    get_executor_cache,
+)
+from src.services.agent_execution.mcp_bridge_pooler import detach_mcp_bridge, get_mcp_bridge
+from src.services.agent_execution.message_builder import build_messages
+from src.services.agent_execution.tool_converter import convert_tools_to_langchain
+
+if TYPE_CHECKING:
+    from src.services.agent_execution_service import AgentExecutionService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PreparedExecution:
+    """
+    An execution ready to run: executor plus its invocation arguments.
+
+    Attributes:
+        executor: Compiled LangGraph graph (possibly a cached one)
+        inputs: Graph input ({"messages": [...]})
+        config: RunnableConfig for the run
+        invoke_kwargs: Extra invocation kwargs (runtime context of cached executors)
+        model_string: LiteLLM model string the run uses
+    """
+
+    executor: Any
+    inputs: Dict[str, Any]
+    config: Dict[str, Any]
+    invoke_kwargs: Dict[str, Any]
+    model_string: str
+
+
+async def prepare_execution(
+    service: "AgentExecutionService",
+    agent_id: UUID,
+    tenant_id: str,
+    user_message: str,
+    context: Optional[Dict[str, Any]],
+    execution_context_id: str,
+) -> PreparedExecution:
+    """
+    Prepare an execution of an agent on a service's session and LLM client.
+
+    The caller owns the execution context (current_execution_context_id and
+    MCP bridge cleanup).
+
+    Args:
+        service: AgentExecutionService (db, agent_service, llm_service)
+        agent_id: Agent UUID to execute
+        tenant_id: Tenant identifier for isolation and budget tracking
+        user_message: User's input message to the agent
+        context: Optional context dict for prompt variable substitution
+        execution_context_id: MCP bridge pooling key of this execution
+
+    Returns:
+        PreparedExecution ready to invoke or stream
+
+    Raises:
+        AgentExecutionError: If the agent is not active
+        BudgetExceededError: If tenant budget exceeded
+    """
+    # Step 1: Load agent with tenant isolation (CRITICAL: AC#7)
+    logger.info(
+        "Loading agent for execution",
+        extra={
+            "agent_id": str(agent_id),
+            "tenant_id": tenant_id,
+        },
+    )
+
+    # Cached immutable snapshot (agent, tools, prompt, LLM config)
+    agent = await service.agent_service.get_agent_snapshot(
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        db=service.db,
+    )
+
+    # Verify agent is active
+    if agent.status != "active":
+        from src.services.agent_execution_service import AgentExecutionError
+
+        raise AgentExecutionError(
+            f"Agent is not active (status: {agent.status}). "
+            "Only active agents can be executed."
+        )
+
+    # Step 2: Get tenant's virtual key and check budget (Story 8.10)
+    logger.info(
+        "Initializing LLM client for tenant",
+        extra={"tenant_id": tenant_id},
+    )
+
+    try:
+        # Get AsyncOpenAI client to extract API key (virtual key)
+        # This also performs budget check per Story 8.10
+        async_openai_client = await service.llm_service.get_llm_client_for_tenant(tenant_id)
+        # Extract virtual key from client for init_chat_model
+        virtual_key = async_openai_client.api_key
+    except BudgetExceededError as e:
+        logger.warning(
+            f"Budget exceeded for tenant {tenant_id}",
+            extra={"error": str(e)},
+        )
+        # Re-raise budget error for caller to handle
+        raise
+
+    # Step 3: Load all tools (OpenAPI + MCP) via UnifiedToolService
+    logger.info(
+        "Loading tools for agent",
+        extra={"agent_id": str(agent_id)},
+    )
+
+    unified_tools = await service.agent_service.get_agent_tools(
+        agent_id=agent_id,
+        tenant_id=tenant_id,
+        db=service.db,
+        snapshot=agent,
+    )
+
+    logger.info(
+        f"Loaded {len(unified_tools)} unified tools",
+        extra={
+            "agent_id": str(agent_id),
+            "tool_count": len(unified_tools),
+        },
+    )
+
+    # Step 4: Get active MCP servers for tool conversion
+    stmt = select(MCPServer).where(
+        MCPServer.tenant_id == tenant_id,
+        MCPServer.status == "active",
+    )
+    db_result = await service.db.execute(stmt)
+    mcp_servers = list(db_result.scalars().all())
+
+    # Reuse the executor compiled for this exact agent/tool-set version
+    cache_enabled = settings.agent_executor_cache_enabled
+    stamp = executor_stamp(agent, unified_tools, mcp_servers) if cache_enabled else ""
+    cached = get_executor_cache().get(agent_id, stamp) if cache_enabled else None
+
+    if cached is not None:
+        langchain_tools = cached.tools
+        logger.info(
+            "Reusing compiled agent executor",
+            extra={"agent_id": str(agent_id), "executor_stamp": stamp},
+        )
+    else:
+        # Convert tools to LangChain-compatible format
+        # Uses extracted tool_converter module (Story 12.7)
+        # Cacheable tool wrappers must not hold rows of this DB session
+        langchain_tools = await convert_tools_to_langchain(
+            unified_tools=unified_tools,
+            mcp_servers=detached_servers(mcp_servers) if cache_enabled else mcp_servers,
+            execution_context_id=execution_context_id,
+        )
+
+    logger.info(
+        f"Converted {len(langchain_tools)} tools to LangChain format",
+        extra={"tool_count": len(langchain_tools)},
+    )
+
+    # Step 5: Extract LLM model from agent.llm_config
+    llm_provider = agent.llm_config.get("provider", "openai")
+    llm_model = agent.llm_config.get("model", "gpt-4o-mini")
+    temperature = agent.llm_config.get("temperature", 0.3)
+    max_tokens = agent.llm_config.get("max_tokens", 1000)
+
+    # Normalize model string for LiteLLM proxy
+    # Handles various config formats: provider-prefixed models, bare names, etc.
+    # Reason: Ensure compatibility with all current and future LLM model configurations
+    if "/" in llm_model:
+        # Model already has provider prefix (e.g., "xai/grok-4-fast-reasoning")
+        model_string = llm_model
+        logger.info(
+            f"Using provider-prefixed model: {model_string}",
+            extra={"model": model_string, "provider": llm_provider},
+        )
+    elif llm_provider == "litellm" or not llm_provider:
+        # Provider is generic marker or empty - use model as-is
+        # LiteLLM will infer the correct provider
+        model_string = llm_model
+        logger.info(
+            f"Using model without prefix (provider={llm_provider}): {model_string}",
+            extra={"model": model_string, "provider": llm_provider},
+        )
+    else:
+        # Traditional format: concatenate provider/model
+        model_string = f"{llm_provider}/{llm_model}"
+        logger.info(
+            f"Constructed model string from provider+model: {model_string}",
+            extra={"model": llm_model, "provider": llm_provider},
+        )
+
+    logger.info(
+        "Creating ReAct agent",
+        extra={
+            "model": model_string,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "tool_count": len(langchain_tools),
+        },
+    )
+
+    # Step 6: Initialize chat model with ChatOpenAI
+    # Using ChatOpenAI with LiteLLM proxy ensures proper tool binding for all providers
+    # LiteLLM handles provider-specific tool calling formats (OpenAI, Grok, Claude, etc.)
+    from src.services.llm_concurrency_limiter import build_limited_http_client
+
+    llm = ChatOpenAI(
+        model=model_string,  # e.g., "xai/grok-4-fast-reasoning", "openai/gpt-4o-mini"
+        api_key=virtual_key,  # Tenant's virtual key from LiteLLM
+        base_url=f"{service.litellm_proxy_url}/v1",  # LiteLLM proxy endpoint
+        temperature=temperature,
+        max_tokens=max_tokens,
+        # Every ReAct LLM call queues behind the per-model adaptive limiter
+        # and adds its LiteLLM cost to the tenant's spend ledger
+        http_async_client=build_limited_http_client(
+            default_provider=llm_provider or "litellm",
+            tenant_id=tenant_id,
+        ),
+        # LiteLLM stores metadata tags as request_tags; the spend attribution
+        # trigger indexes these for per-agent and per-execution cost queries
+        extra_body={
+            "metadata": {
+                "tags": [
+                    f"agent:{agent.name}",
+                    f"agent_id:{agent_id}",
+                    f"execution:{execution_context_id}",
+                ]
+            }
+        },
+    )
+
+    # Step 7: Create agent executor based on architecture
+    # Using factory pattern to support multiple cognitive architectures (Story 12.8)
+    architecture = getattr(agent, "cognitive_architecture", CognitiveArchitecture.REACT)
+
+    if cached is None and cache_enabled and executor_cacheable(execution_context_id):
+        # Compiled once with a dynamic model; each run supplies its own
+        # chat model through the LangGraph runtime context
+        cached = CachedExecutor(
+            agent_id=agent_id,
+            stamp=stamp,
+            executor=service._create_agent_executor(
+                architecture=architecture,
+                llm=context_model,
+                tools=langchain_tools,
+            ),
+            tools=langchain_tools,
+        )
+        get_executor_cache().put(cached)
+        # The bridge now lives with the cached tools, not this execution
+        detach_mcp_bridge(execution_context_id)
+
+    invoke_kwargs: Dict[str, Any] = {}
+    if cached is not None:
+        agent_executor = cached.executor
+        invoke_kwargs["context"] = AgentRunContext(
+            model=llm.bind_tools(langchain_tools) if langchain_tools else llm
+        )
+    else:
+        agent_executor = service._create_agent_executor(
+            architecture=architecture,
+            llm=llm,
+            tools=langchain_tools,
+        )
+
+    # Step 8: Build messages with system prompt + user message
+    # Uses extracted message_builder module (Story 12.7)
+    messages = build_messages(
+        system_prompt=agent.system_prompt,
+        user_message=user_message,
+        context=context,
+    )
+
+    logger.info(
+        "Executing agent",
+        extra={
+            "agent_id": str(agent_id),
+            "message_count": len(messages),
+        },
+    )
+
+    return PreparedExecution(
+        executor=agent_executor,
+        inputs={"messages": messages},
+        # Tool calls from one assistant message run as parallel graph tasks;
+        # max_concurrency caps how many execute at once for this agent
+        config={"max_concurrency": max_parallel_tool_calls(agent.llm_config)},
+        invoke_kwargs=invoke_kwargs,
+        model_string=model_string,
+    )
+
+
+def run_config(
+    prepared: PreparedExecution,
+    tenant_id: str,
+    execution_id: Optional[UUID | str],
+) -> Dict[str, Any]:
+    """Graph run config, checking the cancel flag of cancellable executions."""
+    if execution_id is None:
+        return prepared.config
+    return {
+        **prepared.config,
+        "callbacks": [CancellationCallbackHandler(tenant_id, execution_id)],
+    }
+
+
+def executor_cacheable(execution_context_id: str) -> bool:
+    """
+    Whether an executor built for this execution can be reused.
+
+    Tools loaded over per-execution MCP sessions (legacy
+    MultiServerMCPClient path) are closed by cleanup and cannot.
+    """
+    bridge = get_mcp_bridge(execution_context_id)
+    return bridge is None or not bridge.holds_execution_sessions
+
+
+def max_parallel_tool_calls(llm_config: Optional[Dict[str, Any]]) -> int:
+    """
+    Concurrent tool-call cap for one agent.
+
+    Uses llm_config["max_parallel_tool_calls"] when set, otherwise the
+    platform default; 1 (sequential) when parallel tool calls are disabled.
+
+    Args:
+        llm_config: Agent llm_config JSONB
+
+    Returns:
+        Maximum tool calls from one assistant message executing at once
+    """
+    if not settings.agent_parallel_tool_calls_enabled:
+        return 1
+    configured = (llm_config or {}).get("max_parallel_tool_calls")
+    if isinstance(configured, int) and configured >= 1:
+        return configured
+    return settings.agent_max_parallel_tool_calls
+
+
+__all__ = [
+    "PreparedExecution",
+    "executor_cacheable",
+    "max_parallel_tool_calls",
+    "prepare_execution",
+    "run_config",
+]
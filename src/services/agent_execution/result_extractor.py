@@ -8,6 +8,9 @@ Pattern: Two pure extraction functions with clear separation of concerns.
 - extract_response: Parse final AI response from message list
 - extract_tool_calls: Parse tool invocation history from message list
 
+success_result / failure_result build the execute_agent() result dict of a
+completed or failed execution from them.
+
 References:
 - LangGraph message structure (AIMessage, ToolMessage)
 - Story 11.1.7: MCP Tool Invocation in Agent Execution
@@ -22,6 +25,7 @@ Usage:
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List
+from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
@@ -97,13 +101,21 @@ def extract_response(result: Dict[str, Any]) -> str:
         return str(last_message)
 
 
+def _is_cache_hit(tool_message: Any) -> bool:
+    """Whether a ToolMessage's result came from the MCP tool result cache."""
+    # Pooled MCP tools attach {"cache_hit": bool}; other tools' artifacts differ
+    artifact = getattr(tool_message, "artifact", None)
+    return isinstance(artifact, dict) and artifact.get("cache_hit") is True
+
+
 def extract_tool_calls(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Extract tool call history from LangGraph execution result.
 
     Parses messages list to find all AIMessages with tool_calls and
     corresponding ToolMessages with results. Matches tool calls with
-    their results sequentially (assumes synchronous execution).
+        their results sequentially (assumes synchronous execution). Results served
+    from the MCP tool result cache are marked with cache_hit.
 
     Args:
         result: LangGraph agent execution result dict
@@ -115,6 +127,7 @@ def extract_tool_calls(result: Dict[str, Any]) -> List[Dict[str, Any]]:
                 "tool_name": str,
                 "tool_input": dict,
                 "tool_output": str,
+                "cache_hit": bool,
                 "timestamp": str (ISO 8601)
             },
             ...
@@ -144,6 +157,7 @@ def extract_tool_calls(result: Dict[str, Any]) -> List[Dict[str, Any]]:
                         "tool_name": tool_call.get("name", "unknown"),
                         "tool_input": tool_call.get("args", {}),
                         "tool_output": "",  # Will be filled from ToolMessage
+                        "cache_hit": False,
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     }
                 )
@@ -153,7 +167,71 @@ def extract_tool_calls(result: Dict[str, Any]) -> List[Dict[str, Any]]:
             # Match with last tool call (assumes sequential execution)
             if tool_calls:
                 tool_calls[-1]["tool_output"] = str(message.content)
+                tool_calls[-1]["cache_hit"] = _is_cache_hit(message)
 
     logger.debug(f"Extracted {len(tool_calls)} tool calls from execution result")
 
     return tool_calls
+
+
+def success_result(
+    execution_result: Dict[str, Any],
+    model_string: str,
+    agent_id: UUID,
+    start_time: datetime,
+) -> Dict[str, Any]:
+    """Structured result of a completed execution from the final graph state."""
+    final_response = extract_response(execution_result)
+    tool_calls = extract_tool_calls(execution_result)
+
+    execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+
+    logger.info(
+        "Agent execution completed",
+        extra={
+            "agent_id": str(agent_id),
+            "execution_time_seconds": execution_time,
+            "tool_calls_count": len(tool_calls),
+        },
+    )
+
+    return {
+        "success": True,
+        "response": final_response,
+        "tool_calls": tool_calls,
+        "execution_time_seconds": execution_time,
+        "model_used": model_string,
+        "error": None,
+    }
+
+
+def failure_result(
+    error: Exception,
+    agent_id: UUID,
+    tenant_id: str,
+    start_time: datetime,
+) -> Dict[str, Any]:
+    """Structured result of a failed execution."""
+    execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+    error_msg = f"Agent execution failed: {str(error)}"
+
+    logger.error(
+        error_msg,
+        extra={
+            "agent_id": str(agent_id),
+            "tenant_id": tenant_id,
+            "error_type": type(error).__name__,
+            "execution_time_seconds": execution_time,
+        },
+        exc_info=True,
+    )
+
+    # Return structured error response
+    return {
+        "success": False,
+        "response": "",
+        "tool_calls": [],
+        "execution_time_seconds": execution_time,
+        "model_used": "",
+        "error": error_msg,
+    }
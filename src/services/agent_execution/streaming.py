@@ -0,0 +1,143 @@
+"""
+Streamed Agent Execution
+
+Runs an agent execution over LangGraph astream_events and yields its events
+(see event_stream) as they happen, for AgentExecutionService.stream_agent().
+
+The execution runs in its own task, which owns its execution context and MCP
+bridge, and hands events to the consumer through a bounded queue. Closing the
+iterator early (client disconnect) cancels that task, and its cleanup
+releases the bridge.
+
+References:
+- src/services/agent_execution_service.py (stream_agent, _prepare_execution)
+- src/services/agent_execution/event_stream.py
+- src/api/agent_execution_stream.py (POST /execute/stream)
+"""
+
+import asyncio
+import contextlib
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID
+
+from src.exceptions import BudgetExceededError
+from src.services.agent_execution.event_stream import StreamEventTranslator, error_event
+from src.services.agent_execution.mcp_bridge_pooler import cleanup_mcp_bridge
+from src.services.agent_execution.preparation import run_config
+from src.services.agent_execution.result_extractor import failure_result, success_result
+from src.services.agent_execution_service import (
+    AgentExecutionError,
+    AgentExecutionService,
+    budget_admission_error,
+)
+from src.services.mcp_tool_bridge import current_execution_context_id
+
+# Streamed events buffered ahead of a slow client before the execution waits
+STREAM_QUEUE_SIZE = 256
+
+
+async def stream_execution(
+    service: AgentExecutionService,
+    agent_id: UUID,
+    tenant_id: str,
+    user_message: str,
+    context: Optional[Dict[str, Any]] = None,
+    timeout_seconds: int = 120,
+    execution_id: Optional[UUID | str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run an execution on a service's agent, yielding its events.
+
+    Args:
+        service: AgentExecutionService that prepares the execution
+        agent_id: Agent UUID to execute
+        tenant_id: Tenant identifier for isolation and budget tracking
+        user_message: User's input message to the agent
+        context: Optional context dict for prompt variable substitution
+        timeout_seconds: Maximum execution time (default: 120s)
+        execution_id: Execution ID cancel requests are made for
+
+    Yields:
+        Event dicts, always ending with the result event
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    producer = asyncio.create_task(
+        _produce_events(
+            service,
+            queue,
+            agent_id,
+            tenant_id,
+            user_message,
+            context,
+            timeout_seconds,
+            execution_id,
+        )
+    )
+    try:
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+            yield event
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+
+async def _produce_events(
+    service: AgentExecutionService,
+    queue: asyncio.Queue,
+    agent_id: UUID,
+    tenant_id: str,
+    user_message: str,
+    context: Optional[Dict[str, Any]],
+    timeout_seconds: int,
+    execution_id: Optional[UUID | str],
+) -> None:
+    """Run one streamed execution, putting its events on queue (None ends it)."""
+    start_time = datetime.now(timezone.utc)
+    execution_context_id = str(uuid.uuid4())
+    # Set in this task's own context copy; no reset needed
+    current_execution_context_id.set(execution_context_id)
+
+    try:
+        prepared = await service._prepare_execution(
+            agent_id, tenant_id, user_message, context, execution_context_id
+        )
+        translator = StreamEventTranslator()
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                async for raw_event in prepared.executor.astream_events(
+                    prepared.inputs,
+                    config=run_config(prepared, tenant_id, execution_id),
+                    version="v2",
+                    **prepared.invoke_kwargs,
+                ):
+                    event = translator.translate(raw_event)
+                    if event is not None:
+                        await queue.put(event)
+        except TimeoutError:
+            raise AgentExecutionError(f"Agent execution timeout after {timeout_seconds} seconds")
+        result = success_result(
+            translator.final_state or {}, prepared.model_string, agent_id, start_time
+        )
+
+    except Exception as e:
+        error = e
+        if not isinstance(e, BudgetExceededError):
+            error = budget_admission_error(e, tenant_id) or e
+        await queue.put(error_event(error))
+        result = failure_result(error, agent_id, tenant_id, start_time)
+
+    finally:
+        await cleanup_mcp_bridge(execution_context_id)
+
+    await queue.put({"event": "result", "data": result})
+    await queue.put(None)
+
+
+__all__ = ["STREAM_QUEUE_SIZE", "stream_execution"]
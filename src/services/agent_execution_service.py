@@ -15,6 +15,8 @@ Implements:
 - Result extraction from LangGraph state
 - MCP bridge connection pooling per execution context
 - Error recovery with detailed diagnostics
+- Streamed execution (stream_agent) over LangGraph astream_events
+- Cooperative cancellation before LLM turns and tool calls
 
 Refactoring Note (Story 12.7):
 This module was refactored to comply with 2025 Python best practices
@@ -22,7 +24,9 @@ This module was refactored to comply with 2025 Python best practices
 - agent_execution.mcp_bridge_pooler: Connection pooling lifecycle
 - agent_execution.tool_converter: Tool format conversion
 - agent_execution.message_builder: Message construction
-- agent_execution.result_extractor: Result parsing
+- agent_execution.result_extractor: Result parsing and result dicts
+- agent_execution.streaming: Streamed execution (stream_agent)
+- agent_execution.preparation: Steps 1-8 up to invoking the executor
 
 References:
 - Story 11.1.7: MCP Tool Invocation in Agent Execution
@@ -36,23 +40,26 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from uuid import UUID
 
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import MCPServer
 from src.exceptions import BudgetExceededError
 from src.schemas.agent import CognitiveArchitecture
 from src.services.agent_execution.mcp_bridge_pooler import cleanup_mcp_bridge
-from src.services.agent_execution.message_builder import build_messages
-from src.services.agent_execution.result_extractor import extract_response, extract_tool_calls
-from src.services.agent_execution.tool_converter import convert_tools_to_langchain
+from src.services.agent_execution.preparation import (
+    PreparedExecution,
+    prepare_execution,
+    run_config,
+)
+from src.services.agent_execution.result_extractor import failure_result, success_result
 from src.services.agent_service import AgentService
+from src.services.execution_cancellation import ExecutionCancelledError
 from src.services.llm_service import LLMService
+from src.services.mcp_tool_bridge import current_execution_context_id
+from src.services.spend_ledger import BUDGET_ADMISSION_ERROR_TYPE
 
 logger = logging.getLogger(__name__)
 
@@ -68,11 +75,12 @@ class AgentExecutionService:
     Service for executing agents with LangGraph + MCP tool support.
 
     Orchestrates complete agent execution workflow:
-    1. Load agent configuration with tenant isolation
+    1. Load the agent's execution snapshot with tenant isolation
     2. Retrieve OpenAPI + MCP tools via UnifiedToolService
     3. Initialize LLM client using tenant's virtual key (LiteLLM)
     4. Convert MCP primitives to LangChain tools via MCPToolBridge
-    5. Create ReAct agent with create_react_agent(model, tools)
+    5. Create ReAct agent with create_react_agent(model, tools), or reuse the
+       executor compiled for the same agent version (executor_cache)
     6. Execute agent with system prompt + user message
     7. Extract response and tool call history
     8. Handle errors gracefully with structured diagnostics
@@ -119,6 +127,7 @@ class AgentExecutionService:
         user_message: str,
         context: Optional[Dict[str, Any]] = None,
         timeout_seconds: int = 120,
+        execution_id: Optional[UUID | str] = None,
     ) -> Dict[str, Any]:
         """
         Execute agent with LangGraph ReAct workflow and MCP tool support.
@@ -138,6 +147,8 @@ class AgentExecutionService:
             user_message: User's input message to the agent
             context: Optional context dict for prompt variable substitution
             timeout_seconds: Maximum execution time (default: 120s)
+            execution_id: Execution ID cancel requests are made for
+                (None: the execution cannot be cancelled)
 
         Returns:
             Dict containing:
@@ -153,6 +164,7 @@ class AgentExecutionService:
         Raises:
             AgentExecutionError: If agent execution fails
             BudgetExceededError: If tenant budget exceeded (re-raised from LLMService)
+            ExecutionCancelledError: If cancelled before an LLM turn or tool call
             ValueError: If agent not found or tenant mismatch
 
         Example:
@@ -170,174 +182,22 @@ class AgentExecutionService:
 
         # Generate execution context ID for MCP bridge pooling (Story 11.2.3)
         execution_context_id = str(uuid.uuid4())
+        # MCP tool wrappers (possibly from a cached executor) read the execution from here
+        context_token = current_execution_context_id.set(execution_context_id)
 
         try:
-            # Step 1: Load agent with tenant isolation (CRITICAL: AC#7)
-            logger.info(
-                "Loading agent for execution",
-                extra={
-                    "agent_id": str(agent_id),
-                    "tenant_id": tenant_id,
-                },
-            )
-
-            agent = await self.agent_service.get_agent_by_id(
-                tenant_id=tenant_id,
-                agent_id=agent_id,
-                db=self.db,
-            )
-
-            # Verify agent is active
-            if agent.status != "active":
-                raise AgentExecutionError(
-                    f"Agent is not active (status: {agent.status}). "
-                    "Only active agents can be executed."
-                )
-
-            # Step 2: Get tenant's virtual key and check budget (Story 8.10)
-            logger.info(
-                "Initializing LLM client for tenant",
-                extra={"tenant_id": tenant_id},
-            )
-
-            try:
-                # Get AsyncOpenAI client to extract API key (virtual key)
-                # This also performs budget check per Story 8.10
-                async_openai_client = await self.llm_service.get_llm_client_for_tenant(tenant_id)
-                # Extract virtual key from client for init_chat_model
-                virtual_key = async_openai_client.api_key
-            except BudgetExceededError as e:
-                logger.warning(
-                    f"Budget exceeded for tenant {tenant_id}",
-                    extra={"error": str(e)},
-                )
-                # Re-raise budget error for caller to handle
-                raise
-
-            # Step 3: Load all tools (OpenAPI + MCP) via UnifiedToolService
-            logger.info(
-                "Loading tools for agent",
-                extra={"agent_id": str(agent_id)},
-            )
-
-            unified_tools = await self.agent_service.get_agent_tools(
-                agent_id=agent_id,
-                tenant_id=tenant_id,
-                db=self.db,
-            )
-
-            logger.info(
-                f"Loaded {len(unified_tools)} unified tools",
-                extra={
-                    "agent_id": str(agent_id),
-                    "tool_count": len(unified_tools),
-                },
-            )
-
-            # Step 4: Get active MCP servers for tool conversion
-            stmt = select(MCPServer).where(
-                MCPServer.tenant_id == tenant_id,
-                MCPServer.status == "active",
-            )
-            db_result = await self.db.execute(stmt)
-            mcp_servers = list(db_result.scalars().all())
-
-            # Convert tools to LangChain-compatible format
-            # Uses extracted tool_converter module (Story 12.7)
-            langchain_tools = await convert_tools_to_langchain(
-                unified_tools=unified_tools,
-                mcp_servers=mcp_servers,
-                execution_context_id=execution_context_id,
-            )
-
-            logger.info(
-                f"Converted {len(langchain_tools)} tools to LangChain format",
-                extra={"tool_count": len(langchain_tools)},
-            )
-
-            # Step 5: Extract LLM model from agent.llm_config
-            llm_provider = agent.llm_config.get("provider", "openai")
-            llm_model = agent.llm_config.get("model", "gpt-4o-mini")
-            temperature = agent.llm_config.get("temperature", 0.3)
-            max_tokens = agent.llm_config.get("max_tokens", 1000)
-
-            # Normalize model string for LiteLLM proxy
-            # Handles various config formats: provider-prefixed models, bare names, etc.
-            # Reason: Ensure compatibility with all current and future LLM model configurations
-            if "/" in llm_model:
-                # Model already has provider prefix (e.g., "xai/grok-4-fast-reasoning")
-                model_string = llm_model
-                logger.info(
-                    f"Using provider-prefixed model: {model_string}",
-                    extra={"model": model_string, "provider": llm_provider},
-                )
-            elif llm_provider == "litellm" or not llm_provider:
-                # Provider is generic marker or empty - use model as-is
-                # LiteLLM will infer the correct provider
-                model_string = llm_model
-                logger.info(
-                    f"Using model without prefix (provider={llm_provider}): {model_string}",
-                    extra={"model": model_string, "provider": llm_provider},
-                )
-            else:
-                # Traditional format: concatenate provider/model
-                model_string = f"{llm_provider}/{llm_model}"
-                logger.info(
-                    f"Constructed model string from provider+model: {model_string}",
-                    extra={"model": llm_model, "provider": llm_provider},
-                )
-
-            logger.info(
-                "Creating ReAct agent",
-                extra={
-                    "model": model_string,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "tool_count": len(langchain_tools),
-                },
-            )
-
-            # Step 6: Initialize chat model with ChatOpenAI
-            # Using ChatOpenAI with LiteLLM proxy ensures proper tool binding for all providers
-            # LiteLLM handles provider-specific tool calling formats (OpenAI, Grok, Claude, etc.)
-            llm = ChatOpenAI(
-                model=model_string,  # e.g., "xai/grok-4-fast-reasoning", "openai/gpt-4o-mini"
-                api_key=virtual_key,  # Tenant's virtual key from LiteLLM
-                base_url=f"{self.litellm_proxy_url}/v1",  # LiteLLM proxy endpoint
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
-
-            # Step 7: Create agent executor based on architecture
-            # Using factory pattern to support multiple cognitive architectures (Story 12.8)
-            architecture = getattr(agent, "cognitive_architecture", CognitiveArchitecture.REACT)
-            
-            agent_executor = self._create_agent_executor(
-                architecture=architecture,
-                llm=llm,
-                tools=langchain_tools,
-            )
-
-            # Step 8: Build messages with system prompt + user message
-            # Uses extracted message_builder module (Story 12.7)
-            messages = build_messages(
-                system_prompt=agent.system_prompt,
-                user_message=user_message,
-                context=context,
-            )
-
-            logger.info(
-                "Executing agent",
-                extra={
-                    "agent_id": str(agent_id),
-                    "message_count": len(messages),
-                },
+            prepared = await self._prepare_execution(
+                agent_id, tenant_id, user_message, context, execution_context_id
             )
 
             # Step 9: Execute agent with timeout
             try:
                 execution_result = await asyncio.wait_for(
-                    agent_executor.ainvoke({"messages": messages}),
+                    prepared.executor.ainvoke(
+                        prepared.inputs,
+                        config=run_config(prepared, tenant_id, execution_id),
+                        **prepared.invoke_kwargs,
+                    ),
                     timeout=timeout_seconds,
                 )
             except asyncio.TimeoutError:
@@ -361,63 +221,72 @@ class AgentExecutionService:
             print(f"{'='*80}\n")
 
             # Step 10: Extract response and tool calls from result
-            # Uses extracted result_extractor module (Story 12.7)
-            final_response = extract_response(execution_result)
-            tool_calls = extract_tool_calls(execution_result)
-
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-
-            logger.info(
-                "Agent execution completed",
-                extra={
-                    "agent_id": str(agent_id),
-                    "execution_time_seconds": execution_time,
-                    "tool_calls_count": len(tool_calls),
-                },
-            )
-
-            return {
-                "success": True,
-                "response": final_response,
-                "tool_calls": tool_calls,
-                "execution_time_seconds": execution_time,
-                "model_used": model_string,
-                "error": None,
-            }
+            return success_result(execution_result, prepared.model_string, agent_id, start_time)
 
-        except BudgetExceededError:
-            # Re-raise budget errors for caller to handle
+        except (BudgetExceededError, ExecutionCancelledError):
+            # Re-raise budget errors and cancellations for caller to handle
             raise
 
         except Exception as e:
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-            error_msg = f"Agent execution failed: {str(e)}"
-
-            logger.error(
-                error_msg,
-                extra={
-                    "agent_id": str(agent_id),
-                    "tenant_id": tenant_id,
-                    "error_type": type(e).__name__,
-                    "execution_time_seconds": execution_time,
-                },
-                exc_info=True,
-            )
-
-            # Return structured error response
-            return {
-                "success": False,
-                "response": "",
-                "tool_calls": [],
-                "execution_time_seconds": execution_time,
-                "model_used": "",
-                "error": error_msg,
-            }
+            budget_error = budget_admission_error(e, tenant_id)
+            if budget_error is not None:
+                raise budget_error from e
+            return failure_result(e, agent_id, tenant_id, start_time)
 
         finally:
             # Cleanup MCP bridge for this execution context (Story 11.2.3)
             # Uses extracted mcp_bridge_pooler module (Story 12.7)
             await cleanup_mcp_bridge(execution_context_id)
+            current_execution_context_id.reset(context_token)
+
+    def stream_agent(
+        self,
+        agent_id: UUID,
+        tenant_id: str,
+        user_message: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout_seconds: int = 120,
+        execution_id: Optional[UUID | str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute an agent like execute_agent(), yielding events as it runs.
+
+        Events are {"event": name, "data": dict}: token, tool_start, tool_end
+        and error as they happen, then always a final result event whose data
+        is the dict execute_agent() returns (see agent_execution.event_stream).
+        Budget errors and cancellations are reported as error events, not raised.
+        Runs in its own task (see agent_execution.streaming); closing the
+        iterator early cancels it.
+
+        Args:
+            agent_id: Agent UUID to execute
+            tenant_id: Tenant identifier for isolation and budget tracking
+            user_message: User's input message to the agent
+            context: Optional context dict for prompt variable substitution
+            timeout_seconds: Maximum execution time (default: 120s)
+            execution_id: Execution ID cancel requests are made for
+
+        Returns:
+            Async iterator of event dicts
+        """
+        from src.services.agent_execution.streaming import stream_execution
+
+        return stream_execution(
+            self, agent_id, tenant_id, user_message, context, timeout_seconds, execution_id
+        )
+
+    async def _prepare_execution(
+        self,
+        agent_id: UUID,
+        tenant_id: str,
+        user_message: str,
+        context: Optional[Dict[str, Any]],
+        execution_context_id: str,
+    ) -> PreparedExecution:
+        """Steps 1-8 of an execution (see agent_execution.preparation)."""
+        return await prepare_execution(
+            self, agent_id, tenant_id, user_message, context, execution_context_id
+        )
 
     def _create_agent_executor(
         self, 
@@ -466,3 +335,33 @@ class AgentExecutionService:
         """
         # TODO: Implement full Plan-and-Solve graph
         return create_react_agent(model=llm, tools=tools)
+
+
+def budget_admission_error(error: Exception, tenant_id: str) -> Optional[BudgetExceededError]:
+    """
+    BudgetExceededError for an LLM call rejected mid-run by budget admission.
+
+    BudgetAdmissionTransport answers with a synthetic 402, which surfaces
+    as an OpenAI APIStatusError; it is reported like the up-front budget check.
+
+    Args:
+        error: Exception raised by the execution
+        tenant_id: Tenant the execution ran for
+
+    Returns:
+        Equivalent BudgetExceededError, or None for any other error
+    """
+    error_body = getattr(error, "body", None)
+    if (
+        getattr(error, "status_code", None) == 402
+        and isinstance(error_body, dict)
+        and error_body.get("type") == BUDGET_ADMISSION_ERROR_TYPE
+    ):
+        return BudgetExceededError(
+            tenant_id=tenant_id,
+            current_spend=error_body.get("current_spend", 0.0),
+            max_budget=error_body.get("max_budget", 0.0),
+            grace_threshold=error_body.get("grace_threshold", 110),
+            message=error_body.get("message"),
+        )
+    return None
@@ -0,0 +1,166 @@
+"""
+Agent Memory Embedding Backfill Module.
+
+Moves embeddings stored as text before migration 023
+(agent_memory.embedding_legacy) into the native vector column, where the HNSW
+index serves semantic memory search. Rows are invisible to semantic search
+until they are converted.
+
+Each batch locks up to batch_size legacy rows (FOR UPDATE SKIP LOCKED, so
+overlapping runs split the work instead of blocking), parses them and writes
+the vectors while clearing embedding_legacy in the same transaction, so an
+interrupted run loses no work. Text that is not a JSON list of 1536 finite
+numbers can never be searched: it is cleared and counted as invalid. Once no
+legacy rows remain, a run is one probe of the partial index
+idx_agent_memory_embedding_legacy.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import bindparam, select, update
+
+from src.database.models import AgentMemory
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = AgentMemory.embedding.type.dim
+
+_table = AgentMemory.__table__
+
+# Executed once per converted row of a batch (executemany)
+_CONVERT_SQL = (
+    update(_table)
+    .where(_table.c.id == bindparam("memory_id"))
+    .values(embedding=bindparam("vector", type_=_table.c.embedding.type), embedding_legacy=None)
+)
+
+
+@dataclass
+class BackfillRunResult:
+    """
+    Outcome of one backfill run.
+
+    Attributes:
+        batches: Number of batches committed
+        converted: Rows whose text embedding was written to the vector column
+        invalid: Rows whose text embedding was unusable and cleared
+        done: True if no legacy rows remain
+    """
+
+    batches: int = 0
+    converted: int = 0
+    invalid: int = 0
+    done: bool = False
+
+
+def parse_legacy_embedding(value: Optional[str]) -> Optional[List[float]]:
+    """
+    Parse a text embedding as stored by EmbeddingService (JSON list of floats).
+
+    Args:
+        value: Text embedding
+
+    Returns:
+        List of EMBEDDING_DIMENSIONS finite floats, or None if unusable
+    """
+    try:
+        values = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(values, list) or len(values) != EMBEDDING_DIMENSIONS:
+        return None
+    if not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+        for v in values
+    ):
+        return None
+    return [float(v) for v in values]
+
+
+class MemoryEmbeddingBackfill:
+    """Converts legacy text embeddings of agent_memory to vectors."""
+
+    def __init__(
+        self,
+        session_maker: Callable[[], Any],
+        batch_size: int,
+        max_batches: int,
+    ):
+        """
+        Initialize backfill.
+
+        Args:
+            session_maker: Async session factory
+            batch_size: Rows converted per transaction
+            max_batches: Maximum batches per run (bounds work per run)
+        """
+        self.session_maker = session_maker
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    async def _backfill_batch(self, session: Any, result: BackfillRunResult) -> bool:
+        """
+        Convert one batch of legacy rows.
+
+        Returns:
+            False if no legacy rows were left to convert
+        """
+        rows = (
+            await session.execute(
+                select(AgentMemory.id, AgentMemory.embedding_legacy)
+                .where(AgentMemory.embedding_legacy.isnot(None))
+                .order_by(AgentMemory.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not rows:
+            return False
+
+        converted = []
+        invalid = []
+        for memory_id, legacy in rows:
+            vector = parse_legacy_embedding(legacy)
+            if vector is None:
+                invalid.append(memory_id)
+            else:
+                converted.append({"memory_id": memory_id, "vector": vector})
+
+        if converted:
+            await session.execute(_CONVERT_SQL, converted)
+        if invalid:
+            await session.execute(
+                update(_table).where(_table.c.id.in_(invalid)).values(embedding_legacy=None)
+            )
+            logger.warning(
+                f"Cleared {len(invalid)} unusable legacy memory embeddings",
+                extra={"memory_ids": [str(memory_id) for memory_id in invalid[:20]]},
+            )
+        await session.commit()
+
+        result.batches += 1
+        result.converted += len(converted)
+        result.invalid += len(invalid)
+        return True
+
+    async def run(self) -> BackfillRunResult:
+        """
+        Convert legacy rows until none remain or max_batches is reached.
+
+        Returns:
+            BackfillRunResult
+        """
+        result = BackfillRunResult()
+
+        while result.batches < self.max_batches:
+            async with self.session_maker() as session:
+                if not await self._backfill_batch(session, result):
+                    result.done = True
+                    break
+
+        return result
+
@@ -20,6 +20,11 @@ from sqlalchemy.orm import selectinload
 
 from src.config import get_settings
 from src.database.models import Agent, AgentTool, AgentTrigger
+from src.services.agent_execution.agent_snapshot import (
+    AgentSnapshot,
+    get_agent_snapshot,
+    invalidate_agent_snapshot,
+)
 from src.schemas.agent import (
     AgentCreate,
     AgentResponse,
@@ -422,6 +427,34 @@ class AgentService:
                 detail="Failed to retrieve agent",
             )
 
+    async def get_agent_snapshot(
+        self,
+        tenant_id: str,
+        agent_id: UUID,
+        db: AsyncSession,
+    ) -> AgentSnapshot:
+        """
+        Get the cached execution snapshot of an agent.
+
+        Args:
+            tenant_id: Tenant identifier for isolation
+            agent_id: Agent UUID
+            db: Async database session (used on a cache miss)
+
+        Returns:
+            AgentSnapshot: Immutable agent, trigger, tool and prompt view
+
+        Raises:
+            HTTPException(404): If agent not found or belongs to different tenant
+        """
+        snapshot = await get_agent_snapshot(db, agent_id, tenant_id=tenant_id)
+        if snapshot is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Agent not found",
+            )
+        return snapshot
+
     async def update_agent(
         self,
         tenant_id: str,
@@ -526,6 +559,7 @@ class AgentService:
             agent.updated_at = datetime.now(timezone.utc)
 
             await db.commit()
+            await invalidate_agent_snapshot(agent_id)
             await db.refresh(agent, ["triggers", "tools"])
 
             # Convert to Pydantic response
@@ -575,6 +609,7 @@ class AgentService:
             agent.updated_at = datetime.now(timezone.utc)
 
             await db.commit()
+            await invalidate_agent_snapshot(agent_id)
             return True
 
         except HTTPException:
@@ -676,6 +711,7 @@ class AgentService:
             agent.updated_at = datetime.now(timezone.utc)
 
             await db.commit()
+            await invalidate_agent_snapshot(agent_id)
             await db.refresh(agent, ["triggers", "tools"])
 
             # Convert to Pydantic response
@@ -814,6 +850,7 @@ class AgentService:
             webhook_trigger.updated_at = datetime.now(timezone.utc)
             db.add(webhook_trigger)
             await db.commit()
+            await invalidate_agent_snapshot(agent_id)
 
             logger.warning(
                 f"HMAC secret regenerated for agent {agent_id} (tenant: {tenant_id}). "
@@ -885,6 +922,7 @@ class AgentService:
         agent_id: UUID,
         tenant_id: str,
         db: AsyncSession,
+        snapshot: Optional[AgentSnapshot] = None,
     ) -> list[dict]:
         """
         Get unified list of OpenAPI and MCP tools assigned to an agent.
@@ -900,6 +938,8 @@ class AgentService:
             agent_id: Agent UUID
             tenant_id: Tenant identifier for isolation
             db: Async database session
+            snapshot: Agent snapshot to read assignments from instead of
+                loading the agent
 
         Returns:
             list[dict]: Combined list of OpenAPI and MCP tool definitions
@@ -911,42 +951,47 @@ class AgentService:
         from src.services.unified_tool_service import UnifiedToolService
 
         try:
-            # Fetch agent with OpenAPI tools relationship
-            query = (
-                select(Agent)
-                .where(
-                    and_(
-                        Agent.id == agent_id,  # type: ignore
-                        Agent.tenant_id == tenant_id,  # type: ignore
+            if snapshot is not None and snapshot.tenant_id == tenant_id:
+                openapi_tool_ids = list(snapshot.openapi_tool_ids)
+                assigned_mcp_tools = [dict(tool) for tool in snapshot.assigned_mcp_tools]
+            else:
+                # Fetch agent with OpenAPI tools relationship
+                query = (
+                    select(Agent)
+                    .where(
+                        and_(
+                            Agent.id == agent_id,  # type: ignore
+                            Agent.tenant_id == tenant_id,  # type: ignore
+                        )
                     )
+                    .options(selectinload(Agent.tools))
                 )
-                .options(selectinload(Agent.tools))
-            )
 
-            result = await db.execute(query)
-            agent = result.scalar_one_or_none()
+                result = await db.execute(query)
+                agent = result.scalar_one_or_none()
 
-            if not agent:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Agent not found",
-                )
+                if not agent:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Agent not found",
+                    )
+                openapi_tool_ids = [agent_tool.tool_id for agent_tool in agent.tools or []]
+                assigned_mcp_tools = agent.assigned_mcp_tools or []
 
             tools = []
 
             # Add OpenAPI tools (from agent_tools table)
-            if agent.tools:
-                for agent_tool in agent.tools:
-                    tools.append(
-                        {
-                            "id": agent_tool.tool_id,
-                            "source_type": "openapi",
-                            "name": agent_tool.tool_id,  # Tool IDs are names in current implementation
-                        }
-                    )
+            for tool_id in openapi_tool_ids:
+                tools.append(
+                    {
+                        "id": tool_id,
+                        "source_type": "openapi",
+                        "name": tool_id,  # Tool IDs are names in current implementation
+                    }
+                )
 
             # Add MCP tools (from assigned_mcp_tools JSON field)
-            if agent.assigned_mcp_tools:
+            if assigned_mcp_tools:
                 # Get unified tool service to validate MCP tools still exist
                 unified_service = UnifiedToolService(db=db)
                 current_mcp_tools = await unified_service.list_tools(tenant_id)
@@ -956,7 +1001,7 @@ class AgentService:
                 current_mcp_tool_names = {tool.name for tool in current_mcp_tools}
 
                 # Filter MCP tools to only include still-active ones
-                for assigned_tool in agent.assigned_mcp_tools:
+                for assigned_tool in assigned_mcp_tools:
                     tool_name = assigned_tool.get("name")
 
                     # Validate tool still exists in current discovery (name-based)
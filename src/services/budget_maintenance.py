@@ -0,0 +1,401 @@
+"""
+Batched budget maintenance pipelines for Celery beat jobs.
+
+Implements the work behind tasks.reset_tenant_budgets and
+tasks.expire_budget_overrides as keyset-paginated batch pipelines:
+
+1. Select a batch of due rows (ordered by primary key, after the cursor)
+2. Apply LiteLLM /key/update calls for the batch concurrently over one
+   shared HTTP client (bounded by a semaphore)
+3. Apply the database changes for rows whose LiteLLM update succeeded with
+   set-based UPDATE/DELETE statements and a multi-row audit INSERT
+4. Commit the batch and report progress
+
+Runs are resumable by construction: processed rows stop matching the "due"
+predicate once their batch commits, so a retried or restarted job picks up
+exactly the rows that are still pending. Rows that fail are left due and are
+retried by the next run.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import httpx
+from loguru import logger
+from sqlalchemy import delete, insert, select, update
+
+from src.database.models import AuditLog, BudgetOverride, TenantConfig
+
+# Budget duration units supported by TenantConfig.budget_duration
+_DURATION_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+
+@dataclass
+class BudgetJobResult:
+    """
+    Outcome of one budget maintenance run.
+
+    Attributes:
+        job: Job name ("reset" or "expire_overrides")
+        due_count: Rows found due across all batches
+        success_count: Rows processed successfully
+        failed: List of {"id", "tenant_id", "error"} for rows left pending
+        batches: Number of committed batches
+        duration_seconds: Wall-clock run time
+    """
+
+    job: str
+    due_count: int = 0
+    success_count: int = 0
+    failed: List[Dict[str, str]] = field(default_factory=list)
+    batches: int = 0
+    duration_seconds: float = 0.0
+
+    def progress(self) -> Dict[str, Any]:
+        """Progress snapshot for Celery task state."""
+        return {
+            "job": self.job,
+            "due_count": self.due_count,
+            "success_count": self.success_count,
+            "failed_count": len(self.failed),
+            "batches": self.batches,
+        }
+
+
+def parse_budget_duration(duration: Optional[str]) -> timedelta:
+    """
+    Convert a budget_duration string ("30s", "30m", "30h", "30d") to a timedelta.
+
+    Args:
+        duration: Duration string (defaults to "30d" when empty)
+
+    Returns:
+        timedelta for the duration
+
+    Raises:
+        ValueError: If the duration is malformed
+    """
+    duration = (duration or "30d").strip()
+    unit = _DURATION_UNITS.get(duration[-1:])
+    if unit is None or not duration[:-1].isdigit():
+        raise ValueError(f"Invalid budget_duration: {duration!r}")
+    return timedelta(**{unit: int(duration[:-1])})
+
+
+class BudgetMaintenanceService:
+    """
+    Batched tenant budget reset and override expiry.
+
+    Attributes:
+        session_maker: Async session factory (one session per batch)
+        litellm_proxy_url: LiteLLM proxy base URL
+        master_key: LiteLLM master key
+        batch_size: Rows per database batch
+        concurrency: Concurrent LiteLLM key updates
+    """
+
+    def __init__(
+        self,
+        session_maker: Callable,
+        litellm_proxy_url: Optional[str] = None,
+        master_key: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            session_maker: Async session factory (e.g. get_async_session_maker())
+            litellm_proxy_url: LiteLLM proxy URL (defaults to settings)
+            master_key: LiteLLM master key (defaults to settings)
+            batch_size: Rows per batch (defaults to settings.budget_job_batch_size)
+            concurrency: Concurrent LiteLLM calls (defaults to settings.budget_job_concurrency)
+        """
+        from src.config import get_settings
+
+        settings = get_settings()
+        self.session_maker = session_maker
+        self.litellm_proxy_url = (litellm_proxy_url or settings.litellm_proxy_url).rstrip("/")
+        self.master_key = master_key or settings.litellm_master_key
+        self.batch_size = batch_size or settings.budget_job_batch_size
+        self.concurrency = concurrency or settings.budget_job_concurrency
+
+    async def _update_litellm_keys(
+        self, client: httpx.AsyncClient, payloads: Iterable[Dict[str, Any]]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Send a batch of /key/update calls concurrently.
+
+        Args:
+            client: Shared HTTP client
+            payloads: /key/update request bodies (each with a "key")
+
+        Returns:
+            Dict of key -> None on success or error message on failure
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        headers = {"Authorization": f"Bearer {self.master_key}"}
+        results: Dict[str, Optional[str]] = {}
+
+        async def _send(payload: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    response = await client.post(
+                        f"{self.litellm_proxy_url}/key/update", json=payload, headers=headers
+                    )
+                    response.raise_for_status()
+                    results[payload["key"]] = None
+                except Exception as e:
+                    results[payload["key"]] = str(e) or type(e).__name__
+
+        await asyncio.gather(*(_send(payload) for payload in payloads))
+        return results
+
+    async def reset_due_budgets(
+        self,
+        now: datetime,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> BudgetJobResult:
+        """
+        Reset spend for every active tenant whose budget_reset_at has passed.
+
+        Args:
+            now: Reset timestamp (tenants with budget_reset_at <= now are due)
+            on_progress: Optional callback receiving a progress dict per batch
+
+        Returns:
+            BudgetJobResult with counts, failures and duration
+        """
+        from src.services.spend_ledger import SpendLedger
+
+        result = BudgetJobResult(job="reset")
+        start = time.monotonic()
+        cursor = None
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            while True:
+                async with self.session_maker() as session:
+                    stmt = (
+                        select(
+                            TenantConfig.id,
+                            TenantConfig.tenant_id,
+                            TenantConfig.litellm_virtual_key,
+                            TenantConfig.budget_duration,
+                            TenantConfig.litellm_key_last_reset,
+                            TenantConfig.max_budget,
+                        )
+                        .where(
+                            TenantConfig.budget_reset_at <= now,
+                            TenantConfig.is_active == True,
+                        )
+                        .order_by(TenantConfig.tenant_id)
+                        .limit(self.batch_size)
+                    )
+                    if cursor is not None:
+                        stmt = stmt.where(TenantConfig.tenant_id > cursor)
+                    rows = (await session.execute(stmt)).all()
+                    if not rows:
+                        break
+                    cursor = rows[-1].tenant_id
+                    result.due_count += len(rows)
+
+                    key_errors = await self._update_litellm_keys(
+                        client,
+                        [
+                            {"key": row.litellm_virtual_key, "spend": 0}
+                            for row in rows
+                            if row.litellm_virtual_key
+                        ],
+                    )
+
+                    # Group successful tenants by next reset time: one UPDATE per duration
+                    by_next_reset: Dict[datetime, List[str]] = defaultdict(list)
+                    audit_rows = []
+                    for row in rows:
+                        error = key_errors.get(row.litellm_virtual_key) if row.litellm_virtual_key else None
+                        try:
+                            if error:
+                                raise RuntimeError(f"LiteLLM key update failed: {error}")
+                            next_reset_at = now + parse_budget_duration(row.budget_duration)
+                        except Exception as e:
+                            result.failed.append(
+                                {"id": str(row.id), "tenant_id": row.tenant_id, "error": str(e)}
+                            )
+                            continue
+                        by_next_reset[next_reset_at].append(row.tenant_id)
+                        audit_rows.append(
+                            {
+                                "tenant_id": row.tenant_id,
+                                "action": "update",
+                                "entity_type": "tenant_budget_reset",
+                                "entity_id": row.id,
+                                "old_value": {
+                                    "previous_reset": row.litellm_key_last_reset.isoformat()
+                                    if row.litellm_key_last_reset
+                                    else None,
+                                },
+                                "new_value": {
+                                    "next_reset": next_reset_at.isoformat(),
+                                    "duration": row.budget_duration,
+                                    "max_budget": row.max_budget,
+                                },
+                            }
+                        )
+
+                    for next_reset_at, tenant_ids in by_next_reset.items():
+                        await session.execute(
+                            update(TenantConfig)
+                            .where(TenantConfig.tenant_id.in_(tenant_ids))
+                            .values(
+                                litellm_key_last_reset=now,
+                                budget_reset_at=next_reset_at,
+                                updated_at=now,
+                            )
+                            .execution_options(synchronize_session=False)
+                        )
+                    if audit_rows:
+                        await session.execute(insert(AuditLog), audit_rows)
+                    await session.commit()
+
+                reset_ids = [tid for ids in by_next_reset.values() for tid in ids]
+                result.success_count += len(reset_ids)
+                result.batches += 1
+                try:
+                    await SpendLedger().invalidate_many(reset_ids)
+                except Exception as e:
+                    logger.warning(f"Failed to invalidate spend ledger after budget reset: {e}")
+
+                logger.info(
+                    f"Budget reset batch {result.batches}: {len(reset_ids)}/{len(rows)} reset",
+                    extra=result.progress(),
+                )
+                if on_progress:
+                    on_progress(result.progress())
+                if len(rows) < self.batch_size:
+                    break
+
+        result.duration_seconds = time.monotonic() - start
+        return result
+
+    async def expire_due_overrides(
+        self,
+        now: datetime,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> BudgetJobResult:
+        """
+        Remove budget overrides whose expires_at has passed.
+
+        Each affected tenant's virtual key is reset to its base max_budget
+        once, even if several of its overrides expire in the same batch.
+
+        Args:
+            now: Expiry timestamp (overrides with expires_at <= now are due)
+            on_progress: Optional callback receiving a progress dict per batch
+
+        Returns:
+            BudgetJobResult with counts, failures and duration
+        """
+        result = BudgetJobResult(job="expire_overrides")
+        start = time.monotonic()
+        cursor = None
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            while True:
+                async with self.session_maker() as session:
+                    stmt = (
+                        select(
+                            BudgetOverride.id,
+                            BudgetOverride.tenant_id,
+                            BudgetOverride.override_amount,
+                            BudgetOverride.expires_at,
+                            BudgetOverride.created_at,
+                            BudgetOverride.reason,
+                            BudgetOverride.created_by,
+                            TenantConfig.id.label("tenant_config_id"),
+                            TenantConfig.litellm_virtual_key,
+                            TenantConfig.max_budget,
+                        )
+                        .outerjoin(TenantConfig, TenantConfig.tenant_id == BudgetOverride.tenant_id)
+                        .where(BudgetOverride.expires_at <= now)
+                        .order_by(BudgetOverride.id)
+                        .limit(self.batch_size)
+                    )
+                    if cursor is not None:
+                        stmt = stmt.where(BudgetOverride.id > cursor)
+                    rows = (await session.execute(stmt)).all()
+                    if not rows:
+                        break
+                    cursor = rows[-1].id
+                    result.due_count += len(rows)
+
+                    # One key update per tenant in the batch
+                    payloads = {
+                        row.litellm_virtual_key: {
+                            "key": row.litellm_virtual_key,
+                            "max_budget": row.max_budget,
+                        }
+                        for row in rows
+                        if row.tenant_config_id is not None and row.litellm_virtual_key
+                    }
+                    key_errors = await self._update_litellm_keys(client, payloads.values())
+
+                    expired_ids = []
+                    audit_rows = []
+                    for row in rows:
+                        if row.tenant_config_id is None:
+                            error = "Tenant not found"
+                        elif row.litellm_virtual_key:
+                            error = key_errors.get(row.litellm_virtual_key)
+                        else:
+                            error = None
+                        if error:
+                            result.failed.append(
+                                {"id": str(row.id), "tenant_id": row.tenant_id, "error": error}
+                            )
+                            continue
+                        expired_ids.append(row.id)
+                        audit_rows.append(
+                            {
+                                "tenant_id": row.tenant_id,
+                                "action": "delete",
+                                "entity_type": "budget_override",
+                                "entity_id": row.tenant_config_id,
+                                "old_value": {
+                                    "override_id": row.id,
+                                    "override_amount": row.override_amount,
+                                    "granted_at": row.created_at.isoformat() if row.created_at else None,
+                                    "expires_at": row.expires_at.isoformat(),
+                                    "reason": row.reason,
+                                    "created_by": row.created_by,
+                                },
+                                "new_value": {"max_budget": row.max_budget},
+                            }
+                        )
+
+                    if expired_ids:
+                        await session.execute(
+                            delete(BudgetOverride)
+                            .where(BudgetOverride.id.in_(expired_ids))
+                            .execution_options(synchronize_session=False)
+                        )
+                        await session.execute(insert(AuditLog), audit_rows)
+                    await session.commit()
+
+                result.success_count += len(expired_ids)
+                result.batches += 1
+                logger.info(
+                    f"Override expiry batch {result.batches}: {len(expired_ids)}/{len(rows)} expired",
+                    extra=result.progress(),
+                )
+                if on_progress:
+                    on_progress(result.progress())
+                if len(rows) < self.batch_size:
+                    break
+
+        result.duration_seconds = time.monotonic() - start
+        return result
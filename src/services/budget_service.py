@@ -5,11 +5,12 @@ Works in conjunction with LiteLLM proxy's native budget webhooks to provide:
 - Real-time budget status queries
 - Budget exceeded detection (grace threshold enforcement)
 - Budget blocking with clear error messages
-- Budget status caching for performance
+- Budget status caching for performance (Redis spend ledger)
 
 Architecture:
     - LiteLLM Proxy: Tracks spend via virtual keys, sends webhook alerts
     - Budget Service: Queries current spend, enforces grace threshold locally
+    - Spend Ledger: Redis mirror of spend checked per call, reconciled by beat task
     - Budget Webhooks: Async alerts at 80%, 100%, 110% thresholds (see budget.py)
 
 References:
@@ -31,6 +32,7 @@ from sqlalchemy import select
 from src.config import settings
 from src.database.models import TenantConfig as TenantConfigModel
 from src.exceptions import BudgetExceededError
+from src.services.spend_ledger import SpendLedger
 
 
 @dataclass
@@ -238,6 +240,7 @@ class BudgetService:
                 if response.status_code == 200:
                     data = response.json()
                     spend = float(data.get("spend", 0.0))
+                    await self._seed_ledger(tenant_id, spend, max_budget, grace_threshold)
                 else:
                     logger.warning(
                         f"Failed to fetch budget status for tenant {tenant_id}: "
@@ -268,11 +271,35 @@ class BudgetService:
             is_blocked=is_blocked,
         )
 
+    async def _seed_ledger(
+        self, tenant_id: str, spend: float, max_budget: float, grace_threshold: int
+    ) -> None:
+        """Write LiteLLM's spend to the Redis ledger (best effort)."""
+        if not getattr(settings, "budget_ledger_enabled", False):
+            return
+        try:
+            await SpendLedger().set(tenant_id, spend, max_budget, grace_threshold)
+        except Exception as e:
+            logger.debug(f"Spend ledger seed failed for tenant {tenant_id}: {str(e)}")
+
+    async def _get_ledger_entry(self, tenant_id: str):
+        """Read the tenant's ledger entry, or None on miss/Redis failure."""
+        if not getattr(settings, "budget_ledger_enabled", False):
+            return None
+        try:
+            return await SpendLedger().get(tenant_id)
+        except Exception as e:
+            logger.debug(f"Spend ledger read failed for tenant {tenant_id}: {str(e)}")
+            return None
+
     async def check_budget_exceeded(self, tenant_id: str) -> Tuple[bool, str]:
         """
         Check if tenant has exceeded grace threshold budget.
 
         Lightweight check used by LLMService before provisioning client.
+        Reads the Redis spend ledger (one round trip, no database or LiteLLM
+        call); falls back to get_budget_status when the tenant has no ledger
+        entry or Redis is unavailable.
         Returns boolean exceeded flag and formatted error message.
 
         Args:
@@ -290,7 +317,9 @@ class BudgetService:
             >>>     raise BudgetExceededError(msg)
         """
         try:
-            status = await self.get_budget_status(tenant_id)
+            status = await self._get_ledger_entry(tenant_id)
+            if status is None:
+                status = await self.get_budget_status(tenant_id)
 
             if status.is_blocked:
                 error_message = (
@@ -527,3 +556,78 @@ class BudgetService:
                 f"Error fetching spend data from LiteLLM for tenant {tenant_id}: {str(e)}"
             )
             raise
+
+    async def reconcile_spend_ledger(self) -> Dict[str, Any]:
+        """
+        Overwrite every active tenant's ledger entry with LiteLLM's spend.
+
+        Corrects drift from costs the ledger missed (Redis blips, streamed
+        responses without a cost header) and refreshes budget limits after
+        tenant or override changes. Queries run with bounded concurrency over
+        a shared client.
+
+        Returns:
+            Dict with tenant_count, reconciled_count and failed_tenants list
+
+        Example:
+            >>> budget_service = BudgetService(db)
+            >>> result = await budget_service.reconcile_spend_ledger()
+            >>> print(f"{result['reconciled_count']}/{result['tenant_count']} reconciled")
+        """
+        stmt = select(
+            TenantConfigModel.tenant_id,
+            TenantConfigModel.max_budget,
+            TenantConfigModel.grace_threshold,
+        ).where(TenantConfigModel.is_active == True)
+        result = await self.db.execute(stmt)
+        tenants = result.all()
+
+        ledger = SpendLedger()
+        semaphore = asyncio.Semaphore(
+            getattr(settings, "budget_ledger_reconcile_concurrency", 10)
+        )
+        headers = {
+            "Authorization": f"Bearer {self.master_key}",
+            "Content-Type": "application/json",
+        }
+        failed_tenants: List[Dict[str, str]] = []
+
+        async def _reconcile(client: httpx.AsyncClient, row) -> bool:
+            tenant_id, max_budget, grace_threshold = row
+            async with semaphore:
+                try:
+                    response = await client.get(
+                        f"{self.litellm_proxy_url}/user/info",
+                        headers=headers,
+                        params={"user_id": tenant_id},
+                    )
+                    response.raise_for_status()
+                    spend = float(response.json().get("spend", 0.0))
+                    await ledger.set(
+                        tenant_id,
+                        spend,
+                        max_budget or 500.00,
+                        grace_threshold or 110,
+                    )
+                    return True
+                except Exception as e:
+                    logger.warning(
+                        f"Spend ledger reconciliation failed for tenant {tenant_id}: {str(e)}"
+                    )
+                    failed_tenants.append({"tenant_id": tenant_id, "error": str(e)})
+                    return False
+
+        transport = httpx.AsyncHTTPTransport(retries=1)
+        async with httpx.AsyncClient(
+            transport=transport,
+            timeout=self.TIMEOUT_CONFIG,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        ) as client:
+            outcomes = await asyncio.gather(*(_reconcile(client, row) for row in tenants))
+
+        return {
+            "tenant_count": len(tenants),
+            "reconciled_count": sum(outcomes),
+            "failed_tenants": failed_tenants,
+        }
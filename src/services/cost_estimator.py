@@ -0,0 +1,164 @@
+"""
+Pre-call token and cost estimation for budget admission.
+
+Estimates the worst-case cost of a chat completion request before it is sent:
+prompt tokens are approximated from the request body and output tokens are
+bounded by max_tokens. Prices come from LiteLLM model discovery (cached
+in-process for 5 minutes), so estimating never adds a provider round trip.
+
+The estimate is used by BudgetAdmissionTransport to reserve spend in the
+Redis ledger while a call is in flight (see spend_ledger.py).
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+# Rough tokenizer-free approximation used across the codebase (~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# Per-message framing tokens added by chat templates
+TOKENS_PER_MESSAGE = 4
+
+# Process-wide ModelDiscoveryService so its pricing cache is shared
+_shared_discovery = None
+
+
+@dataclass
+class CostEstimate:
+    """
+    Upper-bound cost estimate for one LLM request.
+
+    Attributes:
+        model: Model name from the request
+        prompt_tokens: Estimated prompt tokens (messages + tool definitions)
+        max_output_tokens: Output token bound (max_tokens or default)
+        estimated_cost: Estimated cost in USD
+    """
+
+    model: str
+    prompt_tokens: int
+    max_output_tokens: int
+    estimated_cost: float
+
+
+def estimate_prompt_tokens(body: Dict[str, Any]) -> int:
+    """
+    Approximate prompt tokens for a chat completion request body.
+
+    Args:
+        body: OpenAI-compatible request body
+
+    Returns:
+        Estimated prompt token count
+    """
+    tokens = 0
+    for message in body.get("messages") or []:
+        content = message.get("content") if isinstance(message, dict) else message
+        if not isinstance(content, str):
+            # Multi-part content and tool calls: count their serialized form
+            content = json.dumps(content, default=str)
+        tokens += TOKENS_PER_MESSAGE + len(content) // CHARS_PER_TOKEN
+    tools = body.get("tools")
+    if tools:
+        tokens += len(json.dumps(tools, default=str)) // CHARS_PER_TOKEN
+    return tokens
+
+
+class CostEstimator:
+    """
+    Estimates request cost from cached LiteLLM model pricing.
+
+    Unknown models are priced with the configured defaults so that admission
+    stays conservative rather than letting unpriced calls through for free.
+    """
+
+    def __init__(self, discovery_service=None):
+        """
+        Initialize estimator.
+
+        Args:
+            discovery_service: ModelDiscoveryService to read prices from
+                (defaults to a process-wide instance so its cache is shared)
+        """
+        from src.config import get_settings
+
+        self._settings = get_settings()
+        self._discovery = discovery_service
+
+    def _get_discovery(self):
+        global _shared_discovery
+        if self._discovery is None:
+            if _shared_discovery is None:
+                from src.services.llm_model_discovery import ModelDiscoveryService
+
+                _shared_discovery = ModelDiscoveryService()
+            self._discovery = _shared_discovery
+        return self._discovery
+
+    async def get_pricing(self, model: str) -> Tuple[float, float]:
+        """
+        Return (input, output) cost per token for a model.
+
+        Matches the exact LiteLLM model name first, then the provider
+        wildcard entry (e.g. "xai/*"), then falls back to settings defaults.
+
+        Args:
+            model: Model name as sent to LiteLLM
+
+        Returns:
+            Tuple of input and output cost per token in USD
+        """
+        input_cost: Optional[float] = None
+        output_cost: Optional[float] = None
+        try:
+            models = await self._get_discovery().get_available_models()
+            by_id = {m.id: m for m in models}
+            candidates = [model]
+            if "/" in model:
+                candidates.append(f"{model.split('/', 1)[0]}/*")
+            for candidate in candidates:
+                info = by_id.get(candidate)
+                if info and info.input_cost_per_token is not None:
+                    input_cost = info.input_cost_per_token
+                    output_cost = info.output_cost_per_token
+                    break
+        except Exception as e:
+            logger.debug(f"Model pricing lookup failed for {model}: {e}")
+
+        if input_cost is None:
+            input_cost = self._settings.budget_estimator_default_input_cost_per_token
+        if output_cost is None:
+            output_cost = self._settings.budget_estimator_default_output_cost_per_token
+        return input_cost, output_cost
+
+    async def estimate(self, body: Dict[str, Any]) -> Optional[CostEstimate]:
+        """
+        Estimate the cost of a chat completion request body.
+
+        Args:
+            body: OpenAI-compatible request body
+
+        Returns:
+            CostEstimate, or None if the body has no model
+        """
+        model = body.get("model")
+        if not isinstance(model, str) or not model:
+            return None
+
+        prompt_tokens = estimate_prompt_tokens(body)
+        max_output_tokens = int(
+            body.get("max_completion_tokens")
+            or body.get("max_tokens")
+            or self._settings.budget_estimator_default_max_output_tokens
+        )
+        input_cost, output_cost = await self.get_pricing(model)
+        return CostEstimate(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            max_output_tokens=max_output_tokens,
+            estimated_cost=prompt_tokens * input_cost + max_output_tokens * output_cost,
+        )
+
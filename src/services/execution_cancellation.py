@@ -0,0 +1,132 @@
+"""
+Cooperative Cancellation of Running Executions
+
+Once a Celery task has started, the hard time limit is the only thing that
+stops a runaway ReAct loop or an obsolete ticket enhancement. A cancel
+request instead sets a flag in Redis, and the running code checks it at
+its safe points and aborts by raising ExecutionCancelledError:
+
+- Agent executions (AgentExecutionService): before every LLM turn and tool
+  call, via agent_execution.cancellation.CancellationCallbackHandler
+- Ticket enhancements (enhance_ticket): between context gathering, LLM
+  synthesis and the ticket update
+
+Flags are keyed execution_cancel:{tenant_id}:{execution_id}, so a tenant
+can only cancel its own executions, and expire after
+settings.execution_cancel_ttl_seconds (long enough for a queued job to be
+picked up). Checks fail open: without Redis nothing is cancelled.
+
+Functions:
+    - request_cancellation(): Set the cancel flag of an execution
+    - is_cancellation_requested(): Whether an execution was cancelled
+    - raise_if_cancelled(): Abort at a safe point if it was
+    - record_cancellation(): Count an execution aborted by a cancel request
+
+References:
+- src/api/agent_execution.py (POST /{execution_id}/cancel)
+- src/api/webhooks.py (POST /servicedesk/jobs/{job_id}/cancel)
+- src/workers/tasks.py (execute_agent, enhance_ticket)
+"""
+
+import logging
+from uuid import UUID
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "execution_cancel"
+
+# Status recorded for executions aborted by a cancel request
+CANCELLED_STATUS = "cancelled"
+
+
+class ExecutionCancelledError(Exception):
+    """Raised at a safe point of an execution whose cancellation was requested."""
+
+    def __init__(self, execution_id: UUID | str):
+        self.execution_id = str(execution_id)
+        super().__init__(f"Execution {execution_id} was cancelled")
+
+
+def _cancel_key(tenant_id: str, execution_id: UUID | str) -> str:
+    return f"{KEY_PREFIX}:{tenant_id}:{execution_id}"
+
+
+def _redis():
+    from src.cache.redis_client import get_shared_redis
+
+    return get_shared_redis()
+
+
+async def request_cancellation(tenant_id: str, execution_id: UUID | str) -> bool:
+    """
+    Set the cancel flag of an execution (queued or running).
+
+    Args:
+        tenant_id: Tenant the execution belongs to
+        execution_id: Agent execution ID or enhancement job ID
+
+    Returns:
+        False if the flag could not be stored (Redis unavailable)
+    """
+    try:
+        await _redis().set(
+            _cancel_key(tenant_id, execution_id), "1", ex=settings.execution_cancel_ttl_seconds
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to store cancel request: {e}",
+            extra={
+                "tenant_id": tenant_id,
+                "execution_id": str(execution_id),
+                "error_type": type(e).__name__,
+            },
+        )
+        return False
+
+    logger.info(
+        "Execution cancellation requested",
+        extra={"tenant_id": tenant_id, "execution_id": str(execution_id)},
+    )
+    return True
+
+
+async def is_cancellation_requested(tenant_id: str, execution_id: UUID | str) -> bool:
+    """Whether an execution's cancellation was requested (False if Redis is down)."""
+    try:
+        return bool(await _redis().exists(_cancel_key(tenant_id, execution_id)))
+    except Exception as e:
+        logger.warning(
+            f"Cancel flag check failed, continuing execution: {e}",
+            extra={"execution_id": str(execution_id), "error_type": type(e).__name__},
+        )
+        return False
+
+
+async def raise_if_cancelled(tenant_id: str, execution_id: UUID | str) -> None:
+    """
+    Abort an execution at a safe point if its cancellation was requested.
+
+    Raises:
+        ExecutionCancelledError: The cancel flag is set
+    """
+    if await is_cancellation_requested(tenant_id, execution_id):
+        raise ExecutionCancelledError(execution_id)
+
+
+def record_cancellation(kind: str) -> None:
+    """Count an execution aborted by a cancel request (kind: agent/enhancement)."""
+    from src.monitoring.metrics import execution_cancellations_total
+
+    execution_cancellations_total.labels(kind=kind).inc()
+
+
+__all__ = [
+    "CANCELLED_STATUS",
+    "ExecutionCancelledError",
+    "is_cancellation_requested",
+    "raise_if_cancelled",
+    "record_cancellation",
+    "request_cancellation",
+]
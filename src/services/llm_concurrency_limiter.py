@@ -0,0 +1,468 @@
+"""
+Adaptive concurrency limiter for LLM calls per (provider, model).
+
+Bursts of agent executions that all hit LiteLLM at once trigger 429s and then
+wait out Celery retry backoff. Queuing locally behind an adaptive limit is much
+cheaper. This module implements an AIMD (additive increase, multiplicative
+decrease) limiter:
+
+- Every successful call raises the limit by 1/limit (about +1 per "round trip")
+- A 429/503 from the provider halves the limit (at most once per cooldown)
+
+The limiter is shared by all coroutines in a worker process. When Redis
+coordination is enabled, a cluster-wide in-flight cap per (provider, model) is
+enforced with expiring leases in a sorted set. The cap starts at the
+configured ceiling and follows the same AIMD rule, so all workers back off
+together on 429s and recover together afterwards. Redis errors fail open to the
+local limit (same policy as RateLimiter).
+
+Integration is at the HTTP layer: LimitedLLMTransport wraps every request sent
+by the AsyncOpenAI/ChatOpenAI clients, reads the model from the request body
+and holds a slot until the response body is closed. This covers every LLM call
+in a LangGraph ReAct loop as well as synthesize_enhancement.
+
+Metrics:
+- llm_concurrency_limit, llm_concurrency_in_flight (gauges)
+- llm_concurrency_queue_seconds (histogram)
+- llm_concurrency_throttled_total (counter)
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from src.monitoring.metrics import (
+    llm_concurrency_in_flight,
+    llm_concurrency_limit,
+    llm_concurrency_queue_seconds,
+    llm_concurrency_throttled_total,
+)
+
+# HTTP status codes treated as provider overload signals
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# Redis lease polling backoff bounds (seconds)
+LEASE_POLL_MIN = 0.05
+LEASE_POLL_MAX = 0.5
+
+# Atomically drop expired leases and take one if the cluster limit allows it.
+# KEYS[1]=lease zset, KEYS[2]=cluster limit; ARGV: now, ttl, lease_id, default_limit
+_ACQUIRE_LEASE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+local limit = tonumber(redis.call('GET', KEYS[2]) or ARGV[4])
+if redis.call('ZCARD', KEYS[1]) < math.floor(limit) then
+    redis.call('ZADD', KEYS[1], tonumber(ARGV[1]) + tonumber(ARGV[2]), ARGV[3])
+    redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]) * 2)
+    return 1
+end
+return 0
+"""
+
+# AIMD update of the cluster limit. ARGV: mode ('inc'|'dec'), default, min, max
+_ADJUST_LIMIT_SCRIPT = """
+local cur = tonumber(redis.call('GET', KEYS[1]) or ARGV[2])
+local minl = tonumber(ARGV[3])
+local maxl = tonumber(ARGV[4])
+if ARGV[1] == 'dec' then
+    cur = math.max(minl, math.floor(cur / 2))
+else
+    cur = math.min(maxl, cur + 1 / cur)
+end
+redis.call('SET', KEYS[1], tostring(cur))
+return tostring(cur)
+"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter for one (provider, model) pair.
+
+    Use `async with limiter.slot() as permit:` around an LLM call and call
+    `permit.mark_throttled()` when the provider reports overload.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_cooldown_seconds: float = 2.0,
+        redis_enabled: bool = False,
+        cluster_limit: int = 32,
+        lease_ttl_seconds: int = 150,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            provider: Provider name (e.g., "openai", "openrouter")
+            model: Model name as sent to the provider
+            initial_limit: Starting per-worker limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            decrease_cooldown_seconds: Minimum time between multiplicative decreases
+            redis_enabled: Enforce a cluster-wide cap through Redis leases
+            cluster_limit: Starting cluster-wide cap
+            lease_ttl_seconds: Expiry of a Redis lease (crash safety)
+        """
+        self.provider = provider
+        self.model = model
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.redis_enabled = redis_enabled
+        self.cluster_limit = cluster_limit
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        key_suffix = f"{provider}:{model}"
+        self._lease_key = f"llm:concurrency:leases:{key_suffix}"
+        self._limit_key = f"llm:concurrency:limit:{key_suffix}"
+        self._labels = {"provider": provider, "model": model}
+        llm_concurrency_limit.labels(**self._labels).set(self.limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        """
+        Return the wait condition for the running event loop.
+
+        Celery tasks call asyncio.run() per task, so the condition is recreated
+        when the loop changes. The learned limit survives across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator["_Permit"]:
+        """
+        Acquire a concurrency slot, waiting locally (and on the cluster) if needed.
+
+        Yields:
+            _Permit used to report throttling for the call
+        """
+        condition = self._get_condition()
+        queued_at = time.monotonic()
+
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        llm_concurrency_in_flight.labels(**self._labels).set(self.in_flight)
+
+        lease_id: Optional[str] = None
+        permit = _Permit()
+        try:
+            if self.redis_enabled:
+                lease_id = await self._acquire_cluster_lease()
+            llm_concurrency_queue_seconds.labels(**self._labels).observe(
+                time.monotonic() - queued_at
+            )
+            yield permit
+        finally:
+            if lease_id is not None:
+                await self._release_cluster_lease(lease_id)
+            if permit.throttled:
+                await self._on_throttle()
+            elif permit.succeeded:
+                await self._on_success()
+            async with condition:
+                self.in_flight -= 1
+                condition.notify_all()
+            llm_concurrency_in_flight.labels(**self._labels).set(self.in_flight)
+
+    async def _on_success(self) -> None:
+        """Additive increase after a successful call."""
+        self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        llm_concurrency_limit.labels(**self._labels).set(self.limit)
+        if self.redis_enabled:
+            await self._adjust_cluster_limit("inc")
+
+    async def _on_throttle(self) -> None:
+        """Multiplicative decrease after a provider overload signal."""
+        llm_concurrency_throttled_total.labels(**self._labels).inc()
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), float(int(self.limit / 2)))
+        llm_concurrency_limit.labels(**self._labels).set(self.limit)
+        logger.warning(
+            f"LLM provider throttled, reducing concurrency limit | "
+            f"provider={self.provider} | model={self.model} | limit={int(self.limit)}"
+        )
+        if self.redis_enabled:
+            await self._adjust_cluster_limit("dec")
+
+    async def _acquire_cluster_lease(self) -> Optional[str]:
+        """
+        Take a cluster-wide lease, polling with backoff until one is free.
+
+        Returns:
+            Lease ID, or None if Redis is unavailable (fail open)
+        """
+        from src.cache.redis_client import get_shared_redis
+
+        lease_id = uuid.uuid4().hex
+        delay = LEASE_POLL_MIN
+        try:
+            client = get_shared_redis()
+            while True:
+                acquired = await client.eval(
+                    _ACQUIRE_LEASE_SCRIPT,
+                    2,
+                    self._lease_key,
+                    self._limit_key,
+                    time.time(),
+                    self.lease_ttl_seconds,
+                    lease_id,
+                    self.cluster_limit,
+                )
+                if int(acquired) == 1:
+                    return lease_id
+                await asyncio.sleep(delay)
+                delay = min(LEASE_POLL_MAX, delay * 2)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"LLM concurrency lease unavailable, using local limit only: {str(e)}"
+            )
+            return None
+
+    async def _release_cluster_lease(self, lease_id: str) -> None:
+        """Release a cluster-wide lease (expiry reclaims it if this fails)."""
+        from src.cache.redis_client import get_shared_redis
+
+        try:
+            await get_shared_redis().zrem(self._lease_key, lease_id)
+        except Exception as e:
+            logger.warning(f"Failed to release LLM concurrency lease: {str(e)}")
+
+    async def _adjust_cluster_limit(self, mode: str) -> None:
+        """Apply the AIMD rule to the shared cluster limit."""
+        from src.cache.redis_client import get_shared_redis
+
+        try:
+            await get_shared_redis().eval(
+                _ADJUST_LIMIT_SCRIPT,
+                1,
+                self._limit_key,
+                mode,
+                self.cluster_limit,
+                self.min_limit,
+                self.cluster_limit,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update cluster LLM concurrency limit: {str(e)}")
+
+
+class _Permit:
+    """Outcome holder for one limited call."""
+
+    def __init__(self) -> None:
+        self.throttled = False
+        self.succeeded = False
+
+    def mark_throttled(self) -> None:
+        """Report that the provider rejected the call as overloaded."""
+        self.throttled = True
+
+    def mark_succeeded(self) -> None:
+        """Report that the call completed normally."""
+        self.succeeded = True
+
+
+# Process-wide registry, shared by all coroutines in this worker
+_limiters: Dict[Tuple[str, str], AdaptiveConcurrencyLimiter] = {}
+
+
+def get_llm_limiter(provider: str, model: str) -> AdaptiveConcurrencyLimiter:
+    """
+    Return the process-wide limiter for a (provider, model) pair.
+
+    Args:
+        provider: Provider name
+        model: Model name
+
+    Returns:
+        AdaptiveConcurrencyLimiter configured from settings
+    """
+    key = (provider, model)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        from src.config import get_settings
+
+        settings = get_settings()
+        limiter = AdaptiveConcurrencyLimiter(
+            provider=provider,
+            model=model,
+            initial_limit=settings.llm_concurrency_initial_limit,
+            min_limit=settings.llm_concurrency_min_limit,
+            max_limit=settings.llm_concurrency_max_limit,
+            redis_enabled=settings.llm_concurrency_redis_enabled,
+            cluster_limit=settings.llm_concurrency_cluster_limit,
+            lease_ttl_seconds=settings.llm_concurrency_lease_ttl_seconds,
+        )
+        _limiters[key] = limiter
+    return limiter
+
+
+def _split_model(model: str, default_provider: str) -> Tuple[str, str]:
+    """Split "provider/model" into its parts, falling back to default_provider."""
+    if "/" in model:
+        provider, _, name = model.partition("/")
+        return provider, name
+    return default_provider, model
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response body wrapper that releases the concurrency slot on close."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, slot_cm, permit: _Permit):
+        self._stream = stream
+        self._slot_cm = slot_cm
+        self._permit = permit
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._stream.aclose()
+        finally:
+            self._permit.mark_succeeded()
+            await self._slot_cm.__aexit__(None, None, None)
+
+
+class LimitedLLMTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that runs every LLM request through the adaptive limiter.
+
+    The model is read from the JSON request body; requests without one (e.g.
+    /models) bypass the limiter. The slot is held until the response body is
+    closed so streamed completions count as in flight while streaming.
+    """
+
+    def __init__(
+        self,
+        default_provider: str = "litellm",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            default_provider: Provider label for models without a "provider/" prefix
+            transport: Underlying transport (defaults to httpx.AsyncHTTPTransport)
+        """
+        self.default_provider = default_provider
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    def _model_for(self, request: httpx.Request) -> Optional[str]:
+        """Extract the model name from a JSON request body."""
+        try:
+            body = json.loads(request.content or b"{}")
+        except (ValueError, httpx.RequestNotRead):
+            return None
+        model = body.get("model") if isinstance(body, dict) else None
+        return model if isinstance(model, str) and model else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request while holding a concurrency slot for its model."""
+        model = self._model_for(request)
+        if model is None:
+            return await self._transport.handle_async_request(request)
+
+        provider, name = _split_model(model, self.default_provider)
+        slot_cm = get_llm_limiter(provider, name).slot()
+        permit = await slot_cm.__aenter__()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            await slot_cm.__aexit__(type(e), e, e.__traceback__)
+            raise
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            permit.mark_throttled()
+            try:
+                await response.aread()
+            finally:
+                await slot_cm.__aexit__(None, None, None)
+            return response
+
+        if isinstance(response.stream, httpx.ByteStream):
+            # Body already in memory; nothing left in flight to hold the slot for
+            permit.mark_succeeded()
+            await slot_cm.__aexit__(None, None, None)
+            return response
+
+        response.stream = _SlotReleasingStream(response.stream, slot_cm, permit)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        await self._transport.aclose()
+
+
+def build_limited_http_client(
+    default_provider: str = "litellm",
+    timeout: Optional[float] = None,
+    tenant_id: Optional[str] = None,
+) -> Optional[httpx.AsyncClient]:
+    """
+    Build an httpx.AsyncClient whose LLM requests go through the limiter.
+
+    Args:
+        default_provider: Provider label for models without a "provider/" prefix
+        timeout: Optional client timeout in seconds
+        tenant_id: When given, LiteLLM response costs are added to the
+            tenant's spend ledger and each call's estimated cost is reserved
+            against the tenant's budget before it is sent
+
+    Returns:
+        AsyncClient to pass as http_client/http_async_client, or None when
+        neither the limiter nor the spend ledger applies (callers then use
+        their default client)
+    """
+    from src.config import get_settings
+
+    settings = get_settings()
+    record_spend = tenant_id is not None and settings.budget_ledger_enabled
+    if not settings.llm_concurrency_limiter_enabled and not record_spend:
+        return None
+
+    kwargs = {"timeout": timeout} if timeout is not None else {}
+    if record_spend:
+        from src.services.spend_ledger import spend_recording_hook
+
+        kwargs["event_hooks"] = {"response": [spend_recording_hook(tenant_id)]}
+    transport = None
+    if settings.llm_concurrency_limiter_enabled:
+        transport = LimitedLLMTransport(default_provider)
+    if record_spend and settings.budget_admission_enabled:
+        from src.services.spend_ledger import BudgetAdmissionTransport
+
+        # Admission runs first so denied calls never take a concurrency slot
+        transport = BudgetAdmissionTransport(tenant_id, transport=transport)
+    if transport is not None:
+        kwargs["transport"] = transport
+    return httpx.AsyncClient(**kwargs)
@@ -19,6 +19,7 @@ from src.schemas.llm_cost import (
     CostSummaryDTO,
 )
 from src.services.llm_cost_queries import CostQueryBuilder
+from src.services.llm_spend_attribution_queries import SpendAttributionQueries
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class CostAggregator:
         """Initialize aggregator."""
         self.db = db
         self.query_builder = CostQueryBuilder(db)
+        self.attribution_queries = SpendAttributionQueries(db)
 
     async def get_budget_utilization(
         self,
@@ -141,7 +143,7 @@ class CostAggregator:
 
             # Top agent
             top_agent = None
-            agents = await self.query_builder.get_spend_by_agent(
+            agents = await self.attribution_queries.get_spend_by_agent(
                 days_30_start, today, tenant_id, limit=1
             )
             top_agent = agents[0] if agents else None
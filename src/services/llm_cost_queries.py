@@ -4,21 +4,26 @@ LLM Cost Queries Module.
 Low-level database queries for LiteLLM spend tracking.
 Handles raw SQL/SQLAlchemy operations for cost data retrieval.
 
+Aggregates read complete days from llm_spend_daily_rollups and only scan
+LiteLLM_SpendLogs for days at or after the rollup high-water mark (see
+llm_spend_rollup.py), so dashboard cost no longer grows with history.
+Per-agent spend is queried from llm_spend_attributions instead, see
+llm_spend_attribution_queries.py.
+
 CRITICAL: ALL queries MUST filter by tenant_id for security.
 """
 
 import logging
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.litellm_models import LiteLLMSpendLog
-from src.database.models import Agent, TenantConfig
+from src.database.models import Agent, LLMSpendAttribution, LLMSpendDailyRollup, TenantConfig
 from src.schemas.llm_cost import (
-    AgentSpendDTO,
     DailySpendDTO,
     ModelSpendDTO,
     SpendLogDetailDTO,
@@ -29,30 +34,123 @@ from src.schemas.llm_cost import (
 logger = logging.getLogger(__name__)
 
 
+def day_range(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """Half-open naive UTC datetime range covering [start_date, end_date]."""
+    return (
+        datetime.combine(start_date, datetime.min.time()),
+        datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
+    )
+
+
 class CostQueryBuilder:
     """Helper class for building cost queries."""
 
     def __init__(self, db: AsyncSession):
         """Initialize query builder."""
         self.db = db
+        self._rollup_cutoff: Optional[date] = None
+        self._rollup_cutoff_loaded = False
 
-    async def get_total_spend(
+    async def _get_rollup_cutoff(self) -> Optional[date]:
+        """First day not covered by the rollup (loaded once per builder)."""
+        if not self._rollup_cutoff_loaded:
+            from src.services.llm_spend_rollup import get_rollup_cutoff
+
+            self._rollup_cutoff = await get_rollup_cutoff(self.db)
+            self._rollup_cutoff_loaded = True
+        return self._rollup_cutoff
+
+    async def _spend_source(
         self,
         start_date: date,
         end_date: date,
         tenant_id: Optional[UUID] = None,
-    ) -> float:
-        """Calculate total spend for date range with optional tenant filter."""
-        try:
-            stmt = select(func.coalesce(func.sum(LiteLLMSpendLog.spend), 0.0))
-            stmt = stmt.where(
+    ):
+        """
+        Build a subquery of spend rows covering [start_date, end_date].
+
+        Days before the rollup cutoff come from llm_spend_daily_rollups; the
+        remaining (partial) days come from raw spend logs using a startTime
+        range predicate so the startTime index is usable.
+
+        Columns: day, tenant_id, model_group, spend, prompt_tokens,
+        completion_tokens, total_tokens, request_count.
+        """
+        cutoff = await self._get_rollup_cutoff()
+        parts = []
+
+        if cutoff is not None and cutoff > start_date:
+            rollup_end = min(end_date, cutoff - timedelta(days=1))
+            rollup = select(
+                LLMSpendDailyRollup.day.label("day"),
+                LLMSpendDailyRollup.tenant_id.label("tenant_id"),
+                LLMSpendDailyRollup.model_group.label("model_group"),
+                LLMSpendDailyRollup.spend.label("spend"),
+                LLMSpendDailyRollup.prompt_tokens.label("prompt_tokens"),
+                LLMSpendDailyRollup.completion_tokens.label("completion_tokens"),
+                LLMSpendDailyRollup.total_tokens.label("total_tokens"),
+                LLMSpendDailyRollup.request_count.label("request_count"),
+            ).where(
                 and_(
-                    func.date(LiteLLMSpendLog.startTime) >= start_date,
-                    func.date(LiteLLMSpendLog.startTime) <= end_date,
+                    LLMSpendDailyRollup.day >= start_date,
+                    LLMSpendDailyRollup.day <= rollup_end,
                 )
             )
             if tenant_id:
-                stmt = stmt.where(LiteLLMSpendLog.end_user == str(tenant_id))
+                rollup = rollup.where(LLMSpendDailyRollup.tenant_id == str(tenant_id))
+            parts.append(rollup)
+
+        raw_start = max(start_date, cutoff) if cutoff is not None else start_date
+        if raw_start <= end_date:
+            range_start, range_end = day_range(raw_start, end_date)
+            raw = select(
+                func.date(LiteLLMSpendLog.startTime).label("day"),
+                LiteLLMSpendLog.end_user.label("tenant_id"),
+                LiteLLMSpendLog.model_group.label("model_group"),
+                LiteLLMSpendLog.spend.label("spend"),
+                LiteLLMSpendLog.prompt_tokens.label("prompt_tokens"),
+                LiteLLMSpendLog.completion_tokens.label("completion_tokens"),
+                LiteLLMSpendLog.total_tokens.label("total_tokens"),
+                literal(1).label("request_count"),
+            ).where(
+                and_(
+                    LiteLLMSpendLog.startTime >= range_start,
+                    LiteLLMSpendLog.startTime < range_end,
+                )
+            )
+            if tenant_id:
+                raw = raw.where(LiteLLMSpendLog.end_user == str(tenant_id))
+            parts.append(raw)
+
+        if not parts:
+            # Inverted range: keep a well-formed, empty source
+            parts.append(
+                select(
+                    literal(start_date).label("day"),
+                    literal("").label("tenant_id"),
+                    literal("").label("model_group"),
+                    literal(0.0).label("spend"),
+                    literal(0).label("prompt_tokens"),
+                    literal(0).label("completion_tokens"),
+                    literal(0).label("total_tokens"),
+                    literal(0).label("request_count"),
+                ).where(literal(False))
+            )
+
+        if len(parts) == 1:
+            return parts[0].subquery("spend_source")
+        return union_all(*parts).subquery("spend_source")
+
+    async def get_total_spend(
+        self,
+        start_date: date,
+        end_date: date,
+        tenant_id: Optional[UUID] = None,
+    ) -> float:
+        """Calculate total spend for date range with optional tenant filter."""
+        try:
+            source = await self._spend_source(start_date, end_date, tenant_id)
+            stmt = select(func.coalesce(func.sum(source.c.spend), 0.0))
             result = await self.db.execute(stmt)
             return float(result.scalar())
         except Exception as e:
@@ -67,21 +165,20 @@ class CostQueryBuilder:
     ) -> List[TenantSpendDTO]:
         """Get top N tenants by spend."""
         try:
+            source = await self._spend_source(start_date, end_date)
             stmt = (
                 select(
-                    LiteLLMSpendLog.end_user.label("tenant_id"),
-                    func.sum(LiteLLMSpendLog.spend).label("total_spend"),
+                    source.c.tenant_id,
+                    func.sum(source.c.spend).label("total_spend"),
                 )
                 .where(
                     and_(
-                        func.date(LiteLLMSpendLog.startTime) >= start_date,
-                        func.date(LiteLLMSpendLog.startTime) <= end_date,
-                        LiteLLMSpendLog.end_user.isnot(None),
-                        LiteLLMSpendLog.end_user != '',  # Exclude empty strings
+                        source.c.tenant_id.isnot(None),
+                        source.c.tenant_id != '',  # Exclude empty strings
                     )
                 )
-                .group_by(LiteLLMSpendLog.end_user)
-                .order_by(func.sum(LiteLLMSpendLog.spend).desc())
+                .group_by(source.c.tenant_id)
+                .order_by(func.sum(source.c.spend).desc())
                 .limit(limit)
             )
 
@@ -117,79 +214,6 @@ class CostQueryBuilder:
             logger.error(f"Error fetching spend by tenant: {e}", exc_info=True)
             raise
 
-    async def get_spend_by_agent(
-        self,
-        start_date: date,
-        end_date: date,
-        tenant_id: Optional[UUID] = None,
-        limit: int = 10,
-    ) -> List[AgentSpendDTO]:
-        """Get top N agents by spend with execution statistics."""
-        try:
-            # Use a subquery to expand the array elements first
-            subq = (
-                select(
-                    LiteLLMSpendLog.request_id,
-                    LiteLLMSpendLog.spend,
-                    func.jsonb_array_elements_text(LiteLLMSpendLog.request_tags).label("tag")
-                )
-                .where(
-                    and_(
-                        func.date(LiteLLMSpendLog.startTime) >= start_date,
-                        func.date(LiteLLMSpendLog.startTime) <= end_date,
-                        LiteLLMSpendLog.request_tags.isnot(None),
-                    )
-                )
-            )
-
-            if tenant_id:
-                subq = subq.where(LiteLLMSpendLog.end_user == str(tenant_id))
-
-            subq = subq.subquery()
-
-            # Now group by tag and filter for agent tags
-            stmt = (
-                select(
-                    subq.c.tag,
-                    func.count(subq.c.request_id).label("execution_count"),
-                    func.sum(subq.c.spend).label("total_cost"),
-                )
-                .where(subq.c.tag.like("agent:%"))
-                .group_by(subq.c.tag)
-                .order_by(func.sum(subq.c.spend).desc())
-                .limit(limit)
-            )
-
-            result = await self.db.execute(stmt)
-            rows = result.all()
-
-            agent_dtos = []
-            for row in rows:
-                tag = row.tag
-                if tag and tag.startswith("agent:"):
-                    agent_name = tag.split(":", 1)[1]
-                    execution_count = int(row.execution_count)
-                    total_cost = float(row.total_cost)
-                    avg_cost = total_cost / execution_count if execution_count > 0 else 0.0
-
-                    agent_stmt = select(Agent.id).where(Agent.name == agent_name)
-                    agent_result = await self.db.execute(agent_stmt)
-                    agent_id = agent_result.scalar()
-
-                    agent_dtos.append(
-                        AgentSpendDTO(
-                            agent_id=agent_id,
-                            agent_name=agent_name,
-                            execution_count=execution_count,
-                            total_cost=total_cost,
-                            avg_cost=avg_cost,
-                        )
-                    )
-            return agent_dtos
-        except Exception as e:
-            logger.error(f"Error fetching spend by agent: {e}", exc_info=True)
-            raise
-
     async def get_spend_by_model(
         self,
         start_date: date,
@@ -198,27 +222,21 @@ class CostQueryBuilder:
     ) -> List[ModelSpendDTO]:
         """Get spend breakdown by model."""
         try:
+            source = await self._spend_source(start_date, end_date, tenant_id)
             stmt = (
                 select(
-                    LiteLLMSpendLog.model_group.label("model_name"),
-                    func.sum(LiteLLMSpendLog.spend).label("total_spend"),
-                    func.sum(LiteLLMSpendLog.total_tokens).label("total_tokens"),
-                    func.sum(LiteLLMSpendLog.prompt_tokens).label("prompt_tokens"),
-                    func.sum(LiteLLMSpendLog.completion_tokens).label("completion_tokens"),
-                )
-                .where(
-                    and_(
-                        func.date(LiteLLMSpendLog.startTime) >= start_date,
-                        func.date(LiteLLMSpendLog.startTime) <= end_date,
-                    )
+                    source.c.model_group.label("model_name"),
+                    func.sum(source.c.spend).label("total_spend"),
+                    func.coalesce(func.sum(source.c.total_tokens), 0).label("total_tokens"),
+                    func.coalesce(func.sum(source.c.prompt_tokens), 0).label("prompt_tokens"),
+                    func.coalesce(func.sum(source.c.completion_tokens), 0).label(
+                        "completion_tokens"
+                    ),
                 )
-                .group_by(LiteLLMSpendLog.model_group)
-                .order_by(func.sum(LiteLLMSpendLog.spend).desc())
+                .group_by(source.c.model_group)
+                .order_by(func.sum(source.c.spend).desc())
             )
 
-            if tenant_id:
-                stmt = stmt.where(LiteLLMSpendLog.end_user == str(tenant_id))
-
             result = await self.db.execute(stmt)
             rows = result.all()
 
@@ -245,27 +263,21 @@ class CostQueryBuilder:
     ) -> List[TokenBreakdownDTO]:
         """Get token usage breakdown (input vs output) by model."""
         try:
+            source = await self._spend_source(start_date, end_date, tenant_id)
             stmt = (
                 select(
-                    LiteLLMSpendLog.model_group.label("model_name"),
-                    func.sum(LiteLLMSpendLog.prompt_tokens).label("prompt_tokens"),
-                    func.sum(LiteLLMSpendLog.completion_tokens).label("completion_tokens"),
-                    func.sum(LiteLLMSpendLog.total_tokens).label("total_tokens"),
+                    source.c.model_group.label("model_name"),
+                    func.coalesce(func.sum(source.c.prompt_tokens), 0).label("prompt_tokens"),
+                    func.coalesce(func.sum(source.c.completion_tokens), 0).label(
+                        "completion_tokens"
+                    ),
+                    func.coalesce(func.sum(source.c.total_tokens), 0).label("total_tokens"),
                 )
-                .where(
-                    and_(
-                        func.date(LiteLLMSpendLog.startTime) >= start_date,
-                        func.date(LiteLLMSpendLog.startTime) <= end_date,
-                    )
-                )
-                .group_by(LiteLLMSpendLog.model_group)
+                .group_by(source.c.model_group)
             )
 
             if model:
-                stmt = stmt.where(LiteLLMSpendLog.model_group == model)
-
-            if tenant_id:
-                stmt = stmt.where(LiteLLMSpendLog.end_user == str(tenant_id))
+                stmt = stmt.where(source.c.model_group == model)
 
             result = await self.db.execute(stmt)
             rows = result.all()
@@ -303,25 +315,17 @@ class CostQueryBuilder:
             start_date = date.today() - timedelta(days=days)
             end_date = date.today()
 
+            source = await self._spend_source(start_date, end_date, tenant_id)
             stmt = (
                 select(
-                    func.date(LiteLLMSpendLog.startTime).label("date"),
-                    func.sum(LiteLLMSpendLog.spend).label("total_spend"),
-                    func.count(LiteLLMSpendLog.request_id).label("transaction_count"),
-                )
-                .where(
-                    and_(
-                        func.date(LiteLLMSpendLog.startTime) >= start_date,
-                        func.date(LiteLLMSpendLog.startTime) <= end_date,
-                    )
+                    source.c.day.label("date"),
+                    func.sum(source.c.spend).label("total_spend"),
+                    func.sum(source.c.request_count).label("transaction_count"),
                 )
-                .group_by(func.date(LiteLLMSpendLog.startTime))
-                .order_by(func.date(LiteLLMSpendLog.startTime).asc())
+                .group_by(source.c.day)
+                .order_by(source.c.day.asc())
             )
 
-            if tenant_id:
-                stmt = stmt.where(LiteLLMSpendLog.end_user == str(tenant_id))
-
             result = await self.db.execute(stmt)
             rows = result.all()
 
@@ -361,10 +365,11 @@ class CostQueryBuilder:
     ) -> List[SpendLogDetailDTO]:
         """Get detailed spend logs for CSV export."""
         try:
+            range_start, range_end = day_range(start_date, end_date)
             stmt = select(LiteLLMSpendLog).where(
                 and_(
-                    func.date(LiteLLMSpendLog.startTime) >= start_date,
-                    func.date(LiteLLMSpendLog.startTime) <= end_date,
+                    LiteLLMSpendLog.startTime >= range_start,
+                    LiteLLMSpendLog.startTime < range_end,
                 )
             )
 
@@ -377,7 +382,15 @@ class CostQueryBuilder:
                 agent_name = agent_result.scalar()
                 if agent_name:
                     stmt = stmt.where(
-                        LiteLLMSpendLog.request_tags.contains([f"agent:{agent_name}"])
+                        LiteLLMSpendLog.request_id.in_(
+                            select(LLMSpendAttribution.request_id).where(
+                                and_(
+                                    LLMSpendAttribution.agent_name == agent_name,
+                                    LLMSpendAttribution.start_time >= range_start,
+                                    LLMSpendAttribution.start_time < range_end,
+                                )
+                            )
+                        )
                     )
 
             result = await self.db.execute(stmt)
@@ -15,12 +15,13 @@ Following 2025 best practices:
 
 import logging
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas.llm_cost import (
+    AgentExecutionSpendDTO,
     AgentSpendDTO,
     BudgetUtilizationDTO,
     CostSummaryDTO,
@@ -32,6 +33,7 @@ from src.schemas.llm_cost import (
 )
 from src.services.llm_cost_aggregations import CostAggregator
 from src.services.llm_cost_queries import CostQueryBuilder
+from src.services.llm_spend_attribution_queries import SpendAttributionQueries
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,7 @@ class LLMCostService:
         """
         self.db = db
         self.query_builder = CostQueryBuilder(db)
+        self.attribution_queries = SpendAttributionQueries(db)
         self.aggregator = CostAggregator(db)
 
     async def get_total_spend(
@@ -81,11 +84,25 @@ class LLMCostService:
         tenant_id: Optional[UUID] = None,
         limit: int = 10,
     ) -> List[AgentSpendDTO]:
-        """Get top N agents by spend (delegates to query builder)."""
-        return await self.query_builder.get_spend_by_agent(
+        """Get top N agents by spend (delegates to attribution queries)."""
+        return await self.attribution_queries.get_spend_by_agent(
             start_date, end_date, tenant_id, limit
         )
 
+    async def get_agent_execution_spend(
+        self,
+        agent_name: str,
+        start_date: date,
+        end_date: date,
+        tenant_id: Optional[UUID] = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> Tuple[List[AgentExecutionSpendDTO], int]:
+        """Get paginated per-execution spend for an agent (delegates to attribution queries)."""
+        return await self.attribution_queries.get_agent_execution_spend(
+            agent_name, start_date, end_date, tenant_id, page, page_size
+        )
+
     async def get_spend_by_model(
         self,
         start_date: date,
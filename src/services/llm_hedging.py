@@ -0,0 +1,354 @@
+"""
+Hedged LLM requests across an ordered fallback chain.
+
+Without hedging, a slow primary model only falls back after a full failure or
+timeout, so tail latency is set by the slowest provider. When hedging is
+enabled, the primary request is streamed and, if no first token arrives within
+a p95-derived delay, the same request is sent to the next model in the chain.
+The first attempt to complete wins and every other attempt is cancelled.
+
+Key Components:
+- FirstTokenLatencyTracker: Rolling per-model first-token latency window (p95)
+- hedged_chat_completion(): Race streamed completions across the chain
+- HedgedCompletion: Result of the winning attempt
+
+Metrics:
+- llm_hedged_requests_total: Requests by outcome (hedge rate)
+- llm_hedge_overhead_tokens_total: Tokens spent on cancelled attempts (cost overhead)
+- llm_first_token_seconds: First-token latency per model
+
+The chain is a list of LiteLLM/OpenRouter model names (primary first). The
+database-backed fallback chains were retired in Story 9.2, so callers pass the
+chain explicitly (see settings.llm_hedge_fallback_models).
+"""
+
+import asyncio
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from src.monitoring.metrics import (
+    llm_first_token_seconds,
+    llm_hedge_overhead_tokens_total,
+    llm_hedged_requests_total,
+)
+
+# Rough chars-per-token ratio used to estimate prompt cost of cancelled attempts
+CHARS_PER_TOKEN = 4
+
+
+class FirstTokenLatencyTracker:
+    """
+    Rolling window of first-token latencies per model.
+
+    Shared by all coroutines in a worker process; asyncio runs them on one
+    thread, so no locking is required.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 200,
+        default_delay_seconds: float = 2.0,
+        min_samples: int = 20,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            window_size: Maximum samples kept per model
+            default_delay_seconds: Hedge delay used before enough samples exist
+            min_samples: Samples required before the p95 estimate is trusted
+        """
+        self.window_size = window_size
+        self.default_delay_seconds = default_delay_seconds
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        """Record a first-token latency sample for a model."""
+        samples = self._samples.get(model)
+        if samples is None:
+            samples = deque(maxlen=self.window_size)
+            self._samples[model] = samples
+        samples.append(seconds)
+
+    def p95(self, model: str) -> Optional[float]:
+        """
+        Return the p95 first-token latency for a model.
+
+        Returns:
+            p95 latency in seconds, or None if fewer than min_samples recorded
+        """
+        samples = self._samples.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return ordered[index]
+
+    def hedge_delay(self, model: str) -> float:
+        """Return how long to wait for a first token before hedging."""
+        p95 = self.p95(model)
+        return p95 if p95 is not None else self.default_delay_seconds
+
+
+@dataclass
+class HedgedCompletion:
+    """
+    Result of a hedged chat completion.
+
+    Attributes:
+        content: Full text of the winning completion
+        model: Model that produced the winning completion
+        hedged: True if at least one hedge request was sent
+        usage: Usage object from the final stream chunk (None if not reported)
+        attempts: Models attempted, in launch order
+    """
+
+    content: str
+    model: str
+    hedged: bool
+    usage: Optional[Any] = None
+    attempts: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Attempt:
+    """In-flight streamed completion for one model in the chain."""
+
+    model: str
+    started_at: float
+    first_token: asyncio.Event
+    task: Optional["asyncio.Task[HedgedCompletion]"] = None
+    chunks_received: int = 0
+
+
+# Worker-level tracker shared by every hedged call in this process
+_latency_tracker: Optional[FirstTokenLatencyTracker] = None
+
+
+def get_latency_tracker() -> FirstTokenLatencyTracker:
+    """
+    Return the process-wide first-token latency tracker.
+
+    Lazily created from settings so tests can initialize configuration first.
+    """
+    global _latency_tracker
+    if _latency_tracker is None:
+        from src.config import get_settings
+
+        settings = get_settings()
+        _latency_tracker = FirstTokenLatencyTracker(
+            default_delay_seconds=settings.llm_hedge_default_delay_seconds,
+            min_samples=settings.llm_hedge_min_samples,
+        )
+    return _latency_tracker
+
+
+async def _stream_completion(
+    client: Any,
+    attempt: _Attempt,
+    messages: List[Dict[str, Any]],
+    tracker: FirstTokenLatencyTracker,
+    request_kwargs: Dict[str, Any],
+) -> HedgedCompletion:
+    """
+    Stream one completion, signalling attempt.first_token on the first chunk.
+
+    Returns:
+        HedgedCompletion for this attempt (hedged/attempts filled by caller)
+    """
+    loop = asyncio.get_running_loop()
+    stream = await client.chat.completions.create(
+        model=attempt.model,
+        messages=messages,
+        stream=True,
+        stream_options={"include_usage": True},
+        **request_kwargs,
+    )
+
+    parts: List[str] = []
+    usage = None
+    async for chunk in stream:
+        if getattr(chunk, "usage", None) is not None:
+            usage = chunk.usage
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            continue
+        delta = getattr(choices[0], "delta", None)
+        text = getattr(delta, "content", None) if delta is not None else None
+        if not text:
+            continue
+        if not attempt.first_token.is_set():
+            elapsed = loop.time() - attempt.started_at
+            tracker.record(attempt.model, elapsed)
+            llm_first_token_seconds.labels(model=attempt.model).observe(elapsed)
+            attempt.first_token.set()
+        attempt.chunks_received += 1
+        parts.append(text)
+
+    return HedgedCompletion(content="".join(parts), model=attempt.model, hedged=False, usage=usage)
+
+
+async def hedged_chat_completion(
+    client: Any,
+    models: List[str],
+    messages: List[Dict[str, Any]],
+    tracker: Optional[FirstTokenLatencyTracker] = None,
+    **request_kwargs: Any,
+) -> HedgedCompletion:
+    """
+    Run a chat completion, hedging across an ordered model chain.
+
+    The primary model is called first. If no attempt in flight has produced a
+    first token within the hedge delay of the most recently launched model,
+    the next model in the chain is launched alongside it. If every in-flight
+    attempt fails, the next model is launched immediately (plain fallback).
+    The first attempt to finish successfully wins; the rest are cancelled.
+
+    Args:
+        client: AsyncOpenAI-compatible client
+        models: Ordered model names, primary first
+        messages: Chat messages
+        tracker: Latency tracker (defaults to the process-wide tracker)
+        **request_kwargs: Extra completion parameters (max_tokens, temperature, ...)
+
+    Returns:
+        HedgedCompletion: Winning completion
+
+    Raises:
+        ValueError: If models is empty
+        Exception: The last attempt's error if every model in the chain failed
+    """
+    if not models:
+        raise ValueError("At least one model is required for a hedged completion")
+
+    tracker = tracker or get_latency_tracker()
+    loop = asyncio.get_running_loop()
+    primary = models[0]
+    attempts: List[_Attempt] = []
+    winner: Optional[HedgedCompletion] = None
+    winning_attempt: Optional[_Attempt] = None
+    last_error: Optional[BaseException] = None
+    hedged = False
+    next_index = 0
+
+    def launch(model: str) -> None:
+        attempt = _Attempt(model=model, started_at=loop.time(), first_token=asyncio.Event())
+        attempt.task = asyncio.create_task(
+            _stream_completion(client, attempt, messages, tracker, request_kwargs)
+        )
+        attempts.append(attempt)
+
+    launch(models[next_index])
+    next_index += 1
+
+    try:
+        while winner is None:
+            pending = [a for a in attempts if not a.task.done()]
+            if not pending:
+                if next_index >= len(models):
+                    break
+                # Everything in flight failed: fall back immediately
+                launch(models[next_index])
+                next_index += 1
+                continue
+
+            can_hedge = next_index < len(models) and not any(
+                a.first_token.is_set() for a in pending
+            )
+            wait_set = {a.task for a in pending}
+            token_waiter = None
+            timeout = None
+            if can_hedge:
+                latest = attempts[-1]
+                timeout = max(
+                    0.0, latest.started_at + tracker.hedge_delay(latest.model) - loop.time()
+                )
+                token_waiter = asyncio.create_task(latest.first_token.wait())
+                wait_set.add(token_waiter)
+
+            done, _ = await asyncio.wait(
+                wait_set, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if token_waiter is not None and not token_waiter.done():
+                token_waiter.cancel()
+
+            for attempt in attempts:
+                if attempt.task not in done:
+                    continue
+                if attempt.task.exception() is not None:
+                    last_error = attempt.task.exception()
+                    logger.warning(
+                        f"Hedged LLM attempt failed | model={attempt.model} | "
+                        f"error={last_error}"
+                    )
+                    continue
+                winner = attempt.task.result()
+                winning_attempt = attempt
+                break
+
+            if winner is None and not done and can_hedge:
+                logger.info(
+                    f"No first token from {attempts[-1].model} within hedge delay, "
+                    f"hedging to {models[next_index]}"
+                )
+                launch(models[next_index])
+                next_index += 1
+                hedged = True
+    finally:
+        await _cancel_losers(attempts, winning_attempt, messages, tracker, loop.time())
+
+    if winner is None:
+        llm_hedged_requests_total.labels(primary_model=primary, outcome="failed").inc()
+        raise last_error or RuntimeError("All hedged LLM attempts failed")
+
+    if not hedged:
+        outcome = "not_hedged"
+    elif winner.model == primary:
+        outcome = "primary_won"
+    else:
+        outcome = "hedge_won"
+    llm_hedged_requests_total.labels(primary_model=primary, outcome=outcome).inc()
+
+    winner.hedged = hedged
+    winner.attempts = [a.model for a in attempts]
+    return winner
+
+
+async def _cancel_losers(
+    attempts: List[_Attempt],
+    winning_attempt: Optional[_Attempt],
+    messages: List[Dict[str, Any]],
+    tracker: FirstTokenLatencyTracker,
+    now: float,
+) -> None:
+    """
+    Cancel every attempt except the winner and account for their token cost.
+
+    Cancelled attempts were still billed for the prompt and any streamed
+    output, which is the cost overhead of hedging.
+    """
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    prompt_tokens = prompt_chars // CHARS_PER_TOKEN
+
+    cancelled = [
+        a for a in attempts if a is not winning_attempt and not a.task.done()
+    ]
+    for attempt in cancelled:
+        attempt.task.cancel()
+    if cancelled:
+        await asyncio.gather(*(a.task for a in cancelled), return_exceptions=True)
+
+    if winning_attempt is None:
+        return
+    for attempt in cancelled:
+        llm_hedge_overhead_tokens_total.labels(model=attempt.model).inc(
+            prompt_tokens + attempt.chunks_received
+        )
+        if not attempt.first_token.is_set():
+            # Censored sample: the model was at least this slow, keep p95 honest
+            tracker.record(attempt.model, now - attempt.started_at)
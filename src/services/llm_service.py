@@ -383,10 +383,15 @@ class LLMService:
             raise
 
         # Return AsyncOpenAI client pointing to LiteLLM proxy
+        # Requests go through the per-model adaptive concurrency limiter and
+        # record their cost in the tenant's spend ledger
+        from src.services.llm_concurrency_limiter import build_limited_http_client
+
         return AsyncOpenAI(
             base_url=f"{self.litellm_proxy_url}/v1",
             api_key=virtual_key,
             timeout=30.0,
+            http_client=build_limited_http_client(timeout=30.0, tenant_id=tenant_id),
         )
 
     async def rotate_virtual_key(self, tenant_id: str) -> str:
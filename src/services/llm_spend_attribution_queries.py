@@ -0,0 +1,178 @@
+"""
+LLM Spend Attribution Queries Module.
+
+Per-agent and per-execution spend queries over llm_spend_attributions, the
+agent, agent_id and execution tags LiteLLM spend logs carry, extracted at
+ingestion time, so they no longer unnest request_tags of every spend log
+in the range.
+
+CRITICAL: ALL queries MUST filter by tenant_id for security.
+"""
+
+import logging
+from datetime import date
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import Agent, LLMSpendAttribution
+from src.schemas.llm_cost import AgentExecutionSpendDTO, AgentSpendDTO
+from src.services.llm_cost_queries import day_range
+
+logger = logging.getLogger(__name__)
+
+
+class SpendAttributionQueries:
+    """Helper class for per-agent spend queries."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize attribution queries."""
+        self.db = db
+
+    @staticmethod
+    def _execution_key():
+        """Execution ID, or the request_id for spend logs without one."""
+        return func.coalesce(LLMSpendAttribution.execution_id, LLMSpendAttribution.request_id)
+
+    @staticmethod
+    def _attribution_filter(
+        start_date: date,
+        end_date: date,
+        tenant_id: Optional[UUID],
+    ) -> list:
+        """Index-friendly attribution predicates for a date range and tenant."""
+        range_start, range_end = day_range(start_date, end_date)
+        conditions = [
+            LLMSpendAttribution.start_time >= range_start,
+            LLMSpendAttribution.start_time < range_end,
+        ]
+        if tenant_id:
+            conditions.append(LLMSpendAttribution.tenant_id == str(tenant_id))
+        return conditions
+
+    async def get_spend_by_agent(
+        self,
+        start_date: date,
+        end_date: date,
+        tenant_id: Optional[UUID] = None,
+        limit: int = 10,
+    ) -> List[AgentSpendDTO]:
+        """
+        Get top N agents by spend with execution statistics.
+
+        Reads llm_spend_attributions (agent tags extracted at ingestion time)
+        instead of unnesting request_tags. Executions are counted by
+        execution ID; untagged spend logs count as one execution per call.
+        """
+        try:
+            stmt = (
+                select(
+                    LLMSpendAttribution.agent_name,
+                    func.max(LLMSpendAttribution.agent_id).label("agent_id"),
+                    func.count(distinct(self._execution_key())).label("execution_count"),
+                    func.sum(LLMSpendAttribution.spend).label("total_cost"),
+                )
+                .where(and_(*self._attribution_filter(start_date, end_date, tenant_id)))
+                .group_by(LLMSpendAttribution.agent_name)
+                .order_by(func.sum(LLMSpendAttribution.spend).desc())
+                .limit(limit)
+            )
+
+            result = await self.db.execute(stmt)
+            rows = result.all()
+
+            agent_dtos = []
+            for row in rows:
+                execution_count = int(row.execution_count)
+                total_cost = float(row.total_cost or 0.0)
+                avg_cost = total_cost / execution_count if execution_count > 0 else 0.0
+
+                agent_id = None
+                if row.agent_id:
+                    try:
+                        agent_id = UUID(row.agent_id)
+                    except ValueError:
+                        logger.warning(f"Invalid agent_id tag: {row.agent_id}")
+                if agent_id is None:
+                    # Spend logs from before agent_id tagging: resolve by name
+                    agent_stmt = select(Agent.id).where(Agent.name == row.agent_name)
+                    agent_result = await self.db.execute(agent_stmt)
+                    agent_id = agent_result.scalar()
+
+                agent_dtos.append(
+                    AgentSpendDTO(
+                        agent_id=agent_id,
+                        agent_name=row.agent_name,
+                        execution_count=execution_count,
+                        total_cost=total_cost,
+                        avg_cost=avg_cost,
+                    )
+                )
+            return agent_dtos
+        except Exception as e:
+            logger.error(f"Error fetching spend by agent: {e}", exc_info=True)
+            raise
+
+    async def get_agent_execution_spend(
+        self,
+        agent_name: str,
+        start_date: date,
+        end_date: date,
+        tenant_id: Optional[UUID] = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> Tuple[List[AgentExecutionSpendDTO], int]:
+        """
+        Get per-execution spend for one agent, most recent first.
+
+        Served by the (tenant_id, agent_name, start_time) attribution index.
+
+        Returns:
+            Tuple of (executions on the requested page, total execution count)
+        """
+        try:
+            conditions = self._attribution_filter(start_date, end_date, tenant_id)
+            conditions.append(LLMSpendAttribution.agent_name == agent_name)
+            execution_key = self._execution_key()
+
+            count_stmt = select(func.count(distinct(execution_key))).where(and_(*conditions))
+            total = int((await self.db.execute(count_stmt)).scalar() or 0)
+            if total == 0:
+                return [], 0
+
+            stmt = (
+                select(
+                    execution_key.label("execution_id"),
+                    func.min(LLMSpendAttribution.start_time).label("first_call_at"),
+                    func.max(LLMSpendAttribution.start_time).label("last_call_at"),
+                    func.count().label("call_count"),
+                    func.coalesce(func.sum(LLMSpendAttribution.total_tokens), 0).label(
+                        "total_tokens"
+                    ),
+                    func.coalesce(func.sum(LLMSpendAttribution.spend), 0.0).label("total_cost"),
+                )
+                .where(and_(*conditions))
+                .group_by(execution_key)
+                .order_by(func.max(LLMSpendAttribution.start_time).desc(), execution_key)
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+            )
+
+            result = await self.db.execute(stmt)
+            executions = [
+                AgentExecutionSpendDTO(
+                    execution_id=row.execution_id,
+                    first_call_at=row.first_call_at,
+                    last_call_at=row.last_call_at,
+                    call_count=int(row.call_count),
+                    total_tokens=int(row.total_tokens),
+                    total_cost=float(row.total_cost),
+                )
+                for row in result.all()
+            ]
+            return executions, total
+        except Exception as e:
+            logger.error(f"Error fetching execution spend for agent {agent_name}: {e}", exc_info=True)
+            raise
@@ -0,0 +1,261 @@
+"""
+LLM Spend Rollup Module.
+
+Maintains llm_spend_daily_rollups incrementally from LiteLLM_SpendLogs so the
+cost dashboard never aggregates the raw spend log over long date ranges.
+
+Each run folds spend logs in [high_water_mark, now - lag) into the rollup in
+bounded windows. Every window is one INSERT ... SELECT ... GROUP BY with an
+ON CONFLICT increment, committed together with the advanced high-water mark,
+so an interrupted run resumes exactly where it stopped. The lag leaves room
+for LiteLLM's batched spend-log writes to land before a window is sealed.
+
+Each window also sweeps agent-tagged spend logs into llm_spend_attributions.
+The ingestion trigger normally writes those rows already; the sweep backfills
+history and covers rows the trigger missed (it is idempotent on request_id).
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.litellm_models import LiteLLMSpendLog
+from src.database.models import LLMSpendRollupState
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = "daily"
+
+# Spend logs in [:window_start, :window_end) folded into the daily rollup.
+# The agent tag is the first 'agent:%' element of request_tags, matching how
+# get_spend_by_agent attributes spend.
+_ROLLUP_WINDOW_SQL = text(
+    """
+    INSERT INTO llm_spend_daily_rollups AS r (
+        day, tenant_id, model_group, agent_tag, spend,
+        prompt_tokens, completion_tokens, total_tokens, request_count, updated_at
+    )
+    SELECT
+        date(s."startTime"),
+        COALESCE(s.end_user, ''),
+        COALESCE(s.model_group, ''),
+        COALESCE(agent.tag, ''),
+        COALESCE(SUM(s.spend), 0),
+        COALESCE(SUM(s.prompt_tokens), 0),
+        COALESCE(SUM(s.completion_tokens), 0),
+        COALESCE(SUM(s.total_tokens), 0),
+        COUNT(*),
+        now()
+    FROM "LiteLLM_SpendLogs" s
+    LEFT JOIN LATERAL (
+        SELECT t.tag
+        FROM jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(s.request_tags::jsonb) = 'array'
+                 THEN s.request_tags::jsonb ELSE '[]'::jsonb END
+        ) AS t(tag)
+        WHERE t.tag LIKE 'agent:%'
+        LIMIT 1
+    ) agent ON TRUE
+    WHERE s."startTime" >= :window_start AND s."startTime" < :window_end
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT (day, tenant_id, model_group, agent_tag) DO UPDATE SET
+        spend = r.spend + EXCLUDED.spend,
+        prompt_tokens = r.prompt_tokens + EXCLUDED.prompt_tokens,
+        completion_tokens = r.completion_tokens + EXCLUDED.completion_tokens,
+        total_tokens = r.total_tokens + EXCLUDED.total_tokens,
+        request_count = r.request_count + EXCLUDED.request_count,
+        updated_at = now()
+    """
+)
+
+# Agent attribution sweep for [:window_start, :window_end), mirroring the
+# llm_spend_attribution_capture trigger (migration 018)
+_ATTRIBUTION_WINDOW_SQL = text(
+    """
+    INSERT INTO llm_spend_attributions (
+        request_id, start_time, tenant_id, agent_name, agent_id, execution_id,
+        model_group, spend, prompt_tokens, completion_tokens, total_tokens
+    )
+    SELECT
+        s.request_id,
+        s."startTime",
+        s.end_user,
+        substr(agent.tag, 7),
+        left(substr(agent_id.tag, 10), 36),
+        substr(execution.tag, 11),
+        s.model_group,
+        COALESCE(s.spend, 0),
+        COALESCE(s.prompt_tokens, 0),
+        COALESCE(s.completion_tokens, 0),
+        COALESCE(s.total_tokens, 0)
+    FROM "LiteLLM_SpendLogs" s
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN jsonb_typeof(s.request_tags::jsonb) = 'array'
+                    THEN s.request_tags::jsonb ELSE '[]'::jsonb END AS tags
+    ) tags
+    JOIN LATERAL (
+        SELECT t.tag FROM jsonb_array_elements_text(tags.tags) AS t(tag)
+        WHERE t.tag LIKE 'agent:%' LIMIT 1
+    ) agent ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT t.tag FROM jsonb_array_elements_text(tags.tags) AS t(tag)
+        WHERE t.tag LIKE 'agent\\_id:%' LIMIT 1
+    ) agent_id ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT t.tag FROM jsonb_array_elements_text(tags.tags) AS t(tag)
+        WHERE t.tag LIKE 'execution:%' LIMIT 1
+    ) execution ON TRUE
+    WHERE s."startTime" >= :window_start AND s."startTime" < :window_end
+    ON CONFLICT (request_id) DO NOTHING
+    """
+)
+
+
+@dataclass
+class RollupRunResult:
+    """
+    Outcome of one rollup run.
+
+    Attributes:
+        windows: Number of windows folded into the rollup
+        rows_upserted: Rollup rows inserted or incremented
+        high_water_mark: High-water mark after the run (naive UTC)
+        caught_up: True if the high-water mark reached now - lag
+    """
+
+    windows: int = 0
+    rows_upserted: int = 0
+    high_water_mark: Optional[datetime] = None
+    caught_up: bool = False
+
+
+def _utcnow_naive() -> datetime:
+    """Current UTC time as a naive datetime, matching LiteLLM's startTime."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def get_rollup_cutoff(session: Any) -> Optional[date]:
+    """
+    Return the first day not fully covered by the rollup.
+
+    Days strictly before the cutoff can be read from llm_spend_daily_rollups;
+    the cutoff day and later must be read from raw spend logs.
+
+    Args:
+        session: Async database session
+
+    Returns:
+        Cutoff date, or None if the rollup has never run
+    """
+    result = await session.execute(
+        select(LLMSpendRollupState.high_water_mark).where(
+            LLMSpendRollupState.name == ROLLUP_NAME
+        )
+    )
+    high_water_mark = result.scalar()
+    return high_water_mark.date() if high_water_mark else None
+
+
+class SpendRollupService:
+    """Folds LiteLLM spend logs into the daily rollup table."""
+
+    def __init__(
+        self,
+        session_maker: Callable[[], Any],
+        lag: timedelta,
+        max_window: timedelta,
+        max_windows: int,
+    ):
+        """
+        Initialize rollup service.
+
+        Args:
+            session_maker: Async session factory
+            lag: Spend logs newer than now - lag are left for a later run
+            max_window: Maximum startTime span folded per transaction
+            max_windows: Maximum windows folded per run (bounds catch-up work)
+        """
+        self.session_maker = session_maker
+        self.lag = lag
+        self.max_window = max_window
+        self.max_windows = max_windows
+
+    async def _initial_high_water_mark(self, session: Any) -> Optional[datetime]:
+        """Start from the oldest spend log, aligned to midnight."""
+        result = await session.execute(select(func.min(LiteLLMSpendLog.startTime)))
+        oldest = result.scalar()
+        if oldest is None:
+            return None
+        return datetime.combine(oldest.date(), datetime.min.time())
+
+    async def run(self, now: Optional[datetime] = None) -> RollupRunResult:
+        """
+        Advance the rollup towards now - lag.
+
+        The state row is locked (SELECT ... FOR UPDATE) for each window so
+        overlapping runs serialize instead of double counting.
+
+        Args:
+            now: Current naive UTC time (defaults to utcnow)
+
+        Returns:
+            RollupRunResult
+        """
+        target = (now or _utcnow_naive()) - self.lag
+        result = RollupRunResult()
+
+        while result.windows < self.max_windows:
+            async with self.session_maker() as session:
+                state = (
+                    await session.execute(
+                        select(LLMSpendRollupState)
+                        .where(LLMSpendRollupState.name == ROLLUP_NAME)
+                        .with_for_update()
+                    )
+                ).scalar_one_or_none()
+
+                if state is None:
+                    start = await self._initial_high_water_mark(session)
+                    if start is None:
+                        # No spend logs yet: nothing to roll up
+                        result.caught_up = True
+                        return result
+                    # Concurrent first runs race on the insert; the loser's
+                    # DO NOTHING leaves the winner's state in place
+                    await session.execute(
+                        insert(LLMSpendRollupState)
+                        .values(name=ROLLUP_NAME, high_water_mark=start)
+                        .on_conflict_do_nothing(index_elements=["name"])
+                    )
+                    await session.commit()
+                    continue
+
+                window_start = state.high_water_mark
+                if window_start >= target:
+                    result.high_water_mark = window_start
+                    result.caught_up = True
+                    return result
+
+                window_end = min(window_start + self.max_window, target)
+                window = {"window_start": window_start, "window_end": window_end}
+                upsert = await session.execute(_ROLLUP_WINDOW_SQL, window)
+                await session.execute(_ATTRIBUTION_WINDOW_SQL, window)
+                state.high_water_mark = window_end
+                state.updated_at = func.now()
+                await session.commit()
+
+                result.windows += 1
+                result.rows_upserted += max(upsert.rowcount or 0, 0)
+                result.high_water_mark = window_end
+
+                logger.debug(
+                    f"Rolled up spend logs [{window_start.isoformat()}, "
+                    f"{window_end.isoformat()}): {upsert.rowcount} rows"
+                )
+
+        result.caught_up = result.high_water_mark is not None and result.high_water_mark >= target
+        return result
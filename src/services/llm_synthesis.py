@@ -20,6 +20,8 @@ from loguru import logger
 from openai import AsyncOpenAI, APIError, APIConnectionError, APITimeoutError
 
 from src.config import settings
+from src.services.llm_concurrency_limiter import build_limited_http_client
+from src.services.llm_hedging import hedged_chat_completion
 from src.workflows.state import WorkflowState
 
 
@@ -93,6 +95,8 @@ def _initialize_llm_client() -> AsyncOpenAI:
             "HTTP-Referer": settings.openrouter_site_url,
             "X-Title": settings.openrouter_app_name,
         },
+        # Queue locally behind the adaptive per-model concurrency limit
+        http_client=build_limited_http_client(default_provider="openrouter"),
     )
 
 
@@ -329,19 +333,41 @@ async def synthesize_enhancement(context: WorkflowState) -> str:
 
         logger.debug(f"Calling OpenRouter API | model={settings.llm_model}")
 
+        messages = [
+            {"role": "system", "content": ENHANCEMENT_SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ]
+        model_used = settings.llm_model
+
         try:
-            response = await asyncio.wait_for(
-                _llm_client.chat.completions.create(
-                    model=settings.llm_model,
-                    messages=[
-                        {"role": "system", "content": ENHANCEMENT_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_message},
-                    ],
-                    max_tokens=settings.llm_max_tokens,
-                    temperature=settings.llm_temperature,
-                ),
-                timeout=settings.llm_timeout_seconds,
-            )
+            if settings.llm_hedging_enabled and settings.llm_hedge_fallback_models:
+                # Opt-in hedging: race the fallback chain when the primary is slow
+                completion = await asyncio.wait_for(
+                    hedged_chat_completion(
+                        _llm_client,
+                        [settings.llm_model, *settings.llm_hedge_fallback_models],
+                        messages,
+                        max_tokens=settings.llm_max_tokens,
+                        temperature=settings.llm_temperature,
+                    ),
+                    timeout=settings.llm_timeout_seconds,
+                )
+                synthesis_text = completion.content
+                model_used = completion.model
+                usage = completion.usage
+            else:
+                response = await asyncio.wait_for(
+                    _llm_client.chat.completions.create(
+                        model=settings.llm_model,
+                        messages=messages,
+                        max_tokens=settings.llm_max_tokens,
+                        temperature=settings.llm_temperature,
+                    ),
+                    timeout=settings.llm_timeout_seconds,
+                )
+                # Step 4: Extract response content
+                synthesis_text = response.choices[0].message.content or ""
+                usage = response.usage
         except asyncio.TimeoutError:
             logger.warning(
                 f"LLM API timeout after {settings.llm_timeout_seconds}s | "
@@ -349,23 +375,20 @@ async def synthesize_enhancement(context: WorkflowState) -> str:
             )
             return _build_fallback_output(context, "AI synthesis timed out. Showing context.")
 
-        # Step 4: Extract response content
-        synthesis_text = response.choices[0].message.content or ""
-
         # Step 5: Enforce word limit
         synthesis_text = truncate_to_words(synthesis_text, max_words=500)
 
         # Step 6: Log token usage for cost tracking
-        if response.usage:
+        if usage:
             usage_log = {
                 "event": "llm_synthesis_token_usage",
                 "correlation_id": correlation_id,
                 "tenant_id": tenant_id,
                 "ticket_id": ticket_id,
-                "model": settings.llm_model,
-                "input_tokens": response.usage.prompt_tokens,
-                "output_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
+                "model": model_used,
+                "input_tokens": usage.prompt_tokens,
+                "output_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens,
             }
             logger.info(json.dumps(usage_log))
 
@@ -0,0 +1,221 @@
+"""
+MCP server capability cache.
+
+Tools, resources and prompts change rarely and are already persisted on the
+mcp_servers row by discovery. This worker-local cache holds them keyed by
+(server id, discovery_version) so MCPToolBridge can build LangChain tool
+wrappers without spawning or handshaking with the server; the server is only
+contacted when a tool is actually invoked.
+
+discovery_version is bumped on the row whenever discovery or the health
+monitor observes different capabilities, which makes every worker's cached
+entry for the old version unreachable on its next lookup.
+
+Functions:
+    - get_capability_cache(): Process-wide cache instance
+    - capabilities_from_server(): Snapshot of a row's discovered capabilities
+    - apply_discovery(): Store a full discovery result, bumping the version
+    - refresh_server_tools(): Record tools seen by a probe, bumping the version
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class ServerCapabilities:
+    """
+    Discovered capabilities of one MCP server at one discovery version.
+
+    Attributes:
+        server_id: MCP server UUID
+        discovery_version: mcp_servers.discovery_version these were read at
+        tools: Tool definitions from tools/list (name, description, inputSchema)
+        resources: Resource descriptors from resources/list
+        prompts: Prompt templates from prompts/list
+        cached_at: time.monotonic() when the entry was built
+    """
+
+    server_id: UUID
+    discovery_version: int
+    tools: tuple[dict[str, Any], ...] = ()
+    resources: tuple[dict[str, Any], ...] = ()
+    prompts: tuple[dict[str, Any], ...] = ()
+    cached_at: float = field(default_factory=time.monotonic)
+
+    def tool(self, name: str) -> dict[str, Any] | None:
+        """Tool definition by name, or None if the server does not expose it."""
+        for spec in self.tools:
+            if spec.get("name") == name:
+                return spec
+        return None
+
+
+def _normalize(items: Any) -> tuple[dict[str, Any], ...]:
+    """Keep dict entries with a name/uri from a JSONB capability list."""
+    if not items:
+        return ()
+    return tuple(
+        item for item in items if isinstance(item, dict) and (item.get("name") or item.get("uri"))
+    )
+
+
+def _version_of(server: Any) -> int:
+    """discovery_version of a row (unflushed rows have None)."""
+    return int(getattr(server, "discovery_version", None) or 0)
+
+
+def capabilities_from_server(server: Any) -> ServerCapabilities:
+    """
+    Snapshot the discovered_* columns of an MCPServer row.
+
+    Args:
+        server: MCPServer row (or any object with the same attributes)
+
+    Returns:
+        ServerCapabilities at the row's discovery_version
+    """
+    return ServerCapabilities(
+        server_id=server.id,
+        discovery_version=_version_of(server),
+        tools=_normalize(server.discovered_tools),
+        resources=_normalize(server.discovered_resources),
+        prompts=_normalize(server.discovered_prompts),
+    )
+
+
+class MCPCapabilityCache:
+    """
+    Bounded LRU of ServerCapabilities keyed by server id and discovery version.
+
+    Only the newest version seen for a server is kept; a lookup with a
+    different version misses, so stale capabilities are never served after
+    the row is bumped. Not thread-safe; used from a single event loop.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[UUID, ServerCapabilities] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, server_id: UUID, discovery_version: int) -> ServerCapabilities | None:
+        """Cached capabilities for exactly this version, or None."""
+        entry = self._entries.get(server_id)
+        if entry is None or entry.discovery_version != discovery_version:
+            return None
+        self._entries.move_to_end(server_id)
+        return entry
+
+    def put(self, capabilities: ServerCapabilities) -> None:
+        """Store capabilities unless a newer version is already cached."""
+        current = self._entries.get(capabilities.server_id)
+        if current is not None and current.discovery_version > capabilities.discovery_version:
+            return
+        self._entries[capabilities.server_id] = capabilities
+        self._entries.move_to_end(capabilities.server_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, server_id: UUID) -> None:
+        """Drop any cached capabilities for a server."""
+        self._entries.pop(server_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def for_server(self, server: Any) -> ServerCapabilities:
+        """
+        Capabilities for a server row, built from its columns on a miss.
+
+        Args:
+            server: MCPServer row carrying discovered_* and discovery_version
+
+        Returns:
+            ServerCapabilities at the row's discovery_version
+        """
+        cached = self.get(server.id, _version_of(server))
+        if cached is not None:
+            return cached
+        capabilities = capabilities_from_server(server)
+        self.put(capabilities)
+        return capabilities
+
+
+_cache = MCPCapabilityCache()
+
+
+def get_capability_cache() -> MCPCapabilityCache:
+    """Process-wide capability cache."""
+    return _cache
+
+
+def apply_discovery(
+    server: Any,
+    tools: list[dict[str, Any]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+) -> bool:
+    """
+    Store a discovery result on a server row (caller commits).
+
+    discovery_version is bumped only when something changed, so
+    rediscovering an unchanged server keeps every worker's cache warm.
+
+    Returns:
+        True if the capabilities changed
+    """
+    changed = (
+        _normalize(tools) != _normalize(server.discovered_tools)
+        or _normalize(resources) != _normalize(server.discovered_resources)
+        or _normalize(prompts) != _normalize(server.discovered_prompts)
+    )
+    server.discovered_tools = tools
+    server.discovered_resources = resources
+    server.discovered_prompts = prompts
+    if changed:
+        server.discovery_version = _version_of(server) + 1
+    _cache.put(capabilities_from_server(server))
+    return changed
+
+
+def refresh_server_tools(server: Any, tools: list[dict[str, Any]]) -> bool:
+    """
+    Record the tools returned by a live tools/list call against a server row.
+
+    When they differ from discovered_tools, the row is updated and its
+    discovery_version bumped (caller commits), and the new version is cached.
+
+    Args:
+        server: MCPServer row loaded in the caller's session
+        tools: Tool definitions from tools/list
+
+    Returns:
+        True if the row changed
+    """
+    normalized = _normalize(tools)
+    if normalized == _normalize(server.discovered_tools):
+        _cache.for_server(server)
+        return False
+
+    server.discovered_tools = list(normalized)
+    server.discovery_version = _version_of(server) + 1
+    _cache.put(capabilities_from_server(server))
+    logger.info(
+        "MCP server tools changed, discovery version bumped",
+        extra={
+            "server_id": str(server.id),
+            "discovery_version": server.discovery_version,
+            "tool_count": len(normalized),
+        },
+    )
+    return True
@@ -18,25 +18,37 @@ Dependencies:
 
 import asyncio
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
+from uuid import UUID
 
 from loguru import logger
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import MCPServer, MCPServerMetric
 from src.schemas.mcp_metrics import MCPHealthMetric, MCPHealthCheckStatus
+from src.schemas.mcp_server import MCPServerResponse
+from src.services.mcp_capability_cache import refresh_server_tools
+from src.services.mcp_latency_rollups import record_latencies
 from src.services.mcp_stdio_client import MCPStdioClient
+from src.services.tool_catalog_cache import invalidate_tool_catalog
 from src.monitoring.metrics import (
     mcp_server_health_status,
     mcp_server_last_check_timestamp,
     mcp_health_checks_total,
     mcp_health_check_errors_total,
     mcp_health_check_duration_seconds,
+    mcp_health_check_cycle_duration_seconds,
+    mcp_health_check_cycle_servers,
 )
 
 
-async def perform_detailed_health_check(server: MCPServer) -> MCPHealthMetric:
+async def perform_detailed_health_check(
+    server: MCPServer,
+    timeout_seconds: float = 30.0,
+) -> MCPHealthMetric:
     """
     Perform detailed health check with precise timing and error classification.
 
@@ -47,6 +59,7 @@ async def perform_detailed_health_check(server: MCPServer) -> MCPHealthMetric:
 
     Args:
         server: MCPServer instance with stdio configuration
+        timeout_seconds: Deadline for the whole probe (spawn, handshake, tools/list)
 
     Returns:
         MCPHealthMetric: Structured health check result with:
@@ -56,6 +69,7 @@ async def perform_detailed_health_check(server: MCPServer) -> MCPHealthMetric:
             - error_message: Detailed error description
             - check_type: 'tools_list' (health check probe method)
             - transport_type: 'stdio' or 'http_sse'
+            - tools: tools/list result on success (feeds the capability cache)
 
     Example:
         >>> metric = await perform_detailed_health_check(server)
@@ -68,17 +82,19 @@ async def perform_detailed_health_check(server: MCPServer) -> MCPHealthMetric:
     check_timestamp = datetime.now(timezone.utc)
 
     try:
-        # 30-second timeout for health check operation
-        async with asyncio.timeout(30.0):
+        async with asyncio.timeout(timeout_seconds):
             client = MCPStdioClient(
-                command=server.command,
-                args=server.args or [],
-                env=server.env or {}
+                MCPServerResponse.model_construct(
+                    transport_type="stdio",
+                    command=server.command,
+                    args=list(server.args or []),
+                    env=dict(server.env or {}),
+                )
             )
 
             async with client:
                 await client.initialize()
-                await client.list_tools()
+                tools = await client.list_tools()
 
         # Calculate response time with millisecond precision
         response_time_ms = int((time.perf_counter() - start_perf) * 1000)
@@ -93,6 +109,7 @@ async def perform_detailed_health_check(server: MCPServer) -> MCPHealthMetric:
             error_type=None,
             check_type="tools_list",
             transport_type=server.transport_type,
+            tools=[tool for tool in tools if isinstance(tool, dict)],
         )
 
     except asyncio.TimeoutError:
@@ -103,7 +120,7 @@ async def perform_detailed_health_check(server: MCPServer) -> MCPHealthMetric:
             response_time_ms=response_time_ms,
             check_timestamp=check_timestamp,
             status=MCPHealthCheckStatus.TIMEOUT,
-            error_message="Health check exceeded 30s timeout",
+            error_message=f"Health check exceeded {timeout_seconds:g}s timeout",
             error_type="TimeoutError",
             check_type="tools_list",
             transport_type=server.transport_type,
@@ -161,7 +178,8 @@ async def record_metric(metric: MCPHealthMetric, db: AsyncSession) -> None:
     Story: 11.2.4 - Enhanced MCP Health Monitoring (AC2)
 
     Performs two operations:
-    1. Insert raw metric to mcp_server_metrics table (time-series data)
+    1. Insert raw metric to mcp_server_metrics table (time-series data) and
+       add it to the per-minute latency rollup in the same transaction
     2. Update Prometheus metrics (gauges, counters, histograms)
 
     Args:
@@ -176,19 +194,7 @@ async def record_metric(metric: MCPHealthMetric, db: AsyncSession) -> None:
         >>> await record_metric(metric, db)  # Inserts to DB + updates Prometheus
     """
     try:
-        # 1. Insert to database (time-series storage)
-        db_metric = MCPServerMetric(
-            mcp_server_id=metric.mcp_server_id,
-            tenant_id=metric.tenant_id,
-            response_time_ms=metric.response_time_ms,
-            check_timestamp=metric.check_timestamp,
-            status=metric.status.value,
-            error_message=metric.error_message,
-            error_type=metric.error_type,
-            check_type=metric.check_type,
-            transport_type=metric.transport_type,
-        )
-        db.add(db_metric)
+        await write_metrics([metric], db)
         await db.commit()
 
     except Exception as e:
@@ -202,58 +208,120 @@ async def record_metric(metric: MCPHealthMetric, db: AsyncSession) -> None:
         # Don't raise - metric recording failure shouldn't block health checks
         await db.rollback()
 
-    # 2. Update Prometheus metrics (always attempt, even if DB insert failed)
-    try:
-        # Get server name for labels (use server_id as fallback)
-        server_name = str(metric.mcp_server_id)[:8]  # First 8 chars of UUID
-
-        # Gauge: Health status (1=success, 0=failure)
-        status_value = 1.0 if metric.status == MCPHealthCheckStatus.SUCCESS else 0.0
-        mcp_server_health_status.labels(
-            server_id=str(metric.mcp_server_id),
-            server_name=server_name,
-            transport_type=metric.transport_type,
-            tenant_id=str(metric.tenant_id),
-        ).set(status_value)
-
-        # Gauge: Last check timestamp (Unix seconds)
-        mcp_server_last_check_timestamp.labels(
-            server_id=str(metric.mcp_server_id),
-            server_name=server_name,
-        ).set(metric.check_timestamp.timestamp())
-
-        # Counter: Total checks
-        mcp_health_checks_total.labels(
-            server_id=str(metric.mcp_server_id),
-            server_name=server_name,
-            transport_type=metric.transport_type,
-            status=metric.status.value,
-        ).inc()
-
-        # Counter: Errors (only if status != success)
-        if metric.status != MCPHealthCheckStatus.SUCCESS:
-            mcp_health_check_errors_total.labels(
-                server_id=str(metric.mcp_server_id),
+    # Always attempt, even if DB insert failed
+    update_health_gauges([metric])
+
+
+async def write_metrics(metrics: list[MCPHealthMetric], db: AsyncSession) -> None:
+    """
+    Insert health metrics and their latency rollups (caller commits).
+
+    All rows go out as one multi-row INSERT into mcp_server_metrics plus one
+    executemany rollup upsert, however many servers were checked.
+
+    Args:
+        metrics: Health check results to persist
+        db: AsyncSession for database operations
+    """
+    if not metrics:
+        return
+
+    await db.execute(
+        insert(MCPServerMetric),
+        [
+            {
+                "mcp_server_id": metric.mcp_server_id,
+                "tenant_id": metric.tenant_id,
+                "response_time_ms": metric.response_time_ms,
+                "check_timestamp": metric.check_timestamp,
+                "status": metric.status.value,
+                "error_message": metric.error_message,
+                "error_type": metric.error_type,
+                "check_type": metric.check_type,
+                "transport_type": metric.transport_type,
+            }
+            for metric in metrics
+        ],
+    )
+    await record_latencies(
+        db,
+        [
+            {
+                "mcp_server_id": metric.mcp_server_id,
+                "tenant_id": metric.tenant_id,
+                "check_timestamp": metric.check_timestamp,
+                "response_time_ms": metric.response_time_ms,
+                "success": metric.status == MCPHealthCheckStatus.SUCCESS,
+            }
+            for metric in metrics
+        ],
+    )
+
+
+def update_health_gauges(
+    metrics: list[MCPHealthMetric],
+    server_names: dict[UUID, str] | None = None,
+) -> None:
+    """
+    Update Prometheus health metrics for a batch of check results.
+
+    Args:
+        metrics: Health check results
+        server_names: Optional server_id -> name map for labels (defaults to
+            the first 8 characters of the server UUID)
+    """
+    for metric in metrics:
+        try:
+            server_id = str(metric.mcp_server_id)
+            server_name = (server_names or {}).get(metric.mcp_server_id) or server_id[:8]
+
+            # Gauge: Health status (1=success, 0=failure)
+            status_value = 1.0 if metric.status == MCPHealthCheckStatus.SUCCESS else 0.0
+            mcp_server_health_status.labels(
+                server_id=server_id,
+                server_name=server_name,
+                transport_type=metric.transport_type,
+                tenant_id=str(metric.tenant_id),
+            ).set(status_value)
+
+            # Gauge: Last check timestamp (Unix seconds)
+            mcp_server_last_check_timestamp.labels(
+                server_id=server_id,
+                server_name=server_name,
+            ).set(metric.check_timestamp.timestamp())
+
+            # Counter: Total checks
+            mcp_health_checks_total.labels(
+                server_id=server_id,
                 server_name=server_name,
-                error_type=metric.error_type or "unknown",
+                transport_type=metric.transport_type,
+                status=metric.status.value,
             ).inc()
 
-        # Histogram: Response time distribution
-        mcp_health_check_duration_seconds.labels(
-            server_id=str(metric.mcp_server_id),
-            server_name=server_name,
-            transport_type=metric.transport_type,
-        ).observe(metric.response_time_ms / 1000.0)  # Convert ms to seconds
+            # Counter: Errors (only if status != success)
+            if metric.status != MCPHealthCheckStatus.SUCCESS:
+                mcp_health_check_errors_total.labels(
+                    server_id=server_id,
+                    server_name=server_name,
+                    error_type=metric.error_type or "unknown",
+                ).inc()
+
+            # Histogram: Response time distribution
+            mcp_health_check_duration_seconds.labels(
+                server_id=server_id,
+                server_name=server_name,
+                transport_type=metric.transport_type,
+            ).observe(metric.response_time_ms / 1000.0)  # Convert ms to seconds
 
-    except Exception as e:
-        logger.error(
-            "Failed to update Prometheus metrics",
-            extra={
-                "mcp_server_id": str(metric.mcp_server_id),
-                "error": str(e),
-            }
-        )
-        # Don't raise - Prometheus failure shouldn't block health checks
+        except Exception as e:
+            logger.error(
+                "Failed to update Prometheus metrics",
+                extra={
+                    "mcp_server_id": str(metric.mcp_server_id),
+                    "error": str(e),
+                }
+            )
+            # Don't raise - Prometheus failure shouldn't block health checks
 
 
 async def check_server_health(
@@ -342,25 +410,36 @@ async def _check_server_health_impl(
     await record_metric(metric, db)
 
     # Update server status in mcp_servers table (existing logic from Story 11.1.8)
+    result = apply_health_result(server, metric)
+    await db.commit()
+
+    if health_span:
+        _annotate_health_span(server, metric, tracer, health_span)
+
+    return result
+
+
+def apply_health_result(server: MCPServer, metric: MCPHealthMetric) -> dict[str, Any]:
+    """
+    Apply a health check result to a server row (caller commits).
+
+    On success: status='active', consecutive_failures reset to 0.
+    On failure: status='error', consecutive_failures incremented; after 3
+    consecutive failures the circuit breaker sets status='inactive'.
+
+    Args:
+        server: MCPServer instance to update
+        metric: Health check result for the server
+
+    Returns:
+        dict with status ("active" | "error"), error_message, duration_ms
+    """
     if metric.status == MCPHealthCheckStatus.SUCCESS:
         server.status = "active"
         server.last_health_check = metric.check_timestamp
         server.error_message = None
         server.consecutive_failures = 0
 
-        # Update discovered_tools if available (requires tools response)
-        # Note: perform_detailed_health_check() doesn't return tools list to keep it fast
-        # Tools are still updated by the existing check logic below
-
-        await db.commit()
-
-        # Story 12.8 AC2: Set success attributes on health span
-        if health_span:
-            health_span.set_attribute("health.status", "active")
-            health_span.set_attribute("health.response_time_ms", metric.response_time_ms)
-            health_span.set_attribute("circuit_breaker.state", "closed")
-            health_span.set_attribute("circuit_breaker.failure_count", 0)
-
         logger.info(
             "MCP health check completed",
             extra={
@@ -377,73 +456,206 @@ async def _check_server_health_impl(
             "error_message": None,
             "duration_ms": metric.response_time_ms
         }
-    else:
-        # FAILURE: Update status and circuit breaker
-        server.status = "error"
-        server.last_health_check = metric.check_timestamp
-        server.error_message = metric.error_message
-        server.consecutive_failures += 1
-
-        # Story 12.8 AC2: Set failure attributes on health span
-        if health_span:
-            health_span.set_attribute("health.status", "error")
-            health_span.set_attribute("health.response_time_ms", metric.response_time_ms)
-            health_span.set_attribute("health.error_type", metric.error_type or "unknown")
-            health_span.set_attribute("circuit_breaker.failure_count", server.consecutive_failures)
-
-        # Circuit breaker: Mark inactive after 3 consecutive failures
-        if server.consecutive_failures >= 3:
-            server.status = "inactive"
-
-            # Story 12.8 AC2: Child span for circuit breaker state change
-            if tracer and health_span:
-                with tracer.start_as_current_span("mcp.circuit_breaker.update") as cb_span:
-                    cb_span.set_attribute("mcp.server_id", str(server.id))
-                    cb_span.set_attribute("circuit_breaker.previous_state", "closed")
-                    cb_span.set_attribute("circuit_breaker.new_state", "open")
-                    cb_span.set_attribute("circuit_breaker.failure_count", server.consecutive_failures)
-                    cb_span.set_attribute("circuit_breaker.threshold", 3)
-
-            # Update parent health span with circuit breaker state
-            if health_span:
-                health_span.set_attribute("circuit_breaker.state", "open")
-
-            logger.warning(
-                f"MCP server {server.name} marked inactive after 3 consecutive failures",
-                extra={
-                    "mcp_server_id": str(server.id),
-                    "mcp_server_name": server.name,
-                    "tenant_id": str(server.tenant_id),
-                    "consecutive_failures": server.consecutive_failures,
-                    "circuit_breaker": "triggered"
-                }
-            )
-        else:
-            # Circuit breaker still closed (fewer than 3 failures)
-            if health_span:
-                health_span.set_attribute("circuit_breaker.state", "closed")
 
-        await db.commit()
+    # FAILURE: Update status and circuit breaker
+    server.status = "error"
+    server.last_health_check = metric.check_timestamp
+    server.error_message = metric.error_message
+    server.consecutive_failures += 1
 
+    # Circuit breaker: Mark inactive after 3 consecutive failures
+    if server.consecutive_failures >= 3:
+        server.status = "inactive"
         logger.warning(
-            "MCP health check failed",
+            f"MCP server {server.name} marked inactive after 3 consecutive failures",
             extra={
                 "mcp_server_id": str(server.id),
                 "mcp_server_name": server.name,
                 "tenant_id": str(server.tenant_id),
-                "status": server.status,
-                "error_type": metric.error_type,
-                "error_message": metric.error_message,
                 "consecutive_failures": server.consecutive_failures,
-                "duration_ms": metric.response_time_ms
+                "circuit_breaker": "triggered"
             }
         )
 
-        return {
-            "status": "error",
+    logger.warning(
+        "MCP health check failed",
+        extra={
+            "mcp_server_id": str(server.id),
+            "mcp_server_name": server.name,
+            "tenant_id": str(server.tenant_id),
+            "status": server.status,
+            "error_type": metric.error_type,
             "error_message": metric.error_message,
+            "consecutive_failures": server.consecutive_failures,
             "duration_ms": metric.response_time_ms
         }
+    )
+
+    return {
+        "status": "error",
+        "error_message": metric.error_message,
+        "duration_ms": metric.response_time_ms
+    }
+
+
+def _annotate_health_span(
+    server: MCPServer,
+    metric: MCPHealthMetric,
+    tracer: Any | None,
+    health_span: Any,
+) -> None:
+    """Set health and circuit breaker attributes on a health check span (Story 12.8 AC2)."""
+    health_span.set_attribute("health.response_time_ms", metric.response_time_ms)
+    health_span.set_attribute("circuit_breaker.failure_count", server.consecutive_failures)
+
+    if metric.status == MCPHealthCheckStatus.SUCCESS:
+        health_span.set_attribute("health.status", "active")
+        health_span.set_attribute("circuit_breaker.state", "closed")
+        return
+
+    health_span.set_attribute("health.status", "error")
+    health_span.set_attribute("health.error_type", metric.error_type or "unknown")
+
+    if server.status != "inactive":
+        # Circuit breaker still closed (fewer than 3 failures)
+        health_span.set_attribute("circuit_breaker.state", "closed")
+        return
+
+    # Child span for circuit breaker state change
+    if tracer:
+        with tracer.start_as_current_span("mcp.circuit_breaker.update") as cb_span:
+            cb_span.set_attribute("mcp.server_id", str(server.id))
+            cb_span.set_attribute("circuit_breaker.previous_state", "closed")
+            cb_span.set_attribute("circuit_breaker.new_state", "open")
+            cb_span.set_attribute("circuit_breaker.failure_count", server.consecutive_failures)
+            cb_span.set_attribute("circuit_breaker.threshold", 3)
+    health_span.set_attribute("circuit_breaker.state", "open")
+
+
+@dataclass
+class HealthCheckCycleResult:
+    """
+    Outcome of one health check cycle across many servers.
+
+    Attributes:
+        checked: Servers whose check produced a result
+        healthy: Servers now 'active'
+        unhealthy: Failed checks (including servers tripped to 'inactive')
+        inactive: Servers whose circuit breaker tripped this cycle
+        duration_seconds: Wall-clock duration of the cycle
+    """
+
+    checked: int = 0
+    healthy: int = 0
+    unhealthy: int = 0
+    inactive: int = 0
+    duration_seconds: float = 0.0
+
+
+async def run_health_check_cycle(
+    servers: list[MCPServer],
+    db: AsyncSession,
+    concurrency: int,
+    timeout_seconds: float,
+    tracer: Any | None = None,
+) -> HealthCheckCycleResult:
+    """
+    Health check many servers concurrently and persist results in one batch.
+
+    Probes run under a semaphore of `concurrency`, each bounded by
+    `timeout_seconds`, so a cycle takes roughly
+    ceil(len(servers) / concurrency) * timeout_seconds in the worst case
+    instead of the sum of every probe. Probes never touch the session; once
+    they finish, server status updates (and any tools/list changes, which
+    bump discovery_version) are committed together, then one
+    multi-row metrics INSERT and the rollup upserts are committed as a
+    single batch, and Prometheus metrics are updated in one pass.
+
+    Args:
+        servers: MCPServer rows loaded in `db`
+        db: AsyncSession the servers belong to (committed here)
+        concurrency: Maximum probes in flight
+        timeout_seconds: Per-probe deadline
+        tracer: Optional OpenTelemetry tracer (one mcp.health.ping span per probe)
+
+    Returns:
+        HealthCheckCycleResult with counts and cycle duration
+    """
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _probe(server: MCPServer) -> MCPHealthMetric:
+        async with semaphore:
+            if not tracer:
+                return await perform_detailed_health_check(server, timeout_seconds)
+            with tracer.start_as_current_span("mcp.health.ping") as span:
+                span.set_attribute("mcp.server_id", str(server.id))
+                span.set_attribute("mcp.server_name", server.name)
+                span.set_attribute("mcp.transport_type", "stdio")
+                return await perform_detailed_health_check(server, timeout_seconds)
+
+    outcomes = await asyncio.gather(
+        *(_probe(server) for server in servers), return_exceptions=True
+    )
+
+    cycle = HealthCheckCycleResult()
+    metrics: list[MCPHealthMetric] = []
+    changed_tenants: set[str] = set()
+    for server, outcome in zip(servers, outcomes):
+        if isinstance(outcome, BaseException):
+            # perform_detailed_health_check classifies its own errors; this
+            # only catches failures building the result itself
+            logger.error(
+                f"Health check failed for server {server.name}: {outcome}",
+                extra={
+                    "mcp_server_id": str(server.id),
+                    "mcp_server_name": server.name,
+                    "tenant_id": str(server.tenant_id),
+                    "error": str(outcome),
+                }
+            )
+            cycle.unhealthy += 1
+            continue
+
+        metrics.append(outcome)
+        before = (server.status, server.discovery_version)
+        result = apply_health_result(server, outcome)
+        if outcome.tools is not None:
+            # Probe already listed tools: keep discovered_tools and the
+            # capability cache current without a separate discovery run
+            refresh_server_tools(server, outcome.tools)
+        if (server.status, server.discovery_version) != before:
+            changed_tenants.add(str(server.tenant_id))
+        cycle.checked += 1
+        if result["status"] == "active":
+            cycle.healthy += 1
+        else:
+            cycle.unhealthy += 1
+        if server.status == "inactive":
+            cycle.inactive += 1
+
+    # Server status updates first, so a failed metrics write can't drop them
+    await db.commit()
+    for tenant_id in changed_tenants:
+        await invalidate_tool_catalog(tenant_id)
+
+    try:
+        await write_metrics(metrics, db)
+        await db.commit()
+    except Exception as e:
+        logger.error(
+            "Failed to record health check cycle metrics to database",
+            extra={"metric_count": len(metrics), "error": str(e)}
+        )
+        # Don't raise - metric recording failure shouldn't block health checks
+        await db.rollback()
+
+    update_health_gauges(metrics, {server.id: server.name for server in servers})
+
+    cycle.duration_seconds = time.perf_counter() - start
+    mcp_health_check_cycle_duration_seconds.observe(cycle.duration_seconds)
+    mcp_health_check_cycle_servers.set(len(servers))
+    return cycle
 
 
 # Legacy check_server_health() implementation below (Story 11.1.8)
@@ -0,0 +1,328 @@
+"""
+MCP Streamable HTTP Connection Pool
+
+Process-wide pool of httpx.AsyncClient instances shared by
+MCPStreamableHTTPClient sessions. Without it every session creates its own
+client, so each agent run repeats DNS, TCP and TLS setup against the same
+remote MCP endpoints. Pooled clients keep connections alive between runs and
+multiplex concurrent requests over HTTP/2.
+
+Clients are keyed by (url, headers fingerprint): a SHA-256 of the endpoint
+and its headers, so only sessions with identical credentials share a client
+and no secret is kept in the key. MCP session state (Mcp-Session-Id) stays on
+each MCPStreamableHTTPClient, i.e. per execution; only connections are
+shared. Clients with no borrowers for mcp_pool_http_idle_ttl_seconds are
+closed on the next acquisition.
+
+Like the stdio pool, a pool is bound to the event loop it was created on;
+get_http_pool() returns the pool for the running loop. Connections can only
+be closed on that loop, so a pool closes itself when its loop cancels the
+remaining tasks on exit (asyncio.run), and a pool replaced by one for another
+loop is closed the next time its own loop runs.
+
+Populates the mcp_pool_* Prometheus metrics (transport_type="http").
+
+References:
+- Story 11.2.3: MCP Connection Pooling and Caching
+- src/services/mcp_http_sse_client.py
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT = "http"
+
+
+def pool_key(url: str, headers: dict[str, str] | None) -> str:
+    """
+    Return the pool key for an endpoint and its headers.
+
+    Args:
+        url: MCP server endpoint URL
+        headers: HTTP headers sent with every request (auth included)
+
+    Returns:
+        str: 16-hex-digit SHA-256 prefix of the URL and headers
+    """
+    payload = json.dumps(
+        {"url": url, "headers": {k.lower(): v for k, v in (headers or {}).items()}},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def create_unpooled_client(headers: dict[str, str] | None) -> httpx.AsyncClient:
+    """
+    New private HTTP/2 client for one session (mcp_pool_http_enabled off).
+
+    Args:
+        headers: Default headers sent on every request (e.g. Authorization)
+
+    Returns:
+        httpx.AsyncClient the caller owns and must close
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            connect=10.0,  # TCP connection establishment
+            read=60.0,  # Response reading
+            write=10.0,  # Request writing
+            pool=5.0,  # Connection pool acquisition
+        ),
+        limits=httpx.Limits(
+            max_connections=100,  # Total concurrent connections
+            max_keepalive_connections=20,  # Reusable persistent connections
+        ),
+        http2=True,  # Enable HTTP/2 with automatic fallback to HTTP/1.1
+        headers=headers or {},
+        follow_redirects=True,
+    )
+
+
+@dataclass
+class _SharedClient:
+    """An httpx.AsyncClient shared by sessions with the same pool key."""
+
+    client: httpx.AsyncClient
+    host: str
+    borrowers: int = 0
+    last_released: float = field(default_factory=time.monotonic)
+
+
+class MCPHTTPPool:
+    """
+    Shared HTTP/2 clients for streamable-HTTP MCP servers.
+
+    Example usage:
+        pool = get_http_pool()
+        client = pool.acquire(url, headers)
+        try:
+            await client.post(url, json=payload)
+        finally:
+            pool.release(url, headers)
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 60.0,
+        pool_timeout_seconds: float = 5.0,
+        idle_ttl_seconds: float = 300.0,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry_seconds = keepalive_expiry_seconds
+        self.pool_timeout_seconds = pool_timeout_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+
+        self._clients: dict[str, _SharedClient] = {}
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._closer: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @classmethod
+    def from_settings(cls) -> "MCPHTTPPool":
+        """Build a pool from mcp_pool_http_* settings."""
+        return cls(
+            max_connections=settings.mcp_pool_http_max_connections,
+            max_keepalive_connections=settings.mcp_pool_http_max_keepalive_connections,
+            keepalive_expiry_seconds=settings.mcp_pool_http_keepalive_expiry_seconds,
+            pool_timeout_seconds=settings.mcp_pool_http_pool_timeout,
+            idle_ttl_seconds=settings.mcp_pool_http_idle_ttl_seconds,
+        )
+
+    @property
+    def total_clients(self) -> int:
+        return len(self._clients)
+
+    def acquire(self, url: str, headers: dict[str, str] | None = None) -> httpx.AsyncClient:
+        """
+        Borrow the shared client for an endpoint, creating it on first use.
+
+        Every acquire() must be paired with release().
+
+        Args:
+            url: MCP server endpoint URL
+            headers: Headers set as client defaults (auth included)
+
+        Returns:
+            httpx.AsyncClient with HTTP/2 and keep-alive enabled
+        """
+        from src.monitoring.metrics import (
+            mcp_pool_client_acquisitions_total,
+            mcp_pool_client_creations_total,
+            mcp_pool_client_reuses_total,
+        )
+
+        if self._closed:
+            raise RuntimeError("MCP HTTP pool is closed")
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+            self._closer = self.loop.create_task(self._close_with_loop())
+
+        self._evict_idle()
+
+        key = pool_key(url, headers)
+        shared = self._clients.get(key)
+        host = urlsplit(url).netloc
+        labels = {"server_id": host, "transport_type": TRANSPORT, "tenant_id": "shared"}
+        if shared is None:
+            shared = _SharedClient(client=self._create_client(headers), host=host)
+            self._clients[key] = shared
+            mcp_pool_client_creations_total.labels(**labels).inc()
+            logger.info(
+                "MCP HTTP pool client created",
+                extra={"host": host, "pool_key": key, "total_clients": len(self._clients)},
+            )
+        else:
+            mcp_pool_client_reuses_total.labels(**labels).inc()
+
+        mcp_pool_client_acquisitions_total.labels(**labels).inc()
+        shared.borrowers += 1
+        self._update_gauges()
+        return shared.client
+
+    def release(self, url: str, headers: dict[str, str] | None = None) -> None:
+        """Return a client borrowed with acquire(); connections stay open."""
+        shared = self._clients.get(pool_key(url, headers))
+        if shared is None:
+            return
+        shared.borrowers = max(0, shared.borrowers - 1)
+        shared.last_released = time.monotonic()
+        self._update_gauges()
+
+    def _create_client(self, headers: dict[str, str] | None) -> httpx.AsyncClient:
+        """New HTTP/2 client with keep-alive limits from the pool settings."""
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=10.0,  # TCP connection establishment
+                read=60.0,  # Response reading
+                write=10.0,  # Request writing
+                pool=self.pool_timeout_seconds,  # Connection pool acquisition
+            ),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry_seconds,
+            ),
+            http2=True,  # Multiplex concurrent requests; falls back to HTTP/1.1
+            headers=headers or {},
+            follow_redirects=True,
+        )
+
+    def _evict_idle(self) -> None:
+        """Close clients nobody has borrowed for idle_ttl_seconds."""
+        from src.monitoring.metrics import mcp_pool_client_evictions_total
+
+        now = time.monotonic()
+        for key, shared in list(self._clients.items()):
+            if shared.borrowers == 0 and now - shared.last_released >= self.idle_ttl_seconds:
+                del self._clients[key]
+                asyncio.get_running_loop().create_task(shared.client.aclose())
+                mcp_pool_client_evictions_total.labels(transport_type=TRANSPORT).inc()
+                logger.info("MCP HTTP pool client evicted", extra={"host": shared.host})
+
+    def _update_gauges(self) -> None:
+        from src.monitoring.metrics import (
+            mcp_pool_active_clients,
+            mcp_pool_idle_clients,
+            mcp_pool_total_clients,
+        )
+
+        active = sum(1 for shared in self._clients.values() if shared.borrowers)
+        mcp_pool_total_clients.labels(transport_type=TRANSPORT).set(len(self._clients))
+        mcp_pool_active_clients.labels(transport_type=TRANSPORT).set(active)
+        mcp_pool_idle_clients.labels(transport_type=TRANSPORT).set(len(self._clients) - active)
+
+    async def _close_with_loop(self) -> None:
+        """Wait until cancelled (loop exit or close_on_loop()), then close the clients."""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if not self._closed:
+                await self.close()
+
+    def close_on_loop(self) -> None:
+        """
+        Close the pool on its own loop from outside it (the loop is not running).
+
+        The clients close as soon as the loop runs again. If it is already
+        closed they cannot be closed cleanly; they are dropped and their
+        sockets are released when garbage collected.
+        """
+        if self._closed or self._closer is None:
+            return
+        if self.loop is None or self.loop.is_closed():
+            logger.warning(
+                "MCP HTTP pool dropped with its closed event loop",
+                extra={"total_clients": len(self._clients)},
+            )
+            self._closed = True
+            self._clients.clear()
+            self._update_gauges()
+            return
+        self.loop.call_soon_threadsafe(self._closer.cancel)
+
+    async def close(self) -> None:
+        """Close every shared client (worker shutdown)."""
+        self._closed = True
+        if self._closer is not None and self._closer is not asyncio.current_task():
+            self._closer.cancel()
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for shared in clients:
+            try:
+                await shared.client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing MCP HTTP pool client: {e}")
+        self._update_gauges()
+
+
+# Pool for the running event loop (one per process in practice)
+_pool: MCPHTTPPool | None = None
+
+
+def get_http_pool() -> MCPHTTPPool:
+    """
+    Return the HTTP pool for the running event loop, creating it if needed.
+
+    A pool left behind by another event loop is closed on that loop; its
+    connections belong to it and cannot be reused.
+    """
+    global _pool
+
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool.loop not in (None, loop) or _pool._closed:
+        if _pool is not None:
+            _pool.close_on_loop()
+        _pool = MCPHTTPPool.from_settings()
+    return _pool
+
+
+async def close_http_pool() -> None:
+    """Close the pool for the running event loop (worker shutdown)."""
+    global _pool
+
+    if _pool is not None and _pool.loop in (None, asyncio.get_running_loop()):
+        await _pool.close()
+    _pool = None
+
+
+__all__ = [
+    "MCPHTTPPool",
+    "close_http_pool",
+    "create_unpooled_client",
+    "get_http_pool",
+    "pool_key",
+]
@@ -13,6 +13,9 @@ from typing import Any, Self, cast
 import httpx
 from loguru import logger
 
+from src.config import settings
+from src.services.mcp_http_pool import MCPHTTPPool, create_unpooled_client, get_http_pool
+
 # Reuse exception hierarchy from stdio client
 from src.services.mcp_stdio_client import (
     MCPError,
@@ -31,6 +34,9 @@ from src.services._mcp_http_response_handlers import (
     handle_json_response,
     post_request,
     redact_sensitive_headers,
+    response_session_id,
+    session_headers,
+    terminate_session,
 )
 
 
@@ -39,7 +45,8 @@ class MCPStreamableHTTPClient:
     MCP Streamable HTTP transport client for remote MCP servers.
 
     Implements JSON-RPC 2.0 over HTTP POST with dual response modes per MCP Specification 2025-03-26.
-    Supports async context manager for automatic cleanup.
+    Supports async context manager for automatic cleanup. Connections come
+    from the shared HTTP/2 pool; the Mcp-Session-Id is tracked per instance.
 
     Example usage:
         async with MCPStreamableHTTPClient(url, headers) as client:
@@ -65,10 +72,14 @@ class MCPStreamableHTTPClient:
         self.url = url
         self.headers = headers or {}
 
-        # HTTP client (created in __aenter__)
+        # HTTP client (created or borrowed in __aenter__)
         self.client: httpx.AsyncClient | None = None
+        self._pool: MCPHTTPPool | None = None
         self._closed = False
 
+        # MCP session assigned by the server (Mcp-Session-Id), per instance
+        self.session_id: str | None = None
+
         # JSON-RPC state
         self._request_id = 0
 
@@ -80,33 +91,23 @@ class MCPStreamableHTTPClient:
 
     async def __aenter__(self) -> Self:
         """
-        Async context manager entry: create HTTP client.
+        Async context manager entry: borrow (or create) the HTTP client.
+
+        With mcp_pool_http_enabled the client comes from the process-wide
+        HTTP/2 pool (mcp_http_pool.py), so connections to the endpoint are
+        reused across sessions; MCP session state stays on this instance.
 
         Returns:
             Self for use in async with statement.
         """
-        # Configure granular timeouts (2025 best practice)
-        timeout = httpx.Timeout(
-            connect=10.0,  # TCP connection establishment
-            read=60.0,  # Response reading
-            write=10.0,  # Request writing
-            pool=5.0,  # Connection pool acquisition
-        )
+        if settings.mcp_pool_http_enabled:
+            self._pool = get_http_pool()
+            self.client = self._pool.acquire(self.url, self.headers)
 
-        # Configure connection pooling
-        limits = httpx.Limits(
-            max_connections=100,  # Total concurrent connections
-            max_keepalive_connections=20,  # Reusable persistent connections
-        )
+            logger.info("MCP HTTP client borrowed from pool", url=self.url, http2=True)
+            return self
 
-        # Create async HTTP client with HTTP/2 support
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            limits=limits,
-            http2=True,  # Enable HTTP/2 with automatic fallback to HTTP/1.1
-            headers=self.headers,
-            follow_redirects=True,
-        )
+        self.client = create_unpooled_client(self.headers)
 
         logger.info(
             "MCP HTTP client initialized",
@@ -130,14 +131,22 @@ class MCPStreamableHTTPClient:
 
     async def close(self) -> None:
         """
-        Close HTTP client and release all connections.
+        End the MCP session and release the HTTP client.
 
-        Idempotent: safe to call multiple times.
+        A pooled client is returned to the pool with its connections kept
+        alive; a private client is closed. Idempotent: safe to call multiple
+        times.
         """
         if self._closed:
             return
 
-        if self.client:
+        if self.client and self.session_id:
+            await terminate_session(self.client, self.url, self.session_id)
+
+        if self._pool is not None:
+            self._pool.release(self.url, self.headers)
+            logger.info("MCP HTTP client released to pool")
+        elif self.client:
             await self.client.aclose()
             logger.info("MCP HTTP client closed")
 
@@ -249,9 +258,17 @@ class MCPStreamableHTTPClient:
 
         # Attempt POST request using handler
         response = await post_request(
-            self.client, self.url, jsonrpc_payload, self.headers, redact_sensitive_headers
+            self.client,
+            self.url,
+            jsonrpc_payload,
+            self.headers,
+            redact_sensitive_headers,
+            request_headers=session_headers(self.session_id),
         )
 
+        # Server assigns the session on initialize; echo it on later requests
+        self.session_id = response_session_id(response, self.session_id)
+
         # Determine response mode based on Content-Type
         content_type = response.headers.get("content-type", "")
 
@@ -261,7 +278,9 @@ class MCPStreamableHTTPClient:
 
         elif "text/event-stream" in content_type:
             # SSE stream response mode - delegate to handler
-            result, last_event_id = await handle_sse_stream(self.client, self.url, jsonrpc_payload)
+            result, last_event_id = await handle_sse_stream(
+                self.client, self.url, jsonrpc_payload, request_headers=session_headers(self.session_id)
+            )
 
             # Store last event ID for resumability
             if last_event_id:
@@ -0,0 +1,281 @@
+"""
+Spill store for large MCP tool results.
+
+A tool returning a huge JSON document or file listing would otherwise be
+held whole in the LangGraph message list and re-sent to the LLM on every
+later ReAct turn. Results above mcp_large_result_threshold_bytes are written
+to a compressed spill file instead, and the LLM receives a bounded view: a
+short summary, the first mcp_large_result_preview_chars characters and a
+handle it can page through with the read_mcp_result_page tool.
+
+Spill files hold one independently zlib-compressed segment per page, with
+segment offsets kept in memory, so reading page N decompresses only that
+page. Pages are compressed and written one at a time in a worker thread,
+which keeps the extra memory per spill to a single page.
+
+Handles are scoped to the execution that produced them and removed when the
+execution's MCPToolBridge is cleaned up; files older than
+mcp_large_result_ttl_seconds are removed on the next spill.
+
+Functions:
+    - get_large_result_store(): Process-wide store instance
+    - bound_tool_output(): Spill an oversized result and return its view
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+PAGE_TOOL_NAME = "read_mcp_result_page"
+
+
+@dataclass
+class SpilledResult:
+    """
+    Index of one spilled tool result.
+
+    Attributes:
+        handle: Opaque identifier given to the LLM
+        path: Spill file holding one compressed segment per page
+        tool_name: Tool that produced the result
+        execution_context_id: Execution allowed to page through it
+        total_chars: Length of the full result
+        segments: (offset, length) of each compressed page in the file
+        created_at: time.monotonic() when the result was spilled
+    """
+
+    handle: str
+    path: str
+    tool_name: str
+    execution_context_id: str | None
+    total_chars: int
+    segments: list[tuple[int, int]] = field(default_factory=list)
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.segments)
+
+
+class LargeResultStore:
+    """
+    Compressed, paged spill files for oversized tool results.
+
+    Example usage:
+        store = get_large_result_store()
+        spilled = await store.spill(text, "list_files", execution_context_id)
+        page = await store.read_page(spilled.handle, 2, execution_context_id)
+        store.purge(execution_context_id)
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        page_chars: int = 16000,
+        ttl_seconds: float = 3600.0,
+    ):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "aiops-mcp-results")
+        self.page_chars = page_chars
+        self.ttl_seconds = ttl_seconds
+        self._results: dict[str, SpilledResult] = {}
+
+    @classmethod
+    def from_settings(cls) -> "LargeResultStore":
+        """Build a store from mcp_large_result_* settings."""
+        return cls(
+            directory=settings.mcp_large_result_dir or None,
+            page_chars=settings.mcp_large_result_page_chars,
+            ttl_seconds=settings.mcp_large_result_ttl_seconds,
+        )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def spill(
+        self, text: str, tool_name: str, execution_context_id: str | None = None
+    ) -> SpilledResult:
+        """
+        Write a result to a compressed, paged spill file.
+
+        Args:
+            text: Full tool result
+            tool_name: Tool that produced it
+            execution_context_id: Execution allowed to read it back
+
+        Returns:
+            SpilledResult describing the pages
+        """
+        self._evict_expired()
+        handle = uuid.uuid4().hex[:16]
+        result = SpilledResult(
+            handle=handle,
+            path=os.path.join(self.directory, f"{handle}.pages"),
+            tool_name=tool_name,
+            execution_context_id=execution_context_id,
+            total_chars=len(text),
+        )
+        result.segments = await asyncio.to_thread(self._write_pages, result.path, text)
+        self._results[handle] = result
+        return result
+
+    def _write_pages(self, path: str, text: str) -> list[tuple[int, int]]:
+        """Compress and append one page at a time (runs in a worker thread)."""
+        os.makedirs(self.directory, exist_ok=True)
+        segments: list[tuple[int, int]] = []
+        offset = 0
+        with open(path, "wb") as f:
+            for start in range(0, len(text), self.page_chars):
+                segment = zlib.compress(text[start:start + self.page_chars].encode("utf-8"))
+                f.write(segment)
+                segments.append((offset, len(segment)))
+                offset += len(segment)
+        return segments
+
+    async def read_page(
+        self, handle: str, page: int, execution_context_id: str | None = None
+    ) -> str:
+        """
+        Read one page (1-based) of a spilled result.
+
+        Raises:
+            KeyError: Unknown or expired handle, or one from another execution
+            IndexError: Page out of range
+        """
+        result = self._results.get(handle)
+        if result is None or result.execution_context_id != execution_context_id:
+            raise KeyError(handle)
+        if not 1 <= page <= result.page_count:
+            raise IndexError(page)
+        offset, length = result.segments[page - 1]
+        return await asyncio.to_thread(self._read_segment, result.path, offset, length)
+
+    @staticmethod
+    def _read_segment(path: str, offset: int, length: int) -> str:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return zlib.decompress(f.read(length)).decode("utf-8")
+
+    def get(self, handle: str) -> SpilledResult | None:
+        return self._results.get(handle)
+
+    def purge(self, execution_context_id: str | None) -> int:
+        """Delete every spilled result of an execution; returns how many."""
+        handles = [
+            handle
+            for handle, result in self._results.items()
+            if result.execution_context_id == execution_context_id
+        ]
+        for handle in handles:
+            self._remove(handle)
+        return len(handles)
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for handle, result in list(self._results.items()):
+            if now - result.created_at >= self.ttl_seconds:
+                self._remove(handle)
+
+    def _remove(self, handle: str) -> None:
+        result = self._results.pop(handle, None)
+        if result is None:
+            return
+        try:
+            os.unlink(result.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove MCP result spill file: {e}", extra={"path": result.path})
+
+
+_store: LargeResultStore | None = None
+
+
+def get_large_result_store() -> LargeResultStore:
+    """Process-wide spill store, created on first use."""
+    global _store
+
+    if _store is None:
+        _store = LargeResultStore.from_settings()
+    return _store
+
+
+def _summarize(text: str) -> str:
+    """One-line shape description computed without parsing the whole result."""
+    head = text.lstrip()[:1]
+    kind = {"{": "JSON object", "[": "JSON array"}.get(head, "text")
+    return f"{kind}, {len(text):,} characters, {text.count(chr(10)) + 1:,} lines"
+
+
+async def bound_tool_output(
+    text: str, tool_name: str, execution_context_id: str | None = None
+) -> str:
+    """
+    Return a tool result as-is, or a bounded view of it if it is too large.
+
+    Results above mcp_large_result_threshold_bytes are spilled to the store;
+    the returned view holds a summary, a preview and the paging handle.
+    Spill failures fall back to a truncated preview without a handle.
+
+    Args:
+        text: Full tool result
+        tool_name: Tool that produced it
+        execution_context_id: Execution allowed to page through the result
+
+    Returns:
+        str: Text to hand to the LLM
+    """
+    if not settings.mcp_large_result_enabled:
+        return text
+    # UTF-8 is at most 4 bytes per character; only encode when it could matter
+    threshold = settings.mcp_large_result_threshold_bytes
+    if len(text) * 4 <= threshold or len(text.encode("utf-8")) <= threshold:
+        return text
+
+    from src.monitoring.metrics import mcp_tool_results_spilled_total
+
+    preview = text[: settings.mcp_large_result_preview_chars]
+    summary = _summarize(text)
+    try:
+        spilled = await get_large_result_store().spill(text, tool_name, execution_context_id)
+    except Exception as e:
+        logger.warning(
+            f"Failed to spill large MCP tool result, truncating: {e}",
+            extra={"tool_name": tool_name, "error_type": type(e).__name__},
+        )
+        mcp_tool_results_spilled_total.labels(tool_name=tool_name, outcome="truncated").inc()
+        return f"[Result truncated: {summary}. Showing the first {len(preview):,} characters.]\n{preview}"
+
+    mcp_tool_results_spilled_total.labels(tool_name=tool_name, outcome="spilled").inc()
+    logger.info(
+        "Large MCP tool result spilled",
+        extra={
+            "tool_name": tool_name,
+            "handle": spilled.handle,
+            "total_chars": spilled.total_chars,
+            "pages": spilled.page_count,
+        },
+    )
+    return (
+        f"[Large result stored as handle '{spilled.handle}': {summary}, "
+        f"{spilled.page_count} pages. Showing the first {len(preview):,} characters. "
+        f"Call {PAGE_TOOL_NAME}(handle='{spilled.handle}', page=N) to read page N "
+        f"(1-{spilled.page_count}).]\n{preview}"
+    )
+
+
+__all__ = [
+    "LargeResultStore",
+    "PAGE_TOOL_NAME",
+    "SpilledResult",
+    "bound_tool_output",
+    "get_large_result_store",
+]
@@ -0,0 +1,358 @@
+"""
+Per-minute MCP latency histogram rollups.
+
+Every recorded health metric also increments a per-server, per-minute row in
+mcp_server_latency_rollups: check/success counts, latency sum and max, and a
+fixed log-scale latency histogram. Dashboard percentiles merge these
+histograms (an element-wise sum computed in SQL) instead of running
+PERCENTILE_CONT over raw metric rows, so the cost of a percentile query is
+bounded by minutes in the window rather than checks recorded.
+
+Histogram layout:
+    Bucket 0 holds sub-millisecond times; bucket i (1..N-2) holds
+    [GROWTH**(i-1), GROWTH**i) ms; the last bucket holds everything above
+    MAX_TRACKED_MS. With GROWTH = 1.2 any percentile is accurate to within
+    ~20% of the true value (interpolated within the bucket, clamped to max).
+
+Functions:
+    - bucket_index(): Histogram bucket for a response time
+    - histogram_quantile(): Percentile from merged bucket counts
+    - record_latency(): Upsert one observation into its minute rollup
+    - record_latencies(): Upsert a batch of observations in one round trip
+    - get_latency_summary(): Merged counts/percentiles for a time window
+    - get_split_averages(): Average latency before/after a split, one query
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import MCPServerLatencyRollup
+
+GROWTH = 1.2
+MAX_TRACKED_MS = 120_000
+# Zero bucket + log buckets up to MAX_TRACKED_MS + overflow bucket
+BUCKET_COUNT = math.ceil(math.log(MAX_TRACKED_MS) / math.log(GROWTH)) + 2
+
+_UPSERT_SQL = text(
+    """
+    INSERT INTO mcp_server_latency_rollups AS r (
+        mcp_server_id, bucket_start, tenant_id, check_count, success_count,
+        sum_response_time_ms, max_response_time_ms, histogram
+    )
+    VALUES (
+        :mcp_server_id, :bucket_start, :tenant_id, 1, :success,
+        :response_time_ms, :response_time_ms, :histogram
+    )
+    ON CONFLICT (mcp_server_id, bucket_start) DO UPDATE SET
+        check_count = r.check_count + 1,
+        success_count = r.success_count + EXCLUDED.success_count,
+        sum_response_time_ms = r.sum_response_time_ms + EXCLUDED.sum_response_time_ms,
+        max_response_time_ms = GREATEST(r.max_response_time_ms, EXCLUDED.max_response_time_ms),
+        histogram[:slot] = r.histogram[:slot] + 1
+    """
+)
+
+
+@dataclass
+class LatencySummary:
+    """
+    Latency statistics merged from minute rollups.
+
+    Attributes:
+        total_checks: Number of health checks in the window
+        success_count: Successful checks in the window
+        avg_response_time_ms: Mean response time
+        max_response_time_ms: Maximum response time
+        p50/p95/p99: Percentiles from the merged histogram
+    """
+
+    total_checks: int
+    success_count: int
+    avg_response_time_ms: float
+    max_response_time_ms: int
+    p50: float
+    p95: float
+    p99: float
+
+
+def bucket_index(response_time_ms: float) -> int:
+    """
+    Return the histogram bucket for a response time.
+
+    Args:
+        response_time_ms: Response time in milliseconds
+
+    Returns:
+        int: Bucket index in [0, BUCKET_COUNT)
+    """
+    if response_time_ms < 1:
+        return 0
+    if response_time_ms >= MAX_TRACKED_MS:
+        return BUCKET_COUNT - 1
+    return min(BUCKET_COUNT - 2, int(math.log(response_time_ms) / math.log(GROWTH)) + 1)
+
+
+def bucket_bounds(index: int) -> tuple[float, float]:
+    """
+    Return the [lower, upper) response time bounds of a bucket in ms.
+
+    The overflow bucket is reported as [MAX_TRACKED_MS, MAX_TRACKED_MS];
+    histogram_quantile() widens it to the observed maximum.
+    """
+    if index == 0:
+        return 0.0, 1.0
+    if index >= BUCKET_COUNT - 1:
+        return float(MAX_TRACKED_MS), float(MAX_TRACKED_MS)
+    return GROWTH ** (index - 1), min(GROWTH ** index, float(MAX_TRACKED_MS))
+
+
+def histogram_quantile(
+    counts: Sequence[int],
+    quantile: float,
+    max_value: Optional[float] = None,
+) -> float:
+    """
+    Estimate a quantile from histogram bucket counts.
+
+    Interpolates linearly inside the bucket that contains the target rank.
+
+    Args:
+        counts: Bucket counts (merged across rollups)
+        quantile: Quantile in [0, 1]
+        max_value: Observed maximum used to clamp the estimate
+
+    Returns:
+        float: Estimated value in ms (0.0 for an empty histogram)
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+
+    rank = quantile * total
+    cumulative = 0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            lower, upper = bucket_bounds(index)
+            if index >= BUCKET_COUNT - 1 and max_value is not None:
+                # Overflow bucket spans up to the observed maximum
+                upper = max(upper, float(max_value))
+            fraction = (rank - cumulative) / count
+            value = lower + (upper - lower) * fraction
+            return min(value, max_value) if max_value is not None else value
+        cumulative += count
+    return float(max_value) if max_value is not None else bucket_bounds(len(counts) - 1)[1]
+
+
+def _latency_params(
+    mcp_server_id: UUID,
+    tenant_id: str,
+    check_timestamp: datetime,
+    response_time_ms: int,
+    success: bool,
+) -> Dict[str, Any]:
+    """Bind parameters for one _UPSERT_SQL observation."""
+    index = bucket_index(response_time_ms)
+    histogram = [0] * BUCKET_COUNT
+    histogram[index] = 1
+    return {
+        "mcp_server_id": mcp_server_id,
+        "bucket_start": check_timestamp.replace(second=0, microsecond=0),
+        "tenant_id": tenant_id,
+        "success": 1 if success else 0,
+        "response_time_ms": response_time_ms,
+        "histogram": histogram,
+        # PostgreSQL arrays are 1-based
+        "slot": index + 1,
+    }
+
+
+async def record_latency(
+    db: AsyncSession,
+    mcp_server_id: UUID,
+    tenant_id: str,
+    check_timestamp: datetime,
+    response_time_ms: int,
+    success: bool,
+) -> None:
+    """
+    Add one health check observation to its per-minute rollup.
+
+    Executes in the caller's transaction (caller commits).
+
+    Args:
+        db: AsyncSession for database operations
+        mcp_server_id: MCP server UUID
+        tenant_id: Tenant identifier
+        check_timestamp: When the check was performed
+        response_time_ms: Measured response time
+        success: Whether the check succeeded
+    """
+    await record_latencies(
+        db,
+        [
+            {
+                "mcp_server_id": mcp_server_id,
+                "tenant_id": tenant_id,
+                "check_timestamp": check_timestamp,
+                "response_time_ms": response_time_ms,
+                "success": success,
+            }
+        ],
+    )
+
+
+async def record_latencies(db: AsyncSession, observations: Sequence[Dict[str, Any]]) -> None:
+    """
+    Add a batch of observations to their per-minute rollups.
+
+    Sent as a single executemany round trip (caller commits).
+
+    Args:
+        db: AsyncSession for database operations
+        observations: Dicts with the keyword arguments of record_latency()
+    """
+    if not observations:
+        return
+    params = [_latency_params(**observation) for observation in observations]
+    await db.execute(_UPSERT_SQL, params[0] if len(params) == 1 else params)
+
+
+def _window(server_id: UUID, since: datetime, until: datetime) -> list:
+    """Predicates selecting a server's minute rollups in [since, until]."""
+    return [
+        MCPServerLatencyRollup.mcp_server_id == server_id,
+        MCPServerLatencyRollup.bucket_start >= since.replace(second=0, microsecond=0),
+        MCPServerLatencyRollup.bucket_start <= until,
+    ]
+
+
+async def get_latency_summary(
+    db: AsyncSession,
+    server_id: UUID,
+    since: datetime,
+    until: datetime,
+) -> Optional[LatencySummary]:
+    """
+    Merge minute rollups in a window into counts, average and percentiles.
+
+    Runs two small queries: scalar totals, and the histogram merged in SQL
+    (unnest WITH ORDINALITY, summed per bucket), so at most BUCKET_COUNT
+    rows are returned regardless of window length.
+
+    Args:
+        db: AsyncSession for database queries
+        server_id: MCP server UUID
+        since: Window start (rounded down to the minute)
+        until: Window end
+
+    Returns:
+        LatencySummary, or None if no rollups exist in the window
+    """
+    conditions = _window(server_id, since, until)
+    totals = (
+        await db.execute(
+            select(
+                func.coalesce(func.sum(MCPServerLatencyRollup.check_count), 0).label("checks"),
+                func.coalesce(func.sum(MCPServerLatencyRollup.success_count), 0).label("successes"),
+                func.coalesce(func.sum(MCPServerLatencyRollup.sum_response_time_ms), 0).label(
+                    "sum_ms"
+                ),
+                func.max(MCPServerLatencyRollup.max_response_time_ms).label("max_ms"),
+            ).where(and_(*conditions))
+        )
+    ).one()
+
+    total_checks = int(totals.checks or 0)
+    if total_checks == 0:
+        return None
+
+    bucket = func.unnest(MCPServerLatencyRollup.histogram).table_valued(
+        "count", with_ordinality="slot"
+    ).render_derived(name="bucket")
+    merged = await db.execute(
+        select(bucket.c.slot, func.sum(bucket.c.count).label("count"))
+        .select_from(MCPServerLatencyRollup)
+        .join(bucket, literal_column("true"))
+        .where(and_(*conditions))
+        .group_by(bucket.c.slot)
+    )
+    counts: List[int] = [0] * BUCKET_COUNT
+    for row in merged.all():
+        slot = int(row.slot) - 1
+        if 0 <= slot < BUCKET_COUNT:
+            counts[slot] = int(row.count or 0)
+
+    max_ms = int(totals.max_ms or 0)
+    return LatencySummary(
+        total_checks=total_checks,
+        success_count=int(totals.successes or 0),
+        avg_response_time_ms=float(totals.sum_ms) / total_checks,
+        max_response_time_ms=max_ms,
+        p50=histogram_quantile(counts, 0.50, max_ms),
+        p95=histogram_quantile(counts, 0.95, max_ms),
+        p99=histogram_quantile(counts, 0.99, max_ms),
+    )
+
+
+async def get_split_averages(
+    db: AsyncSession,
+    server_id: UUID,
+    start: datetime,
+    split: datetime,
+    end: datetime,
+) -> tuple[Optional[float], Optional[float]]:
+    """
+    Average response time before and after a split point, in one query.
+
+    Args:
+        db: AsyncSession for database queries
+        server_id: MCP server UUID
+        start: Start of the earlier window
+        split: End of the earlier window / start of the later window
+        end: End of the later window
+
+    Returns:
+        Tuple of (earlier average, later average) in ms; None where a window
+        has no checks
+    """
+    later = MCPServerLatencyRollup.bucket_start >= split
+    result = await db.execute(
+        select(
+            func.sum(MCPServerLatencyRollup.sum_response_time_ms).filter(~later).label("prev_sum"),
+            func.sum(MCPServerLatencyRollup.check_count).filter(~later).label("prev_checks"),
+            func.sum(MCPServerLatencyRollup.sum_response_time_ms).filter(later).label("last_sum"),
+            func.sum(MCPServerLatencyRollup.check_count).filter(later).label("last_checks"),
+        ).where(
+            and_(
+                MCPServerLatencyRollup.mcp_server_id == server_id,
+                MCPServerLatencyRollup.bucket_start >= start,
+                MCPServerLatencyRollup.bucket_start <= end,
+            )
+        )
+    )
+    row = result.one()
+    prev_avg = float(row.prev_sum) / int(row.prev_checks) if row.prev_checks else None
+    last_avg = float(row.last_sum) / int(row.last_checks) if row.last_checks else None
+    return prev_avg, last_avg
+
+
+async def prune_latency_rollups(db: AsyncSession, cutoff: datetime) -> int:
+    """
+    Delete minute rollups older than cutoff (caller commits).
+
+    Rollups are one row per server-minute, so this stays small compared to
+    raw metric retention.
+
+    Returns:
+        Number of rollup rows deleted
+    """
+    result = await db.execute(
+        delete(MCPServerLatencyRollup).where(MCPServerLatencyRollup.bucket_start < cutoff)
+    )
+    return result.rowcount or 0
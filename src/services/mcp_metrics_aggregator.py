@@ -3,15 +3,22 @@ MCP Server Metrics Aggregation Service.
 
 Story: 11.2.4 - Enhanced MCP Health Monitoring (AC5)
 
-This module provides SQL-based metrics aggregation from the mcp_server_metrics table.
-Calculates success rates, response time percentiles, error distributions, and
-performance trends for MCP servers.
+This module provides SQL-based metrics aggregation for MCP servers. Success
+rates, response time percentiles and trends come from per-minute latency
+histogram rollups (mcp_latency_rollups.py); error distributions come from
+the mcp_server_metrics table.
 
 Functions:
     - get_server_metrics(): Aggregate metrics for API response
     - get_percentile(): Calculate percentile from values list
     - calculate_trend(): Analyze 24h performance trend
 
+Partition pruning:
+    mcp_server_metrics is range-partitioned by check_timestamp into daily
+    partitions (migration 019). Every query here bounds check_timestamp on
+    both sides so PostgreSQL only scans the partitions covering the window
+    (runtime pruning also applies to bound parameters).
+
 Dependencies:
     - PostgreSQL PERCENTILE_CONT() function for SQL-based percentiles
     - SQLAlchemy 2.0 async queries
@@ -19,7 +26,7 @@ Dependencies:
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Dict, Optional
 from uuid import UUID
 
 from loguru import logger
@@ -28,6 +35,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import MCPServer, MCPServerMetric
 from src.schemas.mcp_metrics import MCPServerMetrics, MetricsData
+from src.services.mcp_latency_rollups import (
+    LatencySummary,
+    get_latency_summary,
+    get_split_averages,
+)
 
 
 async def get_server_metrics(
@@ -40,7 +52,8 @@ async def get_server_metrics(
 
     Story: 11.2.4 - Enhanced MCP Health Monitoring (AC5)
 
-    Executes SQL aggregations with PERCENTILE_CONT() for P50/P95/P99 calculations.
+    Merges per-minute latency histograms for P50/P95/P99 (falling back to
+    PERCENTILE_CONT() over raw rows for windows without rollups).
     Calculates success/error rates, error distribution, and performance trend.
 
     Args:
@@ -70,34 +83,17 @@ async def get_server_metrics(
     if not server:
         raise ValueError(f"Server {server_id} not found")
 
-    # Calculate time window
-    since = datetime.now(timezone.utc) - timedelta(hours=period_hours)
+    # Calculate time window (both bounds on the partition key)
+    until = datetime.now(timezone.utc)
+    since = until - timedelta(hours=period_hours)
 
-    # SQL aggregations with PERCENTILE_CONT for percentiles
-    # Following 2025 SQLAlchemy patterns from Context7 MCP research
-    result = await db.execute(
-        select(
-            func.count(MCPServerMetric.id).label("total_checks"),
-            func.avg(MCPServerMetric.response_time_ms).label("avg_response_time_ms"),
-            func.max(MCPServerMetric.response_time_ms).label("max_response_time_ms"),
-            func.percentile_cont(0.5).within_group(MCPServerMetric.response_time_ms).label("p50"),
-            func.percentile_cont(0.95).within_group(MCPServerMetric.response_time_ms).label("p95"),
-            func.percentile_cont(0.99).within_group(MCPServerMetric.response_time_ms).label("p99"),
-            func.sum(
-                case((MCPServerMetric.status == "success", 1), else_=0)
-            ).label("success_count"),
-        )
-        .where(
-            and_(
-                MCPServerMetric.mcp_server_id == server_id,
-                MCPServerMetric.check_timestamp >= since,
-            )
-        )
-    )
-    row = result.one()
+    # Percentiles from merged per-minute histograms; raw rows are only read
+    # when a window predates the rollups (metrics recorded before migration 020)
+    summary = await get_latency_summary(db, server_id, since, until)
+    if summary is None:
+        summary = await _get_raw_latency_summary(server_id, since, until, db)
 
-    total_checks = row.total_checks or 0
-    if total_checks == 0:
+    if summary is None:
         # No metrics in period - return empty metrics
         return MCPServerMetrics(
             server_id=server_id,
@@ -119,13 +115,13 @@ async def get_server_metrics(
         )
 
     # Calculate rates
-    success_count = row.success_count or 0
-    success_rate = success_count / total_checks
+    total_checks = summary.total_checks
+    success_rate = summary.success_count / total_checks
     error_rate = 1.0 - success_rate
     uptime_percentage = success_rate * 100.0
 
     # Get error distribution
-    errors_by_type = await _get_errors_by_type(server_id, since, db)
+    errors_by_type = await _get_errors_by_type(server_id, since, db, until=until)
 
     # Calculate trend (comparing last 24h vs previous 24h)
     trend = await calculate_trend(server_id, db)
@@ -138,11 +134,11 @@ async def get_server_metrics(
             total_checks=total_checks,
             success_rate=round(success_rate, 3),
             error_rate=round(error_rate, 3),
-            avg_response_time_ms=int(row.avg_response_time_ms or 0),
-            p50_response_time_ms=int(row.p50 or 0),
-            p95_response_time_ms=int(row.p95 or 0),
-            p99_response_time_ms=int(row.p99 or 0),
-            max_response_time_ms=int(row.max_response_time_ms or 0),
+            avg_response_time_ms=int(summary.avg_response_time_ms),
+            p50_response_time_ms=int(summary.p50),
+            p95_response_time_ms=int(summary.p95),
+            p99_response_time_ms=int(summary.p99),
+            max_response_time_ms=int(summary.max_response_time_ms),
             errors_by_type=errors_by_type,
             uptime_percentage=round(uptime_percentage, 1),
             last_24h_trend=trend,
@@ -150,10 +146,86 @@ async def get_server_metrics(
     )
 
 
-async def _get_errors_by_type(
+async def _get_raw_latency_summary(
     server_id: UUID,
     since: datetime,
+    until: datetime,
     db: AsyncSession
+) -> Optional[LatencySummary]:
+    """
+    Compute latency statistics from raw metric rows with PERCENTILE_CONT.
+
+    Fallback for windows with no latency rollups (metrics recorded before
+    the rollups existed).
+
+    Args:
+        server_id: MCP server UUID
+        since: Start timestamp for query window
+        until: End timestamp for query window
+        db: AsyncSession for database queries
+
+    Returns:
+        LatencySummary, or None if no metrics exist in the window
+    """
+    result = await db.execute(
+        select(
+            func.count(MCPServerMetric.id).label("total_checks"),
+            func.avg(MCPServerMetric.response_time_ms).label("avg_response_time_ms"),
+            func.max(MCPServerMetric.response_time_ms).label("max_response_time_ms"),
+            func.percentile_cont(0.5).within_group(MCPServerMetric.response_time_ms).label("p50"),
+            func.percentile_cont(0.95).within_group(MCPServerMetric.response_time_ms).label("p95"),
+            func.percentile_cont(0.99).within_group(MCPServerMetric.response_time_ms).label("p99"),
+            func.sum(
+                case((MCPServerMetric.status == "success", 1), else_=0)
+            ).label("success_count"),
+        )
+        .where(
+            and_(
+                MCPServerMetric.mcp_server_id == server_id,
+                *_time_window(since, until),
+            )
+        )
+    )
+    row = result.one()
+    if not row.total_checks:
+        return None
+
+    return LatencySummary(
+        total_checks=row.total_checks,
+        success_count=row.success_count or 0,
+        avg_response_time_ms=float(row.avg_response_time_ms or 0),
+        max_response_time_ms=int(row.max_response_time_ms or 0),
+        p50=float(row.p50 or 0),
+        p95=float(row.p95 or 0),
+        p99=float(row.p99 or 0),
+    )
+
+
+def _time_window(since: datetime, until: Optional[datetime] = None) -> list:
+    """
+    Build check_timestamp predicates for [since, until].
+
+    Bounding both sides lets PostgreSQL prune mcp_server_metrics partitions
+    outside the window (including partitions created ahead of time).
+
+    Args:
+        since: Inclusive window start
+        until: Inclusive window end (defaults to now)
+
+    Returns:
+        List of SQLAlchemy predicates
+    """
+    return [
+        MCPServerMetric.check_timestamp >= since,
+        MCPServerMetric.check_timestamp <= (until or datetime.now(timezone.utc)),
+    ]
+
+
+async def _get_errors_by_type(
+    server_id: UUID,
+    since: datetime,
+    db: AsyncSession,
+    until: Optional[datetime] = None,
 ) -> Dict[str, int]:
     """
     Get error count breakdown by error_type.
@@ -162,6 +234,7 @@ async def _get_errors_by_type(
         server_id: MCP server UUID
         since: Start timestamp for query window
         db: AsyncSession for database queries
+        until: End timestamp for query window (defaults to now)
 
     Returns:
         Dict mapping error_type to count (e.g., {"TimeoutError": 28})
@@ -174,7 +247,7 @@ async def _get_errors_by_type(
         .where(
             and_(
                 MCPServerMetric.mcp_server_id == server_id,
-                MCPServerMetric.check_timestamp >= since,
+                *_time_window(since, until),
                 MCPServerMetric.status != "success",
                 MCPServerMetric.error_type.isnot(None),
             )
@@ -215,30 +288,28 @@ async def calculate_trend(
     last_24h_start = now - timedelta(hours=24)
     prev_24h_start = now - timedelta(hours=48)
 
-    # Get avg response time for last 24 hours
-    result_last = await db.execute(
-        select(func.avg(MCPServerMetric.response_time_ms))
-        .where(
-            and_(
-                MCPServerMetric.mcp_server_id == server_id,
-                MCPServerMetric.check_timestamp >= last_24h_start,
-            )
-        )
+    # Both averages from the per-minute rollups in a single query
+    avg_prev_24h, avg_last_24h = await get_split_averages(
+        db, server_id, prev_24h_start, last_24h_start, now
     )
-    avg_last_24h = result_last.scalar()
 
-    # Get avg response time for previous 24 hours
-    result_prev = await db.execute(
-        select(func.avg(MCPServerMetric.response_time_ms))
-        .where(
-            and_(
-                MCPServerMetric.mcp_server_id == server_id,
-                MCPServerMetric.check_timestamp >= prev_24h_start,
-                MCPServerMetric.check_timestamp < last_24h_start,
+    if avg_prev_24h is None and avg_last_24h is None:
+        # No rollups yet: both averages from raw rows, still in one pass
+        later = MCPServerMetric.check_timestamp >= last_24h_start
+        result = await db.execute(
+            select(
+                func.avg(MCPServerMetric.response_time_ms).filter(~later).label("prev"),
+                func.avg(MCPServerMetric.response_time_ms).filter(later).label("last"),
+            )
+            .where(
+                and_(
+                    MCPServerMetric.mcp_server_id == server_id,
+                    *_time_window(prev_24h_start, now),
+                )
             )
         )
-    )
-    avg_prev_24h = result_prev.scalar()
+        row = result.one()
+        avg_prev_24h, avg_last_24h = row.prev, row.last
 
     # If either period has no data, return stable
     if not avg_last_24h or not avg_prev_24h:
@@ -0,0 +1,229 @@
+"""
+MCP Server Metrics Partition Management.
+
+mcp_server_metrics is range-partitioned by check_timestamp into one partition
+per UTC day (migration 019). This module keeps partitions created ahead of
+the health-check writers and enforces retention by detaching and dropping
+whole partitions, instead of a bulk DELETE that holds locks, bloats WAL and
+leaves vacuum work behind.
+
+Partition naming: mcp_server_metrics_pYYYYMMDD, covering
+[YYYY-MM-DD 00:00 UTC, next day 00:00 UTC).
+
+Functions:
+    - partition_name(): Partition table name for a day
+    - ensure_partitions(): Create missing partitions for a range of days
+    - drop_expired_partitions(): Detach and drop partitions past retention
+    - maintain_partitions(): Retention + pre-creation in one call
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import MCPServerMetric
+from src.services.mcp_latency_rollups import prune_latency_rollups
+
+PARENT_TABLE = "mcp_server_metrics"
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    """
+    Outcome of a partition maintenance run.
+
+    Attributes:
+        partitioned: False if the table is a plain table (DELETE fallback used)
+        created: Partitions created ahead of time
+        dropped: Partitions detached and dropped by retention
+        deleted_rows: Rows deleted by the fallback DELETE (plain table only)
+        pruned_rollups: Latency rollup rows deleted by retention
+    """
+
+    partitioned: bool = True
+    created: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    deleted_rows: int = 0
+    pruned_rollups: int = 0
+
+
+def partition_name(day: date) -> str:
+    """
+    Return the partition table name for a UTC day.
+
+    Args:
+        day: UTC day covered by the partition
+
+    Returns:
+        str: e.g. 'mcp_server_metrics_p20251124'
+    """
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    """
+    Parse the UTC day from a partition table name.
+
+    Args:
+        name: Partition table name
+
+    Returns:
+        date, or None if the name is not a daily partition
+    """
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(PARTITION_PREFIX):], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+async def is_partitioned(db: AsyncSession) -> bool:
+    """
+    Check whether mcp_server_metrics is a partitioned table.
+
+    Databases built with Base.metadata.create_all (tests, local dev) have a
+    plain table; only migrated databases are partitioned.
+    """
+    result = await db.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": PARENT_TABLE},
+    )
+    return result.scalar() == "p"
+
+
+async def list_partitions(db: AsyncSession) -> List[str]:
+    """
+    List attached partitions of mcp_server_metrics.
+
+    Returns:
+        List of partition table names
+    """
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": PARENT_TABLE},
+    )
+    return [row[0] for row in result.all()]
+
+
+async def ensure_partitions(db: AsyncSession, start_day: date, days_ahead: int) -> List[str]:
+    """
+    Create any missing daily partitions from start_day to start_day + days_ahead.
+
+    Args:
+        db: AsyncSession (caller commits)
+        start_day: First UTC day to cover
+        days_ahead: Number of days after start_day to pre-create
+
+    Returns:
+        Names of partitions created
+    """
+    existing = set(await list_partitions(db))
+    created = []
+    for offset in range(days_ahead + 1):
+        day = start_day + timedelta(days=offset)
+        name = partition_name(day)
+        if name in existing:
+            continue
+        # Identifiers are generated from dates, never user input
+        await db.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {PARENT_TABLE} '
+                f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+                f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+async def drop_expired_partitions(db: AsyncSession, cutoff_day: date) -> List[str]:
+    """
+    Detach and drop every daily partition that ends on or before cutoff_day.
+
+    A partition for day D holds rows in [D, D+1), so it is expired once
+    D + 1 <= cutoff_day. DETACH and DROP are catalog operations: their cost
+    does not depend on how many rows the partition holds.
+
+    Args:
+        db: AsyncSession (caller commits)
+        cutoff_day: Rows before this UTC day are past retention
+
+    Returns:
+        Names of partitions dropped
+    """
+    dropped = []
+    for name in sorted(await list_partitions(db)):
+        day = partition_day(name)
+        if day is None or day + timedelta(days=1) > cutoff_day:
+            continue
+        await db.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{name}"'))
+        await db.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append(name)
+    return dropped
+
+
+async def maintain_partitions(
+    db: AsyncSession,
+    retention_days: int,
+    days_ahead: int,
+    now: Optional[datetime] = None,
+) -> PartitionMaintenanceResult:
+    """
+    Enforce retention and pre-create upcoming partitions.
+
+    Latency rollups (mcp_server_latency_rollups) share the same retention.
+    On a plain (unpartitioned) table this falls back to a DELETE by
+    check_timestamp so retention still holds.
+
+    Args:
+        db: AsyncSession (committed here)
+        retention_days: Days of metrics to keep
+        days_ahead: Days of partitions to keep created ahead of today
+        now: Current time (defaults to utcnow)
+
+    Returns:
+        PartitionMaintenanceResult
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=retention_days)
+    result = PartitionMaintenanceResult()
+    result.pruned_rollups = await prune_latency_rollups(db, cutoff)
+
+    if not await is_partitioned(db):
+        deleted = await db.execute(
+            delete(MCPServerMetric).where(MCPServerMetric.check_timestamp < cutoff)
+        )
+        await db.commit()
+        result.partitioned = False
+        result.deleted_rows = deleted.rowcount or 0
+        logger.warning(
+            "mcp_server_metrics is not partitioned; used DELETE for retention",
+            extra={"deleted_rows": result.deleted_rows},
+        )
+        return result
+
+    # Partitions covering the cutoff day stay until they fully expire, so up
+    # to one extra day of metrics is kept
+    result.dropped = await drop_expired_partitions(db, cutoff.date())
+    result.created = await ensure_partitions(db, now.date(), days_ahead)
+    await db.commit()
+
+    logger.info(
+        "MCP metrics partitions maintained",
+        extra={
+            "created": result.created,
+            "dropped": result.dropped,
+            "pruned_rollups": result.pruned_rollups,
+        },
+    )
+    return result
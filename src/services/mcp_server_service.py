@@ -22,6 +22,8 @@ from src.schemas.mcp_server import (
     MCPServerResponse,
     MCPServerUpdate,
 )
+from src.services.mcp_capability_cache import apply_discovery, get_capability_cache
+from src.services.tool_catalog_cache import invalidate_tool_catalog
 from src.services.mcp_stdio_client import (
     InitializationError,
     InvalidJSONError,
@@ -218,6 +220,7 @@ class MCPServerService:
 
         await self.db.commit()
         await self.db.refresh(server)
+        await invalidate_tool_catalog(tenant_id)
 
         logger.info(f"Updated MCP server {server_id} for tenant {tenant_id}")
         return server
@@ -247,6 +250,8 @@ class MCPServerService:
         stmt = delete(MCPServer).where(MCPServer.id == server_id, MCPServer.tenant_id == tenant_id)
         await self.db.execute(stmt)
         await self.db.commit()
+        get_capability_cache().invalidate(server_id)
+        await invalidate_tool_catalog(tenant_id)
 
         logger.info(f"Deleted MCP server {server_id} for tenant {tenant_id}")
         return True
@@ -354,10 +359,9 @@ class MCPServerService:
             else:
                 raise ValueError(f"Unsupported transport type: {server.transport_type}")
 
-            # Update server with discovered capabilities
-            server.discovered_tools = tools  # type: ignore[assignment]
-            server.discovered_resources = resources  # type: ignore[assignment]
-            server.discovered_prompts = prompts  # type: ignore[assignment]
+            # Update server with discovered capabilities (bumps discovery_version
+            # and refreshes this worker's capability cache when they changed)
+            apply_discovery(server, tools, resources, prompts)
             server.last_health_check = datetime.now(timezone.utc)  # type: ignore[assignment]
             server.status = MCPServerStatus.ACTIVE  # type: ignore[assignment]
             server.error_message = None  # type: ignore[assignment]
@@ -399,6 +403,9 @@ class MCPServerService:
                 exc_info=True,
             )
 
+        # Discovered primitives or status changed either way
+        await invalidate_tool_catalog(server.tenant_id)
+
     async def test_connection(self, server_config: MCPServerCreate) -> dict[str, Any]:
         """
         Test MCP server connection without saving to database.
@@ -633,6 +640,7 @@ class MCPServerService:
 
         logger.info(f"Starting health check for server {server_id}")
 
+        previous_status = server.status
         start_time = datetime.now(timezone.utc)
         health_status = {
             "server_id": str(server_id),
@@ -709,4 +717,8 @@ class MCPServerService:
                 exc_info=True,
             )
 
+        # Only active servers contribute tools to the catalog
+        if server.status != previous_status:
+            await invalidate_tool_catalog(tenant_id)
+
         return health_status
@@ -60,6 +60,8 @@ class MCPStdioClient:
     MCP stdio transport client for spawning and communicating with local MCP servers.
 
     Implements JSON-RPC 2.0 over stdin/stdout per MCP Specification 2025-03-26.
+    Requests are pipelined: one background reader matches responses to
+    requests by ID, so concurrent calls share a connection.
     Supports async context manager for automatic cleanup.
 
     Example usage:
@@ -102,6 +104,9 @@ class MCPStdioClient:
 
         # Background tasks
         self._stderr_task: asyncio.Task[None] | None = None
+        # Single stdout reader dispatching responses to pending requests by ID,
+        # so any number of requests can be in flight on one connection
+        self._reader_task: asyncio.Task[None] | None = None
 
     def _next_id(self) -> int:
         """
@@ -248,6 +253,8 @@ class MCPStdioClient:
         """
         Send JSON-RPC request and wait for matching response.
 
+        Safe to call concurrently; each caller waits only for its own ID.
+
         Args:
             method: JSON-RPC method name.
             params: Optional method parameters.
@@ -269,12 +276,12 @@ class MCPStdioClient:
         self._pending_requests[request_id] = future
 
         try:
+            # Reader must be running before the response can arrive
+            self._ensure_reader()
+
             # Send request
             await self._send_request(request)
 
-            # Start reading responses in background
-            asyncio.create_task(self._read_responses())
-
             # Wait for response with timeout
             try:
                 response = await asyncio.wait_for(future, timeout=timeout)
@@ -295,23 +302,42 @@ class MCPStdioClient:
             # Clean up pending request
             self._pending_requests.pop(request_id, None)
 
+    def _ensure_reader(self) -> None:
+        """Start the stdout demultiplexing reader if it is not running."""
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._read_responses())
+
     async def _read_responses(self) -> None:
         """
-        Background task to read and dispatch JSON-RPC responses.
+        Background task reading and dispatching JSON-RPC responses.
 
-        Matches responses to pending requests by ID and resolves futures.
+        Reads stdout for the lifetime of the connection and resolves the
+        pending future whose ID matches each response, so responses may
+        arrive in any order. Notifications and responses to abandoned
+        (timed-out) requests are skipped. A read failure (EOF, bad JSON)
+        fails every pending request and stops the reader; the next request
+        restarts it.
         """
         try:
-            response = await self._read_response()
-            response_id = response.get("id")
+            while True:
+                response = await self._read_response()
+                response_id = response.get("id")
 
-            if response_id and response_id in self._pending_requests:
-                future = self._pending_requests[response_id]
-                if not future.done():
+                if "method" in response:
+                    # Server-initiated notification or request; not supported
+                    logger.debug(f"Ignoring server message: {response.get('method')}")
+                    continue
+
+                future = self._pending_requests.get(response_id)  # type: ignore[arg-type]
+                if future is not None and not future.done():
                     future.set_result(response)
+                else:
+                    logger.debug(f"Dropping response for unknown request ID: {response_id}")
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             # Propagate error to all pending requests
-            for future in self._pending_requests.values():
+            for future in list(self._pending_requests.values()):
                 if not future.done():
                     future.set_exception(e)
 
@@ -428,13 +454,14 @@ class MCPStdioClient:
 
         logger.info(f"Closing MCP server process (PID: {self.process.pid})")
 
-        # Cancel stderr monitoring
-        if self._stderr_task and not self._stderr_task.done():
-            self._stderr_task.cancel()
-            try:
-                await self._stderr_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel stderr monitoring and the response reader
+        for task in (self._stderr_task, self._reader_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         # Check if already terminated
         if self.process.returncode is not None:
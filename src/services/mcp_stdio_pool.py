@@ -0,0 +1,488 @@
+"""
+MCP stdio Warm Pool
+
+Worker-level pool of long-lived, initialized MCP stdio server processes shared
+across agent executions. Without it every execution spawns a fresh process,
+runs initialize + tools/list and kills it, which adds seconds of npx/uvx cold
+start to each run.
+
+Processes are keyed by a hash of (tenant_id, command, args, env), see
+src/services/mcp_stdio_pool_clients.py. Each key keeps between
+mcp_pool_min_clients_per_server and mcp_pool_max_clients_per_server
+processes, with a global cap of mcp_pool_max_stdio_processes. A background
+maintenance loop evicts clients idle longer than mcp_pool_client_ttl_seconds,
+probes idle clients with tools/list, and restarts crashed processes to keep
+the minimum warm.
+
+A pool is bound to the event loop it was created on (subprocess transports
+cannot move between loops); agent tools reach the running loop's pool through
+src/services/mcp_stdio_pool_session.py.
+
+Populates the mcp_pool_* Prometheus metrics (transport_type="stdio").
+
+References:
+- Story 11.2.3: MCP Connection Pooling and Caching
+- src/services/mcp_stdio_client.py
+- src/services/mcp_stdio_pool_session.py (get_stdio_pool, PooledMCPSession)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from src.config import settings
+from src.services.mcp_stdio_client import (
+    InvalidJSONError,
+    MCPStdioClient,
+    ProcessError,
+)
+from src.services.mcp_stdio_client import TimeoutError as MCPTimeoutError
+from src.services.mcp_stdio_pool_clients import (
+    TRANSPORT,
+    PooledClient,
+    PoolKey,
+    client_config,
+    config_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keys unused for this long stop keeping min_size processes warm
+_KEY_RETENTION_SECONDS = 3600
+# Errors after which a client's connection state is unknown and it is discarded
+_DISCARD_ERRORS = (MCPTimeoutError, ProcessError, InvalidJSONError, EOFError, asyncio.TimeoutError)
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no pooled client becomes available within the acquire timeout."""
+
+    pass
+
+
+class MCPStdioPool:
+    """
+    Pool of warm MCP stdio processes keyed by server configuration.
+
+    Example usage:
+        pool = get_stdio_pool()
+        async with pool.acquire(server) as client:
+            result = await client.call_tool("read_file", {"path": "/tmp/x"})
+    """
+
+    def __init__(
+        self,
+        min_per_server: int,
+        max_per_server: int,
+        max_total: int,
+        idle_ttl_seconds: float,
+        maintenance_interval_seconds: float,
+        acquire_timeout_seconds: float,
+        probe_timeout_seconds: float = 10.0,
+    ):
+        self.min_per_server = min_per_server
+        self.max_per_server = max_per_server
+        self.max_total = max_total
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.maintenance_interval_seconds = maintenance_interval_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+
+        self._keys: dict[str, PoolKey] = {}
+        self._condition = asyncio.Condition()
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._maintenance_lock = asyncio.Lock()
+        self._last_maintenance = time.monotonic()
+        self._closed = False
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def from_settings(cls) -> "MCPStdioPool":
+        """Build a pool from the mcp_pool_* settings."""
+        return cls(
+            min_per_server=settings.mcp_pool_min_clients_per_server,
+            max_per_server=settings.mcp_pool_max_clients_per_server,
+            max_total=settings.mcp_pool_max_stdio_processes,
+            idle_ttl_seconds=settings.mcp_pool_client_ttl_seconds,
+            maintenance_interval_seconds=settings.mcp_pool_cleanup_interval_seconds,
+            acquire_timeout_seconds=settings.mcp_pool_acquire_timeout_seconds,
+        )
+
+    @property
+    def total_clients(self) -> int:
+        """Processes owned by the pool (idle + in use)."""
+        return sum(entry.size for entry in self._keys.values())
+
+    def start(self) -> None:
+        """Start the background maintenance loop on the running event loop (idempotent)."""
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self.loop = asyncio.get_running_loop()
+            self._maintenance_task = asyncio.create_task(self._run_maintenance())
+
+    @asynccontextmanager
+    async def acquire(self, server: Any) -> AsyncIterator[MCPStdioClient]:
+        """
+        Borrow an initialized client for a server, spawning one if needed.
+
+        The client is returned to the pool on exit. Clients whose connection
+        state is unknown after an error (timeouts, crashes, protocol errors)
+        are closed instead.
+
+        Args:
+            server: MCPServer row or MCPServerResponse with stdio configuration
+
+        Yields:
+            MCPStdioClient after initialize() and tools/list
+
+        Raises:
+            PoolExhaustedError: If no client is available within the acquire timeout
+            ProcessError / InitializationError: If a new process fails to start
+        """
+        pooled = await self._checkout(server)
+        discard = False
+        try:
+            yield pooled.client
+        except _DISCARD_ERRORS:
+            discard = True
+            raise
+        except asyncio.CancelledError:
+            # A cancelled request may still be answered later; don't reuse
+            discard = True
+            raise
+        finally:
+            await self._checkin(pooled, discard=discard)
+
+    async def get_tools(self, server: Any) -> list[dict[str, Any]]:
+        """
+        Return the tools/list result cached on a pooled client.
+
+        Warms the pool for the server as a side effect.
+        """
+        pooled = await self._checkout(server)
+        try:
+            return pooled.tools
+        finally:
+            await self._checkin(pooled)
+
+    async def _checkout(self, server: Any) -> PooledClient:
+        """Take an idle client or reserve a slot and spawn one."""
+        from src.monitoring.metrics import (
+            mcp_pool_acquisition_duration_seconds,
+            mcp_pool_client_acquisitions_total,
+            mcp_pool_client_creations_total,
+            mcp_pool_client_reuses_total,
+            mcp_pool_wait_time_seconds,
+        )
+
+        if self._closed:
+            raise ProcessError("MCP stdio pool is closed")
+        self.start()
+
+        start = time.perf_counter()
+        key = config_hash(server)
+        entry = self._keys.get(key)
+        if entry is None:
+            entry = PoolKey(
+                config=client_config(server),
+                server_id=str(server.id),
+                tenant_id=str(server.tenant_id),
+            )
+            self._keys[key] = entry
+        labels = {
+            "server_id": entry.server_id,
+            "transport_type": TRANSPORT,
+            "tenant_id": entry.tenant_id,
+        }
+        mcp_pool_client_acquisitions_total.labels(**labels).inc()
+
+        deadline = time.monotonic() + self.acquire_timeout_seconds
+        pooled: PooledClient | None = None
+        async with self._condition:
+            waited_since: float | None = None
+            while True:
+                pooled = self._pop_idle(entry)
+                if pooled is not None:
+                    break
+                if entry.size < self.max_per_server and (
+                    self.total_clients < self.max_total or self._evict_lru_idle(exclude=key)
+                ):
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhaustedError(
+                        f"No MCP stdio client available for server {entry.server_id} "
+                        f"within {self.acquire_timeout_seconds}s"
+                    )
+                waited_since = waited_since or time.perf_counter()
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    continue
+            if waited_since is not None:
+                mcp_pool_wait_time_seconds.labels(
+                    server_id=entry.server_id, transport_type=TRANSPORT
+                ).observe(time.perf_counter() - waited_since)
+            entry.in_use += 1
+            entry.last_acquired = time.monotonic()
+
+        if pooled is None:
+            try:
+                pooled = await self._spawn(key, entry)
+            except BaseException:
+                async with self._condition:
+                    entry.in_use -= 1
+                    self._condition.notify_all()
+                self._update_gauges()
+                raise
+            mcp_pool_client_creations_total.labels(**labels).inc()
+        else:
+            mcp_pool_client_reuses_total.labels(**labels).inc()
+
+        mcp_pool_acquisition_duration_seconds.labels(**labels).observe(time.perf_counter() - start)
+        self._update_gauges()
+        return pooled
+
+    async def _checkin(self, pooled: PooledClient, discard: bool = False) -> None:
+        """Return a client to its key's idle queue, or close it."""
+        entry = self._keys.get(pooled.key)
+        keep = not discard and not self._closed and pooled.alive and entry is not None
+        async with self._condition:
+            if entry is not None:
+                entry.in_use -= 1
+                if keep:
+                    pooled.last_used = time.monotonic()
+                    entry.idle.append(pooled)
+            self._condition.notify_all()
+        if not keep:
+            await self._close_client(pooled, reason="discarded")
+        self._update_gauges()
+
+    def _pop_idle(self, entry: PoolKey) -> PooledClient | None:
+        """Pop the most recently used live idle client, dropping dead ones."""
+        while entry.idle:
+            pooled = entry.idle.pop()
+            if pooled.alive:
+                return pooled
+            self._record_eviction()
+            logger.warning(
+                "Dropping crashed MCP stdio process from pool",
+                extra={"server_id": entry.server_id},
+            )
+        return None
+
+    def _evict_lru_idle(self, exclude: str) -> bool:
+        """Close the least recently used idle client of another key to free capacity."""
+        candidates = [
+            (entry.idle[0].last_used, key)
+            for key, entry in self._keys.items()
+            if key != exclude and entry.idle
+        ]
+        if not candidates:
+            return False
+        _, key = min(candidates)
+        pooled = self._keys[key].idle.popleft()
+        asyncio.create_task(self._close_client(pooled, reason="capacity"))
+        return True
+
+    async def _spawn(self, key: str, entry: PoolKey) -> PooledClient:
+        """Start, initialize and list tools on a new process."""
+        client = MCPStdioClient(entry.config)
+        try:
+            await client.__aenter__()
+            await client.initialize()
+            tools = await client.list_tools()
+        except BaseException:
+            await client.close()
+            raise
+        logger.info(
+            "Spawned pooled MCP stdio process",
+            extra={"server_id": entry.server_id, "pool_key": key, "tool_count": len(tools)},
+        )
+        return PooledClient(client=client, key=key, tools=tools)
+
+    async def _close_client(self, pooled: PooledClient, reason: str) -> None:
+        """Terminate a pooled process and count the eviction."""
+        self._record_eviction()
+        try:
+            await pooled.client.close()
+        except Exception as e:
+            logger.warning(
+                f"Error closing pooled MCP stdio process: {e}",
+                extra={"pool_key": pooled.key, "reason": reason},
+            )
+
+    async def maintain(self) -> None:
+        """
+        Run one maintenance pass.
+
+        - Drops crashed idle processes
+        - Evicts idle processes past the TTL beyond each key's minimum
+        - Probes remaining idle processes with tools/list (refreshing cached tools)
+        - Restarts processes for recently used keys below the minimum
+        - Forgets keys with no processes that have not been used recently
+        """
+        async with self._maintenance_lock:
+            self._last_maintenance = time.monotonic()
+            await self._maintain()
+
+    async def maintain_if_due(self) -> bool:
+        """
+        Run a maintenance pass if none ran for maintenance_interval_seconds.
+
+        Returns:
+            True if a pass ran
+        """
+        if time.monotonic() - self._last_maintenance < self.maintenance_interval_seconds:
+            return False
+        await self.maintain()
+        return True
+
+    async def _maintain(self) -> None:
+        from src.monitoring.metrics import mcp_pool_client_health_check_failures_total
+
+        now = time.monotonic()
+        to_close: list[tuple[PooledClient, str]] = []
+        to_probe: list[PooledClient] = []
+
+        async with self._condition:
+            for key, entry in list(self._keys.items()):
+                recent = now - entry.last_acquired < _KEY_RETENTION_SECONDS
+                keep_min = self.min_per_server if recent else 0
+                survivors: deque[PooledClient] = deque()
+                # Oldest idle first, so the most recently used survive
+                for pooled in entry.idle:
+                    if not pooled.alive:
+                        to_close.append((pooled, "crashed"))
+                    elif (
+                        now - pooled.last_used > self.idle_ttl_seconds
+                        and entry.in_use + len(survivors) >= keep_min
+                    ):
+                        to_close.append((pooled, "idle"))
+                    else:
+                        survivors.append(pooled)
+                entry.idle = deque()
+                # Probed clients count as in use until they are returned
+                entry.in_use += len(survivors)
+                to_probe.extend(survivors)
+                if not survivors and entry.in_use == 0 and not recent:
+                    del self._keys[key]
+
+        for pooled, reason in to_close:
+            await self._close_client(pooled, reason=reason)
+
+        for pooled in to_probe:
+            try:
+                pooled.tools = await asyncio.wait_for(
+                    pooled.client.list_tools(), timeout=self.probe_timeout_seconds
+                )
+                await self._checkin(pooled)
+            except Exception as e:
+                entry = self._keys.get(pooled.key)
+                mcp_pool_client_health_check_failures_total.labels(
+                    server_id=entry.server_id if entry else pooled.key,
+                    transport_type=TRANSPORT,
+                ).inc()
+                logger.warning(
+                    f"Pooled MCP stdio process failed health probe: {e}",
+                    extra={"pool_key": pooled.key, "error_type": type(e).__name__},
+                )
+                await self._checkin(pooled, discard=True)
+
+        await self._refill()
+        self._update_gauges()
+
+    async def _refill(self) -> None:
+        """Restart processes for recently used keys below the minimum size."""
+        now = time.monotonic()
+        for key, entry in list(self._keys.items()):
+            if now - entry.last_acquired >= _KEY_RETENTION_SECONDS:
+                continue
+            while entry.size < self.min_per_server and self.total_clients < self.max_total:
+                async with self._condition:
+                    entry.in_use += 1
+                try:
+                    pooled = await self._spawn(key, entry)
+                except Exception as e:
+                    async with self._condition:
+                        entry.in_use -= 1
+                    logger.warning(
+                        f"Failed to restart pooled MCP stdio process: {e}",
+                        extra={"server_id": entry.server_id, "error_type": type(e).__name__},
+                    )
+                    break
+                await self._checkin(pooled)
+
+    async def _run_maintenance(self) -> None:
+        """Background maintenance loop."""
+        while not self._closed:
+            await asyncio.sleep(self.maintenance_interval_seconds)
+            try:
+                await self.maintain_if_due()
+            except Exception as e:
+                logger.error(f"MCP stdio pool maintenance failed: {e}", exc_info=True)
+
+    async def close(self) -> None:
+        """Stop maintenance and terminate all idle processes (in-use ones close on release)."""
+        self._closed = True
+        if self._maintenance_task and not self._maintenance_task.done():
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+        async with self._condition:
+            idle = [pooled for entry in self._keys.values() for pooled in entry.idle]
+            for entry in self._keys.values():
+                entry.idle.clear()
+            self._condition.notify_all()
+        for pooled in idle:
+            await self._close_client(pooled, reason="shutdown")
+        self._update_gauges()
+
+    def abandon(self) -> None:
+        """
+        Kill all processes without awaiting (pool's event loop is gone).
+
+        Best effort: used when a new event loop replaces the pool's loop.
+        """
+        self._closed = True
+        for entry in self._keys.values():
+            for pooled in entry.idle:
+                process = pooled.client.process
+                if process is not None and process.returncode is None:
+                    try:
+                        process.kill()
+                    except Exception:
+                        pass
+            entry.idle.clear()
+        self._keys.clear()
+        self._update_gauges()
+
+    def _record_eviction(self) -> None:
+        from src.monitoring.metrics import mcp_pool_client_evictions_total
+
+        mcp_pool_client_evictions_total.labels(transport_type=TRANSPORT).inc()
+
+    def _update_gauges(self) -> None:
+        from src.monitoring.metrics import (
+            mcp_pool_active_clients,
+            mcp_pool_idle_clients,
+            mcp_pool_total_clients,
+        )
+
+        active = sum(entry.in_use for entry in self._keys.values())
+        idle = sum(len(entry.idle) for entry in self._keys.values())
+        mcp_pool_active_clients.labels(transport_type=TRANSPORT).set(active)
+        mcp_pool_idle_clients.labels(transport_type=TRANSPORT).set(idle)
+        mcp_pool_total_clients.labels(transport_type=TRANSPORT).set(active + idle)
+
+
+__all__ = [
+    "MCPStdioPool",
+    "PooledClient",
+    "PoolExhaustedError",
+    "config_hash",
+]
@@ -0,0 +1,99 @@
+"""
+MCP stdio Warm Pool Keys and Clients
+
+Records the MCP stdio warm pool (src/services/mcp_stdio_pool.py) keeps per
+server configuration and per process.
+
+Processes are keyed by a hash of (tenant_id, command, args, env): servers with
+identical configuration in the same tenant share processes, tenants never do.
+
+References:
+- Story 11.2.3: MCP Connection Pooling and Caching
+- src/services/mcp_stdio_pool.py
+"""
+
+import hashlib
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.schemas.mcp_server import MCPServerResponse
+from src.services.mcp_stdio_client import MCPStdioClient
+
+TRANSPORT = "stdio"
+
+
+def config_hash(server: Any) -> str:
+    """
+    Return the pool key for an MCP server configuration.
+
+    Args:
+        server: MCPServer row or MCPServerResponse (tenant_id, command, args, env)
+
+    Returns:
+        str: 16-hex-digit SHA-256 prefix of the tenant and launch configuration
+    """
+    payload = json.dumps(
+        {
+            "tenant_id": str(server.tenant_id),
+            "command": server.command,
+            "args": list(server.args or []),
+            "env": dict(server.env or {}),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def client_config(server: Any) -> MCPServerResponse:
+    """Minimal MCPStdioClient config (only transport fields are read)."""
+    return MCPServerResponse.model_construct(
+        transport_type=TRANSPORT,
+        command=server.command,
+        args=list(server.args or []),
+        env=dict(server.env or {}),
+    )
+
+
+@dataclass
+class PooledClient:
+    """An initialized MCPStdioClient owned by the pool."""
+
+    client: MCPStdioClient
+    key: str
+    tools: list[dict[str, Any]]
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def alive(self) -> bool:
+        """True while the subprocess is running and the client is open."""
+        process = self.client.process
+        return process is not None and process.returncode is None and not self.client._closed
+
+
+@dataclass
+class PoolKey:
+    """Per-configuration pool state."""
+
+    config: MCPServerResponse
+    server_id: str
+    tenant_id: str
+    idle: deque[PooledClient] = field(default_factory=deque)
+    in_use: int = 0
+    last_acquired: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return self.in_use + len(self.idle)
+
+
+__all__ = [
+    "TRANSPORT",
+    "PoolKey",
+    "PooledClient",
+    "client_config",
+    "config_hash",
+]
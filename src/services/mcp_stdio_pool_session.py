@@ -0,0 +1,102 @@
+"""
+MCP stdio Warm Pool Access
+
+Per-loop access to the MCP stdio warm pool (src/services/mcp_stdio_pool.py)
+and the session facade agent tools call it through.
+
+A pool is bound to the event loop it was created on (subprocess transports
+cannot move between loops); get_stdio_pool() returns the pool for the running
+loop. Celery workers run agent executions on a per-process loop so the pool
+survives between tasks. That loop only runs during tasks, so workers drive
+maintain_stdio_pool() from a thread while it is idle (see
+src/workers/tasks.py).
+
+References:
+- Story 11.2.3: MCP Connection Pooling and Caching
+- src/services/mcp_tool_bridge.py
+"""
+
+import asyncio
+from typing import Any
+
+from src.services.mcp_stdio_pool import MCPStdioPool
+
+
+class PooledMCPSession:
+    """
+    Session-like facade over the pool for one MCP server.
+
+    Each call borrows a warm client for the duration of that request only, so
+    tools built on it can be shared by concurrent executions. Return shapes
+    match MCPStdioClient (dicts with content / contents / messages).
+    """
+
+    def __init__(self, pool: MCPStdioPool, server: Any):
+        self.pool = pool
+        self.server = server
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return await self.pool.get_tools(self.server)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        async with self.pool.acquire(self.server) as client:
+            return await client.call_tool(name, arguments)
+
+    async def read_resource(self, uri: str) -> dict[str, Any]:
+        async with self.pool.acquire(self.server) as client:
+            return await client.read_resource(uri)
+
+    async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
+        async with self.pool.acquire(self.server) as client:
+            return await client.get_prompt(name, arguments)
+
+
+# Pool for the running event loop (one per process in practice)
+_pool: MCPStdioPool | None = None
+
+
+def get_stdio_pool() -> MCPStdioPool:
+    """
+    Return the warm pool for the running event loop, creating it if needed.
+
+    A pool left behind by a previous (closed) event loop is abandoned and its
+    processes killed.
+    """
+    global _pool
+
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool.loop not in (None, loop) or _pool._closed:
+        if _pool is not None and not _pool._closed:
+            _pool.abandon()
+        _pool = MCPStdioPool.from_settings()
+    _pool.start()
+    return _pool
+
+
+async def maintain_stdio_pool() -> bool:
+    """
+    Run due maintenance on the running loop's pool, if it has one.
+
+    Returns:
+        True if a maintenance pass ran
+    """
+    if _pool is None or _pool._closed or _pool.loop is not asyncio.get_running_loop():
+        return False
+    return await _pool.maintain_if_due()
+
+
+async def close_stdio_pool() -> None:
+    """Close the pool for the running event loop (worker shutdown)."""
+    global _pool
+
+    if _pool is not None and _pool.loop is asyncio.get_running_loop():
+        await _pool.close()
+    _pool = None
+
+
+__all__ = [
+    "PooledMCPSession",
+    "close_stdio_pool",
+    "get_stdio_pool",
+    "maintain_stdio_pool",
+]
@@ -7,9 +7,13 @@ for use in LangGraph agent execution workflows.
 Implements:
 - Tool conversion using langchain-mcp-adapters for primitive_type="tool"
 - Custom wrappers for resources (session.read_resource) and prompts (session.get_prompt)
-- Client lifecycle management (spawn, reuse, cleanup)
+- Client lifecycle management (spawn, reuse, cleanup); stdio servers are
+  served from the worker-level warm pool (mcp_stdio_pool_session.py) when enabled,
+  with tool wrappers built from the capability cache (mcp_capability_cache.py)
 - Error handling with graceful degradation
 - 30-second timeout enforcement
+- Opt-in result cache for read-only tools (mcp_tool_result_cache.py)
+- Oversized results spilled to paged storage (mcp_large_result_store.py)
 - OpenTelemetry distributed tracing (Story 12.8)
 
 References:
@@ -19,7 +23,10 @@ References:
 """
 
 import asyncio
+import dataclasses
+import json
 import logging
+from contextvars import ContextVar
 from typing import Any
 from uuid import UUID
 
@@ -28,11 +35,32 @@ from langchain_mcp_adapters.client import MultiServerMCPClient  # type: ignore[i
 from langchain_mcp_adapters.tools import load_mcp_tools  # type: ignore[import-untyped]
 from opentelemetry import trace
 
+from src.config import settings
 from src.database.models import MCPServer
+from src.services.mcp_capability_cache import get_capability_cache
+from src.services.mcp_large_result_store import (
+    PAGE_TOOL_NAME,
+    bound_tool_output,
+    get_large_result_store,
+)
+from src.services.mcp_stdio_pool_session import PooledMCPSession, get_stdio_pool
+from src.services.mcp_tool_result_cache import (
+    cache_policy,
+    get_cached_result,
+    result_cache_key,
+    store_result,
+)
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Execution the running tool calls belong to. Set by AgentExecutionService so a
+# bridge whose tools are reused across executions (cached agent executors)
+# still scopes cached results and spilled outputs to the current execution.
+current_execution_context_id: ContextVar[str | None] = ContextVar(
+    "mcp_execution_context_id", default=None
+)
+
 
 class MCPToolBridge:
     """
@@ -49,14 +77,22 @@ class MCPToolBridge:
         await bridge.cleanup()
     """
 
-    def __init__(self, mcp_servers: list[MCPServer]):
+    def __init__(
+        self,
+        mcp_servers: list[MCPServer],
+        execution_context_id: str | None = None,
+    ):
         """
         Initialize MCP Tool Bridge with MCP server configurations.
 
         Args:
             mcp_servers: List of active MCP server records from database.
+            execution_context_id: Execution the tools run in (scopes
+                execution-scoped cached tool results). Defaults to
+                current_execution_context_id at call time.
         """
         self.servers = mcp_servers
+        self._execution_context_id = execution_context_id
         self.client: MultiServerMCPClient | None = None
         self._initialized = False
         # BUGFIX (Story 11.1.7): Store active sessions to keep them alive during agent execution
@@ -64,6 +100,16 @@ class MCPToolBridge:
         # open for the entire agent execution lifecycle, not just during tool loading
         self._sessions: dict[str, Any] = {}  # Key: server_id, Value: session context manager
 
+    @property
+    def execution_context_id(self) -> str | None:
+        """Execution the tools are running for (explicit, else from context)."""
+        return self._execution_context_id or current_execution_context_id.get()
+
+    @property
+    def holds_execution_sessions(self) -> bool:
+        """Whether tools reference per-execution sessions closed by cleanup()."""
+        return bool(self._sessions)
+
     async def _initialize_client(self) -> None:
         """
         Initialize MultiServerMCPClient for all configured MCP servers.
@@ -187,44 +233,33 @@ class MCPToolBridge:
                     load_span.set_attribute("mcp.assignment_count", len(server_assignments))
 
                     try:
-                        # BUGFIX (Story 11.1.7): Manually manage session lifecycle to keep it alive
-                        # Reason: langchain_mcp_adapters tools reference the session, which must remain
-                        # open for the entire agent execution. Using 'async with' would close it when
-                        # get_langchain_tools() returns, causing ClosedResourceError during tool execution.
-
-                        server_id_str = str(server.id)
-
-                        # Manually enter the session context manager
-                        session_cm = self.client.session(server_id_str)
-                        session = await session_cm.__aenter__()
-
-                        # Store session for later cleanup (in cleanup() method)
-                        self._sessions[server_id_str] = session_cm
-
-                        logger.info(
-                            f"MCP session opened for server (will remain open until cleanup)",
-                            extra={"server_id": server_id_str, "server_name": server.name},
-                        )
-
-                        # Story 12.8 AC1: Span for MCP client connection
-                        with tracer.start_as_current_span("mcp.client.connect") as connect_span:
-                            connect_span.set_attribute("mcp.server_id", str(server.id))
-                            connect_span.set_attribute("mcp.server_name", server.name)
-                            # Connection happens in context manager, so we just track it
-
-                        # Story 12.8 AC1: Span for listing tools from server
-                        with tracer.start_as_current_span("mcp.client.list_tools") as list_span:
-                            list_span.set_attribute("mcp.server_id", str(server.id))
-                            # Load all tools from server (primitive_type="tool")
-                            server_tools = await asyncio.wait_for(load_mcp_tools(session), timeout=30.0)
-                            list_span.set_attribute("mcp.tools_discovered", len(server_tools))
-
-                        # Filter tools by assignments (only include assigned tools)
                         assigned_tool_names = {
                             a["name"]
                             for a in server_assignments
                             if a.get("mcp_primitive_type") == "tool"
                         }
+
+                        if self._uses_stdio_pool(server):
+                            # Warm pooled processes shared across executions; the
+                            # server is only contacted when a tool is invoked
+                            session = PooledMCPSession(get_stdio_pool(), server)
+                            tool_specs = await self._cached_tool_specs(
+                                server, session, assigned_tool_names
+                            )
+                            load_span.set_attribute(
+                                "mcp.discovery_version",
+                                get_capability_cache().for_server(server).discovery_version,
+                            )
+
+                            server_tools = [
+                                self._create_pooled_tool_wrapper(server, spec, session)
+                                for spec in tool_specs
+                                if spec.get("name") in assigned_tool_names
+                            ]
+                        else:
+                            session, server_tools = await self._open_session_tools(server)
+
+                        # Filter tools by assignments (only include assigned tools)
                         filtered_tools = [t for t in server_tools if t.name in assigned_tool_names]
 
                         # Story 12.8 AC1: Span for validating filtered tools
@@ -295,14 +330,18 @@ class MCPToolBridge:
                         )
                         load_span.set_attribute("mcp.error", type(e).__name__)
 
-                logger.info(
-                    f"MCP Tool Bridge created {len(langchain_tools)} LangChain tools",
-                    extra={"total_tool_count": len(langchain_tools)},
-                )
+            if langchain_tools and settings.mcp_large_result_enabled:
+                # Lets the agent page through results spilled by bound_tool_output()
+                langchain_tools.append(self._create_result_page_tool())
+
+            logger.info(
+                f"MCP Tool Bridge created {len(langchain_tools)} LangChain tools",
+                extra={"total_tool_count": len(langchain_tools)},
+            )
 
-                parent_span.set_attribute("mcp.total_tools_loaded", len(langchain_tools))
+            parent_span.set_attribute("mcp.total_tools_loaded", len(langchain_tools))
 
-                return langchain_tools
+            return langchain_tools
         finally:
             # Restore LoggingProxy wrappers if we changed them
             if is_celery:
@@ -310,6 +349,209 @@ class MCPToolBridge:
                 sys.stderr = original_stderr
                 logger.info("Restored Celery LoggingProxy wrappers after get_langchain_tools()")
 
+    def _uses_stdio_pool(self, server: MCPServer) -> bool:
+        """Whether tools for this server are served from the stdio warm pool."""
+        return settings.mcp_pool_enabled and (server.transport_type or "stdio") == "stdio"
+
+    async def _cached_tool_specs(
+        self, server: MCPServer, session: PooledMCPSession, assigned_tool_names: set[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Tool definitions for a server from the capability cache.
+
+        Built from the discovered_tools column at the row's discovery_version,
+        so no process is spawned here. Only a server that was never discovered
+        (or is missing an assigned tool) is asked for tools/list, and the
+        result is cached for that version.
+
+        Returns:
+            Tool definitions (name, description, inputSchema).
+        """
+        cache = get_capability_cache()
+        capabilities = cache.for_server(server)
+        if all(capabilities.tool(name) for name in assigned_tool_names):
+            return list(capabilities.tools)
+
+        with tracer.start_as_current_span("mcp.client.list_tools") as list_span:
+            list_span.set_attribute("mcp.server_id", str(server.id))
+            list_span.set_attribute("mcp.pooled", True)
+            tool_specs = await asyncio.wait_for(session.list_tools(), timeout=30.0)
+            list_span.set_attribute("mcp.tools_discovered", len(tool_specs))
+
+        cache.put(
+            dataclasses.replace(
+                capabilities, tools=tuple(spec for spec in tool_specs if isinstance(spec, dict))
+            )
+        )
+        return tool_specs
+
+    async def _open_session_tools(self, server: MCPServer) -> tuple[Any, list[BaseTool]]:
+        """
+        Open a per-execution MultiServerMCPClient session and load its tools.
+
+        Returns:
+            Tuple of (session, all tools exposed by the server).
+        """
+        assert self.client is not None
+
+        # BUGFIX (Story 11.1.7): Manually manage session lifecycle to keep it alive
+        # Reason: langchain_mcp_adapters tools reference the session, which must remain
+        # open for the entire agent execution. Using 'async with' would close it when
+        # get_langchain_tools() returns, causing ClosedResourceError during tool execution.
+        server_id_str = str(server.id)
+
+        # Manually enter the session context manager
+        session_cm = self.client.session(server_id_str)
+        session = await session_cm.__aenter__()
+
+        # Store session for later cleanup (in cleanup() method)
+        self._sessions[server_id_str] = session_cm
+
+        logger.info(
+            "MCP session opened for server (will remain open until cleanup)",
+            extra={"server_id": server_id_str, "server_name": server.name},
+        )
+
+        # Story 12.8 AC1: Span for MCP client connection
+        with tracer.start_as_current_span("mcp.client.connect") as connect_span:
+            connect_span.set_attribute("mcp.server_id", str(server.id))
+            connect_span.set_attribute("mcp.server_name", server.name)
+            # Connection happens in context manager, so we just track it
+
+        # Story 12.8 AC1: Span for listing tools from server
+        with tracer.start_as_current_span("mcp.client.list_tools") as list_span:
+            list_span.set_attribute("mcp.server_id", str(server.id))
+            # Load all tools from server (primitive_type="tool")
+            server_tools = await asyncio.wait_for(load_mcp_tools(session), timeout=30.0)
+            list_span.set_attribute("mcp.tools_discovered", len(server_tools))
+
+        return session, server_tools
+
+    def _create_pooled_tool_wrapper(
+        self, server: MCPServer, tool_spec: dict[str, Any], session: PooledMCPSession
+    ) -> BaseTool:
+        """
+        Create LangChain tool for an MCP tool served by the stdio warm pool.
+
+        Args:
+            server: MCP server configuration.
+            tool_spec: Tool definition from tools/list (name, description, inputSchema).
+            session: Pooled session; each call borrows a warm process.
+
+        Returns:
+            LangChain BaseTool calling tools/call on a pooled process. Its
+            ToolMessages carry an artifact {"cache_hit": bool} telling whether
+            the result came from the tool result cache.
+        """
+        tool_name = tool_spec["name"]
+
+        async def call_mcp_tool(**arguments: Any) -> tuple[str, dict[str, bool]]:
+            """Call an MCP tool on a pooled server process (output, cache artifact)."""
+            with tracer.start_as_current_span("mcp.tool.execute") as exec_span:
+                exec_span.set_attribute("mcp.tool_name", tool_name)
+                exec_span.set_attribute("mcp.primitive_type", "tool")
+                exec_span.set_attribute("mcp.server_id", str(server.id))
+                exec_span.set_attribute("mcp.server_name", server.name)
+
+                # Read-only tools with a cache policy: identical calls are served from Redis
+                policy = cache_policy(server, tool_name)
+                cache_key = None
+                if policy is not None:
+                    cache_key = result_cache_key(
+                        server, tool_name, arguments, policy, self.execution_context_id
+                    )
+                    cached = await get_cached_result(server, tool_name, cache_key)
+                    exec_span.set_attribute("mcp.cache_hit", cached is not None)
+                    if cached is not None:
+                        exec_span.set_attribute("mcp.execution_success", True)
+                        output = await bound_tool_output(cached, tool_name, self.execution_context_id)
+                        return output, {"cache_hit": True}
+
+                try:
+                    with tracer.start_as_current_span("mcp.client.call_tool") as call_span:
+                        call_span.set_attribute("mcp.operation", "call_tool")
+                        call_span.set_attribute("mcp.transport_type", "stdio")
+                        call_span.set_attribute("mcp.pooled", True)
+
+                        result = await asyncio.wait_for(
+                            session.call_tool(tool_name, arguments), timeout=30.0
+                        )
+
+                    exec_span.set_attribute("mcp.execution_success", True)
+                    text = _content_to_text(result.get("content", []))
+                    if cache_key is not None and not result.get("is_error"):
+                        await store_result(cache_key, text, policy)
+                    output = await bound_tool_output(text, tool_name, self.execution_context_id)
+                    return output, {"cache_hit": False}
+
+                except asyncio.TimeoutError:
+                    error_msg = f"MCP tool call timeout (>30s): {tool_name}"
+                    logger.error(error_msg, extra={"tool_name": tool_name, "server_name": server.name})
+
+                    exec_span.set_attribute("mcp.execution_success", False)
+                    exec_span.set_attribute("error.type", "TimeoutError")
+                    exec_span.set_attribute("error.message", error_msg)
+
+                    return f"Error: {error_msg}", {"cache_hit": False}
+
+                except Exception as e:
+                    error_msg = f"MCP tool call failed: {e}"
+                    logger.error(
+                        error_msg,
+                        extra={
+                            "tool_name": tool_name,
+                            "server_name": server.name,
+                            "error_type": type(e).__name__,
+                        },
+                    )
+
+                    exec_span.set_attribute("mcp.execution_success", False)
+                    exec_span.set_attribute("error.type", type(e).__name__)
+                    exec_span.set_attribute("error.message", str(e))
+
+                    return f"Error: {error_msg}", {"cache_hit": False}
+
+        return StructuredTool(
+            name=tool_name,
+            description=tool_spec.get("description") or f"MCP tool from {server.name}",
+            args_schema=tool_spec.get("inputSchema") or {"type": "object", "properties": {}},
+            coroutine=call_mcp_tool,
+            # The artifact travels on the ToolMessage into the execution trace
+            response_format="content_and_artifact",
+        )
+
+    def _create_result_page_tool(self) -> BaseTool:
+        """
+        Create the tool that pages through spilled tool results.
+
+        Only handles spilled by this bridge's execution can be read.
+
+        Returns:
+            LangChain BaseTool returning one page of a spilled result.
+        """
+
+        async def read_mcp_result_page(handle: str, page: int = 1) -> str:
+            """Read one page of a large MCP tool result by its handle."""
+            store = get_large_result_store()
+            try:
+                text = await store.read_page(handle, page, self.execution_context_id)
+            except KeyError:
+                return f"Error: unknown or expired result handle '{handle}'"
+            except IndexError:
+                spilled = store.get(handle)
+                return f"Error: page {page} out of range (1-{spilled.page_count if spilled else 0})"
+            spilled = store.get(handle)
+            return f"[{spilled.tool_name} result '{handle}', page {page}/{spilled.page_count}]\n{text}"
+
+        return StructuredTool.from_function(
+            coroutine=read_mcp_result_page,
+            name=PAGE_TOOL_NAME,
+            description=(
+                "Read one page (1-based) of a large MCP tool result that was stored "
+                "under a handle instead of being returned in full."
+            ),
+        )
+
     def _create_resource_wrapper(
         self, server: MCPServer, assignment: dict[str, Any], session: Any
     ) -> BaseTool:
@@ -360,7 +602,9 @@ class MCPToolBridge:
                         response = str(result)
 
                     exec_span.set_attribute("mcp.execution_success", True)
-                    return response
+                    return await bound_tool_output(
+                        response, resource_name, self.execution_context_id
+                    )
 
                 except asyncio.TimeoutError:
                     error_msg = f"MCP resource read timeout (>30s): {uri}"
@@ -494,6 +738,9 @@ class MCPToolBridge:
         that were opened in get_langchain_tools() to keep tools functional during
         agent execution.
         """
+        if self.execution_context_id is not None:
+            get_large_result_store().purge(self.execution_context_id)
+
         # Close all active sessions
         if self._sessions:
             logger.info(
@@ -530,3 +777,11 @@ class MCPToolBridge:
                     f"Error during MCP Tool Bridge cleanup: {e}",
                     extra={"error_type": type(e).__name__},
                 )
+
+
+def _content_to_text(content: list[dict[str, Any]]) -> str:
+    """Flatten MCP content blocks into the text returned to the LLM."""
+    texts = [block.get("text", "") for block in content if block.get("type") == "text"]
+    if texts and len(texts) == len(content):
+        return "\n".join(texts)
+    return json.dumps(content)
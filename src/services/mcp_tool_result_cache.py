@@ -0,0 +1,169 @@
+"""
+MCP tool result cache.
+
+Agents repeatedly call the same read-only MCP tools (issue lookups, inventory
+queries) with identical arguments within minutes. Tools opted in through
+mcp_servers.tool_cache_policies are answered from Redis for identical
+arguments until the policy TTL expires, instead of re-running the remote
+tool.
+
+Keys combine the server id, its discovery_version (a changed tool schema
+invalidates old results), the tool name, and a SHA-256 of the cache scope
+(tenant or execution) plus canonical JSON arguments, so argument order and
+whitespace never cause misses and no argument value appears in a key.
+
+Only successful results are stored. Redis errors fail open: the tool is
+called as if the cache were empty.
+
+Functions:
+    - cache_policy(): Effective policy for a tool, or None if not cacheable
+    - canonical_arguments(): Stable JSON encoding of tool arguments
+    - result_cache_key(): Redis key for one tool call
+    - get_cached_result(): Cached result text, or None
+    - store_result(): Cache a result text for the policy TTL
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.config import settings
+from src.schemas.mcp_server import MCPToolCachePolicy
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "mcp:tool_result"
+
+
+def cache_policy(server: Any, tool_name: str) -> MCPToolCachePolicy | None:
+    """
+    Result cache policy for a tool, if its results may be cached.
+
+    Args:
+        server: MCPServer row carrying tool_cache_policies
+        tool_name: MCP tool name
+
+    Returns:
+        MCPToolCachePolicy for a read-only tool, None otherwise (including
+        when the cache is disabled or the stored policy is invalid)
+    """
+    if not settings.mcp_tool_result_cache_enabled:
+        return None
+    raw = (getattr(server, "tool_cache_policies", None) or {}).get(tool_name)
+    if not raw:
+        return None
+    try:
+        policy = MCPToolCachePolicy.model_validate(raw)
+    except ValidationError:
+        logger.warning(
+            "Ignoring invalid MCP tool cache policy",
+            extra={"server_id": str(server.id), "tool_name": tool_name},
+        )
+        return None
+    return policy if policy.read_only else None
+
+
+def canonical_arguments(arguments: dict[str, Any]) -> str:
+    """Arguments as compact JSON with sorted keys (equal dicts encode equally)."""
+    return json.dumps(
+        arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+
+
+def result_cache_key(
+    server: Any,
+    tool_name: str,
+    arguments: dict[str, Any],
+    policy: MCPToolCachePolicy,
+    execution_context_id: str | None = None,
+) -> str:
+    """
+    Redis key for one tool call.
+
+    Args:
+        server: MCPServer row (id, tenant_id, discovery_version)
+        tool_name: MCP tool name
+        arguments: Tool arguments
+        policy: Policy returned by cache_policy()
+        execution_context_id: Execution the call belongs to (execution scope)
+
+    Returns:
+        str: mcp:tool_result:{server_id}:{discovery_version}:{tool_name}:{digest}
+    """
+    if policy.scope == "execution":
+        scope = f"execution:{execution_context_id}"
+    else:
+        scope = f"tenant:{server.tenant_id}"
+    digest = hashlib.sha256(
+        f"{scope}\n{canonical_arguments(arguments)}".encode("utf-8")
+    ).hexdigest()
+    version = int(getattr(server, "discovery_version", None) or 0)
+    return f"{KEY_PREFIX}:{server.id}:{version}:{tool_name}:{digest}"
+
+
+def _redis():
+    from src.cache.redis_client import get_shared_redis
+
+    return get_shared_redis()
+
+
+def _record_lookup(server: Any, tool_name: str, outcome: str) -> None:
+    from src.monitoring.metrics import mcp_tool_result_cache_lookups_total
+
+    mcp_tool_result_cache_lookups_total.labels(
+        server_id=str(server.id), tool_name=tool_name, outcome=outcome
+    ).inc()
+
+
+async def get_cached_result(server: Any, tool_name: str, key: str) -> str | None:
+    """
+    Cached result text for a key, or None on a miss or Redis error.
+
+    Args:
+        server: MCPServer row (metrics labels)
+        tool_name: MCP tool name (metrics labels)
+        key: Key from result_cache_key()
+    """
+    try:
+        cached = await _redis().get(key)
+    except Exception as e:
+        logger.warning(
+            f"MCP tool result cache read failed, calling tool: {e}",
+            extra={"tool_name": tool_name, "error_type": type(e).__name__},
+        )
+        _record_lookup(server, tool_name, "error")
+        return None
+
+    _record_lookup(server, tool_name, "miss" if cached is None else "hit")
+    if isinstance(cached, bytes):
+        cached = cached.decode("utf-8")
+    return cached
+
+
+async def store_result(key: str, result: str, policy: MCPToolCachePolicy) -> None:
+    """
+    Cache a successful result for the policy TTL (best-effort).
+
+    Results larger than mcp_tool_result_cache_max_bytes are not stored.
+    """
+    if len(result.encode("utf-8")) > settings.mcp_tool_result_cache_max_bytes:
+        return
+    try:
+        await _redis().set(key, result, ex=policy.ttl_seconds)
+    except Exception as e:
+        logger.warning(
+            f"MCP tool result cache write failed: {e}",
+            extra={"error_type": type(e).__name__},
+        )
+
+
+__all__ = [
+    "cache_policy",
+    "canonical_arguments",
+    "get_cached_result",
+    "result_cache_key",
+    "store_result",
+]
@@ -23,6 +23,7 @@ from src.schemas.memory import (
     MemoryItem,
     MemoryState,
 )
+from src.services.memory_embeddings import EmbeddingInput, embedding_to_text, embedding_values
 from src.utils.logger import logger
 
 
@@ -147,7 +148,7 @@ class MemoryConfigService:
         tenant_id: str,
         memory_type: str,
         content: Dict,
-        embedding: Optional[str] = None,
+        embedding: Optional[EmbeddingInput] = None,
     ) -> MemoryItem:
         """
         Store new memory with optional embedding.
@@ -160,7 +161,7 @@ class MemoryConfigService:
             tenant_id: Tenant identifier for isolation
             memory_type: Memory type (short_term, long_term, agentic)
             content: Memory content (flexible JSONB)
-            embedding: Optional vector embedding (text format, 1536 dims)
+            embedding: Optional vector embedding (JSON text or floats, 1536 dims)
 
         Returns:
             MemoryItem: Created memory item
@@ -203,7 +204,7 @@ class MemoryConfigService:
             tenant_id=tenant_id,
             memory_type=memory_type,
             content=content,
-            embedding=embedding,
+            embedding=embedding_values(embedding),
             retention_days=retention_days,
         )
 
@@ -220,7 +221,7 @@ class MemoryConfigService:
             agent_id=memory.agent_id,
             memory_type=memory.memory_type,
             content=memory.content,
-            embedding=memory.embedding,
+            embedding=embedding_to_text(memory.embedding),
             retention_days=memory.retention_days,
             created_at=memory.created_at,
             updated_at=memory.updated_at,
@@ -230,15 +231,16 @@ class MemoryConfigService:
         self,
         agent_id: UUID,
         tenant_id: str,
-        query_embedding: Optional[str] = None,
+        query_embedding: Optional[EmbeddingInput] = None,
         memory_type: Optional[str] = None,
         limit: int = 5,
     ) -> List[MemoryItem]:
         """
         Retrieve memories with optional vector similarity search.
 
-        If query_embedding is provided, performs pgvector cosine similarity search.
-        Otherwise, returns most recent memories by created_at DESC.
+        If query_embedding is provided, performs pgvector cosine similarity search
+        (served by the HNSW index idx_agent_memory_embedding_hnsw). Otherwise,
+        returns most recent memories by created_at DESC.
 
         Args:
             agent_id: Agent UUID
@@ -271,15 +273,15 @@ class MemoryConfigService:
 
         # Reason: Use vector similarity search if query embedding provided
         if query_embedding:
-            # pgvector cosine similarity search using <-> operator
-            # Note: Requires pgvector extension and vector index created
+            # pgvector cosine distance (<=>), the operator the HNSW index is
+            # built for; the query vector is a bound parameter
             stmt = (
                 select(AgentMemory)
                 .where(and_(*conditions))
                 .where(AgentMemory.embedding.isnot(None))
                 .order_by(
-                    text(f"embedding <-> '{query_embedding}'::vector")
-                )  # Cosine distance
+                    AgentMemory.embedding.cosine_distance(embedding_values(query_embedding))
+                )
                 .limit(limit)
             )
         else:
@@ -304,7 +306,7 @@ class MemoryConfigService:
                 agent_id=m.agent_id,
                 memory_type=m.memory_type,
                 content=m.content,
-                embedding=m.embedding,
+                embedding=embedding_to_text(m.embedding),
                 retention_days=m.retention_days,
                 created_at=m.created_at,
                 updated_at=m.updated_at,
@@ -0,0 +1,36 @@
+"""
+Agent memory embedding conversions.
+
+AgentMemory.embedding is a pgvector column: it is written as a list of floats
+and read back as a numpy array. EmbeddingService and MemoryItem.embedding use
+JSON text. These helpers convert between the two for the memory service and
+API.
+
+Story 8.15: Memory Configuration UI
+"""
+
+import json
+from typing import Any, List, Optional, Sequence, Union
+
+# Embedding as JSON text (EmbeddingService format) or a sequence of floats
+EmbeddingInput = Union[str, Sequence[float]]
+
+
+def embedding_values(embedding: Optional[EmbeddingInput]) -> Optional[List[float]]:
+    """Embedding as a list of floats for the vector column."""
+    if embedding is None:
+        return None
+    if isinstance(embedding, str):
+        return json.loads(embedding)
+    return [float(v) for v in embedding]
+
+
+def embedding_to_text(embedding: Optional[Any]) -> Optional[str]:
+    """
+    Embedding read from the vector column (numpy array) as JSON text.
+
+    JSON text is the format of MemoryItem.embedding and EmbeddingService.
+    """
+    if embedding is None or isinstance(embedding, str):
+        return embedding
+    return json.dumps([float(v) for v in embedding])
@@ -14,6 +14,7 @@ from src.services.openapi_parser_service import (
     parse_openapi_spec,
 )
 from src.services.mcp_tool_generator import generate_mcp_tools_from_openapi, count_generated_tools
+from src.services.tool_catalog_cache import invalidate_tool_catalog
 
 
 def get_encryption_cipher() -> Fernet:
@@ -89,6 +90,7 @@ class OpenAPIToolService:
         self.db.add(db_tool)
         await self.db.commit()
         await self.db.refresh(db_tool)
+        await invalidate_tool_catalog(db_tool.tenant_id)
 
         return db_tool, tools_count
 
@@ -122,4 +124,5 @@ class OpenAPIToolService:
 
         await self.db.commit()
         await self.db.refresh(tool)
+        await invalidate_tool_catalog(tool.tenant_id)
         return tool
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import AgentPromptVersion
 from src.schemas.agent import PromptVersionDetail, PromptVersionResponse
+from src.services.agent_execution.agent_snapshot import invalidate_agent_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +194,7 @@ class PromptVersionService:
         await self.db.execute(stmt)
 
         await self.db.commit()
+        await invalidate_agent_snapshot(agent_id)
         await self.db.refresh(new_version)
 
         return PromptVersionResponse.from_orm(new_version)
@@ -274,5 +276,6 @@ class PromptVersionService:
         await self.db.execute(stmt)
 
         await self.db.commit()
+        await invalidate_agent_snapshot(agent_id)
 
         return True
@@ -0,0 +1,423 @@
+"""
+Redis spend ledger for local budget enforcement.
+
+Mirrors each tenant's LiteLLM spend in a Redis hash so budget checks are a
+single Redis round trip instead of a LiteLLM /user/info request per LLM call.
+
+- Every LiteLLM response adds its reported cost (x-litellm-response-cost,
+  computed by LiteLLM from token usage) with an atomic HINCRBYFLOAT
+- The reconcile_spend_ledger beat task overwrites spend with LiteLLM's
+  authoritative figure and refreshes the tenant's budget limits
+- Entries expire when reconciliation stops; callers then fall back to
+  querying LiteLLM directly (fail-open, like RateLimiter)
+- Before each call, BudgetAdmissionTransport reserves the call's estimated
+  cost and rejects it if spend plus in-flight reservations would cross the
+  grace limit; the reservation is released when the response completes
+"""
+
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+import httpx
+from loguru import logger
+
+# Response header carrying LiteLLM's computed cost for the request (USD)
+LITELLM_COST_HEADER = "x-litellm-response-cost"
+
+# Only increment entries that were seeded by reconciliation; a bare counter
+# without budget limits would be useless and never expire.
+# KEYS[1]=ledger hash; ARGV[1]=cost
+_RECORD_SPEND_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HINCRBYFLOAT', KEYS[1], 'spend', ARGV[1])
+end
+return false
+"""
+
+# Reserve an estimated cost if spend + live reservations + amount stays under
+# the grace limit. Reservations are "amount:expiry" fields so crashed workers
+# cannot pin budget forever.
+# KEYS[1]=ledger hash, KEYS[2]=reservations hash
+# ARGV: now, amount, reservation_id, ttl
+# Returns -1 (no ledger entry), 0 (denied) or 1 (reserved)
+_RESERVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local now = tonumber(ARGV[1])
+local amount = tonumber(ARGV[2])
+local spend = tonumber(redis.call('HGET', KEYS[1], 'spend') or '0')
+local max_budget = tonumber(redis.call('HGET', KEYS[1], 'max_budget') or '0')
+local grace = tonumber(redis.call('HGET', KEYS[1], 'grace_threshold') or '110')
+local reserved = 0
+local items = redis.call('HGETALL', KEYS[2])
+for i = 1, #items, 2 do
+    local amt, exp = string.match(items[i + 1], '([^:]+):([^:]+)')
+    if tonumber(exp) < now then
+        redis.call('HDEL', KEYS[2], items[i])
+    else
+        reserved = reserved + tonumber(amt)
+    end
+end
+if spend + reserved + amount > max_budget * grace / 100 then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[2] .. ':' .. tostring(now + tonumber(ARGV[4])))
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[4]))
+return 1
+"""
+
+# Error type in the synthetic 402 body returned for denied calls
+BUDGET_ADMISSION_ERROR_TYPE = "budget_admission_denied"
+
+
+@dataclass
+class LedgerEntry:
+    """
+    Cached budget state for one tenant.
+
+    Attributes:
+        tenant_id: Tenant identifier
+        spend: Spend in USD (last reconciled value plus recorded costs)
+        max_budget: Maximum budget in USD
+        grace_threshold: Blocking threshold percentage (e.g., 110)
+        reconciled_at: Unix timestamp of the last reconciliation
+    """
+
+    tenant_id: str
+    spend: float
+    max_budget: float
+    grace_threshold: int
+    reconciled_at: float
+
+    @property
+    def grace_limit(self) -> float:
+        """Spend in USD at which execution is blocked."""
+        return self.max_budget * (self.grace_threshold / 100)
+
+    @property
+    def is_blocked(self) -> bool:
+        """True if spend has reached the grace limit."""
+        return self.spend >= self.grace_limit
+
+
+class SpendLedger:
+    """Redis-backed per-tenant spend counters."""
+
+    KEY_PREFIX = "budget:ledger:"
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        """
+        Initialize ledger.
+
+        Args:
+            ttl_seconds: Entry lifetime (defaults to settings.budget_ledger_ttl_seconds)
+        """
+        from src.config import get_settings
+
+        self.ttl_seconds = ttl_seconds or get_settings().budget_ledger_ttl_seconds
+
+    def _key(self, tenant_id: str) -> str:
+        return f"{self.KEY_PREFIX}{tenant_id}"
+
+    def _reservations_key(self, tenant_id: str) -> str:
+        return f"{self.KEY_PREFIX}{tenant_id}:reservations"
+
+    @staticmethod
+    def _redis():
+        from src.cache.redis_client import get_shared_redis
+
+        return get_shared_redis()
+
+    async def get(self, tenant_id: str) -> Optional[LedgerEntry]:
+        """
+        Read a tenant's ledger entry.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            LedgerEntry, or None if the tenant has no reconciled entry
+
+        Raises:
+            redis.RedisError: If Redis is unavailable (callers fail open)
+        """
+        data = await self._redis().hgetall(self._key(tenant_id))
+        if not data or "max_budget" not in data:
+            return None
+        return LedgerEntry(
+            tenant_id=tenant_id,
+            spend=float(data.get("spend", 0.0)),
+            max_budget=float(data["max_budget"]),
+            grace_threshold=int(data.get("grace_threshold", 110)),
+            reconciled_at=float(data.get("reconciled_at", 0.0)),
+        )
+
+    async def set(
+        self,
+        tenant_id: str,
+        spend: float,
+        max_budget: float,
+        grace_threshold: int,
+    ) -> None:
+        """
+        Overwrite a tenant's entry with authoritative values and refresh its TTL.
+
+        Args:
+            tenant_id: Tenant identifier
+            spend: Spend in USD reported by LiteLLM
+            max_budget: Maximum budget in USD
+            grace_threshold: Blocking threshold percentage
+        """
+        key = self._key(tenant_id)
+        async with self._redis().pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "spend": spend,
+                    "max_budget": max_budget,
+                    "grace_threshold": grace_threshold,
+                    "reconciled_at": time.time(),
+                },
+            )
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def record_spend(self, tenant_id: str, cost: float) -> Optional[float]:
+        """
+        Atomically add a call's cost to the tenant's spend.
+
+        Args:
+            tenant_id: Tenant identifier
+            cost: Cost in USD
+
+        Returns:
+            New spend, or None if the tenant has no entry yet (the next
+            reconciliation picks the cost up from LiteLLM)
+        """
+        if cost <= 0:
+            return None
+        result = await self._redis().eval(_RECORD_SPEND_SCRIPT, 1, self._key(tenant_id), cost)
+        return float(result) if result is not None else None
+
+    async def reserve(
+        self, tenant_id: str, reservation_id: str, amount: float, ttl_seconds: int
+    ) -> Optional[bool]:
+        """
+        Atomically reserve an estimated cost against the tenant's grace limit.
+
+        Args:
+            tenant_id: Tenant identifier
+            reservation_id: Unique ID used to release the reservation
+            amount: Estimated cost in USD
+            ttl_seconds: Reservation expiry
+
+        Returns:
+            True if reserved, False if the call would cross the grace limit,
+            None if the tenant has no ledger entry (admission not enforced)
+        """
+        result = await self._redis().eval(
+            _RESERVE_SCRIPT,
+            2,
+            self._key(tenant_id),
+            self._reservations_key(tenant_id),
+            time.time(),
+            amount,
+            reservation_id,
+            ttl_seconds,
+        )
+        result = int(result)
+        return None if result < 0 else bool(result)
+
+    async def release(self, tenant_id: str, reservation_id: str) -> None:
+        """
+        Release a reservation once the call's actual cost has been recorded.
+
+        Args:
+            tenant_id: Tenant identifier
+            reservation_id: ID passed to reserve()
+        """
+        await self._redis().hdel(self._reservations_key(tenant_id), reservation_id)
+
+    async def invalidate(self, tenant_id: str) -> None:
+        """
+        Drop a tenant's entry so the next check goes to LiteLLM.
+
+        Args:
+            tenant_id: Tenant identifier
+        """
+        await self._redis().delete(self._key(tenant_id), self._reservations_key(tenant_id))
+
+    async def invalidate_many(self, tenant_ids: List[str]) -> None:
+        """
+        Drop several tenants' entries in one round trip.
+
+        Args:
+            tenant_ids: Tenant identifiers
+        """
+        if not tenant_ids:
+            return
+        keys = [self._key(t) for t in tenant_ids] + [self._reservations_key(t) for t in tenant_ids]
+        await self._redis().delete(*keys)
+
+
+def spend_recording_hook(tenant_id: str):
+    """
+    Build an httpx response hook that records LiteLLM response costs.
+
+    Args:
+        tenant_id: Tenant whose ledger receives the costs
+
+    Returns:
+        Async callable for httpx.AsyncClient(event_hooks={"response": [...]})
+    """
+    ledger = SpendLedger()
+
+    async def _record(response: httpx.Response) -> None:
+        raw_cost = response.headers.get(LITELLM_COST_HEADER)
+        if not raw_cost:
+            return
+        try:
+            await ledger.record_spend(tenant_id, float(raw_cost))
+        except Exception as e:
+            # Fail open: reconciliation corrects any missed costs
+            logger.debug(f"Spend ledger update failed for tenant {tenant_id}: {e}")
+
+    return _record
+
+
+class _ReservationReleasingStream(httpx.AsyncByteStream):
+    """Response body wrapper that releases the cost reservation on close."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._stream.aclose()
+        finally:
+            await self._release()
+
+
+class BudgetAdmissionTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that reserves each LLM call's estimated cost.
+
+    Calls that would push spend plus in-flight reservations past the grace
+    limit get a synthetic 402 response (no provider round trip). Tenants
+    without a ledger entry, and Redis failures, are admitted (fail-open).
+    """
+
+    def __init__(
+        self,
+        tenant_id: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        estimator=None,
+        ledger: Optional[SpendLedger] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            tenant_id: Tenant whose budget admits the calls
+            transport: Underlying transport (defaults to httpx.AsyncHTTPTransport)
+            estimator: CostEstimator (defaults to a new instance)
+            ledger: SpendLedger (defaults to a new instance)
+        """
+        from src.config import get_settings
+        from src.services.cost_estimator import CostEstimator
+
+        self.tenant_id = tenant_id
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._estimator = estimator or CostEstimator()
+        self._ledger = ledger or SpendLedger()
+        self._ttl_seconds = get_settings().budget_reservation_ttl_seconds
+
+    async def _denied_response(self, request: httpx.Request, estimate) -> httpx.Response:
+        message = (
+            f"Budget admission denied for tenant {self.tenant_id}: estimated cost "
+            f"${estimate.estimated_cost:.4f} for {estimate.model} would exceed the grace limit"
+        )
+        error = {
+            "type": BUDGET_ADMISSION_ERROR_TYPE,
+            "message": message,
+            "tenant_id": self.tenant_id,
+            "estimated_cost": estimate.estimated_cost,
+        }
+        try:
+            entry = await self._ledger.get(self.tenant_id)
+        except Exception:
+            entry = None
+        if entry is not None:
+            error.update(
+                current_spend=entry.spend,
+                max_budget=entry.max_budget,
+                grace_threshold=entry.grace_threshold,
+            )
+        return httpx.Response(402, json={"error": error}, request=request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Reserve estimated cost, send the request, release on completion."""
+        try:
+            body = json.loads(request.content or b"{}")
+        except (ValueError, httpx.RequestNotRead):
+            body = None
+        estimate = await self._estimator.estimate(body) if isinstance(body, dict) else None
+        if estimate is None:
+            return await self._transport.handle_async_request(request)
+
+        reservation_id = uuid.uuid4().hex
+        try:
+            reserved = await self._ledger.reserve(
+                self.tenant_id, reservation_id, estimate.estimated_cost, self._ttl_seconds
+            )
+        except Exception as e:
+            logger.debug(f"Budget reservation failed for tenant {self.tenant_id}: {e}")
+            reserved = None
+
+        if reserved is False:
+            logger.warning(
+                f"Budget admission denied for tenant {self.tenant_id}",
+                extra={
+                    "tenant_id": self.tenant_id,
+                    "model": estimate.model,
+                    "estimated_cost": estimate.estimated_cost,
+                },
+            )
+            return await self._denied_response(request, estimate)
+        if reserved is None:
+            return await self._transport.handle_async_request(request)
+
+        async def _release() -> None:
+            try:
+                await self._ledger.release(self.tenant_id, reservation_id)
+            except Exception as e:
+                logger.debug(f"Budget reservation release failed for tenant {self.tenant_id}: {e}")
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            await _release()
+            raise
+
+        if isinstance(response.stream, httpx.ByteStream):
+            await _release()
+            return response
+        response.stream = _ReservationReleasingStream(response.stream, _release)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        await self._transport.aclose()
@@ -0,0 +1,302 @@
+"""
+Cluster-wide tool catalog cache.
+
+UnifiedToolService.list_tools() used to keep each tenant's tool catalog in a
+per-process 60 second TTLCache only, so every API replica and Celery worker
+rebuilt it from the database independently, and a catalog change stayed
+invisible for up to a minute. The catalog now has two levels:
+
+- L1: the in-process TTLCache (local_catalog), kept as a bounded safety net.
+- L2: Redis, under versioned keys. tool_catalog:{tenant}:version holds the
+  tenant's catalog version and tool_catalog:{tenant}:v{n} the serialized
+  catalog built at version n. Invalidation INCRs the version, so catalogs
+  built from data read before a change land under an old key nobody reads.
+
+Invalidations are also published on the tool_catalog:invalidate channel.
+Each process subscribes once per event loop and drains pending messages
+(non-blocking) before every L1 read, dropping the tenants' L1 entries; this
+works on the Celery worker's agent loop, which only runs while a task runs,
+without a background listener task. If the subscription breaks, the whole
+L1 is dropped, since messages may have been missed.
+
+Redis errors fail open: list_tools falls back to the L1 TTL and the database.
+
+Functions:
+    - local_key(): L1 key of a tenant's catalog
+    - record_lookup(): Count an L1/L2 lookup outcome
+    - sync_invalidations(): Apply invalidations published by other processes
+    - load_catalog(): L2 catalog version and tools of a tenant
+    - store_catalog(): Store a catalog built at a version in L2
+    - invalidate_tool_catalog(): Invalidate a tenant's catalog cluster-wide
+    - schedule_invalidation(): Fire-and-forget invalidation from sync code
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from cachetools import TTLCache
+from pydantic import TypeAdapter
+
+from src.config import settings
+from src.schemas.unified_tool import UnifiedTool
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "tool_catalog"
+CHANNEL = "tool_catalog:invalidate"
+
+# Seconds before retrying a failed pub/sub subscription
+_RESUBSCRIBE_BACKOFF_SECONDS = 5.0
+
+# L1: per-process catalogs, shared by every UnifiedToolService instance
+local_catalog: TTLCache[str, list[UnifiedTool]] = TTLCache(maxsize=100, ttl=60)
+
+_tool_list = TypeAdapter(list[UnifiedTool])
+
+
+def local_key(tenant_id: Any) -> str:
+    """L1 key of a tenant's catalog."""
+    return f"tools:{tenant_id}"
+
+
+def _version_key(tenant_id: Any) -> str:
+    return f"{KEY_PREFIX}:{tenant_id}:version"
+
+
+def _catalog_key(tenant_id: Any, version: int) -> str:
+    return f"{KEY_PREFIX}:{tenant_id}:v{version}"
+
+
+def _redis():
+    from src.cache.redis_client import get_shared_redis
+
+    return get_shared_redis()
+
+
+def record_lookup(level: str, outcome: str) -> None:
+    """Count a catalog lookup at a cache level (l1, l2); never raises."""
+    try:
+        from src.monitoring.metrics import tool_catalog_cache_lookups_total
+
+        tool_catalog_cache_lookups_total.labels(level=level, outcome=outcome).inc()
+    except Exception as e:
+        logger.debug(f"Failed to record tool catalog lookup metric: {e}")
+
+
+def _drop_local(tenant_id: Any) -> None:
+    local_catalog.pop(local_key(tenant_id), None)
+
+
+class _InvalidationSubscriber:
+    """Pub/sub subscription to CHANNEL on one event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self._pubsub: Any = None
+        self._retry_at = 0.0
+
+    async def drain(self) -> int:
+        """Apply every pending invalidation message; returns how many."""
+        if self._pubsub is None and not await self._subscribe():
+            return 0
+
+        applied = 0
+        try:
+            while True:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=0.0
+                )
+                if message is None:
+                    break
+                if message.get("type") == "message":
+                    _drop_local(message["data"])
+                    applied += 1
+        except Exception as e:
+            logger.warning(
+                f"Tool catalog invalidation subscription lost, dropping local catalogs: {e}",
+                extra={"error_type": type(e).__name__},
+            )
+            await self._reset()
+        return applied
+
+    async def _subscribe(self) -> bool:
+        if time.monotonic() < self._retry_at:
+            return False
+        pubsub = _redis().pubsub()
+        try:
+            await pubsub.subscribe(CHANNEL)
+        except Exception as e:
+            logger.warning(
+                f"Failed to subscribe to tool catalog invalidations: {e}",
+                extra={"error_type": type(e).__name__},
+            )
+            self._retry_at = time.monotonic() + _RESUBSCRIBE_BACKOFF_SECONDS
+            await _close_quietly(pubsub)
+            return False
+        # Invalidations published before the subscription are unknown
+        local_catalog.clear()
+        self._pubsub = pubsub
+        return True
+
+    async def _reset(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        self._retry_at = time.monotonic() + _RESUBSCRIBE_BACKOFF_SECONDS
+        local_catalog.clear()
+        await _close_quietly(pubsub)
+
+
+async def _close_quietly(pubsub: Any) -> None:
+    try:
+        await pubsub.aclose()
+    except Exception:
+        pass
+
+
+_subscriber: _InvalidationSubscriber | None = None
+
+
+async def sync_invalidations() -> None:
+    """
+    Apply invalidations published by other processes to the L1 catalog.
+
+    Subscribes on first use for the running event loop; a subscription
+    made on another loop is replaced, as its connection belongs to that loop.
+    """
+    global _subscriber
+
+    if not settings.tool_catalog_cache_enabled:
+        return
+    loop = asyncio.get_running_loop()
+    if _subscriber is None or _subscriber.loop is not loop:
+        _subscriber = _InvalidationSubscriber(loop)
+    await _subscriber.drain()
+
+
+async def load_catalog(tenant_id: str) -> tuple[int | None, list[UnifiedTool] | None]:
+    """
+    L2 catalog of a tenant.
+
+    Args:
+        tenant_id: Tenant ID string
+
+    Returns:
+        (version, tools): the tenant's current catalog version and the
+        catalog stored for it, or None for tools on a miss. version is None
+        when Redis is unavailable or the cache is disabled.
+    """
+    if not settings.tool_catalog_cache_enabled:
+        return None, None
+    try:
+        redis = _redis()
+        version = int(await redis.get(_version_key(tenant_id)) or 0)
+        raw = await redis.get(_catalog_key(tenant_id, version))
+    except Exception as e:
+        logger.warning(
+            f"Tool catalog cache read failed, querying database: {e}",
+            extra={"tenant_id": tenant_id, "error_type": type(e).__name__},
+        )
+        record_lookup("l2", "error")
+        return None, None
+
+    if raw is None:
+        record_lookup("l2", "miss")
+        return version, None
+    try:
+        tools = _tool_list.validate_json(raw)
+    except ValueError as e:
+        logger.warning(
+            f"Discarding unreadable cached tool catalog: {e}",
+            extra={"tenant_id": tenant_id, "version": version},
+        )
+        record_lookup("l2", "error")
+        return version, None
+    record_lookup("l2", "hit")
+    return version, tools
+
+
+async def store_catalog(tenant_id: str, version: int | None, tools: list[UnifiedTool]) -> None:
+    """
+    Store a catalog in L2 under the version read before it was built.
+
+    Args:
+        tenant_id: Tenant ID string
+        version: Version returned by load_catalog() (None skips the write)
+        tools: Catalog built from the database
+    """
+    if version is None or not settings.tool_catalog_cache_enabled:
+        return
+    try:
+        await _redis().set(
+            _catalog_key(tenant_id, version),
+            _tool_list.dump_json(tools),
+            ex=settings.tool_catalog_cache_ttl_seconds,
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to cache tool catalog: {e}",
+            extra={"tenant_id": tenant_id, "error_type": type(e).__name__},
+        )
+
+
+async def invalidate_tool_catalog(tenant_id: Any) -> None:
+    """
+    Invalidate a tenant's tool catalog in every process.
+
+    Drops the local L1 entry, bumps the tenant's L2 version and publishes
+    the tenant on CHANNEL. Call after committing the change.
+
+    Args:
+        tenant_id: Tenant whose tools, MCP servers or OpenAPI specs changed
+    """
+    from src.monitoring.metrics import tool_catalog_invalidations_total
+
+    tenant = str(tenant_id)
+    _drop_local(tenant)
+    tool_catalog_invalidations_total.inc()
+    if not settings.tool_catalog_cache_enabled:
+        return
+    try:
+        redis = _redis()
+        await redis.incr(_version_key(tenant))
+        await redis.publish(CHANNEL, tenant)
+    except Exception as e:
+        logger.warning(
+            f"Failed to publish tool catalog invalidation: {e}",
+            extra={"tenant_id": tenant, "error_type": type(e).__name__},
+        )
+    logger.debug(f"Tool catalog invalidated for tenant {tenant}")
+
+
+_pending: set[asyncio.Task] = set()
+
+
+def schedule_invalidation(tenant_id: Any) -> None:
+    """
+    Invalidate from synchronous code.
+
+    Drops the L1 entry immediately; the cluster-wide invalidation runs as a
+    task when called inside an event loop and is skipped otherwise.
+    """
+    _drop_local(tenant_id)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(invalidate_tool_catalog(tenant_id))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+__all__ = [
+    "CHANNEL",
+    "invalidate_tool_catalog",
+    "load_catalog",
+    "local_catalog",
+    "local_key",
+    "record_lookup",
+    "schedule_invalidation",
+    "store_catalog",
+    "sync_invalidations",
+]
@@ -6,11 +6,14 @@ multiple sources (OpenAPI tools and MCP servers), combining them into a unified
 for agent execution with LangChain/LangGraph.
 """
 
+import hashlib
+import json
 import logging
-from typing import Any
+import threading
+from typing import Any, Literal, Optional
 from uuid import UUID, uuid5, NAMESPACE_DNS
 
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 from pydantic import BaseModel, Field, create_model
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,9 +24,20 @@ from src.schemas.unified_tool import (
     SourceType,
     MCPPrimitiveType,
 )
+from src.services import tool_catalog_cache
 
 logger = logging.getLogger(__name__)
 
+# JSON Schema primitive types to Python types
+_JSON_TYPES: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
 
 class UnifiedToolService:
     """
@@ -35,11 +49,18 @@ class UnifiedToolService:
 
     Attributes:
         db: Async database session for querying tools and servers
-        _cache: TTL cache for tool lists (60 second expiration, max 100 entries)
+        _cache: L1 TTL cache for tool lists (60 second expiration, max 100 entries),
+            backed by the Redis L2 in tool_catalog_cache
     """
 
-    # Class-level cache shared across instances (60s TTL, max 100 entries)
-    _cache: TTLCache[str, list[UnifiedTool]] = TTLCache(maxsize=100, ttl=60)
+    # Class-level L1 cache shared across instances (60s TTL, max 100 entries);
+    # entries are dropped by invalidations published from any process
+    _cache: TTLCache[str, list[UnifiedTool]] = tool_catalog_cache.local_catalog
+
+    # Process-wide cache of generated argument models, keyed by model name and
+    # canonical schema hash; create_model is far costlier than a lookup
+    _schema_models: LRUCache[str, type[BaseModel]] = LRUCache(maxsize=1024)
+    _schema_models_lock = threading.Lock()
 
     def __init__(self, db: AsyncSession):
         """
@@ -56,7 +77,8 @@ class UnifiedToolService:
 
         Queries both OpenAPI tools and MCP servers, transforms them to unified format,
         handles deduplication (OpenAPI tools take precedence), and returns cached
-        results when available.
+        results when available: the in-process L1 first, then the Redis L2
+        shared by all API and worker processes.
 
         Args:
             tenant_id: Tenant ID string to filter tools
@@ -67,14 +89,24 @@ class UnifiedToolService:
         Performance:
             - First call: <500ms (p95) - database queries
             - Cached calls: <10ms (p95) - in-memory cache hit
-            - Cache TTL: 60 seconds
+            - L1 TTL: 60 seconds; L2 TTL: tool_catalog_cache_ttl_seconds
         """
-        cache_key = f"tools:{tenant_id}"
+        cache_key = tool_catalog_cache.local_key(tenant_id)
 
-        # Check cache first
+        # Check L1 first, after applying invalidations from other processes
+        await tool_catalog_cache.sync_invalidations()
         if cache_key in self._cache:
             logger.debug(f"Cache hit for tenant {tenant_id}")
+            tool_catalog_cache.record_lookup("l1", "hit")
             return self._cache[cache_key]
+        tool_catalog_cache.record_lookup("l1", "miss")
+
+        # Version is read before querying, so a catalog built from data that
+        # changes meanwhile is stored under the superseded version
+        version, cached_tools = await tool_catalog_cache.load_catalog(tenant_id)
+        if cached_tools is not None:
+            self._cache[cache_key] = cached_tools
+            return cached_tools
 
         logger.debug(f"Cache miss for tenant {tenant_id}, querying database")
 
@@ -97,6 +129,7 @@ class UnifiedToolService:
 
         # Cache results
         self._cache[cache_key] = deduplicated_tools
+        await tool_catalog_cache.store_catalog(tenant_id, version, deduplicated_tools)
 
         logger.info(
             f"Discovered {len(deduplicated_tools)} tools for tenant {tenant_id} "
@@ -457,44 +490,37 @@ class UnifiedToolService:
         """
         Convert JSON Schema to Pydantic BaseModel using create_model.
 
+        Generated models are memoized process-wide by model name and a hash of
+        the canonical (key-sorted) schema, so tools with unchanged schemas
+        reuse their model across conversions and executions.
+
         Args:
             schema: JSON Schema dict with properties and required fields
             model_name: Name for the generated Pydantic model
 
         Returns:
-            Dynamically created Pydantic BaseModel class
+            Dynamically created (or cached) Pydantic BaseModel class
         """
-        properties = schema.get("properties", {})
-        required = schema.get("required", [])
-
-        # Build field definitions for create_model
-        fields: dict[str, Any] = {}
-        for prop_name, prop_schema in properties.items():
-            # Map JSON Schema types to Python types (simplified)
-            json_type = prop_schema.get("type", "string")
-            python_type = {
-                "string": str,
-                "integer": int,
-                "number": float,
-                "boolean": bool,
-                "array": list,
-                "object": dict,
-            }.get(json_type, str)
-
-            # Determine if field is required
-            if prop_name in required:
-                fields[prop_name] = (
-                    python_type,
-                    Field(description=prop_schema.get("description", "")),
-                )
-            else:
-                fields[prop_name] = (
-                    python_type | None,
-                    Field(default=None, description=prop_schema.get("description", "")),
-                )
+        from src.monitoring.metrics import (
+            tool_schema_model_cache_lookups_total,
+            tool_schema_model_cache_size,
+        )
 
-        # Create dynamic Pydantic model
-        return create_model(f"{model_name}Args", **fields)
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+        key = f"{model_name}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+        with self._schema_models_lock:
+            model = self._schema_models.get(key)
+        if model is not None:
+            tool_schema_model_cache_lookups_total.labels(outcome="hit").inc()
+            return model
+
+        tool_schema_model_cache_lookups_total.labels(outcome="miss").inc()
+        model = _schema_to_model(schema, f"{model_name}Args")
+        with self._schema_models_lock:
+            self._schema_models[key] = model
+            tool_schema_model_cache_size.set(len(self._schema_models))
+        return model
 
     def invalidate_cache(self, tenant_id: str) -> None:
         """
@@ -505,10 +531,83 @@ class UnifiedToolService:
         - MCP server discovery is triggered
         - Tool is enabled/disabled
 
+        Drops the local entry immediately; inside an event loop, the
+        cluster-wide invalidation is scheduled as well. Async callers should
+        await tool_catalog_cache.invalidate_tool_catalog() instead.
+
         Args:
             tenant_id: Tenant ID string whose cache should be cleared
         """
-        cache_key = f"tools:{tenant_id}"
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-            logger.debug(f"Cache invalidated for tenant {tenant_id}")
+        tool_catalog_cache.schedule_invalidation(tenant_id)
+        logger.debug(f"Cache invalidated for tenant {tenant_id}")
+
+
+def _schema_to_model(schema: dict[str, Any], model_name: str) -> type[BaseModel]:
+    """
+    Build a Pydantic model for a JSON Schema object.
+
+    Nested objects become nested models, arrays are typed by their items
+    schema and enums become Literal types. Optional fields default to the
+    schema's default (None when absent).
+    """
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+
+    # Build field definitions for create_model
+    fields: dict[str, Any] = {}
+    for prop_name, prop_schema in properties.items():
+        if not isinstance(prop_schema, dict):
+            prop_schema = {}
+        python_type = _schema_type(prop_schema, f"{model_name}_{prop_name}")
+        description = prop_schema.get("description", "")
+
+        # Determine if field is required
+        if prop_name in required:
+            fields[prop_name] = (python_type, Field(description=description))
+        else:
+            fields[prop_name] = (
+                Optional[python_type],
+                Field(default=prop_schema.get("default"), description=description),
+            )
+
+    # Create dynamic Pydantic model
+    return create_model(model_name, **fields)
+
+
+def _schema_type(prop_schema: dict[str, Any], nested_name: str) -> Any:
+    """
+    Python type for one property schema (recursing into objects and arrays).
+
+    Nullable schemas ("null" in a type list, or nullable: true) become
+    Optional, required or not, so an explicit null argument validates.
+    """
+    json_type = prop_schema.get("type")
+    nullable = prop_schema.get("nullable") is True or (
+        isinstance(json_type, list) and "null" in json_type
+    )
+    python_type = _non_null_schema_type(prop_schema, nested_name)
+    return Optional[python_type] if nullable else python_type
+
+
+def _non_null_schema_type(prop_schema: dict[str, Any], nested_name: str) -> Any:
+    """Python type for one property schema, ignoring nullability."""
+    enum_values = prop_schema.get("enum")
+    if enum_values:
+        try:
+            return Literal[tuple(enum_values)]
+        except TypeError:
+            pass  # Unhashable enum members: fall back to the base type
+
+    json_type = prop_schema.get("type", "string")
+    if isinstance(json_type, list):
+        # ["string", "null"] style unions: _schema_type adds Optional
+        json_type = next((t for t in json_type if t != "null"), "string")
+
+    if json_type == "object" and prop_schema.get("properties"):
+        return _schema_to_model(prop_schema, nested_name)
+    if json_type == "array":
+        items = prop_schema.get("items")
+        if isinstance(items, dict) and items:
+            return list[_schema_type(items, f"{nested_name}_item")]  # type: ignore[misc]
+        return list
+    return _JSON_TYPES.get(json_type, str)
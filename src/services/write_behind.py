@@ -0,0 +1,352 @@
+"""
+Write-Behind Persistence for Execution Records
+
+Every agent execution and ticket enhancement used to commit its history
+rows one statement at a time on the task's hot path (pending insert,
+refresh, status update, trace insert), each a Postgres round trip and
+fsync. Workers instead hand finished row states to a per-process buffer,
+and a background flusher thread writes them as grouped multi-row upserts.
+
+Consistency:
+    - Rows are complete column sets keyed by primary key; a later state of
+      the same row replaces the buffered one, so a pending row followed by
+      its final state within one interval is written once, final.
+    - One flusher writes batches in order; a batch that failed because the
+      database was unavailable is re-queued, except rows with a newer
+      buffered state. Rows the database rejects are dropped and logged.
+    - Upserts never overwrite a row that already reached a final status.
+
+Durability:
+    Batches are flushed when max_batch_rows rows are pending or every
+    flush_interval_seconds, and on worker process shutdown (and at exit).
+    Rows of a process killed outright are lost only if buffered within
+    the last interval.
+
+With settings.write_behind_enabled off, persist_row() upserts and commits
+synchronously instead.
+
+Functions:
+    - persist_row(): Save a row state (buffered or synchronous)
+    - record_row(): Column values of an unsaved ORM record
+    - write_rows(): Grouped multi-row upserts on a session (caller commits)
+    - get_write_behind(): This process's buffer
+    - close_write_behind(): Flush and stop the buffer (worker shutdown)
+
+References:
+- src/workers/tasks.py (enhance_ticket, execute_agent)
+- src/workers/celery_app.py (worker_process_shutdown)
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import settings
+from src.database.models import AgentTestExecution, EnhancementHistory
+from src.database.tenant_context import set_db_tenant_context
+
+logger = logging.getLogger(__name__)
+
+# Final statuses per supported model; rows in them are never overwritten
+TERMINAL_STATUSES = {
+    EnhancementHistory: frozenset({"completed", "failed", "cancelled"}),
+    AgentTestExecution: frozenset({"success", "failed", "cancelled"}),
+}
+
+# Seconds close() waits for the final flush
+CLOSE_TIMEOUT_SECONDS = 10.0
+
+_RowKey = Tuple[type, Any]
+
+
+def record_row(record: Any) -> Dict[str, Any]:
+    """
+    Column values of an unsaved ORM record.
+
+    Unset columns with a default are left out, so the database fills them.
+
+    Args:
+        record: Transient EnhancementHistory/AgentTestExecution instance
+
+    Returns:
+        Dict of column name to value
+    """
+    row = {}
+    for column in record.__table__.columns:
+        value = getattr(record, column.key)
+        if value is None and (column.server_default is not None or column.default is not None):
+            continue
+        row[column.key] = value
+    return row
+
+
+async def write_rows(session: AsyncSession, model: type, rows: List[Dict[str, Any]]) -> None:
+    """
+    Upsert rows of one model, one multi-row statement per tenant (caller commits).
+
+    Each tenant's rows are written under its RLS context. Rows of one
+    statement must have the same columns, so rows are also grouped by them.
+
+    Args:
+        session: Session to write on
+        model: Supported model (see TERMINAL_STATUSES)
+        rows: Complete row states with primary key "id"
+    """
+    groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        groups[(row["tenant_id"], tuple(sorted(row)))].append(row)
+
+    table = model.__table__
+    for (tenant_id, columns), group in groups.items():
+        await set_db_tenant_context(session, tenant_id)
+        stmt = pg_insert(table).values(group)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: stmt.excluded[column] for column in columns if column != "id"},
+            where=table.c.status.notin_(TERMINAL_STATUSES[model]),
+        )
+        await session.execute(stmt)
+
+
+def _by_model(items) -> Dict[type, List[Dict[str, Any]]]:
+    by_model: Dict[type, List[Dict[str, Any]]] = defaultdict(list)
+    for (model, _), row in items:
+        by_model[model].append(row)
+    return by_model
+
+
+def _record_rows(items, outcome: str) -> None:
+    from src.monitoring.metrics import write_behind_rows_total
+
+    for model, rows in _by_model(items).items():
+        write_behind_rows_total.labels(table=model.__tablename__, outcome=outcome).inc(len(rows))
+
+
+class WriteBehindBuffer:
+    """
+    Per-process buffer of row states, flushed by a background thread.
+
+    The thread runs its own event loop and database engine, so task code
+    (on any loop, or none) only takes a lock to buffer a row.
+    """
+
+    def __init__(self, flush_interval_seconds: float, max_batch_rows: int) -> None:
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_rows = max_batch_rows
+        self._pending: Dict[_RowKey, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._engine = None
+        self._session_factory = None
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def put(self, model: type, row: Dict[str, Any]) -> None:
+        """Buffer the latest state of a row, replacing any buffered state of it."""
+        if model not in TERMINAL_STATUSES:
+            raise ValueError(f"Write-behind does not support {model.__name__}")
+        with self._cond:
+            self._pending[(model, row["id"])] = row
+            if len(self._pending) >= self.max_batch_rows:
+                self._cond.notify()
+        self.start()
+
+    def start(self) -> None:
+        """Start the flusher thread (idempotent)."""
+        with self._cond:
+            if self._thread is not None or self._stopping:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="write-behind-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def close(self, timeout: float = CLOSE_TIMEOUT_SECONDS) -> None:
+        """Flush everything pending and stop the flusher thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        if self.pending_count:
+            logger.error(
+                "Write-behind rows not persisted at shutdown",
+                extra={"pending_rows": self.pending_count},
+            )
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._stopping or len(self._pending) >= self.max_batch_rows,
+                        timeout=self.flush_interval_seconds,
+                    )
+                    stopping = self._stopping
+                flushed = loop.run_until_complete(self._flush())
+                if stopping and (not flushed or not self.pending_count):
+                    break
+                if not flushed:
+                    # Back off a full interval before retrying the database
+                    with self._cond:
+                        self._cond.wait_for(lambda: self._stopping, timeout=self.flush_interval_seconds)
+        finally:
+            loop.run_until_complete(self._dispose())
+            loop.close()
+
+    async def _flush(self) -> bool:
+        """
+        Write everything pending; False if the database was unavailable.
+
+        The batch is one transaction. If it fails, rows are retried one by
+        one: rows failing while others succeed are invalid and dropped, and
+        if none succeed all are re-queued (unless newer states arrived).
+        """
+        with self._cond:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return True
+
+        from src.monitoring.metrics import write_behind_flush_duration_seconds
+
+        started = time.perf_counter()
+        try:
+            await self._write(_by_model(batch.items()))
+        except Exception as e:
+            logger.warning(
+                f"Write-behind batch failed, writing rows individually: {e}",
+                extra={"rows": len(batch), "error_type": type(e).__name__},
+            )
+            failed = await self._write_individually(batch)
+            if len(failed) == len(batch):
+                logger.error(
+                    "Write-behind flush failed, will retry",
+                    extra={"rows": len(batch)},
+                )
+                with self._cond:
+                    # Rows buffered meanwhile are newer states
+                    for key, row in batch.items():
+                        self._pending.setdefault(key, row)
+                return False
+            for (model, row_id) in failed:
+                logger.error(
+                    "Write-behind row rejected by the database, dropped",
+                    extra={"table": model.__tablename__, "row_id": str(row_id)},
+                )
+            _record_rows(failed.items(), "dropped")
+            batch = {key: row for key, row in batch.items() if key not in failed}
+
+        write_behind_flush_duration_seconds.observe(time.perf_counter() - started)
+        _record_rows(batch.items(), "written")
+        return True
+
+    async def _write_individually(
+        self, batch: Dict[_RowKey, Dict[str, Any]]
+    ) -> Dict[_RowKey, Dict[str, Any]]:
+        """Write each row in its own transaction; returns the rows that failed."""
+        failed = {}
+        for key, row in batch.items():
+            try:
+                await self._write({key[0]: [row]})
+            except Exception:
+                failed[key] = row
+        return failed
+
+    async def _write(self, by_model: Dict[type, List[Dict[str, Any]]]) -> None:
+        if self._session_factory is None:
+            self._engine = create_async_engine(
+                settings.database_url, pool_size=1, max_overflow=0, pool_pre_ping=True
+            )
+            self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
+        async with self._session_factory() as session:
+            for model, rows in by_model.items():
+                await write_rows(session, model, rows)
+            await session.commit()
+
+    async def _dispose(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = self._session_factory = None
+
+
+_buffer: Optional[WriteBehindBuffer] = None
+_buffer_pid: Optional[int] = None
+_buffer_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehindBuffer:
+    """This process's buffer, created on first use (after any worker fork)."""
+    global _buffer, _buffer_pid
+
+    with _buffer_lock:
+        if _buffer is None or _buffer_pid != os.getpid():
+            _buffer = WriteBehindBuffer(
+                flush_interval_seconds=settings.write_behind_flush_interval_seconds,
+                max_batch_rows=settings.write_behind_max_batch_rows,
+            )
+            _buffer_pid = os.getpid()
+            atexit.register(_buffer.close)
+        return _buffer
+
+
+def close_write_behind() -> None:
+    """Flush and stop this process's buffer, if it has one (worker shutdown)."""
+    if _buffer is not None and _buffer_pid == os.getpid():
+        _buffer.close()
+
+
+async def persist_row(
+    model: type,
+    row: Dict[str, Any],
+    session: Optional[AsyncSession] = None,
+) -> None:
+    """
+    Save the latest state of an execution history row.
+
+    Buffered for write-behind when enabled; otherwise upserted and committed
+    on session (or a new session) before returning.
+
+    Args:
+        model: EnhancementHistory or AgentTestExecution
+        row: Complete row state with primary key "id" (see record_row())
+        session: Session for the synchronous path
+    """
+    if settings.write_behind_enabled:
+        get_write_behind().put(model, row)
+        return
+
+    if session is None:
+        from src.database.session import get_async_session_maker
+
+        async with get_async_session_maker()() as own_session:
+            await write_rows(own_session, model, [row])
+            await own_session.commit()
+        return
+
+    await write_rows(session, model, [row])
+    await session.commit()
+
+
+__all__ = [
+    "TERMINAL_STATUSES",
+    "WriteBehindBuffer",
+    "close_write_behind",
+    "get_write_behind",
+    "persist_row",
+    "record_row",
+    "write_rows",
+]
@@ -21,7 +21,7 @@ import logging
 import redis
 from celery import Celery
 from celery.exceptions import Retry
-from celery.signals import task_prerun, worker_process_init
+from celery.signals import task_prerun, worker_process_init, worker_process_shutdown
 from celery.schedules import crontab
 
 from src.config import settings
@@ -93,6 +93,33 @@ def init_celery_tracing(*args, **kwargs) -> None:  # type: ignore
         logger.error(f"Failed to register Jira plugin in worker: {str(e)}", exc_info=True)
         # Continue startup despite plugin registration failure
 
+
+@worker_process_shutdown.connect(weak=False)
+def close_mcp_stdio_pool(*args, **kwargs) -> None:  # type: ignore
+    """
+    Terminate warm MCP stdio processes when a worker process exits.
+
+    Pooled server processes (e.g. npx/uvx children) would otherwise outlive
+    the worker. Pooled MCP HTTP connections are closed as well.
+    """
+    from src.workers.tasks import shutdown_agent_event_loop
+
+    shutdown_agent_event_loop()
+
+
+@worker_process_shutdown.connect(weak=False)
+def flush_write_behind(*args, **kwargs) -> None:  # type: ignore
+    """
+    Flush buffered execution history rows when a worker process exits.
+
+    The write-behind buffer (src/services/write_behind.py) would otherwise
+    lose rows buffered since its last flush.
+    """
+    from src.services.write_behind import close_write_behind
+
+    close_write_behind()
+
+
 # Validate secrets before initializing Celery application
 try:
     validate_secrets()
@@ -174,6 +201,30 @@ celery_app.conf.beat_schedule = {
             'expires': 1800,  # Task expires after 30 minutes if not executed
         },
     },
+    # Spend ledger reconciliation - runs every 60 seconds
+    'reconcile-spend-ledger-60s': {
+        'task': 'tasks.reconcile_spend_ledger',
+        'schedule': 60.0,  # Every 60 seconds
+        'options': {
+            'expires': 55,  # Task expires after 55 seconds if not executed
+        },
+    },
+    # LLM spend daily rollup - runs every 5 minutes
+    'rollup-llm-spend-5m': {
+        'task': 'tasks.rollup_llm_spend',
+        'schedule': 300.0,  # Every 5 minutes
+        'options': {
+            'expires': 280,  # Task expires after 280 seconds if not executed
+        },
+    },
+    # Legacy memory embedding backfill - every 5 minutes (no-op once done)
+    'backfill-memory-embeddings-5m': {
+        'task': 'tasks.backfill_memory_embeddings',
+        'schedule': 300.0,  # Every 5 minutes
+        'options': {
+            'expires': 280,  # Task expires after 280 seconds if not executed
+        },
+    },
     # MCP server health check task - runs every 30 seconds (Story 11.1.8)
     'mcp-health-check-30s': {
         'task': 'tasks.mcp_health_check',
@@ -10,9 +10,11 @@ per tech spec requirements.
 """
 
 import asyncio
+import os
+import threading
 from datetime import datetime, UTC
 from time import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
@@ -43,6 +45,119 @@ except ImportError:
     enhancement_duration_seconds = None
     enhancement_success_rate = None
 
+try:
+    from src.monitoring.metrics import (
+        budget_job_duration_seconds,
+        budget_job_rows_total,
+    )
+    BUDGET_JOB_METRICS_ENABLED = True
+except ImportError:
+    BUDGET_JOB_METRICS_ENABLED = False
+    budget_job_duration_seconds = None
+    budget_job_rows_total = None
+
+
+# Per-process event loop for agent executions. Subprocess transports are bound
+# to the loop that created them, so reusing one loop (rather than a fresh loop
+# per task) lets the MCP stdio warm pool keep server processes alive between
+# executions.
+_agent_event_loop: asyncio.AbstractEventLoop | None = None
+# Held while the loop runs; tasks and the idle maintenance thread take turns
+_agent_loop_lock = threading.Lock()
+# PID of the process whose idle maintenance thread is running (threads don't survive fork)
+_idle_maintenance_pid: int | None = None
+
+
+def get_agent_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return this worker process's agent execution event loop, creating it once.
+
+    Returns:
+        asyncio.AbstractEventLoop: Open loop set as the thread's current loop
+    """
+    global _agent_event_loop
+
+    if _agent_event_loop is None or _agent_event_loop.is_closed():
+        _agent_event_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_agent_event_loop)
+    _start_idle_maintenance()
+    return _agent_event_loop
+
+
+def run_on_agent_loop(coro: Any) -> Any:
+    """Run a coroutine to completion on the agent event loop (blocks idle maintenance)."""
+    with _agent_loop_lock:
+        return get_agent_event_loop().run_until_complete(coro)
+
+
+def maintain_idle_agent_loop() -> bool:
+    """
+    Run due MCP stdio pool maintenance on the agent loop unless a task is using it.
+
+    The loop only runs while tasks execute, so the pool's own maintenance
+    loop (idle TTL eviction, health probes, restarts) stalls between tasks.
+
+    Returns:
+        True if a maintenance pass ran
+    """
+    from src.services.mcp_stdio_pool_session import maintain_stdio_pool
+
+    if not _agent_loop_lock.acquire(blocking=False):
+        return False
+    try:
+        loop = _agent_event_loop
+        if loop is None or loop.is_closed():
+            return False
+        return loop.run_until_complete(maintain_stdio_pool())
+    except Exception as e:
+        logger.warning(f"Idle MCP stdio pool maintenance failed: {e}")
+        return False
+    finally:
+        _agent_loop_lock.release()
+
+
+def _run_idle_maintenance() -> None:
+    from src.config import settings
+
+    while True:
+        threading.Event().wait(settings.mcp_pool_cleanup_interval_seconds)
+        maintain_idle_agent_loop()
+
+
+def _start_idle_maintenance() -> None:
+    """Start this process's idle maintenance thread once (after fork)."""
+    global _idle_maintenance_pid
+
+    from src.config import settings
+
+    if _idle_maintenance_pid == os.getpid() or not settings.mcp_pool_enabled:
+        return
+    _idle_maintenance_pid = os.getpid()
+    threading.Thread(
+        target=_run_idle_maintenance, name="agent-loop-idle-maintenance", daemon=True
+    ).start()
+
+
+def shutdown_agent_event_loop() -> None:
+    """Close pooled MCP processes/connections and the agent event loop (worker shutdown)."""
+    global _agent_event_loop
+
+    with _agent_loop_lock:
+        if _agent_event_loop is None or _agent_event_loop.is_closed():
+            return
+
+        from src.services.mcp_http_pool import close_http_pool
+        from src.services.mcp_stdio_pool_session import close_stdio_pool
+
+        try:
+            _agent_event_loop.run_until_complete(close_stdio_pool())
+            _agent_event_loop.run_until_complete(close_http_pool())
+        except Exception as e:
+            logger.error(f"Failed to close MCP pools: {e}")
+        finally:
+            _agent_event_loop.close()
+            _agent_event_loop = None
+
 
 @celery_app.task(
     bind=True,
@@ -143,6 +258,14 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
     7. Update enhancement_history with result
     8. Log all lifecycle events with correlation ID
 
+    enhancement_history rows are saved through the worker's write-behind
+    buffer (see write_behind), so the pending row and its final state cost
+    no round trips on the task's path.
+
+    A cancel request for the job (see execution_cancellation) is checked
+    before each phase; a cancelled enhancement is recorded with status
+    'cancelled', leaves the ticket untouched and is not retried.
+
     Args:
         self: Celery task instance (injected by bind=True)
         job_data: EnhancementJob serialized as dict from Redis containing:
@@ -156,7 +279,7 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
 
     Returns:
         Dict[str, Any]: Enhancement result containing:
-            - status: "completed" or "failed"
+            - status: "completed", "failed" or "cancelled"
             - ticket_id: ServiceDesk Plus ticket ID
             - enhancement_id: Database enhancement_history record ID (UUID)
             - processing_time_ms: Total processing time in milliseconds
@@ -198,10 +321,18 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
     from src.workflows.enhancement_workflow import execute_context_gathering
     from src.services.llm_synthesis import synthesize_enhancement
     from src.services.servicedesk_client import update_ticket_with_enhancement
+    from src.services.execution_cancellation import (
+        CANCELLED_STATUS,
+        ExecutionCancelledError,
+        raise_if_cancelled,
+        record_cancellation,
+    )
+    from src.services.write_behind import persist_row
     from sqlalchemy import select
 
     start_time = time()
     enhancement_id = None
+    enhancement_row: Optional[Dict[str, Any]] = None
     tenant_id = job_data.get("tenant_id", "unknown")
     context_gathered = {}
     llm_output = ""
@@ -268,7 +399,7 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
 
             # Run async operations in sync Celery task
             async def run_enhancement_pipeline():
-                nonlocal enhancement_id, context_gathered, llm_output
+                nonlocal enhancement_id, enhancement_row, context_gathered, llm_output
 
                 async with get_async_session_maker()() as session:
                     # Set tenant context for RLS (Story 3.1)
@@ -303,24 +434,21 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
                     )
 
                     # Task 1.4: Create enhancement_history record with status='pending'
-                    enhancement = EnhancementHistory(
-                        tenant_id=job.tenant_id,
-                        ticket_id=job.ticket_id,
-                        status="pending",
-                        context_gathered=None,
-                        llm_output=None,
-                        error_message=None,
-                        processing_time_ms=None,
-                        created_at=datetime.now(UTC),
-                        completed_at=None,
-                        correlation_id=correlation_id,
-                    )
-                    session.add(enhancement)
-                    await session.commit()
-                    await session.refresh(enhancement)
-
-                    nonlocal enhancement_id
-                    enhancement_id = str(enhancement.id)
+                    # (write-behind; the ID is assigned here, not by a refresh)
+                    enhancement_row = {
+                        "id": uuid.uuid4(),
+                        "tenant_id": job.tenant_id,
+                        "ticket_id": job.ticket_id,
+                        "status": "pending",
+                        "context_gathered": None,
+                        "llm_output": None,
+                        "error_message": None,
+                        "processing_time_ms": None,
+                        "created_at": datetime.now(UTC),
+                        "completed_at": None,
+                    }
+                    await persist_row(EnhancementHistory, enhancement_row, session)
+                    enhancement_id = str(enhancement_row["id"])
 
                     logger.info(
                         "Enhancement history record created with status=pending",
@@ -332,6 +460,9 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
                         },
                     )
 
+                    # Obsolete jobs stop before each phase (also covers cancel while queued)
+                    await raise_if_cancelled(job.tenant_id, job.job_id)
+
                     # Task 2: Orchestrate Context Gathering (Story 2.8 Integration)
                     logger.info(
                         "Starting context gathering phase",
@@ -428,6 +559,8 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
                             "workflow_execution_time_ms": 30000,
                         }
 
+                    await raise_if_cancelled(job.tenant_id, job.job_id)
+
                     # Task 3: Integrate LLM Synthesis (Story 2.9 Integration)
                     logger.info(
                         "Starting LLM synthesis phase",
@@ -489,6 +622,8 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
                         )
                         llm_output = _format_context_fallback(context_gathered)
 
+                    await raise_if_cancelled(job.tenant_id, job.job_id)
+
                     # Task 4: Update ServiceDesk Plus Ticket (Story 2.10 Integration)
                     logger.info(
                         "Starting ServiceDesk Plus API update phase",
@@ -543,18 +678,15 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
                     processing_time_ms = int((time() - start_time) * 1000)
 
                     # Task 5.2: Update enhancement_history on success
-                    stmt = select(EnhancementHistory).where(EnhancementHistory.id == enhancement_id)
-                    result = await session.execute(stmt)
-                    enhancement = result.scalar_one_or_none()
-
-                    if enhancement:
-                        enhancement.status = "completed"
-                        enhancement.completed_at = datetime.now(UTC)
-                        enhancement.processing_time_ms = processing_time_ms
-                        enhancement.llm_output = llm_output
-                        enhancement.context_gathered = json.dumps(context_gathered, default=str)
-                        enhancement.correlation_id = correlation_id
-                        await session.commit()
+                    enhancement_row = {
+                        **enhancement_row,
+                        "status": "completed",
+                        "completed_at": datetime.now(UTC),
+                        "processing_time_ms": processing_time_ms,
+                        "llm_output": llm_output,
+                        "context_gathered": json.dumps(context_gathered, default=str),
+                    }
+                    await persist_row(EnhancementHistory, enhancement_row, session)
 
                     logger.info(
                         "Enhancement completed and history updated",
@@ -611,6 +743,38 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
 
             return result
 
+    except ExecutionCancelledError:
+        processing_time_ms = int((time() - start_time) * 1000)
+        logger.info(
+            "Task enhance_ticket cancelled",
+            extra={
+                "correlation_id": correlation_id,
+                "task_id": self.request.id,
+                "ticket_id": job_data.get("ticket_id"),
+                "tenant_id": tenant_id,
+                "enhancement_id": enhancement_id,
+                "processing_time_ms": processing_time_ms,
+            },
+        )
+        record_cancellation("enhancement")
+
+        if enhancement_row:
+            asyncio.run(persist_row(EnhancementHistory, {
+                **enhancement_row,
+                "status": CANCELLED_STATUS,
+                "error_message": "Enhancement cancelled on request",
+                "processing_time_ms": processing_time_ms,
+                "completed_at": datetime.now(UTC),
+            }))
+
+        # Returning (not raising) skips autoretry
+        return {
+            "status": CANCELLED_STATUS,
+            "ticket_id": job_data.get("ticket_id"),
+            "enhancement_id": enhancement_id,
+            "processing_time_ms": processing_time_ms,
+        }
+
     except SoftTimeLimitExceeded:
         processing_time_ms = int((time() - start_time) * 1000)
         logger.warning(
@@ -626,24 +790,14 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         # Update enhancement_history to failed
-        if enhancement_id:
-            async def mark_timeout():
-                async with get_async_session_maker()() as session:
-                    from sqlalchemy import select
-                    stmt = select(EnhancementHistory).where(
-                        EnhancementHistory.id == enhancement_id
-                    )
-                    result = await session.execute(stmt)
-                    enhancement = result.scalar_one_or_none()
-                    if enhancement:
-                        enhancement.status = "failed"
-                        enhancement.error_message = "Task exceeded soft time limit (100s)"
-                        enhancement.processing_time_ms = processing_time_ms
-                        enhancement.completed_at = datetime.now(UTC)
-                        enhancement.correlation_id = correlation_id
-                        await session.commit()
-
-            asyncio.run(mark_timeout())
+        if enhancement_row:
+            asyncio.run(persist_row(EnhancementHistory, {
+                **enhancement_row,
+                "status": "failed",
+                "error_message": "Task exceeded soft time limit (100s)",
+                "processing_time_ms": processing_time_ms,
+                "completed_at": datetime.now(UTC),
+            }))
 
         raise
 
@@ -678,24 +832,14 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         # Update enhancement_history to failed
-        if enhancement_id:
-            async def mark_failed():
-                async with get_async_session_maker()() as session:
-                    from sqlalchemy import select
-                    stmt = select(EnhancementHistory).where(
-                        EnhancementHistory.id == enhancement_id
-                    )
-                    result = await session.execute(stmt)
-                    enhancement = result.scalar_one_or_none()
-                    if enhancement:
-                        enhancement.status = "failed"
-                        enhancement.error_message = f"{type(exc).__name__}: {str(exc)}"
-                        enhancement.processing_time_ms = processing_time_ms
-                        enhancement.completed_at = datetime.now(UTC)
-                        enhancement.correlation_id = correlation_id
-                        await session.commit()
-
-            asyncio.run(mark_failed())
+        if enhancement_row:
+            asyncio.run(persist_row(EnhancementHistory, {
+                **enhancement_row,
+                "status": "failed",
+                "error_message": f"{type(exc).__name__}: {str(exc)}",
+                "processing_time_ms": processing_time_ms,
+                "completed_at": datetime.now(UTC),
+            }))
 
         # Task 10: Record Prometheus metrics for failure
         if METRICS_ENABLED:
@@ -724,22 +868,45 @@ def enhance_ticket(self: Task, job_data: Dict[str, Any]) -> Dict[str, Any]:
     time_limit=300,  # 5 minutes hard limit
     soft_time_limit=240,  # 4 minutes soft limit
 )
-def execute_agent(self: Task, agent_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+def execute_agent(
+    self: Task,
+    agent_id: str,
+    payload: Dict[str, Any],
+    execution_id: Optional[str] = None,
+    user_message: Optional[str] = None,
+    timeout_seconds: int = 240,
+    callback_url: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Execute AI agent with given payload (Story 8.6 - Implementation).
 
-    This task handles agent execution triggered via webhook endpoints.
+    This task handles agent execution triggered via webhook endpoints and
+    asynchronous execution jobs (POST /api/agent-execution/jobs).
     Loads agent configuration, executes LLM with system prompt and payload,
     saves execution trace, and returns results.
 
+    Jobs pass the execution_id of their queued AgentTestExecution record:
+    every attempt then updates that record (running, retrying, final
+    status) and the final status is published to long-polling clients and
+    the callback URL (see agent_execution.jobs).
+
+    Executions cancelled through the API (see execution_cancellation) stop
+    before their next LLM turn or tool call, or before starting if still
+    queued, are recorded as cancelled and are not retried.
+
     Args:
         self: Celery task instance (injected by bind=True)
         agent_id: UUID of agent to execute
-        payload: Webhook payload data (validated against agent's payload_schema)
+        payload: Webhook payload data (validated against agent's payload_schema),
+            or the prompt variable context of a job
+        execution_id: Job execution UUID (None: new execution per attempt)
+        user_message: Job user message (None: built from the payload)
+        timeout_seconds: Job execution timeout (capped by the soft time limit)
+        callback_url: URL the finished job is POSTed to
 
     Returns:
         Dict[str, Any]: Execution result containing:
-            - status: "completed" | "failed"
+            - status: "completed" | "failed" | "cancelled"
             - agent_id: Agent UUID
             - execution_id: Unique execution identifier (UUID)
             - result: Agent execution output (when completed)
@@ -765,9 +932,16 @@ def execute_agent(self: Task, agent_id: str, payload: Dict[str, Any]) -> Dict[st
 
     from src.database.models import Agent, AgentTestExecution
     from src.config import settings
+    from src.services.agent_execution.jobs import JOB_RETRYING
+    from src.services.execution_cancellation import (
+        CANCELLED_STATUS,
+        ExecutionCancelledError,
+        record_cancellation,
+    )
 
     start_time = time()
-    execution_id = str(uuid.uuid4())
+    is_job = execution_id is not None
+    execution_id = execution_id or str(uuid.uuid4())
 
     try:
         logger.info(
@@ -780,14 +954,63 @@ def execute_agent(self: Task, agent_id: str, payload: Dict[str, Any]) -> Dict[st
             },
         )
 
-        # Run async code synchronously in Celery worker
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(_execute_agent_async(agent_id, payload, execution_id, start_time, self.request.id))
-        loop.close()
+        # Run async code synchronously in Celery worker, on the per-process
+        # agent loop so warm MCP stdio processes survive between tasks
+        result = run_on_agent_loop(
+            _execute_agent_async(
+                agent_id,
+                payload,
+                execution_id,
+                start_time,
+                self.request.id,
+                user_message=user_message,
+                timeout_seconds=timeout_seconds,
+                callback_url=callback_url,
+                is_job=is_job,
+            )
+        )
 
         return result
 
+    except ExecutionCancelledError as exc:
+        processing_time_ms = int((time() - start_time) * 1000)
+        logger.info(
+            "Task execute_agent cancelled",
+            extra={
+                "task_id": self.request.id,
+                "agent_id": agent_id,
+                "execution_id": execution_id,
+                "processing_time_ms": processing_time_ms,
+            },
+        )
+        record_cancellation("agent")
+
+        # Recorded as final; returning (not raising) skips autoretry
+        try:
+            run_on_agent_loop(
+                _save_failed_execution(
+                    agent_id,
+                    payload,
+                    execution_id,
+                    exc,
+                    processing_time_ms,
+                    self.request.id,
+                    status=CANCELLED_STATUS,
+                    user_message=user_message,
+                    callback_url=callback_url,
+                    is_job=is_job,
+                )
+            )
+        except Exception as save_exc:
+            logger.error(f"Failed to save cancelled execution: {save_exc}")
+
+        return {
+            "status": CANCELLED_STATUS,
+            "agent_id": agent_id,
+            "execution_id": execution_id,
+            "processing_time_ms": processing_time_ms,
+        }
+
     except Exception as exc:
         processing_time_ms = int((time() - start_time) * 1000)
         attempt_number = self.request.retries
@@ -805,12 +1028,24 @@ def execute_agent(self: Task, agent_id: str, payload: Dict[str, Any]) -> Dict[st
             },
         )
 
-        # Save failed execution to database
+        # Save failed execution to database; a job's record stays open while
+        # Celery still retries it
+        final_attempt = attempt_number >= self.retry_kwargs.get("max_retries", self.max_retries)
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(_save_failed_execution(agent_id, payload, execution_id, exc, processing_time_ms, self.request.id))
-            loop.close()
+            run_on_agent_loop(
+                _save_failed_execution(
+                    agent_id,
+                    payload,
+                    execution_id,
+                    exc,
+                    processing_time_ms,
+                    self.request.id,
+                    status="failed" if final_attempt or not is_job else JOB_RETRYING,
+                    user_message=user_message,
+                    callback_url=callback_url,
+                    is_job=is_job,
+                )
+            )
         except Exception as save_exc:
             logger.error(f"Failed to save failed execution: {save_exc}")
 
@@ -818,7 +1053,17 @@ def execute_agent(self: Task, agent_id: str, payload: Dict[str, Any]) -> Dict[st
         raise
 
 
-async def _execute_agent_async(agent_id: str, payload: Dict[str, Any], execution_id: str, start_time: float, task_id: str) -> Dict[str, Any]:
+async def _execute_agent_async(
+    agent_id: str,
+    payload: Dict[str, Any],
+    execution_id: str,
+    start_time: float,
+    task_id: str,
+    user_message: Optional[str] = None,
+    timeout_seconds: int = 240,
+    callback_url: Optional[str] = None,
+    is_job: bool = False,
+) -> Dict[str, Any]:
     """
     Execute agent using AgentExecutionService (with full MCP tool support).
 
@@ -835,36 +1080,49 @@ async def _execute_agent_async(agent_id: str, payload: Dict[str, Any], execution
         execution_id: Execution UUID string
         start_time: Start time (from time.time())
         task_id: Celery task ID for correlation
+        user_message: Job user message (None: built from the payload)
+        timeout_seconds: Execution timeout (capped at the 240s soft time limit)
+        callback_url: URL a finished job is POSTed to
+        is_job: Whether execution_id is a job with a queued record
 
     Returns:
         Dict with execution results including tool_calls history
     """
-    from sqlalchemy import select
     from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
     from sqlalchemy.orm import sessionmaker
     from time import time
     import json
     from uuid import UUID
 
-    from src.database.models import Agent, AgentTestExecution
     from src.config import settings
+    from src.services.agent_execution.agent_snapshot import get_agent_snapshot
+    from src.services.agent_execution.execution_record import build_execution_record
+    from src.services.agent_execution.jobs import mark_job_running
     from src.services.agent_execution_service import AgentExecutionService
+    from src.services.execution_cancellation import (
+        ExecutionCancelledError,
+        raise_if_cancelled,
+    )
 
     # Create async engine and session
     engine = create_async_engine(settings.database_url)
     async_session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
     async with async_session_factory() as session:
-        # Load agent from database
-        stmt = select(Agent).where(Agent.id == agent_id)
-        result = await session.execute(stmt)
-        agent = result.scalar_one_or_none()
+        # Cached execution snapshot (also consumed by execute_agent below)
+        agent = await get_agent_snapshot(session, UUID(agent_id))
 
         if not agent:
             raise ValueError(f"Agent {agent_id} not found")
 
+        if is_job:
+            # A job cancelled while queued never starts
+            await raise_if_cancelled(agent.tenant_id, execution_id)
+            await mark_job_running(session, execution_id)
+
         # Build user message from payload
-        user_message = f"Process the following request:\n\n{json.dumps(payload, indent=2)}"
+        if user_message is None:
+            user_message = f"Process the following request:\n\n{json.dumps(payload, indent=2)}"
 
         # Execute agent using AgentExecutionService (MODERN PATH with MCP tool support)
         logger.info(
@@ -884,73 +1142,30 @@ async def _execute_agent_async(agent_id: str, payload: Dict[str, Any], execution
                 tenant_id=agent.tenant_id,
                 user_message=user_message,
                 context=payload,  # Pass payload as context for prompt variable substitution
-                timeout_seconds=240  # 4 minutes (matches soft_time_limit)
+                timeout_seconds=min(timeout_seconds, 240),  # 4 minutes (matches soft_time_limit)
+                execution_id=execution_id,
             )
+        except ExecutionCancelledError:
+            raise
         except Exception as exec_exc:
             raise Exception(f"Agent execution failed: {str(exec_exc)}")
 
         # Calculate duration
         total_duration_ms = int((time() - start_time) * 1000)
 
-        # Build execution trace from service result
-        execution_trace = {
-            "steps": [],
-            "total_duration_ms": total_duration_ms,
-            "model_used": service_result.get("model_used", "unknown"),
-            "tool_calls_count": len(service_result.get("tool_calls", []))
-        }
-
-        # Add tool calls to trace (MCP tools invoked during ReAct loop)
-        for tool_call in service_result.get("tool_calls", []):
-            execution_trace["steps"].append({
-                "step_type": "tool_call",
-                "tool_name": tool_call.get("tool_name", "unknown"),
-                "tool_args": tool_call.get("tool_input", {}),
-                "tool_result": str(tool_call.get("tool_output", ""))[:500],  # Truncate large results
-            })
-
-        # Add final LLM response to trace
-        execution_trace["steps"].append({
-            "step_type": "llm_response",
-            "response": service_result.get("response", ""),
-            "duration_ms": int(service_result.get("execution_time_seconds", 0) * 1000)
-        })
-
-        # Token usage (if available from service_result)
-        # Note: AgentExecutionService doesn't currently expose token usage
-        # TODO: Add token tracking to AgentExecutionService
-        token_usage = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_tokens": 0,
-            "estimated_cost_usd": 0.0
-        }
-
-        # Determine execution status
+        # Same record the streaming execution API persists
         status = "success" if service_result.get("success") else "failed"
-        errors = None
-        if not service_result.get("success"):
-            errors = {
-                "error_type": "AgentExecutionError",
-                "message": service_result.get("error", "Unknown error"),
-            }
-
-        # Save execution to database
-        test_execution = AgentTestExecution(
-            id=execution_id,
+        test_execution = build_execution_record(
+            execution_id=execution_id,
             agent_id=agent.id,
             tenant_id=agent.tenant_id,
-            payload=payload,
-            execution_trace=execution_trace,
-            token_usage=token_usage,
-            execution_time={"total_duration_ms": total_duration_ms},
-            errors=errors,
-            status=status,
-            task_id=task_id  # Celery task ID for correlation
+            payload=_record_payload(payload, user_message, is_job),
+            service_result=service_result,
+            total_duration_ms=total_duration_ms,
+            task_id=task_id,  # Celery task ID for correlation
         )
 
-        session.add(test_execution)
-        await session.commit()
+        await _save_execution_record(session, test_execution, callback_url, is_job)
 
         logger.info(
             "Agent execution completed",
@@ -973,7 +1188,25 @@ async def _execute_agent_async(agent_id: str, payload: Dict[str, Any], execution
         }
 
 
-async def _save_failed_execution(agent_id: str, payload: Dict[str, Any], execution_id: str, error: Exception, duration_ms: int, task_id: str):
+def _record_payload(payload: Dict[str, Any], user_message: Optional[str], is_job: bool) -> Dict[str, Any]:
+    """Payload stored on an execution record (jobs keep their API request)."""
+    if is_job:
+        return {"user_message": user_message, "context": payload}
+    return payload
+
+
+async def _save_failed_execution(
+    agent_id: str,
+    payload: Dict[str, Any],
+    execution_id: str,
+    error: Exception,
+    duration_ms: int,
+    task_id: str,
+    status: str = "failed",
+    user_message: Optional[str] = None,
+    callback_url: Optional[str] = None,
+    is_job: bool = False,
+):
     """
     Save failed execution to database.
 
@@ -984,6 +1217,10 @@ async def _save_failed_execution(agent_id: str, payload: Dict[str, Any], executi
         error: Exception that caused failure
         duration_ms: Execution time in milliseconds
         task_id: Celery task ID for correlation
+        status: failed, cancelled, or retrying for a job attempt Celery will retry
+        user_message: Job user message
+        callback_url: URL a finished job is POSTed to
+        is_job: Whether execution_id is a job with a queued record
     """
     from sqlalchemy import select
     from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -1010,7 +1247,7 @@ async def _save_failed_execution(agent_id: str, payload: Dict[str, Any], executi
             id=execution_id,
             agent_id=agent_id,
             tenant_id=tenant_id,
-            payload=payload,
+            payload=_record_payload(payload, user_message, is_job),
             execution_trace={"steps": [], "total_duration_ms": duration_ms, "error": "Execution failed before completion"},
             token_usage={"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "estimated_cost_usd": 0.0},
             execution_time={"total_duration_ms": duration_ms},
@@ -1019,12 +1256,37 @@ async def _save_failed_execution(agent_id: str, payload: Dict[str, Any], executi
                 "message": str(error),
                 "stack_trace": traceback.format_exc()
             },
-            status="failed",
+            status=status,
             task_id=task_id  # Celery task ID for correlation
         )
 
-        session.add(test_execution)
-        await session.commit()
+        await _save_execution_record(session, test_execution, callback_url, is_job)
+
+
+async def _save_execution_record(
+    session,
+    record,
+    callback_url: Optional[str],
+    is_job: bool,
+) -> None:
+    """
+    Persist an execution's AgentTestExecution record.
+
+    A job's queued record is updated in place and committed before its
+    status is published, since API clients read it back. Other executions
+    are saved through the worker's write-behind buffer.
+    """
+    from src.database.models import AgentTestExecution
+    from src.services.agent_execution.jobs import finish_job
+    from src.services.write_behind import persist_row, record_row
+
+    if not is_job:
+        await persist_row(AgentTestExecution, record_row(record), session)
+        return
+
+    record = await session.merge(record)
+    await session.commit()
+    await finish_job(session, record, callback_url)
 
 
 def _format_context_fallback(context_gathered: Dict[str, Any]) -> str:
@@ -1087,6 +1349,25 @@ def _format_context_fallback(context_gathered: Dict[str, Any]) -> str:
 
 
 
+def _record_budget_job_metrics(result) -> None:
+    """Export duration and row outcome metrics for a budget maintenance run."""
+    if not BUDGET_JOB_METRICS_ENABLED:
+        return
+    budget_job_duration_seconds.labels(job=result.job).observe(result.duration_seconds)
+    budget_job_rows_total.labels(job=result.job, outcome="success").inc(result.success_count)
+    budget_job_rows_total.labels(job=result.job, outcome="failed").inc(len(result.failed))
+
+
+def _budget_job_progress_callback(task: Task):
+    """Build a per-batch callback publishing PROGRESS state for a bound task."""
+
+    def _on_progress(progress: Dict[str, Any]) -> None:
+        if task.request.id:
+            task.update_state(state="PROGRESS", meta=progress)
+
+    return _on_progress
+
+
 @celery_app.task(
     bind=True,
     name="tasks.reset_tenant_budgets",
@@ -1100,135 +1381,55 @@ def reset_tenant_budgets(self: Task) -> Dict[str, Any]:
     Periodic task to reset tenant budgets based on budget_duration.
 
     Runs daily at 00:00 UTC (configured in Celery beat schedule).
-    For each tenant whose budget_reset_at <= NOW():
-    1. Reset virtual key budget via LiteLLM API
-    2. Update litellm_key_last_reset timestamp  
-    3. Calculate next budget_reset_at
-    4. Log audit entry
-    5. Send notification
+    Tenants whose budget_reset_at <= NOW() are processed in keyset-paginated
+    batches (see BudgetMaintenanceService.reset_due_budgets):
+    1. Reset virtual key spend via LiteLLM API (concurrent, shared client)
+    2. Update litellm_key_last_reset and next budget_reset_at (set-based UPDATE)
+    3. Write audit entries (multi-row INSERT)
+    4. Drop the tenants' spend ledger entries
+
+    Each batch commits independently, so a retried run resumes with the
+    tenants that are still due. Progress is published as PROGRESS task state.
 
     Story 8.10 AC#7: Budget Reset Automation
 
     Returns:
-        Dict with reset_count, success_count, and failed_tenants list
+        Dict with reset_count, success_count, failed_tenants list and duration_ms
 
     Raises:
         SoftTimeLimitExceeded: If task exceeds 10 minutes
     """
-    from datetime import datetime, timezone, timedelta
-    from sqlalchemy import select, update
-    from src.database.models import TenantConfig, AuditLog
-    from src.config import settings
-    import httpx
+    from datetime import datetime, timezone
+    from src.services.budget_maintenance import BudgetMaintenanceService
 
     logger.info("Starting budget reset task")
-    reset_count = 0
-    success_count = 0
-    failed_tenants = []
 
     try:
-        # Run async code in event loop
-        async def _reset_budgets():
-            nonlocal reset_count, success_count, failed_tenants
-
-            async with get_async_session_maker()() as session:
-                # Find tenants whose budget period has expired
-                now = datetime.now(timezone.utc)
-                stmt = select(TenantConfig).where(
-                    TenantConfig.budget_reset_at <= now,
-                    TenantConfig.is_active == True
-                )
-                result = await session.execute(stmt)
-                tenants = result.scalars().all()
-
-                reset_count = len(tenants)
-                logger.info(f"Found {reset_count} tenants requiring budget reset")
-
-                for tenant in tenants:
-                    try:
-                        # Reset virtual key budget via LiteLLM API
-                        if tenant.litellm_virtual_key:
-                            async with httpx.AsyncClient(timeout=30.0) as client:
-                                # Call LiteLLM key/update endpoint to reset budget
-                                litellm_url = f"{settings.litellm_proxy_url}/key/update"
-                                headers = {"Authorization": f"Bearer {settings.litellm_master_key}"}
-                                payload = {
-                                    "key": tenant.litellm_virtual_key,
-                                    "spend": 0,  # Reset spend to 0
-                                }
-
-                                response = await client.post(litellm_url, json=payload, headers=headers)
-                                response.raise_for_status()
-
-                                logger.info(f"Reset budget for tenant {tenant.tenant_id}")
-
-                        # Calculate next reset date based on budget_duration
-                        duration_days = int(tenant.budget_duration.replace('d', ''))
-                        next_reset_at = now + timedelta(days=duration_days)
-
-                        # Update tenant record
-                        await session.execute(
-                            update(TenantConfig)
-                            .where(TenantConfig.tenant_id == tenant.tenant_id)
-                            .values(
-                                litellm_key_last_reset=now,
-                                budget_reset_at=next_reset_at,
-                                updated_at=now
-                            )
-                        )
-
-                        # Log audit entry
-                        audit_entry = AuditLog(
-                            tenant_id=tenant.tenant_id,
-                            operation="budget_reset",
-                            user="system",
-                            timestamp=now,
-                            details={
-                                "previous_reset": tenant.litellm_key_last_reset.isoformat() if tenant.litellm_key_last_reset else None,
-                                "next_reset": next_reset_at.isoformat(),
-                                "duration": tenant.budget_duration,
-                                "max_budget": tenant.max_budget
-                            }
-                        )
-                        session.add(audit_entry)
-
-                        await session.commit()
-                        success_count += 1
-
-                        logger.info(
-                            f"Budget reset successful for tenant {tenant.tenant_id}",
-                            extra={
-                                "tenant_id": tenant.tenant_id,
-                                "next_reset": next_reset_at.isoformat(),
-                                "duration": tenant.budget_duration
-                            }
-                        )
-
-                        # TODO Story 8.10A: Send notification to tenant admin
-                        # await NotificationService().send_budget_reset_notification(tenant.tenant_id)
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to reset budget for tenant {tenant.tenant_id}: {e}",
-                            extra={"tenant_id": tenant.tenant_id, "error": str(e)}
-                        )
-                        failed_tenants.append({
-                            "tenant_id": tenant.tenant_id,
-                            "error": str(e)
-                        })
-
-        # Execute async function
-        asyncio.run(_reset_budgets())
+        service = BudgetMaintenanceService(get_async_session_maker())
+        job_result = asyncio.run(
+            service.reset_due_budgets(
+                datetime.now(timezone.utc),
+                on_progress=_budget_job_progress_callback(self),
+            )
+        )
+        _record_budget_job_metrics(job_result)
 
         result = {
-            "reset_count": reset_count,
-            "success_count": success_count,
-            "failed_count": len(failed_tenants),
-            "failed_tenants": failed_tenants,
+            "reset_count": job_result.due_count,
+            "success_count": job_result.success_count,
+            "failed_count": len(job_result.failed),
+            "failed_tenants": [
+                {"tenant_id": f["tenant_id"], "error": f["error"]} for f in job_result.failed
+            ],
+            "batches": job_result.batches,
+            "duration_ms": int(job_result.duration_seconds * 1000),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
-        logger.info(f"Budget reset task completed: {success_count}/{reset_count} successful")
+        logger.info(
+            f"Budget reset task completed: {job_result.success_count}/{job_result.due_count} "
+            f"successful in {result['duration_ms']}ms"
+        )
         return result
 
     except SoftTimeLimitExceeded:
@@ -1252,178 +1453,221 @@ def expire_budget_overrides(self: Task) -> Dict[str, Any]:
     Periodic task to expire budget overrides that have reached their expiration time.
 
     Runs hourly at :00 minutes (configured in Celery beat schedule).
-    For each override whose expires_at <= NOW():
-    1. Remove override from database
-    2. Reset virtual key budget to tenant's base max_budget via LiteLLM API
-    3. Log audit entry
-    4. Send notification
+    Overrides whose expires_at <= NOW() are processed in keyset-paginated
+    batches (see BudgetMaintenanceService.expire_due_overrides):
+    1. Reset each affected tenant's virtual key to its base max_budget via
+       LiteLLM API (once per tenant, concurrent, shared client)
+    2. Delete the expired overrides (set-based DELETE)
+    3. Write audit entries (multi-row INSERT)
+
+    Each batch commits independently, so a retried run resumes with the
+    overrides that are still due. Progress is published as PROGRESS task state.
 
     Story 8.10C AC#7: Automatic Override Expiry
 
     Returns:
-        Dict with expired_count, success_count, and failed_overrides list
+        Dict with expired_count, success_count, failed_overrides list and duration_ms
 
     Raises:
         SoftTimeLimitExceeded: If task exceeds 5 minutes
     """
     from datetime import datetime, timezone
-    from sqlalchemy import select, delete
-    from src.database.models import TenantConfig, AuditLog
-    from src.config import settings
-    import httpx
+    from src.services.budget_maintenance import BudgetMaintenanceService
+
+    logger.info("Starting budget override expiry task")
 
-    # Check if BudgetOverride model exists (added in Story 8.10)
     try:
-        from src.database.models import BudgetOverride
-    except ImportError:
-        logger.warning("BudgetOverride model not found - skipping override expiry")
-        return {
-            "expired_count": 0,
-            "success_count": 0,
-            "failed_count": 0,
-            "failed_overrides": [],
+        service = BudgetMaintenanceService(get_async_session_maker())
+        job_result = asyncio.run(
+            service.expire_due_overrides(
+                datetime.now(timezone.utc),
+                on_progress=_budget_job_progress_callback(self),
+            )
+        )
+        _record_budget_job_metrics(job_result)
+
+        result = {
+            "expired_count": job_result.due_count,
+            "success_count": job_result.success_count,
+            "failed_count": len(job_result.failed),
+            "failed_overrides": [
+                {"override_id": f["id"], "tenant_id": f["tenant_id"], "error": f["error"]}
+                for f in job_result.failed
+            ],
+            "batches": job_result.batches,
+            "duration_ms": int(job_result.duration_seconds * 1000),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
-    logger.info("Starting budget override expiry task")
-    expired_count = 0
-    success_count = 0
-    failed_overrides = []
+        logger.info(
+            f"Budget override expiry task completed: "
+            f"{job_result.success_count}/{job_result.due_count} successful in {result['duration_ms']}ms"
+        )
+        return result
+
+    except SoftTimeLimitExceeded:
+        logger.error("Budget override expiry task exceeded 5 minute time limit")
+        raise
+    except Exception as e:
+        logger.error(f"Budget override expiry task failed: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=180)  # Retry after 3 minutes
+
+
+@celery_app.task(
+    bind=True,
+    name="tasks.reconcile_spend_ledger",
+    track_started=True,
+    max_retries=0,  # Next beat run retries naturally
+    soft_time_limit=50,
+    time_limit=55,
+)
+def reconcile_spend_ledger(self: Task) -> Dict[str, Any]:
+    """
+    Periodic task to reconcile the Redis spend ledger with LiteLLM.
+
+    Runs every minute (configured in Celery beat schedule). Overwrites each
+    active tenant's ledger spend with LiteLLM's authoritative figure and
+    refreshes budget limits, so check_budget_exceeded can stay a local Redis
+    read between runs.
+
+    Returns:
+        Dict with tenant_count, reconciled_count, failed_count and duration_ms
+    """
+    from datetime import datetime, timezone
+    from src.config import settings
+    from src.services.budget_service import BudgetService
+
+    if not settings.budget_ledger_enabled:
+        return {"skipped": True, "reason": "budget ledger disabled"}
+
+    start = time()
+
+    async def _reconcile() -> Dict[str, Any]:
+        async with get_async_session_maker()() as session:
+            return await BudgetService(session).reconcile_spend_ledger()
 
     try:
-        # Run async code in event loop
-        async def _expire_overrides():
-            nonlocal expired_count, success_count, failed_overrides
-
-            async with get_async_session_maker()() as session:
-                # Find overrides whose expiration time has passed
-                now = datetime.now(timezone.utc)
-                stmt = select(BudgetOverride).where(
-                    BudgetOverride.expires_at <= now
-                )
-                result = await session.execute(stmt)
-                overrides = result.scalars().all()
+        outcome = asyncio.run(_reconcile())
+    except SoftTimeLimitExceeded:
+        logger.error("Spend ledger reconciliation exceeded time limit")
+        raise
 
-                expired_count = len(overrides)
-                logger.info(f"Found {expired_count} expired budget overrides")
+    result = {
+        "tenant_count": outcome["tenant_count"],
+        "reconciled_count": outcome["reconciled_count"],
+        "failed_count": len(outcome["failed_tenants"]),
+        "duration_ms": int((time() - start) * 1000),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    logger.info(
+        f"Spend ledger reconciled: {result['reconciled_count']}/{result['tenant_count']} tenants "
+        f"in {result['duration_ms']}ms"
+    )
+    return result
 
-                for override in overrides:
-                    try:
-                        # Get tenant config to reset virtual key to base budget
-                        tenant_stmt = select(TenantConfig).where(
-                            TenantConfig.tenant_id == override.tenant_id
-                        )
-                        tenant_result = await session.execute(tenant_stmt)
-                        tenant = tenant_result.scalar_one_or_none()
 
-                        if not tenant:
-                            logger.warning(
-                                f"Tenant not found for override: {override.tenant_id}",
-                                extra={"override_id": override.id, "tenant_id": override.tenant_id}
-                            )
-                            failed_overrides.append({
-                                "override_id": str(override.id),
-                                "tenant_id": override.tenant_id,
-                                "error": "Tenant not found"
-                            })
-                            continue
-
-                        # Reset virtual key budget to base max_budget via LiteLLM API
-                        if tenant.litellm_virtual_key:
-                            async with httpx.AsyncClient(timeout=30.0) as client:
-                                # Call LiteLLM key/update endpoint to reset to base budget
-                                litellm_url = f"{settings.litellm_proxy_url}/key/update"
-                                headers = {"Authorization": f"Bearer {settings.litellm_master_key}"}
-                                payload = {
-                                    "key": tenant.litellm_virtual_key,
-                                    "max_budget": tenant.max_budget,  # Reset to base budget
-                                }
-
-                                response = await client.post(litellm_url, json=payload, headers=headers)
-                                response.raise_for_status()
-
-                                logger.info(
-                                    f"Reset virtual key budget to base for tenant {tenant.tenant_id}",
-                                    extra={
-                                        "tenant_id": tenant.tenant_id,
-                                        "base_budget": tenant.max_budget,
-                                        "override_amount": override.override_amount
-                                    }
-                                )
-
-                        # Delete expired override from database
-                        await session.delete(override)
-
-                        # Log audit entry
-                        audit_entry = AuditLog(
-                            tenant_id=override.tenant_id,
-                            operation="budget_override_expired",
-                            user="system",
-                            timestamp=now,
-                            details={
-                                "override_id": str(override.id),
-                                "override_amount": override.override_amount,
-                                "granted_at": override.created_at.isoformat() if override.created_at else None,
-                                "expires_at": override.expires_at.isoformat(),
-                                "reason": override.reason,
-                                "created_by": override.created_by
-                            }
-                        )
-                        session.add(audit_entry)
+@celery_app.task(
+    bind=True,
+    name="tasks.rollup_llm_spend",
+    track_started=True,
+    max_retries=0,  # Next beat run resumes from the high-water mark
+    soft_time_limit=240,
+    time_limit=270,
+)
+def rollup_llm_spend(self: Task) -> Dict[str, Any]:
+    """
+    Periodic task to fold new LiteLLM spend logs into the daily rollup.
 
-                        await session.commit()
-                        success_count += 1
+    Runs every 5 minutes (configured in Celery beat schedule). Each window is
+    committed with the advanced high-water mark, so a run that hits the time
+    limit loses no work and the next run continues from where it stopped.
 
-                        logger.info(
-                            f"Budget override expired successfully for tenant {tenant.tenant_id}",
-                            extra={
-                                "tenant_id": tenant.tenant_id,
-                                "override_id": str(override.id),
-                                "override_amount": override.override_amount
-                            }
-                        )
+    Returns:
+        Dict with windows, rows_upserted, high_water_mark, caught_up and duration_ms
+    """
+    from datetime import timedelta
+    from src.config import settings
+    from src.services.llm_spend_rollup import SpendRollupService
+
+    start = time()
+    service = SpendRollupService(
+        get_async_session_maker(),
+        lag=timedelta(seconds=settings.llm_spend_rollup_lag_seconds),
+        max_window=timedelta(hours=settings.llm_spend_rollup_window_hours),
+        max_windows=settings.llm_spend_rollup_max_windows,
+    )
 
-                        # TODO Story 8.10C: Send notification to tenant admin
-                        # await NotificationService().send_budget_override_expired_notification(
-                        #     tenant_id=override.tenant_id,
-                        #     override_amount=override.override_amount
-                        # )
+    try:
+        outcome = asyncio.run(service.run())
+    except SoftTimeLimitExceeded:
+        logger.error("LLM spend rollup exceeded time limit")
+        raise
 
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to expire override for tenant {override.tenant_id}: {e}",
-                            extra={
-                                "tenant_id": override.tenant_id,
-                                "override_id": str(override.id),
-                                "error": str(e)
-                            }
-                        )
-                        failed_overrides.append({
-                            "override_id": str(override.id),
-                            "tenant_id": override.tenant_id,
-                            "error": str(e)
-                        })
+    result = {
+        "windows": outcome.windows,
+        "rows_upserted": outcome.rows_upserted,
+        "high_water_mark": (
+            outcome.high_water_mark.isoformat() if outcome.high_water_mark else None
+        ),
+        "caught_up": outcome.caught_up,
+        "duration_ms": int((time() - start) * 1000),
+    }
+    logger.info(
+        f"LLM spend rollup: {result['windows']} windows, {result['rows_upserted']} rows, "
+        f"high-water mark {result['high_water_mark']} in {result['duration_ms']}ms"
+    )
+    return result
 
-        # Execute async function
-        asyncio.run(_expire_overrides())
 
-        result = {
-            "expired_count": expired_count,
-            "success_count": success_count,
-            "failed_count": len(failed_overrides),
-            "failed_overrides": failed_overrides,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+@celery_app.task(
+    bind=True,
+    name="tasks.backfill_memory_embeddings",
+    track_started=True,
+    max_retries=0,  # Next beat run picks up the remaining rows
+    soft_time_limit=240,
+    time_limit=270,
+)
+def backfill_memory_embeddings(self: Task) -> Dict[str, Any]:
+    """
+    Periodic task converting legacy text memory embeddings to pgvector vectors.
 
-        logger.info(f"Budget override expiry task completed: {success_count}/{expired_count} successful")
-        return result
+    Runs every 5 minutes (configured in Celery beat schedule). Each batch is
+    committed on its own, so a run that hits the time limit loses no work;
+    once every row is converted a run is a single index probe.
+
+    Returns:
+        Dict with batches, converted, invalid, done and duration_ms
+    """
+    from src.config import settings
+    from src.services.agent_memory_backfill import MemoryEmbeddingBackfill
+
+    start = time()
+    backfill = MemoryEmbeddingBackfill(
+        get_async_session_maker(),
+        batch_size=settings.agent_memory_backfill_batch_size,
+        max_batches=settings.agent_memory_backfill_max_batches,
+    )
 
+    try:
+        outcome = asyncio.run(backfill.run())
     except SoftTimeLimitExceeded:
-        logger.error("Budget override expiry task exceeded 5 minute time limit")
+        logger.error("Memory embedding backfill exceeded time limit")
         raise
-    except Exception as e:
-        logger.error(f"Budget override expiry task failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=180)  # Retry after 3 minutes
+
+    result = {
+        "batches": outcome.batches,
+        "converted": outcome.converted,
+        "invalid": outcome.invalid,
+        "done": outcome.done,
+        "duration_ms": int((time() - start) * 1000),
+    }
+    if outcome.batches:
+        logger.info(
+            f"Memory embedding backfill: {result['converted']} converted, "
+            f"{result['invalid']} invalid in {result['batches']} batches "
+            f"({result['duration_ms']}ms, done: {result['done']})"
+        )
+    return result
 
 
 # ============================================================================
@@ -1450,6 +1694,12 @@ def mcp_health_check_task(self: Task) -> Dict[str, Any]:
     3. Updates database with results (status, last_health_check, consecutive_failures)
     4. Triggers circuit breaker after 3 consecutive failures (status='inactive')
 
+    Probes run concurrently (settings.mcp_health_check_concurrency) with a
+    per-check deadline (settings.mcp_health_check_timeout_seconds); results
+    are written as one multi-row insert and Prometheus metrics are updated
+    once per cycle. Cycle duration is exported as
+    mcp_health_check_cycle_duration_seconds.
+
     Inactive servers are excluded from health checks until manually reactivated.
 
     Story: 11.1.8 - Basic MCP Server Health Monitoring
@@ -1482,11 +1732,13 @@ def mcp_health_check_task(self: Task) -> Dict[str, Any]:
 
     Notes:
         - No retries configured (task runs every 30s anyway)
-        - Errors are logged and counted, but task continues to next server
+        - Errors are logged and counted; one slow or failing server does not
+          delay the others
         - Circuit breaker prevents resource waste on repeatedly failing servers
         - Tenant isolation maintained (each server scoped to its tenant)
     """
-    from src.services.mcp_health_monitor import check_server_health
+    from src.config import settings
+    from src.services.mcp_health_monitor import run_health_check_cycle
     from src.database.models import MCPServer
     from sqlalchemy import select
     from opentelemetry import trace
@@ -1499,30 +1751,8 @@ def mcp_health_check_task(self: Task) -> Dict[str, Any]:
     should_trace = random() < 0.1
 
     try:
-        checked_count = 0
-        healthy_count = 0
-        unhealthy_count = 0
-        inactive_count = 0
-
-        async def _run_health_checks() -> None:
-            """Run health checks for all eligible servers."""
-            nonlocal checked_count, healthy_count, unhealthy_count, inactive_count
-
-            # Story 12.8 AC2: Parent span for health check task (10% sampling)
-            if should_trace:
-                with tracer.start_as_current_span("mcp.health.check") as parent_span:
-                    parent_span.set_attribute("check.source", "celery_beat")
-                    parent_span.set_attribute("check.interval_seconds", 30)
-
-                    await _run_health_checks_with_trace(parent_span)
-            else:
-                # No tracing - run health checks directly
-                await _run_health_checks_without_trace()
-
-        async def _run_health_checks_without_trace() -> None:
-            """Run health checks without tracing (90% of calls)."""
-            nonlocal checked_count, healthy_count, unhealthy_count, inactive_count
-
+        async def _run_health_checks() -> Any:
+            """Run one concurrent health check cycle for all eligible servers."""
             async with get_async_session_maker()() as db:
                 # Query servers with status IN ('active', 'error')
                 # Exclude 'inactive' servers (circuit breaker triggered)
@@ -1537,98 +1767,41 @@ def mcp_health_check_task(self: Task) -> Dict[str, Any]:
                     extra={"server_count": len(servers)}
                 )
 
-                # Check each server health
-                for server in servers:
-                    try:
-                        # Perform health check (with 30s timeout per server)
-                        health_result = await check_server_health(server, db)
-
-                        checked_count += 1
-
-                        # Count results
-                        if health_result["status"] == "active":
-                            healthy_count += 1
-                        elif health_result["status"] == "error":
-                            unhealthy_count += 1
-
-                        # Check if circuit breaker triggered
-                        if server.status == "inactive":
-                            inactive_count += 1
-
-                    except Exception as e:
-                        # Log error but continue to next server
-                        # (graceful error handling per AC5)
-                        logger.error(
-                            f"Health check failed for server {server.name}: {e}",
-                            extra={
-                                "mcp_server_id": str(server.id),
-                                "mcp_server_name": server.name,
-                                "tenant_id": str(server.tenant_id),
-                                "error": str(e)
-                            }
-                        )
-                        unhealthy_count += 1
-
-        async def _run_health_checks_with_trace(parent_span: Any) -> None:
-            """Run health checks with OpenTelemetry tracing (10% of calls)."""
-            nonlocal checked_count, healthy_count, unhealthy_count, inactive_count
-
-            async with get_async_session_maker()() as db:
-                # Query servers with status IN ('active', 'error')
-                # Exclude 'inactive' servers (circuit breaker triggered)
-                stmt = select(MCPServer).where(
-                    MCPServer.status.in_(["active", "error"])
-                )
-                result = await db.execute(stmt)
-                servers = result.scalars().all()
-
-                parent_span.set_attribute("mcp.server_count", len(servers))
-
-                logger.info(
-                    f"MCP health check task starting: {len(servers)} servers to check",
-                    extra={"server_count": len(servers)}
-                )
-
-                # Check each server health
-                for server in servers:
-                    try:
-                        # Perform health check (with 30s timeout per server)
-                        health_result = await check_server_health(server, db, tracer=tracer)
-
-                        checked_count += 1
-
-                        # Count results
-                        if health_result["status"] == "active":
-                            healthy_count += 1
-                        elif health_result["status"] == "error":
-                            unhealthy_count += 1
-
-                        # Check if circuit breaker triggered
-                        if server.status == "inactive":
-                            inactive_count += 1
+                if not should_trace:
+                    return await run_health_check_cycle(
+                        servers,
+                        db,
+                        concurrency=settings.mcp_health_check_concurrency,
+                        timeout_seconds=settings.mcp_health_check_timeout_seconds,
+                    )
 
-                    except Exception as e:
-                        # Log error but continue to next server
-                        # (graceful error handling per AC5)
-                        logger.error(
-                            f"Health check failed for server {server.name}: {e}",
-                            extra={
-                                "mcp_server_id": str(server.id),
-                                "mcp_server_name": server.name,
-                                "tenant_id": str(server.tenant_id),
-                                "error": str(e)
-                            }
-                        )
-                        unhealthy_count += 1
+                # Story 12.8 AC2: Parent span for health check task (10% sampling)
+                with tracer.start_as_current_span("mcp.health.check") as parent_span:
+                    parent_span.set_attribute("check.source", "celery_beat")
+                    parent_span.set_attribute("check.interval_seconds", 30)
+                    parent_span.set_attribute("mcp.server_count", len(servers))
+
+                    cycle = await run_health_check_cycle(
+                        servers,
+                        db,
+                        concurrency=settings.mcp_health_check_concurrency,
+                        timeout_seconds=settings.mcp_health_check_timeout_seconds,
+                        tracer=tracer,
+                    )
 
-                # Set final metrics on parent span
-                parent_span.set_attribute("mcp.servers_checked", checked_count)
-                parent_span.set_attribute("mcp.servers_healthy", healthy_count)
-                parent_span.set_attribute("mcp.servers_unhealthy", unhealthy_count)
-                parent_span.set_attribute("mcp.circuit_breakers_triggered", inactive_count)
+                    # Set final metrics on parent span
+                    parent_span.set_attribute("mcp.servers_checked", cycle.checked)
+                    parent_span.set_attribute("mcp.servers_healthy", cycle.healthy)
+                    parent_span.set_attribute("mcp.servers_unhealthy", cycle.unhealthy)
+                    parent_span.set_attribute("mcp.circuit_breakers_triggered", cycle.inactive)
+                    return cycle
 
         # Execute async health checks
-        asyncio.run(_run_health_checks())
+        cycle = asyncio.run(_run_health_checks())
+        checked_count = cycle.checked
+        healthy_count = cycle.healthy
+        unhealthy_count = cycle.unhealthy
+        inactive_count = cycle.inactive
 
         # Calculate total task duration
         duration_ms = int((time() - start_time) * 1000)
@@ -1666,6 +1839,7 @@ def mcp_health_check_task(self: Task) -> Dict[str, Any]:
 
 
 @celery_app.task(
+    bind=True,
     name="tasks.cleanup_old_mcp_metrics",
     track_started=True,
     max_retries=3,  # Retry on failure (database connectivity issues)
@@ -1675,11 +1849,15 @@ def mcp_health_check_task(self: Task) -> Dict[str, Any]:
 )
 def cleanup_old_mcp_metrics_task(self: Task) -> Dict[str, Any]:
     """
-    Daily cleanup of MCP server metrics older than 7 days.
+    Daily retention and partition maintenance for MCP server metrics.
 
-    This task runs daily at 02:00 UTC (off-peak hours) to enforce 7-day retention
-    policy for mcp_server_metrics time-series data. Deletes rows where
-    check_timestamp < (now - 7 days).
+    This task runs daily at 02:00 UTC (off-peak hours) to enforce the
+    retention policy for mcp_server_metrics time-series data. The table is
+    range-partitioned by check_timestamp into daily partitions (migration 019):
+    partitions wholly older than the cutoff are detached and dropped, and
+    partitions for the next days are created ahead of the health-check writers.
+    Dropping a partition is a catalog operation, so there is no long-running
+    DELETE, WAL burst or vacuum debt regardless of write volume.
 
     Retention rationale:
         - 7 days provides sufficient data for trend analysis
@@ -1688,24 +1866,29 @@ def cleanup_old_mcp_metrics_task(self: Task) -> Dict[str, Any]:
 
     Story: 11.2.4 - Enhanced MCP Health Monitoring (AC6)
     Schedule: Daily at 02:00 UTC (configured in celery_app.conf.beat_schedule)
-    Timeout: 1 minute hard limit (sufficient for DELETE with indexed timestamp)
+    Timeout: 1 minute hard limit (partition DDL is metadata-only)
     Retries: 3 retries with 5min delay (handle transient database issues)
 
     Returns:
         dict with keys:
-            - deleted: int (total metrics deleted)
-            - retention_days: int (always 7)
-            - cutoff_timestamp: str (ISO 8601 timestamp for deletion cutoff)
+            - dropped_partitions: list[str] (partitions detached and dropped)
+            - created_partitions: list[str] (partitions created ahead)
+            - deleted: int (rows deleted; only non-zero on an unpartitioned table)
+            - retention_days: int
+            - cutoff_timestamp: str (ISO 8601 timestamp for retention cutoff)
             - duration_ms: int (task execution time)
             - timestamp: str (task completion timestamp ISO 8601)
 
     Example:
         Result: {
-            "deleted": 125000,
+            "dropped_partitions": ["mcp_server_metrics_p20251102"],
+            "created_partitions": ["mcp_server_metrics_p20251117"],
+            "deleted": 0,
+            "pruned_latency_rollups": 10080,
             "retention_days": 7,
             "cutoff_timestamp": "2025-11-03T02:00:00.000Z",
-            "duration_ms": 2341,
-            "timestamp": "2025-11-10T02:00:05.123Z"
+            "duration_ms": 41,
+            "timestamp": "2025-11-10T02:00:00.123Z"
         }
 
     Raises:
@@ -1713,17 +1896,17 @@ def cleanup_old_mcp_metrics_task(self: Task) -> Dict[str, Any]:
         Exception: Database errors (logged, task retries up to 3 times)
 
     Notes:
-        - Uses indexed mcp_server_metrics(check_timestamp) for fast DELETE
-        - Runs during off-peak hours (02:00 UTC) to minimize impact
-        - Automatically retries on database connectivity failures
-        - Logs deletion count for monitoring/alerting
+        - Falls back to DELETE by check_timestamp if the table is not
+          partitioned (e.g. databases built with metadata.create_all)
+        - A partition is dropped only once its whole day is past the cutoff,
+          so up to one extra day of metrics is retained
     """
-    from src.database.models import MCPServerMetric
-    from sqlalchemy import delete
+    from src.config import settings
+    from src.services.mcp_metrics_partitions import maintain_partitions
     from datetime import timedelta
 
     start_time = time()
-    retention_days = 7
+    retention_days = settings.mcp_metrics_retention_days
 
     try:
         logger.info(
@@ -1731,36 +1914,16 @@ def cleanup_old_mcp_metrics_task(self: Task) -> Dict[str, Any]:
             extra={"retention_days": retention_days}
         )
 
-        async def _cleanup_old_metrics() -> int:
-            """Delete metrics older than retention_days."""
+        async def _maintain():
             async with get_async_session_maker()() as db:
-                # Calculate cutoff timestamp (7 days ago from now)
-                cutoff = datetime.now(UTC) - timedelta(days=retention_days)
-
-                # Delete metrics with check_timestamp < cutoff
-                # Uses index on check_timestamp for efficient DELETE
-                stmt = delete(MCPServerMetric).where(
-                    MCPServerMetric.check_timestamp < cutoff
-                )
-
-                result = await db.execute(stmt)
-                await db.commit()
-
-                deleted_count = result.rowcount
-
-                logger.info(
-                    f"Deleted {deleted_count} metrics older than {cutoff.isoformat()}",
-                    extra={
-                        "deleted_count": deleted_count,
-                        "cutoff_timestamp": cutoff.isoformat(),
-                        "retention_days": retention_days,
-                    }
+                return await maintain_partitions(
+                    db,
+                    retention_days=retention_days,
+                    days_ahead=settings.mcp_metrics_partition_days_ahead,
                 )
 
-                return deleted_count
-
-        # Execute async cleanup
-        deleted_count = asyncio.run(_cleanup_old_metrics())
+        # Execute async maintenance
+        outcome = asyncio.run(_maintain())
 
         # Calculate total task duration
         duration_ms = int((time() - start_time) * 1000)
@@ -1769,7 +1932,10 @@ def cleanup_old_mcp_metrics_task(self: Task) -> Dict[str, Any]:
         cutoff_timestamp = (datetime.now(UTC) - timedelta(days=retention_days)).isoformat()
 
         result = {
-            "deleted": deleted_count,
+            "dropped_partitions": outcome.dropped,
+            "created_partitions": outcome.created,
+            "deleted": outcome.deleted_rows,
+            "pruned_latency_rollups": outcome.pruned_rollups,
             "retention_days": retention_days,
             "cutoff_timestamp": cutoff_timestamp,
             "duration_ms": duration_ms,
@@ -1777,7 +1943,8 @@ def cleanup_old_mcp_metrics_task(self: Task) -> Dict[str, Any]:
         }
 
         logger.info(
-            f"MCP metrics cleanup task completed: {deleted_count} metrics deleted",
+            f"MCP metrics cleanup task completed: {len(outcome.dropped)} partitions dropped, "
+            f"{len(outcome.created)} created",
             extra=result
         )
 
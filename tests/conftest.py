@@ -24,6 +24,8 @@ sys.modules["opentelemetry.trace"] = MagicMock()
 sys.modules["langchain_core"] = MagicMock()
 sys.modules["langchain_core.tools"] = MagicMock()
 sys.modules["langchain_core.messages"] = MagicMock()
+# Real base class so cancellation callback handlers stay testable
+sys.modules["langchain_core.callbacks"] = MagicMock(AsyncCallbackHandler=object)
 sys.modules["langchain_mcp_adapters"] = MagicMock()
 sys.modules["langchain_mcp_adapters.client"] = MagicMock()
 sys.modules["langchain_mcp_adapters.tools"] = MagicMock()
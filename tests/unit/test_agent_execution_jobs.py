@@ -0,0 +1,381 @@
+"""
+Unit tests for asynchronous agent execution jobs.
+
+Tests cover:
+- Queuing a job: queued record, Celery task with the execution ID
+- Enqueue failures marking the record failed
+- Long-polling on the Redis status key, and without Redis, outside transactions
+- Result retrieval only for finished jobs
+- Callbacks delivered for final statuses only, signed, to public hosts only
+- Jobs left unfinished by killed or lost workers failed once stale
+"""
+
+import ipaddress
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+import respx
+from fastapi import HTTPException
+
+from src.api import agent_execution_jobs as jobs_api
+from src.api.agent_execution_jobs import AgentExecutionJobRequest
+from src.services.agent_execution import jobs
+from src.services.webhook_validator import compute_hmac_signature
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the shared Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+        self.commit = AsyncMock()
+
+    def add(self, record):
+        self.added.append(record)
+
+
+def _record(status, steps=None, errors=None, created_at=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        agent_id=uuid4(),
+        tenant_id="tenant-a",
+        status=status,
+        created_at=created_at,
+        execution_trace={"steps": steps or [], "model_used": "openai/gpt-4o-mini"},
+        execution_time={"total_duration_ms": 2100},
+        errors=errors,
+    )
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch.object(jobs, "_redis", return_value=redis):
+        yield redis
+
+
+@pytest.fixture(autouse=True)
+def tenant_context():
+    with patch.object(jobs, "set_db_tenant_context", AsyncMock()) as set_context:
+        yield set_context
+
+
+@pytest.fixture(autouse=True)
+def dns():
+    """Resolve every host to a public address unless a test sets another."""
+    addresses = {"default": "93.184.216.34"}
+
+    async def resolve(host, port):
+        return [ipaddress.ip_address(addresses.get(host, addresses["default"]))]
+
+    with patch.object(jobs, "_resolve", resolve):
+        yield addresses
+
+
+@pytest.fixture
+def active_agent():
+    with patch(
+        "src.services.agent_service.AgentService.get_agent_snapshot",
+        AsyncMock(return_value=SimpleNamespace(status="active")),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+class TestCreateJob:
+    """Tests for POST /jobs."""
+
+    async def test_queues_task_under_execution_id(self, fake_redis, active_agent):
+        db = FakeSession()
+        request = AgentExecutionJobRequest(
+            agent_id=uuid4(),
+            user_message="VPN is down",
+            context={"ticket_id": 7},
+            callback_url="https://hooks.example.com/agent-done",
+        )
+
+        with patch("src.workers.tasks.execute_agent.apply_async") as apply_async:
+            response = await jobs_api.create_execution_job(
+                request, x_tenant_id="tenant-a", db=db
+            )
+
+        (record,) = db.added
+        assert record.status == "queued"
+        assert record.id == response.execution_id
+        assert response.result_url.endswith(f"/jobs/{record.id}/result")
+        kwargs = apply_async.call_args.kwargs
+        assert kwargs["task_id"] == str(record.id)
+        assert kwargs["args"] == [str(request.agent_id), {"ticket_id": 7}]
+        assert kwargs["kwargs"]["execution_id"] == str(record.id)
+        assert kwargs["kwargs"]["callback_url"] == "https://hooks.example.com/agent-done"
+        assert fake_redis.data[f"agent_execution:{record.id}:status"] == "queued"
+
+    async def test_enqueue_failure_fails_record(self, fake_redis, active_agent):
+        db = FakeSession()
+        request = AgentExecutionJobRequest(agent_id=uuid4(), user_message="VPN is down")
+
+        with patch(
+            "src.workers.tasks.execute_agent.apply_async",
+            side_effect=ConnectionError("broker down"),
+        ), pytest.raises(HTTPException) as exc_info:
+            await jobs_api.create_execution_job(request, x_tenant_id="tenant-a", db=db)
+
+        assert exc_info.value.status_code == 503
+        assert db.added[0].status == "failed"
+
+    async def test_private_callback_url_rejected(self, fake_redis, active_agent, dns):
+        dns["metadata.internal"] = "169.254.169.254"
+        db = FakeSession()
+        request = AgentExecutionJobRequest(
+            agent_id=uuid4(),
+            user_message="VPN is down",
+            callback_url="http://metadata.internal/latest/meta-data",
+        )
+
+        with patch("src.workers.tasks.execute_agent.apply_async") as apply_async, pytest.raises(
+            HTTPException
+        ) as exc_info:
+            await jobs_api.create_execution_job(request, x_tenant_id="tenant-a", db=db)
+
+        assert exc_info.value.status_code == 400
+        assert db.added == []
+        apply_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestWaitForJob:
+    """Tests for long-polling."""
+
+    async def test_returns_when_published_status_changes(self, fake_redis):
+        running, done = _record("running"), _record("success")
+        get_job = AsyncMock(side_effect=[running, done])
+        fake_redis.data[f"agent_execution:{running.id}:status"] = "success"
+
+        with patch.object(jobs, "get_job", get_job), patch.object(
+            jobs, "POLL_INTERVAL_SECONDS", 0.01
+        ):
+            record = await jobs.wait_for_job(AsyncMock(), "tenant-a", running.id, 5)
+
+        assert record is done
+        assert get_job.await_count == 2
+
+    async def test_unchanged_status_not_reread_until_timeout(self, fake_redis):
+        running = _record("running")
+        fake_redis.data[f"agent_execution:{running.id}:status"] = "running"
+        get_job = AsyncMock(return_value=running)
+
+        with patch.object(jobs, "get_job", get_job), patch.object(
+            jobs, "POLL_INTERVAL_SECONDS", 0.01
+        ):
+            record = await jobs.wait_for_job(AsyncMock(), "tenant-a", running.id, 0.1)
+
+        assert record.status == "running"
+        # Initial read plus one after the deadline; Redis answered in between
+        assert get_job.await_count == 2
+
+    async def test_redis_unavailable_polls_database(self):
+        broken = SimpleNamespace(get=AsyncMock(side_effect=ConnectionError("redis down")))
+        running, done = _record("running"), _record("failed")
+        get_job = AsyncMock(side_effect=[running, running, done])
+
+        with patch.object(jobs, "_redis", return_value=broken), patch.object(
+            jobs, "get_job", get_job
+        ), patch.object(jobs, "POLL_INTERVAL_SECONDS", 0.01):
+            record = await jobs.wait_for_job(AsyncMock(), "tenant-a", running.id, 5)
+
+        assert record is done
+
+    async def test_transaction_ended_while_waiting(self, fake_redis, tenant_context):
+        running, done = _record("running"), _record("success")
+        db = AsyncMock()
+        calls = []
+        db.rollback.side_effect = lambda: calls.append("rollback")
+        tenant_context.side_effect = lambda *args: calls.append("set_context")
+
+        async def get_job(*args):
+            calls.append("read")
+            return running if len(calls) == 1 else done
+
+        with patch.object(jobs, "get_job", get_job), patch.object(
+            jobs, "POLL_INTERVAL_SECONDS", 0.01
+        ):
+            record = await jobs.wait_for_job(db, "tenant-a", running.id, 0.05)
+
+        assert record is done
+        assert calls == ["read", "rollback", "set_context", "read"]
+        tenant_context.assert_awaited_with(db, "tenant-a")
+
+
+@pytest.mark.asyncio
+class TestJobResult:
+    """Tests for GET /jobs/{id}/result and callbacks."""
+
+    async def test_unfinished_job_conflicts(self):
+        with patch.object(jobs, "get_job", AsyncMock(return_value=_record("running"))), \
+                pytest.raises(HTTPException) as exc_info:
+            await jobs_api.get_execution_job_result(
+                uuid4(), x_tenant_id="tenant-a", db=MagicMock()
+            )
+
+        assert exc_info.value.status_code == 409
+
+    async def test_result_built_from_trace(self):
+        record = _record(
+            "success",
+            steps=[
+                {"step_type": "tool_call", "tool_name": "search_docs", "tool_args": {"q": "vpn"},
+                 "tool_result": "VPN guide"},
+                {"step_type": "llm_response", "response": "Reset your VPN client."},
+            ],
+        )
+
+        with patch.object(jobs, "get_job", AsyncMock(return_value=record)):
+            result = await jobs_api.get_execution_job_result(
+                record.id, x_tenant_id="tenant-a", db=MagicMock()
+            )
+
+        assert result.success is True
+        assert result.response == "Reset your VPN client."
+        assert result.tool_calls[0].tool_name == "search_docs"
+        assert result.duration_ms == 2100
+
+    async def test_callback_only_for_final_status(self, fake_redis):
+        deliver = AsyncMock(return_value=True)
+
+        with patch.object(jobs, "deliver_callback", deliver), patch.object(
+            jobs, "_signing_secret", AsyncMock(return_value="whsec")
+        ):
+            await jobs.finish_job(MagicMock(), _record("retrying"), "https://hooks.example.com/done")
+            assert deliver.await_count == 0
+
+            failed = _record("failed", errors={"message": "LLM unavailable"})
+            await jobs.finish_job(MagicMock(), failed, "https://hooks.example.com/done")
+
+        body = deliver.await_args.args[1]
+        assert body["status"] == "failed"
+        assert body["error"] == "LLM unavailable"
+        assert deliver.await_args.args[2] == "whsec"
+        assert fake_redis.data[f"agent_execution:{failed.id}:status"] == "failed"
+
+    async def test_callback_skipped_without_signing_secret(self, fake_redis):
+        deliver = AsyncMock(return_value=True)
+
+        with patch.object(jobs, "deliver_callback", deliver), patch.object(
+            jobs, "_signing_secret", AsyncMock(return_value=None)
+        ):
+            await jobs.finish_job(MagicMock(), _record("success"), "https://hooks.example.com/done")
+
+        deliver.assert_not_awaited()
+
+    @respx.mock
+    async def test_callback_body_signed(self):
+        route = respx.post("https://hooks.example.com/done").mock(
+            return_value=httpx.Response(204)
+        )
+        body = jobs.job_result(_record("success"))
+
+        assert await jobs.deliver_callback("https://hooks.example.com/done", body, "whsec") is True
+
+        request = route.calls.last.request
+        assert request.headers[jobs.CALLBACK_SIGNATURE_HEADER] == compute_hmac_signature(
+            "whsec", request.content
+        )
+
+    @respx.mock
+    async def test_callback_not_posted_to_private_address(self, dns):
+        dns["hooks.example.com"] = "10.0.0.8"
+        route = respx.post("https://hooks.example.com/done")
+
+        delivered = await jobs.deliver_callback(
+            "https://hooks.example.com/done", jobs.job_result(_record("success")), "whsec"
+        )
+
+        assert delivered is False
+        assert not route.called
+
+    @pytest.mark.parametrize(
+        "address", ["127.0.0.1", "10.1.2.3", "169.254.169.254", "::1", "::ffff:192.168.0.1"]
+    )
+    async def test_non_public_addresses_rejected(self, dns, address):
+        dns["hooks.example.com"] = address
+
+        with pytest.raises(jobs.CallbackURLError):
+            await jobs.check_callback_url("https://hooks.example.com/done")
+
+
+class JobSession:
+    """Session whose job reads return the given records and updates match rowcount rows."""
+
+    def __init__(self, reads, rowcount=1):
+        self.reads = list(reads)
+        self.rowcount = rowcount
+        self.updates = []
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def execute(self, statement):
+        if statement.is_dml:
+            self.updates.append(statement)
+            return SimpleNamespace(rowcount=self.rowcount)
+        return SimpleNamespace(scalar_one_or_none=lambda: self.reads.pop(0))
+
+
+def _ago(seconds):
+    return datetime.now(timezone.utc) - timedelta(seconds=seconds)
+
+
+@pytest.mark.asyncio
+class TestStaleJobs:
+    """Tests for failing jobs whose worker was killed or lost."""
+
+    async def test_stale_running_job_read_as_failed(self, fake_redis):
+        running = _record("running", created_at=_ago(7200))
+        failed = _record("failed", created_at=running.created_at)
+        failed.id = running.id
+        db = JobSession([running, failed])
+
+        record = await jobs.get_job(db, "tenant-a", running.id)
+
+        assert record is failed
+        (update,) = db.updates
+        assert update.compile().params["status"] == "failed"
+        db.commit.assert_awaited_once()
+        assert fake_redis.data[f"agent_execution:{running.id}:status"] == "failed"
+
+    async def test_recent_job_left_running(self, fake_redis):
+        running = _record("running", created_at=_ago(60))
+        db = JobSession([running])
+
+        assert await jobs.get_job(db, "tenant-a", running.id) is running
+        assert db.updates == []
+
+    async def test_concurrently_finished_job_not_failed(self, fake_redis):
+        queued = _record("queued", created_at=_ago(7200))
+        db = JobSession([queued], rowcount=0)
+
+        assert await jobs.fail_stale_job(db, queued) is False
+        assert fake_redis.data == {}
+
+    async def test_long_poll_ends_when_job_goes_stale(self, fake_redis):
+        running = _record("running", created_at=_ago(7200))
+        failed = _record("failed")
+        db = JobSession([running, failed])
+
+        record = await jobs.wait_for_job(db, "tenant-a", running.id, 5)
+
+        assert record is failed
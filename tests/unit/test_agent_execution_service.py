@@ -83,11 +83,11 @@ def test_agent_execution_service_initialization(mock_db_session: AsyncMock) -> N
 
 @pytest.mark.asyncio
 async def test_execute_agent_not_found(mock_db_session: AsyncMock) -> None:
-    """Test agent execution when agent is not found (get_agent_by_id returns None)."""
+    """Test agent execution when agent is not found (get_agent_snapshot returns None)."""
     service = AgentExecutionService(mock_db_session)
 
-    # Mock agent_service.get_agent_by_id to return None
-    service.agent_service.get_agent_by_id = AsyncMock(return_value=None)
+    # Mock agent_service.get_agent_snapshot to return None
+    service.agent_service.get_agent_snapshot = AsyncMock(return_value=None)
 
     # Execute and expect AgentExecutionError (wrapped ValueError)
     result = await service.execute_agent(
@@ -111,7 +111,7 @@ async def test_execute_agent_inactive_status(
     mock_agent.status = "inactive"
 
     # Mock agent retrieval
-    service.agent_service.get_agent_by_id = AsyncMock(return_value=mock_agent)
+    service.agent_service.get_agent_snapshot = AsyncMock(return_value=mock_agent)
 
     # Execute
     result = await service.execute_agent(
@@ -139,7 +139,7 @@ async def test_execute_agent_budget_exceeded(
     service = AgentExecutionService(mock_db_session)
 
     # Mock agent retrieval
-    service.agent_service.get_agent_by_id = AsyncMock(return_value=mock_agent)
+    service.agent_service.get_agent_snapshot = AsyncMock(return_value=mock_agent)
 
     # Mock LLM service to raise BudgetExceededError with required arguments
     service.llm_service.get_llm_client_for_tenant = AsyncMock(
@@ -174,7 +174,7 @@ async def test_execute_agent_success_mocked(
     service = AgentExecutionService(mock_db_session)
 
     # Mock agent retrieval
-    service.agent_service.get_agent_by_id = AsyncMock(return_value=mock_agent)
+    service.agent_service.get_agent_snapshot = AsyncMock(return_value=mock_agent)
     service.agent_service.get_agent_tools = AsyncMock(return_value=[])
 
     # Mock LLM service
@@ -188,7 +188,7 @@ async def test_execute_agent_success_mocked(
     mock_db_session.execute = AsyncMock(return_value=mock_result)
 
     # Mock LangGraph components
-    with patch("src.services.agent_execution_service.ChatOpenAI") as mock_chat_openai:
+    with patch("src.services.agent_execution.preparation.ChatOpenAI") as mock_chat_openai:
         with patch("src.services.agent_execution_service.create_react_agent") as mock_create_agent:
             # Setup LLM
             mock_llm = MagicMock()
@@ -216,6 +216,12 @@ async def test_execute_agent_success_mocked(
             assert result["model_used"] == "openai/gpt-4o-mini"
             assert result["error"] is None
 
+            # LLM calls are tagged for spend attribution
+            tags = mock_chat_openai.call_args.kwargs["extra_body"]["metadata"]["tags"]
+            assert f"agent:{mock_agent.name}" in tags
+            assert f"agent_id:{mock_agent.id}" in tags
+            assert any(tag.startswith("execution:") for tag in tags)
+
 
 # ============================================================================
 # Test Response Structure
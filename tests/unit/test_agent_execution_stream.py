@@ -0,0 +1,260 @@
+"""
+Unit tests for streaming agent execution.
+
+Tests cover:
+- LangGraph streaming events translated to token/tool/result events
+- Closing the stream cancelling the execution and releasing its MCP bridge
+- Budget errors reported as error events
+- The SSE endpoint body persisting the execution record, also on disconnect
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api import agent_execution_stream as stream_api
+from src.api.agent_execution import AgentExecutionRequest
+from src.exceptions import BudgetExceededError
+from src.services.agent_execution.event_stream import StreamEventTranslator
+from src.services.agent_execution.preparation import PreparedExecution
+from src.services.agent_execution_service import AgentExecutionService
+
+
+def _message(content):
+    """Message/chunk stand-in (langchain_core is not importable in unit tests)."""
+    return SimpleNamespace(content=content, tool_calls=[])
+
+
+def _graph_events():
+    return [
+        {"event": "on_chain_start", "parent_ids": [], "data": {}},
+        {
+            "event": "on_chat_model_stream",
+            "parent_ids": ["root"],
+            "data": {"chunk": _message("Checking ")},
+        },
+        {
+            "event": "on_tool_start",
+            "name": "search_docs",
+            "run_id": "run-1",
+            "parent_ids": ["root"],
+            "data": {"input": {"query": "vpn"}},
+        },
+        {
+            "event": "on_tool_end",
+            "name": "search_docs",
+            "run_id": "run-1",
+            "parent_ids": ["root"],
+            "data": {"output": _message("VPN guide")},
+        },
+        {
+            "event": "on_chain_end",
+            "parent_ids": [],
+            "data": {"output": {"messages": [_message("Reset your VPN client.")]}},
+        },
+    ]
+
+
+class FakeGraph:
+    """Compiled graph stand-in replaying events, optionally hanging after them."""
+
+    def __init__(self, events, hang=False):
+        self.events = events
+        self.hang = hang
+        self.cancelled = False
+        self.kwargs = None
+
+    async def astream_events(self, inputs, config=None, version=None, **kwargs):
+        self.kwargs = {"version": version, **kwargs}
+        for event in self.events:
+            yield event
+        if self.hang:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+
+def _service(graph=None, prepare_error=None):
+    service = AgentExecutionService(AsyncMock(spec=AsyncSession))
+    service._prepare_execution = AsyncMock(
+        side_effect=prepare_error,
+        return_value=PreparedExecution(
+            executor=graph,
+            inputs={"messages": []},
+            config={"max_concurrency": 4},
+            invoke_kwargs={"context": "run-context"},
+            model_string="openai/gpt-4o-mini",
+        ),
+    )
+    return service
+
+
+async def _collect(service):
+    return [
+        event
+        async for event in service.stream_agent(uuid4(), "tenant-a", "VPN is down")
+    ]
+
+
+def test_translator_ignores_internal_events():
+    translator = StreamEventTranslator()
+
+    assert translator.translate({"event": "on_chain_start", "parent_ids": []}) is None
+    assert translator.translate(
+        {"event": "on_chat_model_stream", "data": {"chunk": _message("")}}
+    ) is None
+    # Nested chains are not the final state
+    translator.translate({"event": "on_chain_end", "parent_ids": ["root"], "data": {"output": {}}})
+    assert translator.final_state is None
+
+
+@pytest.mark.asyncio
+class TestStreamAgent:
+    """Tests for AgentExecutionService.stream_agent()."""
+
+    async def test_streams_tokens_tools_and_result(self):
+        graph = FakeGraph(_graph_events())
+
+        with patch(
+            "src.services.agent_execution.streaming.cleanup_mcp_bridge", AsyncMock()
+        ) as cleanup:
+            events = await _collect(_service(graph))
+
+        assert [event["event"] for event in events] == [
+            "token",
+            "tool_start",
+            "tool_end",
+            "result",
+        ]
+        assert events[0]["data"] == {"text": "Checking "}
+        assert events[2]["data"]["tool_output"] == "VPN guide"
+        result = events[-1]["data"]
+        assert result["success"] is True
+        assert result["response"] == "Reset your VPN client."
+        assert result["model_used"] == "openai/gpt-4o-mini"
+        assert graph.kwargs == {"version": "v2", "context": "run-context"}
+        cleanup.assert_awaited_once()
+
+    async def test_closing_stream_cancels_execution(self):
+        graph = FakeGraph(_graph_events()[:2], hang=True)
+
+        with patch(
+            "src.services.agent_execution.streaming.cleanup_mcp_bridge", AsyncMock()
+        ) as cleanup:
+            stream = _service(graph).stream_agent(uuid4(), "tenant-a", "VPN is down")
+            first = await anext(stream)
+            await stream.aclose()
+
+        assert first["event"] == "token"
+        assert graph.cancelled
+        cleanup.assert_awaited_once()
+
+    async def test_budget_error_reported_as_event(self):
+        error = BudgetExceededError(tenant_id="tenant-a", current_spend=120.0, max_budget=100.0)
+
+        with patch("src.services.agent_execution.streaming.cleanup_mcp_bridge", AsyncMock()):
+            events = await _collect(_service(prepare_error=error))
+
+        assert [event["event"] for event in events] == ["error", "result"]
+        assert events[0]["data"]["type"] == "budget_exceeded"
+        assert events[0]["data"]["max_budget"] == 100.0
+        assert events[1]["data"]["success"] is False
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+        self.commit = AsyncMock()
+
+    def add(self, record):
+        self.added.append(record)
+
+
+@pytest.fixture
+def fake_session():
+    session = FakeSession()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    with patch.object(
+        stream_api, "get_async_session_maker", return_value=session_factory
+    ), patch.object(stream_api, "set_db_tenant_context", AsyncMock()):
+        yield session
+
+
+def _stream_service(events, hang=False):
+    async def stream_agent(**kwargs):
+        for event in events:
+            yield event
+        if hang:
+            await asyncio.Event().wait()
+
+    service = MagicMock()
+    service.stream_agent = stream_agent
+    return MagicMock(return_value=service)
+
+
+def _parse(frame):
+    event_line, data_line = frame.strip().split("\n")
+    return event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))
+
+
+@pytest.mark.asyncio
+class TestStreamEndpoint:
+    """Tests for the POST /execute/stream body."""
+
+    async def test_frames_and_saved_record(self, fake_session):
+        request = AgentExecutionRequest(agent_id=uuid4(), user_message="VPN is down")
+        result = {
+            "success": True,
+            "response": "Reset your VPN client.",
+            "tool_calls": [],
+            "execution_time_seconds": 1.5,
+            "model_used": "openai/gpt-4o-mini",
+            "error": None,
+        }
+        events = [
+            {"event": "token", "data": {"text": "Reset"}},
+            {"event": "result", "data": result},
+        ]
+
+        with patch.object(stream_api, "AgentExecutionService", _stream_service(events)):
+            frames = [
+                _parse(frame)
+                async for frame in stream_api._execution_events(
+                    request, "tenant-a", 0.0
+                )
+            ]
+
+        assert [name for name, _ in frames] == ["start", "token", "result"]
+        (record,) = fake_session.added
+        assert str(record.id) == frames[0][1]["execution_id"]
+        assert record.status == "success"
+        assert record.execution_trace["steps"][-1]["response"] == "Reset your VPN client."
+        fake_session.commit.assert_awaited_once()
+
+    async def test_disconnect_saves_cancelled_record(self, fake_session):
+        request = AgentExecutionRequest(agent_id=uuid4(), user_message="VPN is down")
+        events = [{"event": "token", "data": {"text": "Reset"}}]
+
+        with patch.object(
+            stream_api, "AgentExecutionService", _stream_service(events, hang=True)
+        ):
+            body = stream_api._execution_events(request, "tenant-a", 0.0)
+            await anext(body)
+            await anext(body)
+            await body.aclose()
+
+        (record,) = fake_session.added
+        assert record.status == "cancelled"
+        assert record.errors["error_type"] == "ClientDisconnected"
@@ -0,0 +1,183 @@
+"""
+Unit tests for the compiled agent executor cache.
+
+Tests cover:
+- Version stamps changing with agent, tool-set and MCP server versions
+- LRU keeping one stamp per agent
+- execute_agent compiling once per agent version and supplying the chat
+  model of each run through the runtime context
+- Executors with per-execution MCP sessions not being cached
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import Agent, MCPServer
+from src.services.agent_execution import executor_cache
+from src.services.agent_execution.executor_cache import (
+    AgentExecutorCache,
+    AgentRunContext,
+    CachedExecutor,
+    context_model,
+    detached_servers,
+    executor_stamp,
+)
+from src.services.agent_execution_service import AgentExecutionService
+
+
+def _agent():
+    agent = MagicMock(spec=Agent)
+    agent.id = uuid4()
+    agent.name = "Triage Agent"
+    agent.status = "active"
+    agent.system_prompt = "You are a triage assistant."
+    agent.cognitive_architecture = "react"
+    agent.llm_config = {"provider": "openai", "model": "gpt-4o-mini"}
+    agent.updated_at = datetime(2025, 11, 1, tzinfo=UTC)
+    return agent
+
+
+def _server(version=0):
+    return SimpleNamespace(id=uuid4(), discovery_version=version, updated_at=None)
+
+
+class TestExecutorStamp:
+    """Tests for version stamps."""
+
+    def test_stable_for_unchanged_agent(self):
+        agent, server = _agent(), _server()
+        tools = [{"source_type": "openapi", "name": "create_ticket"}]
+
+        assert executor_stamp(agent, tools, [server]) == executor_stamp(agent, tools, [server])
+
+    def test_changes_with_agent_tools_and_servers(self):
+        agent, server = _agent(), _server()
+        base = executor_stamp(agent, [], [server])
+
+        agent.updated_at += timedelta(seconds=1)
+        updated = executor_stamp(agent, [], [server])
+        assert updated != base
+        assert executor_stamp(agent, [{"name": "create_ticket"}], [server]) != updated
+        server.discovery_version = 1
+        assert executor_stamp(agent, [], [server]) != updated
+
+
+class TestAgentExecutorCache:
+    """Tests for the LRU."""
+
+    def test_new_stamp_replaces_old(self):
+        cache = AgentExecutorCache()
+        agent_id = uuid4()
+        cache.put(CachedExecutor(agent_id=agent_id, stamp="v1", executor="g1", tools=[]))
+        cache.put(CachedExecutor(agent_id=agent_id, stamp="v2", executor="g2", tools=[]))
+
+        assert cache.get(agent_id, "v1") is None
+        assert cache.get(agent_id, "v2").executor == "g2"
+        assert len(cache) == 1
+
+    def test_lru_bound(self):
+        cache = AgentExecutorCache(max_entries=2)
+        ids = [uuid4() for _ in range(3)]
+        for agent_id in ids:
+            cache.put(CachedExecutor(agent_id=agent_id, stamp="v1", executor=None, tools=[]))
+
+        assert cache.get(ids[0], "v1") is None
+        assert len(cache) == 2
+
+    def test_context_model_reads_runtime_context(self):
+        model = object()
+        runtime = SimpleNamespace(context=AgentRunContext(model=model))
+
+        assert context_model({}, runtime) is model
+
+    def test_detached_servers_are_transient_copies(self):
+        server = MCPServer(id=uuid4(), tenant_id="t", name="jira", discovery_version=3)
+
+        (copy,) = detached_servers([server])
+
+        assert copy is not server
+        assert (copy.id, copy.name, copy.discovery_version) == (server.id, "jira", 3)
+        assert sa_inspect(copy).transient
+
+
+@pytest.fixture
+def service():
+    db = AsyncMock(spec=AsyncSession)
+    servers = MagicMock()
+    servers.scalars.return_value.all.return_value = []
+    db.execute = AsyncMock(return_value=servers)
+
+    service = AgentExecutionService(db)
+    service.agent_service.get_agent_tools = AsyncMock(return_value=[])
+    service.llm_service.get_llm_client_for_tenant = AsyncMock(
+        return_value=SimpleNamespace(api_key="virtual-key")
+    )
+    return service
+
+
+@pytest.fixture
+def fresh_cache():
+    cache = AgentExecutorCache()
+    with patch.object(executor_cache, "get_executor_cache", return_value=cache), patch(
+        "src.services.agent_execution.preparation.get_executor_cache", return_value=cache
+    ):
+        yield cache
+
+
+@pytest.mark.asyncio
+class TestExecuteAgentReuse:
+    """Tests for execute_agent reusing cached executors."""
+
+    async def test_compiles_once_per_agent_version(self, service, fresh_cache):
+        agent = _agent()
+        service.agent_service.get_agent_snapshot = AsyncMock(return_value=agent)
+        graph = MagicMock()
+        graph.ainvoke = AsyncMock(return_value={"messages": [MagicMock(content="done")]})
+
+        with patch("src.services.agent_execution.preparation.ChatOpenAI") as chat_openai, patch(
+            "src.services.agent_execution_service.create_react_agent", return_value=graph
+        ) as create_agent, patch(
+            "src.services.agent_execution.preparation.convert_tools_to_langchain",
+            AsyncMock(return_value=[]),
+        ) as convert:
+            chat_openai.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+            for _ in range(2):
+                result = await service.execute_agent(agent.id, "tenant-a", "Triage OPS-1")
+                assert result["success"] is True
+
+            agent.updated_at += timedelta(minutes=5)
+            await service.execute_agent(agent.id, "tenant-a", "Triage OPS-2")
+
+        assert create_agent.call_count == 2
+        assert convert.await_count == 2
+        assert create_agent.call_args.kwargs["model"] is context_model
+
+        contexts = [call.kwargs["context"] for call in graph.ainvoke.await_args_list]
+        tags = [ctx.model.extra_body["metadata"]["tags"][-1] for ctx in contexts]
+        assert len(set(tags)) == 3
+
+    async def test_legacy_sessions_not_cached(self, service, fresh_cache):
+        agent = _agent()
+        service.agent_service.get_agent_snapshot = AsyncMock(return_value=agent)
+        graph = MagicMock()
+        graph.ainvoke = AsyncMock(return_value={"messages": [MagicMock(content="done")]})
+        bridge = SimpleNamespace(holds_execution_sessions=True)
+
+        with patch("src.services.agent_execution.preparation.ChatOpenAI"), patch(
+            "src.services.agent_execution_service.create_react_agent", return_value=graph
+        ), patch(
+            "src.services.agent_execution.preparation.convert_tools_to_langchain",
+            AsyncMock(return_value=[]),
+        ), patch(
+            "src.services.agent_execution.preparation.get_mcp_bridge", return_value=bridge
+        ):
+            await service.execute_agent(agent.id, "tenant-a", "Triage OPS-1")
+
+        assert len(fresh_cache) == 0
+        assert "context" not in graph.ainvoke.await_args.kwargs
@@ -0,0 +1,105 @@
+"""
+Unit tests for the agent memory embedding backfill.
+
+Tests cover:
+- Parsing of legacy text embeddings (JSON lists of 1536 finite numbers)
+- Batches converting valid rows and clearing unusable ones
+- Runs stopping once no legacy rows remain, or after max_batches
+"""
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.agent_memory_backfill import (
+    EMBEDDING_DIMENSIONS,
+    MemoryEmbeddingBackfill,
+    parse_legacy_embedding,
+)
+
+
+def _legacy(value=0.5, dimensions=EMBEDDING_DIMENSIONS):
+    return json.dumps([value] * dimensions)
+
+
+class TestParseLegacyEmbedding:
+    """Tests for parse_legacy_embedding."""
+
+    def test_embedding_service_format(self):
+        assert parse_legacy_embedding(_legacy()) == [0.5] * EMBEDDING_DIMENSIONS
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "not json",
+            '{"embedding": []}',
+            _legacy(dimensions=3),
+            json.dumps(["0.5"] * EMBEDDING_DIMENSIONS),
+            json.dumps([True] * EMBEDDING_DIMENSIONS),
+            _legacy(value=float("nan")),
+        ],
+    )
+    def test_unusable(self, value):
+        assert parse_legacy_embedding(value) is None
+
+
+class FakeSession:
+    """Session returning queued legacy row batches and recording statements."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.statements = []
+        self.commit = AsyncMock()
+
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        if len(self.statements) == 1:
+            result = MagicMock()
+            result.all.return_value = self.batches.pop(0) if self.batches else []
+            return result
+        return MagicMock()
+
+
+def _backfill(batches, max_batches=10):
+    sessions = []
+
+    @asynccontextmanager
+    async def session_maker():
+        session = FakeSession(batches[len(sessions):len(sessions) + 1])
+        sessions.append(session)
+        yield session
+
+    return MemoryEmbeddingBackfill(session_maker, batch_size=2, max_batches=max_batches), sessions
+
+
+@pytest.mark.asyncio
+class TestBackfillRun:
+    """Tests for MemoryEmbeddingBackfill.run."""
+
+    async def test_converts_valid_and_clears_invalid_rows(self):
+        valid, invalid = uuid4(), uuid4()
+        backfill, sessions = _backfill([[(valid, _legacy()), (invalid, "[0.1, 0.2]")]])
+
+        result = await backfill.run()
+
+        assert (result.batches, result.converted, result.invalid, result.done) == (1, 1, 1, True)
+        select, convert, clear = sessions[0].statements
+        assert "FOR UPDATE SKIP LOCKED" in str(
+            select[0].compile(dialect=postgresql.dialect())
+        )
+        assert convert[1] == [{"memory_id": valid, "vector": [0.5] * EMBEDDING_DIMENSIONS}]
+        assert "embedding_legacy" in str(clear[0])
+        sessions[0].commit.assert_awaited_once()
+
+    async def test_stops_after_max_batches(self):
+        batches = [[(uuid4(), _legacy())] for _ in range(3)]
+        backfill, sessions = _backfill(batches, max_batches=2)
+
+        result = await backfill.run()
+
+        assert (result.batches, result.converted, result.done) == (2, 2, False)
+        assert len(sessions) == 2
@@ -0,0 +1,199 @@
+"""
+Unit tests for agent execution snapshots.
+
+Tests cover:
+- Snapshots holding frozen copies and the decrypted webhook secret
+- Repeated lookups served without database queries
+- Tenant isolation
+- Invalidations from other processes through the Redis version
+- Falling back to the local TTL when Redis is unavailable
+- AgentService.get_agent_tools() reading assignments from a snapshot
+"""
+
+import dataclasses
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services.agent_execution import agent_snapshot
+from src.services.agent_execution.agent_snapshot import (
+    AgentSnapshotCache,
+    build_snapshot,
+    get_agent_snapshot,
+    invalidate_agent_snapshot,
+)
+from src.services.agent_service import AgentService
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the shared Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+def _agent_row(hmac_secret=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        tenant_id="tenant-a",
+        name="Triage Agent",
+        status="active",
+        system_prompt="You are a triage assistant.",
+        llm_config={"provider": "openai", "model": "gpt-4o-mini", "extra": {"seed": 1}},
+        cognitive_architecture="react",
+        updated_at=datetime(2025, 11, 1, tzinfo=UTC),
+        tools=[SimpleNamespace(tool_id="create_ticket")],
+        assigned_mcp_tools=[{"name": "search_docs", "source_type": "mcp"}],
+        triggers=[
+            SimpleNamespace(
+                id=uuid4(),
+                trigger_type="webhook",
+                hmac_secret=hmac_secret or "enc:s3cret",
+                payload_schema={"type": "object"},
+            )
+        ],
+    )
+
+
+def _db(row):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = row
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _decrypt(ciphertext):
+    if not ciphertext.startswith("enc:"):
+        raise ValueError("Decryption failed")
+    return ciphertext[4:]
+
+
+@pytest.fixture(autouse=True)
+def fake_decrypt():
+    with patch("src.utils.encryption.decrypt", side_effect=_decrypt):
+        yield
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch.object(agent_snapshot, "_redis", return_value=redis), patch.object(
+        agent_snapshot, "_cache", AgentSnapshotCache()
+    ):
+        yield redis
+
+
+class TestBuildSnapshot:
+    """Tests for snapshot contents."""
+
+    def test_frozen_copies_and_decrypted_secret(self):
+        row = _agent_row()
+        snapshot = build_snapshot(row, version=3)
+
+        row.llm_config["extra"]["seed"] = 2
+        assert snapshot.llm_config["extra"]["seed"] == 1
+        with pytest.raises(TypeError):
+            snapshot.llm_config["model"] = "gpt-4o"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.status = "inactive"
+        assert snapshot.webhook.hmac_secret == "s3cret"
+        assert snapshot.openapi_tool_ids == ("create_ticket",)
+        assert snapshot.version == 3
+
+    def test_undecryptable_secret_not_cacheable(self):
+        snapshot = build_snapshot(_agent_row(hmac_secret="not-a-fernet-token"))
+
+        assert snapshot.webhook.hmac_secret is None
+        assert not snapshot.cacheable
+
+
+@pytest.mark.asyncio
+class TestGetAgentSnapshot:
+    """Tests for cached snapshot lookups."""
+
+    async def test_repeated_lookup_served_from_memory(self, fake_redis):
+        row = _agent_row()
+        db = _db(row)
+
+        first = await get_agent_snapshot(db, row.id)
+        second = await get_agent_snapshot(db, row.id, tenant_id="tenant-a")
+
+        assert second is first
+        db.execute.assert_awaited_once()
+
+    async def test_other_tenant_sees_no_agent(self, fake_redis):
+        row = _agent_row()
+
+        assert await get_agent_snapshot(_db(row), row.id, tenant_id="tenant-b") is None
+
+    async def test_invalidation_from_other_process(self, fake_redis):
+        row = _agent_row()
+        db = _db(row)
+        await get_agent_snapshot(db, row.id)
+
+        # Another process commits a prompt change and bumps the version
+        row.system_prompt = "You are a senior triage assistant."
+        await fake_redis.incr(f"agent_snapshot:{row.id}:version")
+
+        snapshot = await get_agent_snapshot(db, row.id)
+        assert snapshot.system_prompt == "You are a senior triage assistant."
+        assert db.execute.await_count == 2
+
+    async def test_local_invalidation(self, fake_redis):
+        row = _agent_row()
+        db = _db(row)
+        await get_agent_snapshot(db, row.id)
+
+        await invalidate_agent_snapshot(row.id)
+        await get_agent_snapshot(db, row.id)
+
+        assert db.execute.await_count == 2
+        assert fake_redis.data[f"agent_snapshot:{row.id}:version"] == "1"
+
+    async def test_redis_unavailable_uses_local_ttl(self):
+        broken = SimpleNamespace(get=AsyncMock(side_effect=ConnectionError("redis down")))
+        cache = AgentSnapshotCache(ttl_seconds=60)
+        row = _agent_row()
+        db = _db(row)
+
+        with patch.object(agent_snapshot, "_redis", return_value=broken), patch.object(
+            agent_snapshot, "_cache", cache
+        ):
+            await get_agent_snapshot(db, row.id)
+            await get_agent_snapshot(db, row.id)
+            assert db.execute.await_count == 1
+
+            with patch("src.services.agent_execution.agent_snapshot.time.monotonic",
+                       return_value=cache._entries[row.id].loaded_at + 61):
+                await get_agent_snapshot(db, row.id)
+            assert db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_agent_tools_reads_snapshot():
+    snapshot = build_snapshot(_agent_row())
+    db = MagicMock()
+    db.execute = AsyncMock()
+    catalog = [SimpleNamespace(name="search_docs")]
+
+    with patch(
+        "src.services.unified_tool_service.UnifiedToolService.list_tools",
+        AsyncMock(return_value=catalog),
+    ):
+        tools = await AgentService().get_agent_tools(
+            snapshot.id, "tenant-a", db, snapshot=snapshot
+        )
+
+    assert [tool["name"] for tool in tools] == ["create_ticket", "search_docs"]
+    db.execute.assert_not_awaited()
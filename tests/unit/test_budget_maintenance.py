@@ -0,0 +1,205 @@
+"""
+Unit tests for the batched budget maintenance pipelines.
+
+Tests cover:
+- budget_duration parsing for all supported units
+- Concurrent LiteLLM key updates with per-key error capture
+- Budget reset batches: set-based updates grouped by duration, failures left due
+- Override expiry batches: one key update per tenant, missing tenants reported
+- Keyset pagination across multiple batches
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from sqlalchemy.sql.dml import Delete, Insert, Update
+
+from src.services.budget_maintenance import BudgetMaintenanceService, parse_budget_duration
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _tenant_row(tenant_id, key="sk-key", duration="30d"):
+    return SimpleNamespace(
+        id=f"uuid-{tenant_id}",
+        tenant_id=tenant_id,
+        litellm_virtual_key=f"{key}-{tenant_id}" if key else None,
+        budget_duration=duration,
+        litellm_key_last_reset=None,
+        max_budget=500.0,
+    )
+
+
+def _session_maker(select_batches):
+    """Session factory whose SELECTs return the given batches in order."""
+    executed = []
+    batches = iter(select_batches)
+
+    async def execute(stmt, params=None):
+        executed.append((stmt, params))
+        result = MagicMock()
+        if not isinstance(stmt, (Update, Delete, Insert)):
+            result.all.return_value = next(batches, [])
+        return result
+
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.__aenter__.return_value = session
+    maker = MagicMock(return_value=session)
+    return maker, session, executed
+
+
+def _service(maker, batch_size=100):
+    return BudgetMaintenanceService(
+        maker,
+        litellm_proxy_url="http://litellm:4000",
+        master_key="sk-master",
+        batch_size=batch_size,
+        concurrency=4,
+    )
+
+
+class TestParseBudgetDuration:
+    """Tests for budget_duration parsing."""
+
+    @pytest.mark.parametrize(
+        "duration,expected",
+        [
+            ("30d", timedelta(days=30)),
+            ("12h", timedelta(hours=12)),
+            ("30m", timedelta(minutes=30)),
+            ("45s", timedelta(seconds=45)),
+            (None, timedelta(days=30)),
+        ],
+    )
+    def test_supported_units(self, duration, expected):
+        assert parse_budget_duration(duration) == expected
+
+    @pytest.mark.parametrize("duration", ["30w", "d", "abc"])
+    def test_invalid_duration(self, duration):
+        with pytest.raises(ValueError):
+            parse_budget_duration(duration)
+
+
+@pytest.mark.asyncio
+class TestUpdateLiteLLMKeys:
+    """Tests for concurrent LiteLLM key updates."""
+
+    async def test_errors_captured_per_key(self):
+        def handler(request):
+            if b"sk-bad" in request.content:
+                return httpx.Response(500)
+            return httpx.Response(200, json={})
+
+        service = _service(MagicMock())
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            results = await service._update_litellm_keys(
+                client, [{"key": "sk-good", "spend": 0}, {"key": "sk-bad", "spend": 0}]
+            )
+
+        assert results["sk-good"] is None
+        assert results["sk-bad"]
+
+
+@pytest.mark.asyncio
+class TestResetDueBudgets:
+    """Tests for the budget reset pipeline."""
+
+    async def test_batch_updates_grouped_by_duration(self):
+        rows = [
+            _tenant_row("acme"),
+            _tenant_row("globex", duration="7d"),
+            _tenant_row("initech"),
+            _tenant_row("nokey", key=None),
+            _tenant_row("broken"),
+        ]
+        maker, session, executed = _session_maker([rows])
+        service = _service(maker)
+        progress = []
+
+        with patch.object(
+            service,
+            "_update_litellm_keys",
+            AsyncMock(return_value={"sk-key-broken": "HTTP 500"}),
+        ), patch("src.services.spend_ledger.SpendLedger.invalidate_many", new_callable=AsyncMock) as invalidate:
+            result = await service.reset_due_budgets(NOW, on_progress=progress.append)
+
+        updates = [stmt for stmt, _ in executed if isinstance(stmt, Update)]
+        inserts = [params for stmt, params in executed if isinstance(stmt, Insert)]
+        assert len(updates) == 2  # 30d group and 7d group
+        assert len(inserts[0]) == 4
+        assert result.due_count == 5
+        assert result.success_count == 4
+        assert result.failed[0]["tenant_id"] == "broken"
+        assert set(invalidate.await_args.args[0]) == {"acme", "globex", "initech", "nokey"}
+        session.commit.assert_awaited_once()
+        assert progress[-1]["success_count"] == 4
+
+    async def test_keyset_pagination_across_batches(self):
+        maker, session, executed = _session_maker(
+            [[_tenant_row("a"), _tenant_row("b")], [_tenant_row("c")]]
+        )
+        service = _service(maker, batch_size=2)
+
+        with patch.object(service, "_update_litellm_keys", AsyncMock(return_value={})), patch(
+            "src.services.spend_ledger.SpendLedger.invalidate_many", new_callable=AsyncMock
+        ):
+            result = await service.reset_due_budgets(NOW)
+
+        assert result.batches == 2
+        assert result.success_count == 3
+        assert session.commit.await_count == 2
+
+    async def test_no_due_tenants(self):
+        maker, session, _ = _session_maker([[]])
+        service = _service(maker)
+
+        with patch.object(service, "_update_litellm_keys", AsyncMock(return_value={})):
+            result = await service.reset_due_budgets(NOW)
+
+        assert result.due_count == 0
+        assert result.batches == 0
+        session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestExpireDueOverrides:
+    """Tests for the override expiry pipeline."""
+
+    @staticmethod
+    def _override_row(override_id, tenant_id, tenant_config_id="uuid", key="sk-key"):
+        return SimpleNamespace(
+            id=override_id,
+            tenant_id=tenant_id,
+            override_amount=100.0,
+            expires_at=NOW - timedelta(hours=1),
+            created_at=NOW - timedelta(days=1),
+            reason="campaign",
+            created_by="admin",
+            tenant_config_id=tenant_config_id,
+            litellm_virtual_key=key,
+            max_budget=500.0,
+        )
+
+    async def test_one_key_update_per_tenant(self):
+        rows = [
+            self._override_row(1, "acme"),
+            self._override_row(2, "acme"),
+            self._override_row(3, "ghost", tenant_config_id=None, key=None),
+        ]
+        maker, session, executed = _session_maker([rows])
+        service = _service(maker)
+        update_keys = AsyncMock(return_value={})
+
+        with patch.object(service, "_update_litellm_keys", update_keys):
+            result = await service.expire_due_overrides(NOW)
+
+        payloads = list(update_keys.await_args.args[1])
+        assert payloads == [{"key": "sk-key", "max_budget": 500.0}]
+        deletes = [stmt for stmt, _ in executed if isinstance(stmt, Delete)]
+        assert len(deletes) == 1
+        assert result.success_count == 2
+        assert result.failed == [{"id": "3", "tenant_id": "ghost", "error": "Tenant not found"}]
@@ -14,6 +14,7 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.services.budget_service import BudgetService, BudgetStatus
+from src.services.spend_ledger import LedgerEntry
 from src.exceptions import BudgetExceededError
 
 
@@ -222,6 +223,83 @@ class TestCheckBudgetExceeded:
             assert message == ""
 
 
+@pytest.mark.asyncio
+class TestCheckBudgetExceededLedger:
+    """Test check_budget_exceeded against the Redis spend ledger."""
+
+    async def test_ledger_hit_blocks_without_litellm_call(self, budget_service):
+        """Test that a blocked ledger entry is reported without get_budget_status."""
+        entry = LedgerEntry(
+            tenant_id="acme-corp",
+            spend=560.00,
+            max_budget=500.00,
+            grace_threshold=110,
+            reconciled_at=0.0,
+        )
+
+        with patch.object(budget_service, "_get_ledger_entry", return_value=entry), patch.object(
+            budget_service, "get_budget_status"
+        ) as mock_status:
+            exceeded, message = await budget_service.check_budget_exceeded("acme-corp")
+
+            assert exceeded == True
+            assert "$560.00" in message
+            mock_status.assert_not_called()
+
+    async def test_ledger_miss_falls_back_to_litellm(self, budget_service):
+        """Test fallback to get_budget_status when the ledger has no entry."""
+        mock_status = BudgetStatus(
+            tenant_id="acme-corp",
+            spend=100.00,
+            max_budget=500.00,
+            percentage_used=20.0,
+            grace_remaining=450.00,
+            days_until_reset=None,
+            alert_threshold=80,
+            grace_threshold=110,
+            is_blocked=False,
+        )
+
+        with patch.object(budget_service, "_get_ledger_entry", return_value=None), patch.object(
+            budget_service, "get_budget_status", return_value=mock_status
+        ) as get_status:
+            exceeded, message = await budget_service.check_budget_exceeded("acme-corp")
+
+            assert exceeded == False
+            get_status.assert_awaited_once_with("acme-corp")
+
+    async def test_reconcile_spend_ledger(self, budget_service, mock_db):
+        """Test reconciliation writes LiteLLM spend and records failures."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("acme-corp", 500.00, 110), ("globex", None, None)]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        ok_response = MagicMock()
+        ok_response.raise_for_status = MagicMock()
+        ok_response.json.return_value = {"spend": 42.0}
+
+        async def fake_get(url, headers=None, params=None):
+            if params["user_id"] == "globex":
+                raise Exception("Connection timeout")
+            return ok_response
+
+        with patch("httpx.AsyncClient") as mock_client_class, patch(
+            "src.services.budget_service.SpendLedger"
+        ) as mock_ledger_class:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(side_effect=fake_get)
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_ledger = mock_ledger_class.return_value
+            mock_ledger.set = AsyncMock()
+
+            result = await budget_service.reconcile_spend_ledger()
+
+        assert result["tenant_count"] == 2
+        assert result["reconciled_count"] == 1
+        assert result["failed_tenants"][0]["tenant_id"] == "globex"
+        mock_ledger.set.assert_awaited_once_with("acme-corp", 42.0, 500.00, 110)
+
+
 @pytest.mark.asyncio
 class TestHandleBudgetBlock:
     """Test handle_budget_block method."""
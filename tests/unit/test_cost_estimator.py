@@ -0,0 +1,113 @@
+"""
+Unit tests for the pre-call cost estimator.
+
+Tests cover:
+- Prompt token approximation for text, multi-part content and tool schemas
+- Pricing lookup by exact model, provider wildcard and settings defaults
+- Output bound from max_tokens and the configured default
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.schemas.llm_models import ModelInfo
+from src.services.cost_estimator import CostEstimator, estimate_prompt_tokens
+
+
+def _model(model_id, input_cost=None, output_cost=None):
+    return ModelInfo(
+        id=model_id,
+        name=model_id,
+        provider="openai",
+        max_tokens=8192,
+        supports_function_calling=True,
+        input_cost_per_token=input_cost,
+        output_cost_per_token=output_cost,
+    )
+
+
+@pytest.fixture
+def discovery():
+    """Mock ModelDiscoveryService with priced and unpriced models."""
+    service = MagicMock()
+    service.get_available_models = AsyncMock(
+        return_value=[
+            _model("openai/gpt-4o-mini", 0.00000015, 0.0000006),
+            _model("xai/*", 0.000002, 0.00001),
+            _model("local/llama"),
+        ]
+    )
+    return service
+
+
+class TestEstimatePromptTokens:
+    """Tests for prompt token approximation."""
+
+    def test_text_messages(self):
+        body = {"messages": [{"role": "user", "content": "a" * 400}]}
+        assert estimate_prompt_tokens(body) == 104
+
+    def test_multipart_content_and_tools_counted(self):
+        body = {
+            "messages": [{"role": "user", "content": [{"type": "text", "text": "hi"}]}],
+            "tools": [{"type": "function", "function": {"name": "lookup"}}],
+        }
+        assert estimate_prompt_tokens(body) > 4
+
+    def test_empty_body(self):
+        assert estimate_prompt_tokens({}) == 0
+
+
+@pytest.mark.asyncio
+class TestCostEstimator:
+    """Tests for pricing lookup and cost estimates."""
+
+    async def test_exact_model_pricing(self, discovery):
+        estimator = CostEstimator(discovery_service=discovery)
+        assert await estimator.get_pricing("openai/gpt-4o-mini") == (0.00000015, 0.0000006)
+
+    async def test_provider_wildcard_pricing(self, discovery):
+        estimator = CostEstimator(discovery_service=discovery)
+        assert await estimator.get_pricing("xai/grok-4") == (0.000002, 0.00001)
+
+    async def test_unpriced_model_uses_defaults(self, discovery):
+        estimator = CostEstimator(discovery_service=discovery)
+        input_cost, output_cost = await estimator.get_pricing("local/llama")
+
+        settings = estimator._settings
+        assert input_cost == settings.budget_estimator_default_input_cost_per_token
+        assert output_cost == settings.budget_estimator_default_output_cost_per_token
+
+    async def test_discovery_failure_uses_defaults(self, discovery):
+        discovery.get_available_models.side_effect = Exception("LiteLLM down")
+        estimator = CostEstimator(discovery_service=discovery)
+
+        input_cost, _ = await estimator.get_pricing("openai/gpt-4o-mini")
+
+        assert input_cost == estimator._settings.budget_estimator_default_input_cost_per_token
+
+    async def test_estimate_uses_max_tokens(self, discovery):
+        estimator = CostEstimator(discovery_service=discovery)
+        body = {
+            "model": "xai/grok-4",
+            "messages": [{"role": "user", "content": "a" * 400}],
+            "max_tokens": 500,
+        }
+
+        estimate = await estimator.estimate(body)
+
+        assert estimate.prompt_tokens == 104
+        assert estimate.max_output_tokens == 500
+        assert estimate.estimated_cost == pytest.approx(104 * 0.000002 + 500 * 0.00001)
+
+    async def test_estimate_default_output_bound(self, discovery):
+        estimator = CostEstimator(discovery_service=discovery)
+
+        estimate = await estimator.estimate({"model": "xai/grok-4", "messages": []})
+
+        assert estimate.max_output_tokens == estimator._settings.budget_estimator_default_max_output_tokens
+
+    async def test_estimate_without_model(self, discovery):
+        estimator = CostEstimator(discovery_service=discovery)
+        assert await estimator.estimate({"messages": []}) is None
@@ -0,0 +1,236 @@
+"""
+Unit tests for cooperative execution cancellation.
+
+Tests cover:
+- Tenant-scoped cancel flags, failing open without Redis
+- The callback handler aborting at the next LLM turn or tool call
+- Cancelled executions raised by execute_agent and reported by stream_agent
+- Streamed executions saved as cancelled
+- The agent execution cancel endpoint
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api import agent_execution as agent_execution_api
+from src.api import agent_execution_stream as stream_api
+from src.api.agent_execution import AgentExecutionRequest
+from src.services import execution_cancellation
+from src.services.agent_execution import jobs
+from src.services.agent_execution.cancellation import CancellationCallbackHandler
+from src.services.agent_execution.preparation import PreparedExecution
+from src.services.agent_execution_service import AgentExecutionService
+from src.services.execution_cancellation import (
+    ExecutionCancelledError,
+    is_cancellation_requested,
+    raise_if_cancelled,
+    request_cancellation,
+)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the shared Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch.object(execution_cancellation, "_redis", return_value=redis):
+        yield redis
+
+
+@pytest.mark.asyncio
+class TestCancelFlag:
+    """Tests for the Redis cancel flag."""
+
+    async def test_flag_is_tenant_scoped(self, fake_redis):
+        execution_id = uuid4()
+
+        assert await request_cancellation("tenant-a", execution_id) is True
+
+        assert await is_cancellation_requested("tenant-a", execution_id) is True
+        assert await is_cancellation_requested("tenant-b", execution_id) is False
+        with pytest.raises(ExecutionCancelledError):
+            await raise_if_cancelled("tenant-a", execution_id)
+
+    async def test_redis_unavailable(self):
+        broken = SimpleNamespace(
+            set=AsyncMock(side_effect=ConnectionError("redis down")),
+            exists=AsyncMock(side_effect=ConnectionError("redis down")),
+        )
+
+        with patch.object(execution_cancellation, "_redis", return_value=broken):
+            assert await request_cancellation("tenant-a", uuid4()) is False
+            # Executions keep running when the flag cannot be read
+            await raise_if_cancelled("tenant-a", uuid4())
+
+    async def test_handler_aborts_next_tool_call(self, fake_redis):
+        execution_id = uuid4()
+        handler = CancellationCallbackHandler("tenant-a", execution_id)
+
+        await handler.on_chat_model_start({}, [[]])
+        await request_cancellation("tenant-a", execution_id)
+
+        assert handler.raise_error is True
+        with pytest.raises(ExecutionCancelledError):
+            await handler.on_tool_start({}, "{}")
+
+
+class CancellingGraph:
+    """Graph stand-in calling the run's callbacks like LangGraph before a tool call."""
+
+    async def _tool_start(self, config):
+        for handler in config.get("callbacks", []):
+            await handler.on_tool_start({"name": "search_docs"}, "{}")
+
+    async def ainvoke(self, inputs, config=None, **kwargs):
+        await self._tool_start(config)
+        return {"messages": []}
+
+    async def astream_events(self, inputs, config=None, version=None, **kwargs):
+        yield {"event": "on_chain_start", "parent_ids": [], "data": {}}
+        await self._tool_start(config)
+
+
+def _service():
+    service = AgentExecutionService(AsyncMock(spec=AsyncSession))
+    service._prepare_execution = AsyncMock(
+        return_value=PreparedExecution(
+            executor=CancellingGraph(),
+            inputs={"messages": []},
+            config={"max_concurrency": 4},
+            invoke_kwargs={},
+            model_string="openai/gpt-4o-mini",
+        )
+    )
+    return service
+
+
+@pytest.mark.asyncio
+class TestCancelledExecution:
+    """Tests for cancellation in AgentExecutionService."""
+
+    async def test_execute_agent_raises_and_releases_bridge(self, fake_redis):
+        execution_id = uuid4()
+        await request_cancellation("tenant-a", execution_id)
+
+        with patch(
+            "src.services.agent_execution_service.cleanup_mcp_bridge", AsyncMock()
+        ) as cleanup, pytest.raises(ExecutionCancelledError):
+            await _service().execute_agent(
+                uuid4(), "tenant-a", "VPN is down", execution_id=execution_id
+            )
+
+        cleanup.assert_awaited_once()
+
+    async def test_uncancellable_without_execution_id(self, fake_redis):
+        with patch("src.services.agent_execution_service.cleanup_mcp_bridge", AsyncMock()):
+            result = await _service().execute_agent(uuid4(), "tenant-a", "VPN is down")
+
+        assert result["success"] is True
+
+    async def test_stream_reports_cancelled_error(self, fake_redis):
+        execution_id = uuid4()
+        await request_cancellation("tenant-a", execution_id)
+
+        with patch("src.services.agent_execution.streaming.cleanup_mcp_bridge", AsyncMock()):
+            events = [
+                event
+                async for event in _service().stream_agent(
+                    uuid4(), "tenant-a", "VPN is down", execution_id=execution_id
+                )
+            ]
+
+        assert [event["event"] for event in events] == ["error", "result"]
+        assert events[0]["data"]["type"] == "cancelled"
+        assert events[1]["data"]["success"] is False
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+        self.commit = AsyncMock()
+
+    def add(self, record):
+        self.added.append(record)
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_saves_cancelled_record():
+    session = FakeSession()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    received = {}
+
+    async def stream_agent(**kwargs):
+        received.update(kwargs)
+        yield {"event": "error", "data": {"type": "cancelled", "message": "cancelled"}}
+        yield {
+            "event": "result",
+            "data": {"success": False, "response": "", "tool_calls": [], "error": "cancelled"},
+        }
+
+    service = MagicMock()
+    service.stream_agent = stream_agent
+    request = AgentExecutionRequest(agent_id=uuid4(), user_message="VPN is down")
+
+    with patch.object(
+        stream_api, "get_async_session_maker", return_value=session_factory
+    ), patch.object(stream_api, "set_db_tenant_context", AsyncMock()), patch.object(
+        stream_api, "AgentExecutionService", MagicMock(return_value=service)
+    ):
+        frames = [
+            frame
+            async for frame in stream_api._execution_events(request, "tenant-a", 0.0)
+        ]
+
+    (record,) = session.added
+    assert record.status == "cancelled"
+    # The stream is cancellable by the ID of its start event
+    assert str(received["execution_id"]) in frames[0]
+
+
+@pytest.mark.asyncio
+class TestCancelEndpoint:
+    """Tests for POST /api/agent-execution/{execution_id}/cancel."""
+
+    async def test_finished_job_conflicts(self, fake_redis):
+        record = SimpleNamespace(status="success")
+
+        with patch.object(jobs, "get_job", AsyncMock(return_value=record)), \
+                pytest.raises(HTTPException) as exc_info:
+            await agent_execution_api.cancel_execution(
+                uuid4(), x_tenant_id="tenant-a", db=MagicMock()
+            )
+
+        assert exc_info.value.status_code == 409
+        assert fake_redis.data == {}
+
+    async def test_running_execution_flagged(self, fake_redis):
+        execution_id = uuid4()
+
+        with patch.object(jobs, "get_job", AsyncMock(return_value=None)):
+            response = await agent_execution_api.cancel_execution(
+                execution_id, x_tenant_id="tenant-a", db=MagicMock()
+            )
+
+        assert response.status == "cancelling"
+        assert await is_cancellation_requested("tenant-a", execution_id)
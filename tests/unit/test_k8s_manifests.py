@@ -153,7 +153,7 @@ class TestPostgreSQL:
         """Verify PostgreSQL uses correct image."""
         statefulsets = [m for m in postgres_manifests if m['kind'] == 'StatefulSet']
         image = statefulsets[0]['spec']['template']['spec']['containers'][0]['image']
-        assert image == 'postgres:17-alpine'
+        assert image == 'pgvector/pgvector:pg17'
 
     def test_postgres_container_port(self, postgres_manifests):
         """Verify PostgreSQL container port is 5432."""
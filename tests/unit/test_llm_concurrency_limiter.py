@@ -0,0 +1,155 @@
+"""
+Unit tests for the adaptive LLM concurrency limiter.
+
+Tests cover:
+- In-flight calls never exceed the current limit
+- Additive increase on success, multiplicative decrease on throttle
+- Decrease cooldown prevents collapse on a burst of 429s
+- Redis failures fail open to the local limit
+- LimitedLLMTransport holds a slot per model and detects 429 responses
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.services import llm_concurrency_limiter
+from src.services.llm_concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    LimitedLLMTransport,
+)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AIMD limiter behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_bounded_by_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("openai", "gpt-4o-mini", initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(10)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_success_increases_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("openai", "m", initial_limit=4, max_limit=10)
+
+        async with limiter.slot() as permit:
+            permit.mark_succeeded()
+
+        assert limiter.limit == pytest.approx(4.25)
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_limit_once_per_cooldown(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "openai", "m", initial_limit=16, max_limit=64, decrease_cooldown_seconds=60
+        )
+
+        for _ in range(3):
+            async with limiter.slot() as permit:
+                permit.mark_throttled()
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_limit_never_below_minimum(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "openai", "m", initial_limit=1, min_limit=1, decrease_cooldown_seconds=0
+        )
+
+        async with limiter.slot() as permit:
+            permit.mark_throttled()
+
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open(self):
+        limiter = AdaptiveConcurrencyLimiter("openai", "m", redis_enabled=True)
+
+        with patch(
+            "src.cache.redis_client.get_shared_redis",
+            side_effect=ConnectionError("redis down"),
+        ):
+            async with limiter.slot() as permit:
+                permit.mark_succeeded()
+
+        assert limiter.in_flight == 0
+
+
+class TestLimitedLLMTransport:
+    """Tests for the httpx transport integration."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_limiters(self, monkeypatch):
+        limiters = {}
+
+        def fake_get_llm_limiter(provider, model):
+            key = (provider, model)
+            if key not in limiters:
+                limiters[key] = AdaptiveConcurrencyLimiter(
+                    provider, model, initial_limit=4, decrease_cooldown_seconds=0
+                )
+            return limiters[key]
+
+        monkeypatch.setattr(llm_concurrency_limiter, "get_llm_limiter", fake_get_llm_limiter)
+        return limiters
+
+    @pytest.mark.asyncio
+    async def test_request_routed_to_model_limiter(self, isolated_limiters):
+        seen_in_flight = []
+
+        def handler(request):
+            limiter = isolated_limiters[("xai", "grok-4")]
+            seen_in_flight.append(limiter.in_flight)
+            return httpx.Response(200, json={"ok": True})
+
+        transport = LimitedLLMTransport(transport=httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.post(
+                "http://litellm/v1/chat/completions",
+                content=json.dumps({"model": "xai/grok-4", "messages": []}),
+            )
+
+        assert response.json() == {"ok": True}
+        assert seen_in_flight == [1]
+        assert isolated_limiters[("xai", "grok-4")].in_flight == 0
+        assert isolated_limiters[("xai", "grok-4")].limit > 4
+
+    @pytest.mark.asyncio
+    async def test_429_reduces_limit(self, isolated_limiters):
+        transport = LimitedLLMTransport(
+            default_provider="openrouter",
+            transport=httpx.MockTransport(lambda request: httpx.Response(429, json={})),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.post(
+                "http://openrouter/v1/chat/completions",
+                content=json.dumps({"model": "gpt-4o-mini"}),
+            )
+
+        assert response.status_code == 429
+        limiter = isolated_limiters[("openrouter", "gpt-4o-mini")]
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_without_model_bypass_limiter(self, isolated_limiters):
+        transport = LimitedLLMTransport(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("http://litellm/v1/models")
+
+        assert isolated_limiters == {}
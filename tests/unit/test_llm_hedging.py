@@ -0,0 +1,143 @@
+"""
+Unit tests for hedged LLM requests across fallback chains.
+
+Tests cover:
+- FirstTokenLatencyTracker p95 and default delay behaviour
+- No hedge when the primary streams its first token quickly
+- Hedge to the next model when the primary is slow; loser cancelled
+- Immediate fallback when the primary fails
+- Error propagation when every model fails
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.llm_hedging import (
+    FirstTokenLatencyTracker,
+    hedged_chat_completion,
+)
+
+
+def _chunk(text=None, usage=None):
+    """Build a streamed chat completion chunk."""
+    choices = [] if text is None else [SimpleNamespace(delta=SimpleNamespace(content=text))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeStreamingClient:
+    """AsyncOpenAI-like client whose models stream after configurable delays."""
+
+    def __init__(self, behaviours):
+        self.behaviours = behaviours
+        self.calls = []
+        self.cancelled = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages, stream, stream_options, **kwargs):
+        self.calls.append(model)
+        delay, text = self.behaviours[model]
+        if isinstance(text, Exception):
+            raise text
+        return self._stream(model, delay, text)
+
+    async def _stream(self, model, delay, text):
+        try:
+            await asyncio.sleep(delay)
+            for word in text.split(" "):
+                yield _chunk(word + " ")
+            yield _chunk(usage=SimpleNamespace(prompt_tokens=10, completion_tokens=2, total_tokens=12))
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class TestFirstTokenLatencyTracker:
+    """Tests for the rolling p95 tracker."""
+
+    def test_default_delay_until_min_samples(self):
+        tracker = FirstTokenLatencyTracker(default_delay_seconds=1.5, min_samples=5)
+        for _ in range(4):
+            tracker.record("m", 0.1)
+        assert tracker.p95("m") is None
+        assert tracker.hedge_delay("m") == 1.5
+
+    def test_p95_from_samples(self):
+        tracker = FirstTokenLatencyTracker(min_samples=1)
+        for i in range(1, 101):
+            tracker.record("m", i / 100)
+        assert tracker.p95("m") == pytest.approx(0.95)
+
+    def test_window_is_bounded(self):
+        tracker = FirstTokenLatencyTracker(window_size=10, min_samples=1)
+        for _ in range(50):
+            tracker.record("m", 5.0)
+        for _ in range(10):
+            tracker.record("m", 0.1)
+        assert tracker.p95("m") == pytest.approx(0.1)
+
+
+class TestHedgedChatCompletion:
+    """Tests for hedged_chat_completion()."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        client = FakeStreamingClient({"primary": (0.0, "fast answer"), "backup": (0.0, "backup")})
+        tracker = FirstTokenLatencyTracker(default_delay_seconds=0.5)
+
+        result = await hedged_chat_completion(client, ["primary", "backup"], MESSAGES, tracker=tracker)
+
+        assert result.model == "primary"
+        assert result.content.strip() == "fast answer"
+        assert result.hedged is False
+        assert result.usage.total_tokens == 12
+        assert client.calls == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        client = FakeStreamingClient({"primary": (5.0, "slow"), "backup": (0.0, "hedge answer")})
+        tracker = FirstTokenLatencyTracker(default_delay_seconds=0.05)
+
+        result = await hedged_chat_completion(client, ["primary", "backup"], MESSAGES, tracker=tracker)
+
+        assert result.model == "backup"
+        assert result.content.strip() == "hedge answer"
+        assert result.hedged is True
+        assert result.attempts == ["primary", "backup"]
+        assert client.cancelled == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_falls_back_immediately(self):
+        client = FakeStreamingClient(
+            {"primary": (0.0, RuntimeError("boom")), "backup": (0.0, "fallback answer")}
+        )
+        tracker = FirstTokenLatencyTracker(default_delay_seconds=10.0)
+
+        result = await asyncio.wait_for(
+            hedged_chat_completion(client, ["primary", "backup"], MESSAGES, tracker=tracker),
+            timeout=1.0,
+        )
+
+        assert result.model == "backup"
+        assert result.hedged is False
+
+    @pytest.mark.asyncio
+    async def test_all_models_fail_raises_last_error(self):
+        client = FakeStreamingClient(
+            {"primary": (0.0, RuntimeError("one")), "backup": (0.0, RuntimeError("two"))}
+        )
+
+        with pytest.raises(RuntimeError, match="two"):
+            await hedged_chat_completion(
+                client, ["primary", "backup"], MESSAGES, tracker=FirstTokenLatencyTracker()
+            )
+
+    @pytest.mark.asyncio
+    async def test_empty_chain_rejected(self):
+        with pytest.raises(ValueError):
+            await hedged_chat_completion(MagicMock(), [], MESSAGES, tracker=FirstTokenLatencyTracker())
@@ -0,0 +1,127 @@
+"""
+Unit tests for per-agent spend queries over llm_spend_attributions.
+
+Tests cover:
+- Top agents read from the attribution table without unnesting request_tags
+- agent_id taken from the tag, falling back to a lookup by name
+- Per-execution drill-down pagination and empty results
+"""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.llm_spend_attribution_queries import SpendAttributionQueries
+
+
+def _db(*results):
+    """Mock session returning the given execute results in order."""
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=list(results))
+    return db
+
+
+def _rows(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _scalar(value):
+    result = MagicMock()
+    result.scalar.return_value = value
+    return result
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+class TestGetSpendByAgent:
+    """Tests for SpendAttributionQueries.get_spend_by_agent."""
+
+    async def test_reads_attribution_table(self):
+        agent_id = uuid4()
+        db = _db(
+            _rows(
+                [
+                    SimpleNamespace(
+                        agent_name="triage",
+                        agent_id=str(agent_id),
+                        execution_count=4,
+                        total_cost=2.0,
+                    )
+                ]
+            )
+        )
+
+        agents = await SpendAttributionQueries(db).get_spend_by_agent(
+            date(2025, 1, 1), date(2025, 1, 31), tenant_id=uuid4()
+        )
+
+        sql = _sql(db.execute.await_args_list[0].args[0])
+        assert "llm_spend_attributions" in sql
+        assert "jsonb_array_elements_text" not in sql
+        assert agents[0].agent_id == agent_id
+        assert agents[0].avg_cost == pytest.approx(0.5)
+        assert db.execute.await_count == 1
+
+    async def test_untagged_agent_id_resolved_by_name(self):
+        agent_id = uuid4()
+        db = _db(
+            _rows(
+                [
+                    SimpleNamespace(
+                        agent_name="legacy", agent_id=None, execution_count=1, total_cost=0.1
+                    )
+                ]
+            ),
+            _scalar(agent_id),
+        )
+
+        agents = await SpendAttributionQueries(db).get_spend_by_agent(date(2025, 1, 1), date(2025, 1, 31))
+
+        assert agents[0].agent_id == agent_id
+        assert db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestGetAgentExecutionSpend:
+    """Tests for the per-execution drill-down."""
+
+    async def test_paginates_executions(self):
+        row = SimpleNamespace(
+            execution_id="exec-1",
+            first_call_at=datetime(2025, 1, 2, 10, 0),
+            last_call_at=datetime(2025, 1, 2, 10, 1),
+            call_count=3,
+            total_tokens=1200,
+            total_cost=0.03,
+        )
+        db = _db(_scalar(45), _rows([row]))
+
+        executions, total = await SpendAttributionQueries(db).get_agent_execution_spend(
+            "triage", date(2025, 1, 1), date(2025, 1, 31), tenant_id=uuid4(), page=3, page_size=20
+        )
+
+        assert total == 45
+        assert executions[0].execution_id == "exec-1"
+        assert executions[0].call_count == 3
+        page_stmt = db.execute.await_args_list[1].args[0]
+        assert page_stmt._offset_clause.value == 40
+        assert page_stmt._limit_clause.value == 20
+
+    async def test_no_executions_skips_page_query(self):
+        db = _db(_scalar(0))
+
+        executions, total = await SpendAttributionQueries(db).get_agent_execution_spend(
+            "triage", date(2025, 1, 1), date(2025, 1, 31)
+        )
+
+        assert (executions, total) == ([], 0)
+        assert db.execute.await_count == 1
@@ -0,0 +1,148 @@
+"""
+Unit tests for the incremental LLM spend rollup.
+
+Tests cover:
+- First run seeding the high-water mark from the oldest spend log
+- Windowed catch-up bounded by max_window and max_windows
+- Lag keeping the newest spend logs out of the rollup
+- Agent attribution sweep running in the same window transaction
+- Query source split between rollup (complete days) and raw logs (partial days)
+"""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.sql.elements import TextClause
+
+from src.services.llm_cost_queries import CostQueryBuilder
+from src.services.llm_spend_rollup import _ROLLUP_WINDOW_SQL, SpendRollupService
+
+NOW = datetime(2025, 1, 10, 12, 0, 0)
+
+
+def _session_maker(states, oldest=None):
+    """Session factory whose state SELECT returns the given states in order."""
+    executed = []
+    states = iter(states)
+
+    async def execute(stmt, params=None):
+        executed.append((stmt, params))
+        result = MagicMock()
+        if isinstance(stmt, TextClause):
+            result.rowcount = 3
+        elif not isinstance(stmt, Insert):
+            if "min(" in str(stmt).lower():
+                result.scalar.return_value = oldest
+            else:
+                result.scalar_one_or_none.return_value = next(states, None)
+        return result
+
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.__aenter__.return_value = session
+    return MagicMock(return_value=session), session, executed
+
+
+def _service(maker, max_windows=10):
+    return SpendRollupService(
+        maker,
+        lag=timedelta(minutes=10),
+        max_window=timedelta(hours=24),
+        max_windows=max_windows,
+    )
+
+
+def _windows(executed):
+    return [params for stmt, params in executed if stmt is _ROLLUP_WINDOW_SQL]
+
+
+@pytest.mark.asyncio
+class TestSpendRollupService:
+    """Tests for SpendRollupService.run."""
+
+    async def test_no_spend_logs(self):
+        maker, session, executed = _session_maker([None], oldest=None)
+
+        result = await _service(maker).run(now=NOW)
+
+        assert result.windows == 0
+        assert result.caught_up is True
+        assert _windows(executed) == []
+
+    async def test_first_run_seeds_state_then_rolls_up(self):
+        state = SimpleNamespace(high_water_mark=datetime(2025, 1, 9))
+        maker, session, executed = _session_maker(
+            [None] + [state] * 3, oldest=datetime(2025, 1, 9, 8, 30)
+        )
+
+        result = await _service(maker).run(now=NOW)
+
+        inserts = [stmt for stmt, _ in executed if isinstance(stmt, Insert)]
+        assert len(inserts) == 1
+        windows = _windows(executed)
+        assert windows[0]["window_start"] == datetime(2025, 1, 9)
+        assert windows[0]["window_end"] == datetime(2025, 1, 10)
+        assert windows[1]["window_end"] == NOW - timedelta(minutes=10)
+        assert result.windows == 2
+        assert result.rows_upserted == 6
+        assert result.caught_up is True
+        # Every window also sweeps agent attributions with the same bounds
+        sweeps = [params for stmt, params in executed if isinstance(stmt, TextClause)]
+        assert len(sweeps) == 4
+
+    async def test_max_windows_bounds_catch_up(self):
+        state = SimpleNamespace(high_water_mark=datetime(2024, 12, 1))
+        maker, session, executed = _session_maker([state] * 5)
+
+        result = await _service(maker, max_windows=3).run(now=NOW)
+
+        assert result.windows == 3
+        assert result.high_water_mark == datetime(2024, 12, 4)
+        assert result.caught_up is False
+        assert session.commit.await_count == 3
+
+    async def test_caught_up_within_lag(self):
+        state = SimpleNamespace(high_water_mark=NOW - timedelta(minutes=5))
+        maker, session, executed = _session_maker([state])
+
+        result = await _service(maker).run(now=NOW)
+
+        assert result.windows == 0
+        assert result.caught_up is True
+        session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestSpendSource:
+    """Tests for the rollup/raw query split in CostQueryBuilder."""
+
+    @staticmethod
+    async def _sql(cutoff, start, end):
+        builder = CostQueryBuilder(MagicMock())
+        with patch(
+            "src.services.llm_spend_rollup.get_rollup_cutoff", AsyncMock(return_value=cutoff)
+        ):
+            source = await builder._spend_source(start, end, tenant_id=None)
+        return str(source.compile(dialect=postgresql.dialect()))
+
+    async def test_no_rollup_reads_raw_logs_only(self):
+        sql = await self._sql(None, date(2025, 1, 1), date(2025, 1, 10))
+        assert "LiteLLM_SpendLogs" in sql
+        assert "llm_spend_daily_rollups" not in sql
+
+    async def test_completed_range_reads_rollup_only(self):
+        sql = await self._sql(date(2025, 1, 10), date(2025, 1, 1), date(2025, 1, 5))
+        assert "llm_spend_daily_rollups" in sql
+        assert "LiteLLM_SpendLogs" not in sql
+
+    async def test_range_spanning_cutoff_unions_both(self):
+        sql = await self._sql(date(2025, 1, 10), date(2025, 1, 1), date(2025, 1, 10))
+        assert "llm_spend_daily_rollups" in sql
+        assert "LiteLLM_SpendLogs" in sql
+        assert "UNION ALL" in sql
+        # Raw logs use a startTime range, not date(startTime), so the index applies
+        assert 'date("LiteLLM_SpendLogs"."startTime") >=' not in sql
@@ -0,0 +1,148 @@
+"""
+Unit tests for the MCP capability cache.
+
+Tests cover:
+- Version-keyed lookups (stale versions miss, older puts ignored)
+- LRU bound
+- Discovery and health-probe refreshes bumping discovery_version
+- MCPToolBridge building pooled tool specs without contacting the server
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services import mcp_capability_cache
+from src.services.mcp_capability_cache import (
+    MCPCapabilityCache,
+    ServerCapabilities,
+    apply_discovery,
+    capabilities_from_server,
+    refresh_server_tools,
+)
+from src.services.mcp_tool_bridge import MCPToolBridge
+
+READ_FILE = {"name": "read_file", "description": "Read a file", "inputSchema": {"type": "object"}}
+WRITE_FILE = {"name": "write_file", "inputSchema": {"type": "object"}}
+
+
+def _server(tools=None, version=0):
+    return SimpleNamespace(
+        id=uuid4(),
+        name="filesystem",
+        discovered_tools=tools if tools is not None else [READ_FILE],
+        discovered_resources=[],
+        discovered_prompts=[],
+        discovery_version=version,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    cache = MCPCapabilityCache()
+    with patch.object(mcp_capability_cache, "_cache", cache):
+        yield cache
+
+
+class TestCapabilityCache:
+    """Tests for version-keyed lookups."""
+
+    def test_builds_from_row_and_reuses_entry(self, fresh_cache):
+        server = _server()
+
+        first = fresh_cache.for_server(server)
+        second = fresh_cache.for_server(server)
+
+        assert first is second
+        assert first.tool("read_file") == READ_FILE
+        assert first.tool("missing") is None
+
+    def test_version_bump_misses(self, fresh_cache):
+        server = _server()
+        fresh_cache.for_server(server)
+
+        server.discovery_version = 1
+        server.discovered_tools = [READ_FILE, WRITE_FILE]
+
+        assert fresh_cache.for_server(server).tool("write_file") == WRITE_FILE
+        assert fresh_cache.get(server.id, 0) is None
+
+    def test_older_version_not_stored(self, fresh_cache):
+        server = _server(version=2)
+        fresh_cache.for_server(server)
+
+        fresh_cache.put(ServerCapabilities(server_id=server.id, discovery_version=1))
+
+        assert fresh_cache.get(server.id, 2) is not None
+
+    def test_lru_bound(self):
+        cache = MCPCapabilityCache(max_entries=2)
+        servers = [_server() for _ in range(3)]
+        for server in servers:
+            cache.for_server(server)
+
+        assert len(cache) == 2
+        assert cache.get(servers[0].id, 0) is None
+
+    def test_normalize_drops_invalid_entries(self):
+        server = _server(tools=[READ_FILE, {"description": "no name"}, "bogus"])
+
+        assert capabilities_from_server(server).tools == (READ_FILE,)
+
+
+class TestRefresh:
+    """Tests for discovery and health-probe refreshes."""
+
+    def test_unchanged_discovery_keeps_version(self, fresh_cache):
+        server = _server(version=3)
+
+        changed = apply_discovery(server, [READ_FILE], [], [])
+
+        assert not changed
+        assert server.discovery_version == 3
+        assert fresh_cache.get(server.id, 3) is not None
+
+    def test_changed_discovery_bumps_version(self, fresh_cache):
+        server = _server(version=3)
+
+        changed = apply_discovery(server, [READ_FILE, WRITE_FILE], [], [])
+
+        assert changed
+        assert server.discovery_version == 4
+        assert fresh_cache.get(server.id, 4).tool("write_file") == WRITE_FILE
+
+    def test_probe_tools_change_bumps_version(self, fresh_cache):
+        server = _server(version=0)
+
+        assert refresh_server_tools(server, [READ_FILE, WRITE_FILE])
+        assert not refresh_server_tools(server, [READ_FILE, WRITE_FILE])
+        assert server.discovery_version == 1
+        assert server.discovered_tools == [READ_FILE, WRITE_FILE]
+
+
+@pytest.mark.asyncio
+class TestBridgeUsesCache:
+    """Tests for MCPToolBridge building pooled tool specs from the cache."""
+
+    async def test_no_server_contact_when_discovered(self):
+        bridge = MCPToolBridge([])
+        session = SimpleNamespace(list_tools=AsyncMock())
+
+        specs = await bridge._cached_tool_specs(_server(), session, {"read_file"})
+
+        assert specs == [READ_FILE]
+        session.list_tools.assert_not_awaited()
+
+    async def test_lists_tools_once_when_undiscovered(self, fresh_cache):
+        bridge = MCPToolBridge([])
+        server = _server(tools=[])
+        session = SimpleNamespace(list_tools=AsyncMock(return_value=[READ_FILE]))
+
+        first = await bridge._cached_tool_specs(server, session, {"read_file"})
+        second = await bridge._cached_tool_specs(server, session, {"read_file"})
+
+        assert first == [READ_FILE]
+        assert second == [READ_FILE]
+        session.list_tools.assert_awaited_once()
@@ -0,0 +1,174 @@
+"""
+Unit tests for the MCP health check cycle (run_health_check_cycle).
+
+Tests:
+- Probes run concurrently up to the configured limit
+- Per-check deadline cuts off slow servers
+- Metrics written in one batch; statuses survive a failed metrics insert
+
+Coverage Target: ≥95% for mcp_health_monitor.py
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_mcp_server():
+    """Create mock MCPServer instance for testing."""
+    server = MagicMock()
+    server.id = uuid4()
+    server.tenant_id = uuid4()
+    server.name = "test-server"
+    server.command = "npx"
+    server.args = ["-y", "@modelcontextprotocol/server-filesystem"]
+    server.env = {"LOG_LEVEL": "debug"}
+    server.status = "active"
+    server.consecutive_failures = 0
+    server.transport_type = "stdio"
+    return server
+
+
+@pytest.fixture
+def mock_db():
+    """Create mock database session."""
+    db = AsyncMock()
+    db.commit = AsyncMock()
+    return db
+
+
+# ============================================================================
+# Test run_health_check_cycle() - Concurrent Cycle + Batched Writes
+# ============================================================================
+
+
+def _cycle_server(name, consecutive_failures=0):
+    server = MagicMock()
+    server.id = uuid4()
+    server.tenant_id = uuid4()
+    server.name = name
+    server.status = "active"
+    server.consecutive_failures = consecutive_failures
+    server.transport_type = "stdio"
+    return server
+
+
+def _cycle_metric(server, status="success"):
+    from src.schemas.mcp_metrics import MCPHealthCheckStatus, MCPHealthMetric
+
+    return MCPHealthMetric(
+        mcp_server_id=server.id,
+        tenant_id=server.tenant_id,
+        response_time_ms=20,
+        check_timestamp=datetime.now(timezone.utc),
+        status=MCPHealthCheckStatus(status),
+        error_message=None if status == "success" else "boom",
+        error_type=None if status == "success" else "RuntimeError",
+        check_type="tools_list",
+        transport_type="stdio",
+    )
+
+
+@pytest.mark.asyncio
+async def test_cycle_bounds_concurrency_and_batches_writes(mock_db):
+    """Probes overlap up to the limit and metrics are written in one batch."""
+    from src.services.mcp_health_monitor import run_health_check_cycle
+
+    servers = [_cycle_server(f"server-{i}") for i in range(10)]
+    failing = _cycle_server("failing", consecutive_failures=2)
+    servers.append(failing)
+    in_flight = 0
+    peak = 0
+
+    async def probe(server, timeout_seconds):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _cycle_metric(server, "error" if server is failing else "success")
+
+    with patch(
+        "src.services.mcp_health_monitor.perform_detailed_health_check", side_effect=probe
+    ), patch(
+        "src.services.mcp_health_monitor.write_metrics", new_callable=AsyncMock
+    ) as write_metrics, patch(
+        "src.services.mcp_health_monitor.update_health_gauges"
+    ) as update_gauges:
+        cycle = await run_health_check_cycle(servers, mock_db, concurrency=4, timeout_seconds=5)
+
+    assert peak == 4
+    assert (cycle.checked, cycle.healthy, cycle.unhealthy, cycle.inactive) == (11, 10, 1, 1)
+    assert failing.status == "inactive"
+    write_metrics.assert_awaited_once()
+    assert len(write_metrics.await_args.args[0]) == 11
+    update_gauges.assert_called_once()
+    assert mock_db.commit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cycle_metrics_failure_keeps_status_updates(mock_db):
+    """A failed metrics insert is rolled back after statuses are committed."""
+    from src.services.mcp_health_monitor import run_health_check_cycle
+
+    server = _cycle_server("server")
+
+    with patch(
+        "src.services.mcp_health_monitor.perform_detailed_health_check",
+        AsyncMock(return_value=_cycle_metric(server)),
+    ), patch(
+        "src.services.mcp_health_monitor.write_metrics",
+        AsyncMock(side_effect=RuntimeError("db down")),
+    ):
+        cycle = await run_health_check_cycle([server], mock_db, concurrency=2, timeout_seconds=5)
+
+    assert cycle.healthy == 1
+    assert mock_db.commit.await_count == 1
+    mock_db.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_perform_detailed_health_check_per_check_deadline(mock_mcp_server):
+    """A slow server is cut off at the configured deadline."""
+    from src.services.mcp_health_monitor import perform_detailed_health_check
+
+    async def slow_initialize():
+        await asyncio.sleep(5)
+
+    with patch("src.services.mcp_health_monitor.MCPStdioClient") as MockClient:
+        client = AsyncMock()
+        client.initialize = AsyncMock(side_effect=slow_initialize)
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=None)
+        MockClient.return_value = client
+
+        result = await perform_detailed_health_check(mock_mcp_server, timeout_seconds=0.05)
+
+    assert result.status.value == "timeout"
+    assert result.error_message == "Health check exceeded 0.05s timeout"
+    assert result.response_time_ms < 1000
+
+
+@pytest.mark.asyncio
+async def test_write_metrics_single_multi_row_insert(mock_db):
+    """All metrics go out in one INSERT plus one rollup executemany."""
+    from src.services.mcp_health_monitor import write_metrics
+
+    servers = [_cycle_server(f"server-{i}") for i in range(3)]
+
+    await write_metrics([_cycle_metric(server) for server in servers], mock_db)
+
+    assert mock_db.execute.await_count == 2
+    insert_call, rollup_call = mock_db.execute.await_args_list
+    assert "mcp_server_metrics" in str(insert_call.args[0])
+    assert len(insert_call.args[1]) == 3
+    assert len(rollup_call.args[1]) == 3
@@ -0,0 +1,160 @@
+"""
+Unit tests for the shared MCP Streamable HTTP connection pool.
+
+Tests cover:
+- Pool keys (same endpoint and credentials share, different credentials don't)
+- Sessions reusing one HTTP/2 client and releasing it on close
+- Idle client eviction
+- Per-session Mcp-Session-Id tracking over a shared client
+- Pools closed on their own event loop when the loop changes or exits
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from src.services import mcp_http_pool
+from src.services.mcp_http_pool import MCPHTTPPool, get_http_pool, pool_key
+from src.services.mcp_http_sse_client import MCPStreamableHTTPClient
+
+URL = "https://mcp.example.com/mcp"
+AUTH = {"Authorization": "Bearer token-a"}
+
+
+@pytest.fixture
+def pool():
+    pool = MCPHTTPPool(idle_ttl_seconds=300)
+    with patch("src.services.mcp_http_sse_client.get_http_pool", return_value=pool):
+        yield pool
+
+
+def _initialize_response(session_id: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"protocolVersion": "2025-03-26", "capabilities": {"tools": {}}},
+        },
+        headers={"content-type": "application/json", "Mcp-Session-Id": session_id},
+    )
+
+
+class TestPoolKey:
+    """Tests for pool keys."""
+
+    def test_same_credentials_share(self):
+        assert pool_key(URL, AUTH) == pool_key(URL, {"authorization": "Bearer token-a"})
+
+    def test_different_credentials_do_not_share(self):
+        assert pool_key(URL, AUTH) != pool_key(URL, {"Authorization": "Bearer token-b"})
+
+    def test_key_does_not_contain_secret(self):
+        assert "token-a" not in pool_key(URL, AUTH)
+
+
+@pytest.mark.asyncio
+class TestPooledSessions:
+    """Tests for sessions sharing pooled clients."""
+
+    async def test_sessions_reuse_client(self, pool):
+        async with MCPStreamableHTTPClient(URL, AUTH) as first:
+            pass
+        async with MCPStreamableHTTPClient(URL, AUTH) as second:
+            pass
+
+        assert first.client is second.client
+        assert not first.client.is_closed
+        assert pool.total_clients == 1
+        await pool.close()
+        assert first.client.is_closed
+
+    async def test_credentials_isolated(self, pool):
+        async with MCPStreamableHTTPClient(URL, AUTH) as first:
+            async with MCPStreamableHTTPClient(URL, {"Authorization": "Bearer b"}) as second:
+                assert first.client is not second.client
+        await pool.close()
+
+    async def test_idle_client_evicted(self, pool):
+        pool.idle_ttl_seconds = 0
+        async with MCPStreamableHTTPClient(URL, AUTH) as first:
+            pass
+        async with MCPStreamableHTTPClient(URL, {"Authorization": "Bearer b"}):
+            pass
+        await asyncio.sleep(0)
+
+        assert first.client.is_closed
+        assert pool.total_clients == 1
+        await pool.close()
+
+    @respx.mock
+    async def test_session_ids_tracked_per_session(self, pool):
+        route = respx.post(URL)
+        route.side_effect = [_initialize_response("session-1"), _initialize_response("session-2")]
+        respx.delete(URL).mock(return_value=httpx.Response(204))
+
+        first = await MCPStreamableHTTPClient(URL, AUTH).__aenter__()
+        second = await MCPStreamableHTTPClient(URL, AUTH).__aenter__()
+        await first.initialize()
+        await second.initialize()
+
+        assert first.client is second.client
+        assert (first.session_id, second.session_id) == ("session-1", "session-2")
+
+        route.side_effect = None
+        route.mock(
+            return_value=httpx.Response(
+                200,
+                json={"jsonrpc": "2.0", "id": 2, "result": {"tools": []}},
+                headers={"content-type": "application/json"},
+            )
+        )
+        await first.list_tools()
+        assert route.calls.last.request.headers["Mcp-Session-Id"] == "session-1"
+
+        await first.close()
+        await second.close()
+        assert respx.calls.last.request.method == "DELETE"
+        assert not first.client.is_closed
+        await pool.close()
+
+
+async def _borrow():
+    pool = get_http_pool()
+    client = pool.acquire(URL, AUTH)
+    pool.release(URL, AUTH)
+    return pool, client
+
+
+class TestEventLoops:
+    """Tests for pools bound to event loops that stop or are replaced."""
+
+    @pytest.fixture(autouse=True)
+    def no_pool(self):
+        with patch.object(mcp_http_pool, "_pool", None):
+            yield
+
+    def test_closed_when_asyncio_run_exits(self):
+        pool, client = asyncio.run(_borrow())
+
+        assert client.is_closed
+        assert pool._closed
+
+    def test_replaced_pool_closed_on_its_own_loop(self):
+        worker_loop = asyncio.new_event_loop()
+        try:
+            old_pool, old_client = worker_loop.run_until_complete(_borrow())
+
+            new_pool, _ = asyncio.run(_borrow())
+            assert new_pool is not old_pool
+            assert not old_client.is_closed
+
+            # The worker loop runs its next task
+            worker_loop.run_until_complete(asyncio.sleep(0.01))
+            assert old_client.is_closed
+            assert old_pool.total_clients == 0
+        finally:
+            worker_loop.close()
@@ -0,0 +1,122 @@
+"""
+Unit tests for spilling large MCP tool results.
+
+Tests cover:
+- Small results passed through unchanged
+- Large results replaced by a bounded preview with a paging handle
+- Page reads decompressing a single segment, scoped to the execution
+- Purging an execution's spill files
+- The read_mcp_result_page tool exposed by MCPToolBridge
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.services import mcp_large_result_store
+from src.services.mcp_large_result_store import LargeResultStore, bound_tool_output
+from src.services.mcp_tool_bridge import MCPToolBridge
+
+LISTING = "\n".join(f"/var/log/app/file-{i:05d}.log" for i in range(5000))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LargeResultStore(directory=str(tmp_path), page_chars=10000, ttl_seconds=3600)
+    with patch.object(mcp_large_result_store, "_store", store):
+        yield store
+
+
+@pytest.fixture
+def small_threshold():
+    with patch("src.services.mcp_large_result_store.settings") as settings:
+        settings.mcp_large_result_enabled = True
+        settings.mcp_large_result_threshold_bytes = 32 * 1024
+        settings.mcp_large_result_preview_chars = 500
+        yield settings
+
+
+@pytest.mark.asyncio
+class TestBoundToolOutput:
+    """Tests for the bounded view handed to the LLM."""
+
+    async def test_small_result_unchanged(self, store, small_threshold):
+        assert await bound_tool_output("ok", "get_issue", "exec-1") == "ok"
+        assert len(store) == 0
+
+    async def test_large_result_spilled_with_handle(self, store, small_threshold):
+        view = await bound_tool_output(LISTING, "list_files", "exec-1")
+
+        (spilled,) = store._results.values()
+        assert len(view) < 1000
+        assert f"handle '{spilled.handle}'" in view
+        assert "5,000 lines" in view
+        assert view.endswith(LISTING[:500])
+        assert spilled.page_count == -(-len(LISTING) // 10000)
+        assert os.path.getsize(spilled.path) < len(LISTING) / 4
+
+    async def test_json_summary(self, store, small_threshold):
+        document = json.dumps([{"id": i, "status": "open"} for i in range(3000)])
+
+        view = await bound_tool_output(document, "search", "exec-1")
+
+        assert "JSON array" in view
+
+    async def test_spill_failure_truncates(self, store, small_threshold):
+        with patch.object(store, "_write_pages", side_effect=OSError("disk full")):
+            view = await bound_tool_output(LISTING, "list_files", "exec-1")
+
+        assert view.startswith("[Result truncated")
+        assert len(store) == 0
+
+
+@pytest.mark.asyncio
+class TestPaging:
+    """Tests for reading spilled pages."""
+
+    async def test_pages_reassemble_result(self, store):
+        spilled = await store.spill(LISTING, "list_files", "exec-1")
+
+        pages = [
+            await store.read_page(spilled.handle, n, "exec-1")
+            for n in range(1, spilled.page_count + 1)
+        ]
+
+        assert "".join(pages) == LISTING
+
+    async def test_other_execution_cannot_read(self, store):
+        spilled = await store.spill(LISTING, "list_files", "exec-1")
+
+        with pytest.raises(KeyError):
+            await store.read_page(spilled.handle, 1, "exec-2")
+        with pytest.raises(IndexError):
+            await store.read_page(spilled.handle, spilled.page_count + 1, "exec-1")
+
+    async def test_purge_removes_files(self, store):
+        spilled = await store.spill(LISTING, "list_files", "exec-1")
+        await store.spill(LISTING, "list_files", "exec-2")
+
+        assert store.purge("exec-1") == 1
+        assert not os.path.exists(spilled.path)
+        assert len(store) == 1
+
+    async def test_bridge_page_tool(self, store):
+        spilled = await store.spill(LISTING, "list_files", "exec-1")
+        bridge = MCPToolBridge([], execution_context_id="exec-1")
+
+        with patch(
+            "src.services.mcp_tool_bridge.StructuredTool.from_function",
+            side_effect=lambda **kw: kw,
+        ):
+            read_page = bridge._create_result_page_tool()["coroutine"]
+
+        page = await read_page(handle=spilled.handle, page=2)
+
+        assert page.startswith(f"[list_files result '{spilled.handle}', page 2/")
+        assert page.endswith(LISTING[10000:20000])
+        assert (await read_page(handle="missing")).startswith("Error:")
+
+        await bridge.cleanup()
+        assert len(store) == 0
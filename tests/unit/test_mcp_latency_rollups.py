@@ -0,0 +1,184 @@
+"""
+Unit tests for per-minute MCP latency histogram rollups.
+
+Tests cover:
+- Bucket placement and quantile accuracy against exact percentiles
+- Upsert parameters (minute truncation, 1-based histogram slot)
+- Summary merge and empty-window handling
+- Aggregator fallback to raw PERCENTILE_CONT when no rollups exist
+- Single-query split averages for trend calculation
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services import mcp_metrics_aggregator
+from src.services.mcp_latency_rollups import (
+    BUCKET_COUNT,
+    MAX_TRACKED_MS,
+    LatencySummary,
+    bucket_bounds,
+    bucket_index,
+    get_latency_summary,
+    get_split_averages,
+    histogram_quantile,
+    record_latency,
+)
+
+NOW = datetime(2025, 11, 24, 12, 0, tzinfo=timezone.utc)
+
+
+def _result(one=None, rows=None):
+    result = MagicMock()
+    result.one.return_value = one
+    result.all.return_value = rows or []
+    return result
+
+
+class TestHistogram:
+    """Tests for bucket layout and quantile estimation."""
+
+    @pytest.mark.parametrize("value", [1, 7, 95, 1234, 59_999])
+    def test_value_within_bucket_bounds(self, value):
+        lower, upper = bucket_bounds(bucket_index(value))
+        assert lower <= value < upper
+
+    def test_edge_buckets(self):
+        assert bucket_index(0) == 0
+        assert bucket_index(MAX_TRACKED_MS) == BUCKET_COUNT - 1
+        assert bucket_index(10 * MAX_TRACKED_MS) == BUCKET_COUNT - 1
+
+    def test_quantiles_within_bucket_resolution(self):
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(5, 1)) + 1 for _ in range(5000))
+        counts = [0] * BUCKET_COUNT
+        for value in values:
+            counts[bucket_index(value)] += 1
+
+        for quantile in (0.5, 0.95, 0.99):
+            exact = values[int(quantile * len(values)) - 1]
+            estimate = histogram_quantile(counts, quantile, max_value=values[-1])
+            assert estimate == pytest.approx(exact, rel=0.2)
+
+    def test_clamped_to_max_and_empty(self):
+        counts = [0] * BUCKET_COUNT
+        counts[BUCKET_COUNT - 1] = 3
+        assert MAX_TRACKED_MS < histogram_quantile(counts, 0.99, max_value=150_000) <= 150_000
+        assert histogram_quantile(counts, 1.0, max_value=150_000) == 150_000
+        assert histogram_quantile([0] * BUCKET_COUNT, 0.5) == 0.0
+
+
+@pytest.mark.asyncio
+class TestRollupQueries:
+    """Tests for rollup writes and reads."""
+
+    async def test_record_latency_params(self):
+        db = AsyncMock()
+        server_id = uuid4()
+
+        await record_latency(db, server_id, "tenant-a", NOW.replace(second=42), 120, success=True)
+
+        params = db.execute.await_args.args[1]
+        assert params["bucket_start"] == NOW
+        assert params["slot"] == bucket_index(120) + 1
+        assert params["histogram"][bucket_index(120)] == 1
+        assert sum(params["histogram"]) == 1
+        assert params["success"] == 1
+
+    async def test_summary_merges_histogram(self):
+        slot = bucket_index(100) + 1
+        db = AsyncMock()
+        db.execute.side_effect = [
+            _result(one=SimpleNamespace(checks=10, successes=9, sum_ms=1000, max_ms=110)),
+            _result(rows=[SimpleNamespace(slot=slot, count=10)]),
+        ]
+
+        summary = await get_latency_summary(db, uuid4(), NOW - timedelta(hours=1), NOW)
+
+        assert summary.total_checks == 10
+        assert summary.success_count == 9
+        assert summary.avg_response_time_ms == 100
+        lower, upper = bucket_bounds(slot - 1)
+        assert lower <= summary.p50 <= upper
+        assert summary.p99 <= 110
+
+    async def test_summary_none_without_rollups(self):
+        db = AsyncMock()
+        db.execute.return_value = _result(
+            one=SimpleNamespace(checks=0, successes=0, sum_ms=0, max_ms=None)
+        )
+
+        assert await get_latency_summary(db, uuid4(), NOW - timedelta(hours=1), NOW) is None
+        assert db.execute.await_count == 1
+
+    async def test_split_averages(self):
+        db = AsyncMock()
+        db.execute.return_value = _result(
+            one=SimpleNamespace(prev_sum=2000, prev_checks=20, last_sum=None, last_checks=None)
+        )
+
+        prev_avg, last_avg = await get_split_averages(
+            db, uuid4(), NOW - timedelta(hours=48), NOW - timedelta(hours=24), NOW
+        )
+
+        assert (prev_avg, last_avg) == (100.0, None)
+        assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+class TestAggregatorUsesRollups:
+    """Tests for mcp_metrics_aggregator reading rollups first."""
+
+    async def test_trend_from_rollups_single_query(self):
+        db = AsyncMock()
+        with patch.object(
+            mcp_metrics_aggregator, "get_split_averages", AsyncMock(return_value=(100.0, 150.0))
+        ):
+            trend = await mcp_metrics_aggregator.calculate_trend(uuid4(), db)
+
+        assert trend == "degrading"
+        db.execute.assert_not_awaited()
+
+    async def test_trend_falls_back_to_raw_rows(self):
+        db = AsyncMock()
+        db.execute.return_value = _result(one=SimpleNamespace(prev=100.0, last=80.0))
+        with patch.object(
+            mcp_metrics_aggregator, "get_split_averages", AsyncMock(return_value=(None, None))
+        ):
+            trend = await mcp_metrics_aggregator.calculate_trend(uuid4(), db)
+
+        assert trend == "improving"
+        assert db.execute.await_count == 1
+
+    async def test_raw_summary_when_no_rollups(self):
+        db = AsyncMock()
+        db.execute.return_value = _result(
+            one=SimpleNamespace(
+                total_checks=4,
+                success_count=3,
+                avg_response_time_ms=50.0,
+                max_response_time_ms=90,
+                p50=45.0,
+                p95=88.0,
+                p99=90.0,
+            )
+        )
+
+        summary = await mcp_metrics_aggregator._get_raw_latency_summary(
+            uuid4(), NOW - timedelta(hours=1), NOW, db
+        )
+
+        assert summary == LatencySummary(
+            total_checks=4,
+            success_count=3,
+            avg_response_time_ms=50.0,
+            max_response_time_ms=90,
+            p50=45.0,
+            p95=88.0,
+            p99=90.0,
+        )
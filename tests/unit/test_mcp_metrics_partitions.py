@@ -0,0 +1,116 @@
+"""
+Unit tests for mcp_server_metrics partition management.
+
+Tests cover:
+- Partition naming and parsing
+- Pre-creating only missing daily partitions
+- Detaching and dropping only fully expired partitions
+- DELETE fallback for an unpartitioned table
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.sql.dml import Delete
+
+from src.services.mcp_metrics_partitions import (
+    drop_expired_partitions,
+    ensure_partitions,
+    maintain_partitions,
+    partition_day,
+    partition_name,
+)
+
+NOW = datetime(2025, 11, 24, 2, 0, tzinfo=timezone.utc)
+
+
+def _db(partitions, relkind="p"):
+    """Mock session exposing the given partitions and recording DDL."""
+    executed = []
+
+    async def execute(stmt, params=None):
+        sql = str(stmt)
+        executed.append(sql if not isinstance(stmt, Delete) else stmt)
+        result = MagicMock()
+        if "pg_inherits" in sql:
+            result.all.return_value = [(name,) for name in partitions]
+        elif "relkind" in sql:
+            result.scalar.return_value = relkind
+        else:
+            result.rowcount = 12
+        return result
+
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=execute)
+    return db, executed
+
+
+def _ddl(executed, verb):
+    return [sql for sql in executed if isinstance(sql, str) and sql.startswith(verb)]
+
+
+class TestPartitionNaming:
+    """Tests for partition name helpers."""
+
+    def test_round_trip(self):
+        name = partition_name(date(2025, 11, 24))
+        assert name == "mcp_server_metrics_p20251124"
+        assert partition_day(name) == date(2025, 11, 24)
+
+    @pytest.mark.parametrize("name", ["mcp_server_metrics_default", "other_p20251124"])
+    def test_non_daily_partitions_ignored(self, name):
+        assert partition_day(name) is None
+
+
+@pytest.mark.asyncio
+class TestPartitionMaintenance:
+    """Tests for partition creation and retention."""
+
+    async def test_ensure_creates_only_missing(self):
+        db, executed = _db(["mcp_server_metrics_p20251124", "mcp_server_metrics_p20251125"])
+
+        created = await ensure_partitions(db, date(2025, 11, 24), days_ahead=3)
+
+        assert created == ["mcp_server_metrics_p20251126", "mcp_server_metrics_p20251127"]
+        ddl = _ddl(executed, "CREATE TABLE")
+        assert len(ddl) == 2
+        assert "FROM ('2025-11-26 00:00:00+00') TO ('2025-11-27 00:00:00+00')" in ddl[0]
+
+    async def test_drop_only_fully_expired(self):
+        db, executed = _db(
+            [
+                "mcp_server_metrics_p20251115",
+                "mcp_server_metrics_p20251116",
+                "mcp_server_metrics_p20251117",
+                "mcp_server_metrics_p20251118",
+            ]
+        )
+
+        dropped = await drop_expired_partitions(db, cutoff_day=date(2025, 11, 17))
+
+        assert dropped == ["mcp_server_metrics_p20251115", "mcp_server_metrics_p20251116"]
+        detaches = _ddl(executed, "ALTER TABLE")
+        drops = _ddl(executed, "DROP TABLE")
+        assert len(detaches) == len(drops) == 2
+        assert all("DETACH PARTITION" in sql for sql in detaches)
+
+    async def test_maintain_drops_and_creates(self):
+        db, executed = _db(["mcp_server_metrics_p20251116"])
+
+        result = await maintain_partitions(db, retention_days=7, days_ahead=1, now=NOW)
+
+        assert result.partitioned is True
+        assert result.dropped == ["mcp_server_metrics_p20251116"]
+        assert result.created == ["mcp_server_metrics_p20251124", "mcp_server_metrics_p20251125"]
+        db.commit.assert_awaited_once()
+
+    async def test_unpartitioned_table_falls_back_to_delete(self):
+        db, executed = _db([], relkind="r")
+
+        result = await maintain_partitions(db, retention_days=7, days_ahead=7, now=NOW)
+
+        assert result.partitioned is False
+        assert result.deleted_rows == 12
+        assert any(isinstance(stmt, Delete) for stmt in executed)
+        assert _ddl(executed, "CREATE TABLE") == []
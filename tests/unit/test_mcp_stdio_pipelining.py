@@ -0,0 +1,156 @@
+"""
+Unit tests for pipelined JSON-RPC over MCPStdioClient and the agent
+tool-call concurrency cap.
+
+Tests cover:
+- Concurrent requests on one connection answered out of order
+- One reader task for many requests
+- Read failures failing every in-flight request
+- Per-agent max_parallel_tool_calls resolution
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.schemas.mcp_server import MCPServerResponse
+from src.services.mcp_stdio_client import MCPStdioClient
+
+
+class FakeStdout:
+    """StreamReader stand-in fed by FakeServerProcess."""
+
+    def __init__(self):
+        self.lines: asyncio.Queue[bytes] = asyncio.Queue()
+
+    async def readline(self) -> bytes:
+        return await self.lines.get()
+
+
+class FakeServerProcess:
+    """
+    In-memory stdio server answering each request after a per-tool delay.
+
+    Responses are written to stdout as soon as each request's delay elapses,
+    so slower requests are answered after faster ones sent later.
+    """
+
+    def __init__(self, delays: dict[str, float]):
+        self.delays = delays
+        self.pid = 4242
+        self.returncode = None
+        self.stdin = self
+        self.stdout = FakeStdout()
+        self.stderr = None
+
+    # stdin (StreamWriter) interface
+    def write(self, data: bytes) -> None:
+        request = json.loads(data)
+        asyncio.get_running_loop().create_task(self._respond(request))
+
+    async def drain(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    # Process interface used by close()
+    def terminate(self) -> None:
+        self.returncode = 0
+
+    async def wait(self) -> int:
+        return 0
+
+    async def _respond(self, request: dict) -> None:
+        await asyncio.sleep(self.delays.get(request["params"]["name"], 0))
+        response = {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "result": {"content": [{"type": "text", "text": request["params"]["name"]}]},
+        }
+        await self.stdout.lines.put((json.dumps(response) + "\n").encode())
+
+
+def _client(process) -> MCPStdioClient:
+    client = MCPStdioClient(
+        MCPServerResponse.model_construct(transport_type="stdio", command="fake", args=[], env={})
+    )
+    client.process = process
+    return client
+
+
+@pytest.mark.asyncio
+class TestPipelinedRequests:
+    """Tests for the demultiplexing stdout reader."""
+
+    async def test_concurrent_calls_take_as_long_as_slowest(self):
+        process = FakeServerProcess({"slow": 0.2, "fast": 0.01, "medium": 0.1})
+        client = _client(process)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            client.call_tool("slow", {}),
+            client.call_tool("fast", {}),
+            client.call_tool("medium", {}),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [r["content"][0]["text"] for r in results] == ["slow", "fast", "medium"]
+        assert elapsed < 0.3
+        assert client._pending_requests == {}
+        await client.close()
+
+    async def test_single_reader_for_many_requests(self):
+        process = FakeServerProcess({})
+        client = _client(process)
+
+        with patch.object(asyncio, "create_task", wraps=asyncio.create_task) as create_task:
+            await asyncio.gather(*(client.call_tool(f"t{i}", {}) for i in range(5)))
+
+        reader_tasks = [
+            call for call in create_task.call_args_list
+            if getattr(call.args[0], "__name__", "") == "_read_responses"
+        ]
+        assert len(reader_tasks) == 1
+        await client.close()
+
+    async def test_eof_fails_all_in_flight_requests(self):
+        process = FakeServerProcess({"a": 10, "b": 10})
+        client = _client(process)
+
+        calls = [
+            asyncio.create_task(client.call_tool("a", {})),
+            asyncio.create_task(client.call_tool("b", {})),
+        ]
+        await asyncio.sleep(0.01)
+        await process.stdout.lines.put(b"")
+
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(outcome, EOFError) for outcome in outcomes)
+
+
+class TestMaxParallelToolCalls:
+    """Tests for per-agent tool-call concurrency resolution."""
+
+    def test_agent_override_and_default(self):
+        from src.services.agent_execution.preparation import max_parallel_tool_calls
+
+        with patch("src.services.agent_execution.preparation.settings") as settings:
+            settings.agent_parallel_tool_calls_enabled = True
+            settings.agent_max_parallel_tool_calls = 4
+
+            assert max_parallel_tool_calls({"model": "gpt-4o"}) == 4
+            assert max_parallel_tool_calls({"max_parallel_tool_calls": 8}) == 8
+            assert max_parallel_tool_calls(None) == 4
+
+    def test_disabled_runs_sequentially(self):
+        from src.services.agent_execution.preparation import max_parallel_tool_calls
+
+        with patch("src.services.agent_execution.preparation.settings") as settings:
+            settings.agent_parallel_tool_calls_enabled = False
+
+            assert max_parallel_tool_calls({"max_parallel_tool_calls": 8}) == 1
@@ -0,0 +1,260 @@
+"""
+Unit tests for the MCP stdio warm pool.
+
+Tests cover:
+- Pool keys (tenant isolation, stable hashing)
+- Reuse of warm processes across acquisitions
+- Per-server cap with waiting and acquire timeout
+- Discarding clients after transport errors
+- Maintenance: idle eviction, health probes and crash restarts
+- Maintenance of idle Celery worker loops between tasks
+- Global cap evicting another server's idle process
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.services import mcp_stdio_pool_session
+from src.services.mcp_stdio_client import TimeoutError as MCPTimeoutError
+from src.services.mcp_stdio_pool import MCPStdioPool, PoolExhaustedError, config_hash
+from src.services.mcp_stdio_pool_session import PooledMCPSession
+
+
+class FakeClient:
+    """Stands in for MCPStdioClient without spawning processes."""
+
+    instances: list["FakeClient"] = []
+
+    def __init__(self, config):
+        self.config = config
+        self.process = SimpleNamespace(returncode=None, pid=1000 + len(FakeClient.instances))
+        self._closed = False
+        self.fail_probe = False
+        FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def initialize(self):
+        return {}
+
+    async def list_tools(self):
+        if self.fail_probe:
+            raise MCPTimeoutError("probe timed out")
+        return [{"name": "read_file", "inputSchema": {"type": "object"}}]
+
+    async def call_tool(self, name, arguments):
+        return {"content": [{"type": "text", "text": f"{name}:{arguments}"}], "is_error": False}
+
+    async def close(self):
+        self._closed = True
+
+
+def _server(tenant_id="tenant-a", command="npx"):
+    return SimpleNamespace(
+        id=uuid4(), tenant_id=tenant_id, command=command, args=["-y", "srv"], env={"A": "1"}
+    )
+
+
+def _pool(**overrides):
+    options = dict(
+        min_per_server=1,
+        max_per_server=2,
+        max_total=10,
+        idle_ttl_seconds=300,
+        maintenance_interval_seconds=3600,
+        acquire_timeout_seconds=1.0,
+    )
+    options.update(overrides)
+    return MCPStdioPool(**options)
+
+
+@pytest.fixture(autouse=True)
+def fake_client():
+    FakeClient.instances = []
+    with patch("src.services.mcp_stdio_pool.MCPStdioClient", FakeClient):
+        yield
+
+
+class TestConfigHash:
+    """Tests for pool keys."""
+
+    def test_same_config_same_key(self):
+        assert config_hash(_server()) == config_hash(_server())
+
+    def test_tenants_never_share(self):
+        assert config_hash(_server("tenant-a")) != config_hash(_server("tenant-b"))
+
+
+@pytest.mark.asyncio
+class TestAcquire:
+    """Tests for acquiring and releasing pooled clients."""
+
+    async def test_reuses_warm_process(self):
+        pool = _pool()
+        server = _server()
+
+        async with pool.acquire(server) as first:
+            pass
+        async with pool.acquire(server) as second:
+            pass
+
+        assert first is second
+        assert len(FakeClient.instances) == 1
+        await pool.close()
+        assert first._closed
+
+    async def test_waits_at_per_server_cap(self):
+        pool = _pool(max_per_server=1, acquire_timeout_seconds=0.05)
+        server = _server()
+
+        async with pool.acquire(server):
+            with pytest.raises(PoolExhaustedError):
+                async with pool.acquire(server):
+                    pass
+
+        async def borrow_briefly():
+            async with pool.acquire(server):
+                await asyncio.sleep(0.01)
+
+        pool.acquire_timeout_seconds = 1.0
+        await asyncio.gather(borrow_briefly(), borrow_briefly())
+        assert len(FakeClient.instances) == 1
+        await pool.close()
+
+    async def test_discards_client_after_timeout(self):
+        pool = _pool()
+        server = _server()
+
+        with pytest.raises(MCPTimeoutError):
+            async with pool.acquire(server) as client:
+                raise MCPTimeoutError("no response")
+
+        assert client._closed
+        async with pool.acquire(server) as replacement:
+            assert replacement is not client
+        await pool.close()
+
+    async def test_session_facade(self):
+        pool = _pool()
+        session = PooledMCPSession(pool, _server())
+
+        tools = await session.list_tools()
+        result = await session.call_tool("read_file", {"path": "/tmp/x"})
+
+        assert tools[0]["name"] == "read_file"
+        assert result["content"][0]["text"] == "read_file:{'path': '/tmp/x'}"
+        assert pool.total_clients == 1
+        await pool.close()
+
+    async def test_global_cap_evicts_other_servers_idle_process(self):
+        pool = _pool(max_total=1)
+        server_a, server_b = _server(command="a"), _server(command="b")
+
+        async with pool.acquire(server_a) as client_a:
+            pass
+        async with pool.acquire(server_b):
+            pass
+        await asyncio.sleep(0)
+
+        assert client_a._closed
+        assert pool.total_clients == 1
+        await pool.close()
+
+
+@pytest.mark.asyncio
+class TestMaintenance:
+    """Tests for eviction, probes and restarts."""
+
+    async def test_idle_eviction_keeps_minimum(self):
+        pool = _pool(min_per_server=1, idle_ttl_seconds=0)
+        server = _server()
+
+        async def borrow():
+            async with pool.acquire(server):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(borrow(), borrow())
+        assert pool.total_clients == 2
+
+        await pool.maintain()
+
+        assert pool.total_clients == 1
+        assert sum(client._closed for client in FakeClient.instances) == 1
+        await pool.close()
+
+    async def test_crashed_process_restarted(self):
+        pool = _pool(min_per_server=1)
+        server = _server()
+        async with pool.acquire(server) as client:
+            pass
+
+        client.process.returncode = 1
+        await pool.maintain()
+
+        assert len(FakeClient.instances) == 2
+        async with pool.acquire(server) as replacement:
+            assert replacement is FakeClient.instances[1]
+        await pool.close()
+
+    async def test_failed_probe_replaces_process(self):
+        pool = _pool(min_per_server=1)
+        server = _server()
+        async with pool.acquire(server) as client:
+            pass
+
+        client.fail_probe = True
+        await pool.maintain()
+
+        assert client._closed
+        assert pool.total_clients == 1
+        assert len(FakeClient.instances) == 2
+        await pool.close()
+
+
+class TestIdleWorkerLoop:
+    """Tests for maintenance while the worker's agent loop is idle between tasks."""
+
+    @pytest.fixture
+    def agent_loop(self):
+        from src.workers import tasks
+
+        loop = asyncio.new_event_loop()
+        pool = _pool(min_per_server=0, idle_ttl_seconds=60, maintenance_interval_seconds=30)
+        with patch.object(tasks, "_agent_event_loop", loop), patch.object(
+            mcp_stdio_pool_session, "_pool", pool
+        ):
+            yield tasks, loop, pool
+        loop.run_until_complete(pool.close())
+        loop.close()
+
+    def test_expired_process_evicted_after_idle_time(self, agent_loop):
+        tasks, loop, pool = agent_loop
+
+        async def task():
+            pool.start()
+            async with pool.acquire(_server()):
+                pass
+
+        # A task ran and returned; the loop stops until the next task
+        loop.run_until_complete(task())
+        (client,) = FakeClient.instances
+        (entry,) = pool._keys.values()
+        entry.idle[0].last_used -= 120
+        pool._last_maintenance -= 60
+
+        assert tasks.maintain_idle_agent_loop() is True
+        assert client._closed
+        assert pool.total_clients == 0
+
+    def test_skipped_while_task_runs(self, agent_loop):
+        tasks, loop, pool = agent_loop
+        pool._last_maintenance -= 60
+
+        with tasks._agent_loop_lock:
+            assert tasks.maintain_idle_agent_loop() is False
+        assert tasks.maintain_idle_agent_loop() is False  # pool not started on this loop
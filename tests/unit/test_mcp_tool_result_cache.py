@@ -0,0 +1,250 @@
+"""
+Unit tests for the MCP tool result cache.
+
+Tests cover:
+- Policy resolution (opt-in, read-only only, invalid policies ignored)
+- Canonical argument keys and tenant/execution scoping
+- Pooled tool wrappers serving repeated calls from the cache
+- Cache hits marked in the stored execution trace
+- Failing open when Redis is unavailable
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.mcp_server import MCPToolCachePolicy
+from src.services.agent_execution.execution_record import build_execution_record
+from src.services.agent_execution.preparation import PreparedExecution
+from src.services.agent_execution_service import AgentExecutionService
+from src.services.mcp_tool_bridge import MCPToolBridge
+from src.services.mcp_tool_result_cache import (
+    cache_policy,
+    canonical_arguments,
+    result_cache_key,
+)
+
+GET_ISSUE = {"name": "get_issue", "inputSchema": {"type": "object"}}
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the shared Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+
+
+def _server(policies=None, tenant_id="tenant-a"):
+    return SimpleNamespace(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        name="jira",
+        discovery_version=0,
+        tool_cache_policies=policies if policies is not None else {
+            "get_issue": {"read_only": True, "ttl_seconds": 120, "scope": "tenant"}
+        },
+    )
+
+
+def _call_tool(bridge, server, session):
+    """Coroutine of the pooled wrapper built for GET_ISSUE."""
+    with patch("src.services.mcp_tool_bridge.StructuredTool", side_effect=lambda **kw: kw):
+        return bridge._create_pooled_tool_wrapper(server, GET_ISSUE, session)["coroutine"]
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch("src.services.mcp_tool_result_cache._redis", return_value=redis):
+        yield redis
+
+
+class TestPolicy:
+    """Tests for cache policy resolution."""
+
+    def test_read_only_tool_is_cacheable(self):
+        policy = cache_policy(_server(), "get_issue")
+
+        assert policy == MCPToolCachePolicy(read_only=True, ttl_seconds=120, scope="tenant")
+
+    def test_unlisted_and_writable_tools_not_cached(self):
+        server = _server({"update_issue": {"read_only": False, "ttl_seconds": 60}})
+
+        assert cache_policy(server, "get_issue") is None
+        assert cache_policy(server, "update_issue") is None
+
+    def test_invalid_policy_ignored(self):
+        server = _server({"get_issue": {"read_only": True, "scope": "global"}})
+
+        assert cache_policy(server, "get_issue") is None
+
+    def test_global_switch(self):
+        with patch("src.services.mcp_tool_result_cache.settings") as settings:
+            settings.mcp_tool_result_cache_enabled = False
+
+            assert cache_policy(_server(), "get_issue") is None
+
+
+class TestKeys:
+    """Tests for canonical keys and scoping."""
+
+    def test_argument_order_does_not_matter(self):
+        assert canonical_arguments({"b": 1, "a": {"y": 2, "x": 1}}) == canonical_arguments(
+            {"a": {"x": 1, "y": 2}, "b": 1}
+        )
+
+    def test_tenants_never_share_results(self):
+        policy = cache_policy(_server(), "get_issue")
+        server_a = _server(tenant_id="tenant-a")
+        server_b = SimpleNamespace(**{**vars(server_a), "tenant_id": "tenant-b"})
+
+        assert result_cache_key(server_a, "get_issue", {"key": "OPS-1"}, policy) != (
+            result_cache_key(server_b, "get_issue", {"key": "OPS-1"}, policy)
+        )
+
+    def test_execution_scope_and_discovery_version(self):
+        server = _server()
+        policy = MCPToolCachePolicy(read_only=True, scope="execution")
+        key = result_cache_key(server, "get_issue", {}, policy, "exec-1")
+
+        assert key != result_cache_key(server, "get_issue", {}, policy, "exec-2")
+        server.discovery_version = 1
+        assert key != result_cache_key(server, "get_issue", {}, policy, "exec-1")
+
+
+@pytest.mark.asyncio
+class TestPooledWrapperCaching:
+    """Tests for result caching in pooled tool wrappers."""
+
+    async def test_repeated_call_served_from_cache(self, fake_redis):
+        bridge = MCPToolBridge([], execution_context_id="exec-1")
+        session = SimpleNamespace(
+            call_tool=AsyncMock(
+                return_value={"content": [{"type": "text", "text": "OPS-1: open"}], "is_error": False}
+            )
+        )
+        call = _call_tool(bridge, _server(), session)
+
+        first = await call(key="OPS-1")
+        second = await call(key="OPS-1")
+
+        assert first == ("OPS-1: open", {"cache_hit": False})
+        assert second == ("OPS-1: open", {"cache_hit": True})
+        session.call_tool.assert_awaited_once()
+        assert list(fake_redis.ttls.values()) == [120]
+
+    async def test_uncached_tool_always_called(self, fake_redis):
+        bridge = MCPToolBridge([])
+        session = SimpleNamespace(
+            call_tool=AsyncMock(return_value={"content": [{"type": "text", "text": "ok"}]})
+        )
+        call = _call_tool(bridge, _server({}), session)
+
+        await call(key="OPS-1")
+        await call(key="OPS-1")
+
+        assert session.call_tool.await_count == 2
+        assert fake_redis.data == {}
+
+    async def test_failed_call_not_cached(self, fake_redis):
+        bridge = MCPToolBridge([])
+        session = SimpleNamespace(call_tool=AsyncMock(side_effect=RuntimeError("boom")))
+        call = _call_tool(bridge, _server(), session)
+
+        result, artifact = await call(key="OPS-1")
+
+        assert result.startswith("Error:")
+        assert artifact == {"cache_hit": False}
+        assert fake_redis.data == {}
+
+    async def test_redis_unavailable_fails_open(self):
+        broken = SimpleNamespace(
+            get=AsyncMock(side_effect=ConnectionError("redis down")),
+            set=AsyncMock(side_effect=ConnectionError("redis down")),
+        )
+        bridge = MCPToolBridge([])
+        session = SimpleNamespace(
+            call_tool=AsyncMock(return_value={"content": [{"type": "text", "text": "ok"}]})
+        )
+        call = _call_tool(bridge, _server(), session)
+
+        with patch("src.services.mcp_tool_result_cache._redis", return_value=broken):
+            assert await call(key="OPS-1") == ("ok", {"cache_hit": False})
+
+
+class AIMessage:
+    def __init__(self, content="", tool_calls=None):
+        self.content = content
+        self.tool_calls = tool_calls or []
+
+
+class ToolMessage:
+    def __init__(self, content, artifact=None):
+        self.content = content
+        self.artifact = artifact
+
+
+class ToolCallingGraph:
+    """Graph stand-in calling get_issue once, like LangGraph's ToolNode."""
+
+    def __init__(self, call):
+        self.call = call
+
+    async def ainvoke(self, inputs, config=None, **kwargs):
+        content, artifact = await self.call(key="OPS-1")
+        return {
+            "messages": [
+                AIMessage(tool_calls=[{"name": "get_issue", "args": {"key": "OPS-1"}}]),
+                ToolMessage(content, artifact=artifact),
+                AIMessage(content="OPS-1 is open."),
+            ]
+        }
+
+
+@pytest.mark.asyncio
+async def test_execution_trace_marks_cache_hits(fake_redis):
+    session = SimpleNamespace(
+        call_tool=AsyncMock(
+            return_value={"content": [{"type": "text", "text": "OPS-1: open"}], "is_error": False}
+        )
+    )
+    service = AgentExecutionService(AsyncMock(spec=AsyncSession))
+    service._prepare_execution = AsyncMock(
+        return_value=PreparedExecution(
+            executor=ToolCallingGraph(_call_tool(MCPToolBridge([]), _server(), session)),
+            inputs={"messages": []},
+            config={},
+            invoke_kwargs={},
+            model_string="openai/gpt-4o-mini",
+        )
+    )
+
+    traces = []
+    with patch("src.services.agent_execution_service.cleanup_mcp_bridge", AsyncMock()):
+        for _ in range(2):
+            result = await service.execute_agent(uuid4(), "tenant-a", "Status of OPS-1?")
+            record = build_execution_record(
+                execution_id=uuid4(),
+                agent_id=uuid4(),
+                tenant_id="tenant-a",
+                payload={},
+                service_result=result,
+                total_duration_ms=10,
+            )
+            traces.append(record.execution_trace)
+
+    assert [trace["steps"][0]["cache_hit"] for trace in traces] == [False, True]
+    assert traces[1]["steps"][0]["tool_result"] == "OPS-1: open"
+    session.call_tool.assert_awaited_once()
@@ -441,3 +441,28 @@ async def test_tenant_isolation(mock_db, sample_agent):
     # Act & Assert
     with pytest.raises(ValueError, match="Agent .* not found"):
         await service.get_memory_config(sample_agent.id, "wrong-tenant")
+
+
+@pytest.mark.asyncio
+async def test_retrieve_memory_binds_query_vector(mock_db, sample_agent):
+    """Test semantic search orders by cosine distance with a bound query vector."""
+    # Arrange
+    from sqlalchemy.dialects import postgresql
+
+    service = MemoryConfigService(mock_db)
+
+    mock_agent_result = MagicMock()
+    mock_agent_result.scalar_one_or_none.return_value = sample_agent
+    mock_memory_result = MagicMock()
+    mock_memory_result.scalars.return_value.all.return_value = []
+    mock_db.execute = AsyncMock(side_effect=[mock_agent_result, mock_memory_result])
+
+    # Act
+    await service.retrieve_memory(
+        sample_agent.id, "test-tenant", query_embedding="[0.1, 0.2, 0.3]", limit=5
+    )
+
+    # Assert
+    compiled = mock_db.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect())
+    assert "agent_memory.embedding <=> %(embedding_1)s" in str(compiled)
+    assert compiled.params["embedding_1"] == [0.1, 0.2, 0.3]
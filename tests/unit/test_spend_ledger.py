@@ -0,0 +1,207 @@
+"""
+Unit tests for the Redis spend ledger.
+
+Tests cover:
+- Ledger entries parsed from Redis hashes (hit, miss, unseeded counter)
+- Grace limit blocking on ledger entries
+- Cost recording only for seeded tenants
+- Response hook reading LiteLLM's cost header and failing open
+- Budget admission reservations, denials and release
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.services.cost_estimator import CostEstimate
+from src.services.spend_ledger import (
+    BUDGET_ADMISSION_ERROR_TYPE,
+    LITELLM_COST_HEADER,
+    BudgetAdmissionTransport,
+    LedgerEntry,
+    SpendLedger,
+    spend_recording_hook,
+)
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock async Redis client returned by get_shared_redis."""
+    redis = AsyncMock()
+    with patch("src.cache.redis_client.get_shared_redis", return_value=redis):
+        yield redis
+
+
+class TestLedgerEntry:
+    """Tests for LedgerEntry blocking logic."""
+
+    def test_blocked_at_grace_limit(self):
+        entry = LedgerEntry("acme", spend=550.0, max_budget=500.0, grace_threshold=110, reconciled_at=0)
+        assert entry.grace_limit == pytest.approx(550.0)
+        assert entry.is_blocked is True
+
+    def test_not_blocked_below_grace_limit(self):
+        entry = LedgerEntry("acme", spend=549.99, max_budget=500.0, grace_threshold=110, reconciled_at=0)
+        assert entry.is_blocked is False
+
+
+@pytest.mark.asyncio
+class TestSpendLedger:
+    """Tests for SpendLedger Redis operations."""
+
+    async def test_get_returns_entry(self, mock_redis):
+        mock_redis.hgetall.return_value = {
+            "spend": "412.5",
+            "max_budget": "500.0",
+            "grace_threshold": "110",
+            "reconciled_at": "1700000000.0",
+        }
+
+        entry = await SpendLedger(ttl_seconds=300).get("acme")
+
+        mock_redis.hgetall.assert_awaited_once_with("budget:ledger:acme")
+        assert entry.spend == 412.5
+        assert entry.max_budget == 500.0
+        assert entry.grace_threshold == 110
+
+    async def test_get_miss_returns_none(self, mock_redis):
+        mock_redis.hgetall.return_value = {}
+        assert await SpendLedger(ttl_seconds=300).get("acme") is None
+
+    async def test_get_without_limits_returns_none(self, mock_redis):
+        mock_redis.hgetall.return_value = {"spend": "1.0"}
+        assert await SpendLedger(ttl_seconds=300).get("acme") is None
+
+    async def test_record_spend_returns_new_total(self, mock_redis):
+        mock_redis.eval.return_value = "12.75"
+
+        new_spend = await SpendLedger(ttl_seconds=300).record_spend("acme", 0.25)
+
+        assert new_spend == 12.75
+        args = mock_redis.eval.await_args.args
+        assert args[1:] == (1, "budget:ledger:acme", 0.25)
+
+    async def test_record_spend_unseeded_tenant(self, mock_redis):
+        mock_redis.eval.return_value = None
+        assert await SpendLedger(ttl_seconds=300).record_spend("acme", 0.25) is None
+
+    async def test_record_zero_cost_skips_redis(self, mock_redis):
+        assert await SpendLedger(ttl_seconds=300).record_spend("acme", 0.0) is None
+        mock_redis.eval.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestSpendRecordingHook:
+    """Tests for the httpx response hook."""
+
+    async def test_records_cost_header(self):
+        with patch.object(SpendLedger, "record_spend", new_callable=AsyncMock) as record:
+            hook = spend_recording_hook("acme")
+            await hook(httpx.Response(200, headers={LITELLM_COST_HEADER: "0.0042"}))
+
+        record.assert_awaited_once_with("acme", 0.0042)
+
+    async def test_missing_header_ignored(self):
+        with patch.object(SpendLedger, "record_spend", new_callable=AsyncMock) as record:
+            hook = spend_recording_hook("acme")
+            await hook(httpx.Response(200))
+
+        record.assert_not_awaited()
+
+    async def test_redis_failure_fails_open(self):
+        with patch.object(
+            SpendLedger, "record_spend", AsyncMock(side_effect=ConnectionError("redis down"))
+        ):
+            hook = spend_recording_hook("acme")
+            await hook(httpx.Response(200, headers={LITELLM_COST_HEADER: "0.01"}))
+
+
+@pytest.mark.asyncio
+class TestBudgetAdmissionTransport:
+    """Tests for per-call cost reservation."""
+
+    @pytest.fixture
+    def estimator(self):
+        estimator = MagicMock()
+        estimator.estimate = AsyncMock(
+            return_value=CostEstimate(
+                model="openai/gpt-4o-mini", prompt_tokens=100, max_output_tokens=500, estimated_cost=0.5
+            )
+        )
+        return estimator
+
+    @pytest.fixture
+    def ledger(self):
+        ledger = MagicMock()
+        ledger.reserve = AsyncMock(return_value=True)
+        ledger.release = AsyncMock()
+        ledger.get = AsyncMock(
+            return_value=LedgerEntry("acme", spend=549.8, max_budget=500.0, grace_threshold=110, reconciled_at=0)
+        )
+        return ledger
+
+    async def _post(self, transport, body=None):
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.post(
+                "http://litellm/v1/chat/completions",
+                content=json.dumps(body or {"model": "openai/gpt-4o-mini", "messages": []}),
+            )
+
+    async def test_reserves_and_releases(self, estimator, ledger):
+        upstream = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+        transport = BudgetAdmissionTransport("acme", upstream, estimator=estimator, ledger=ledger)
+
+        response = await self._post(transport)
+
+        assert response.status_code == 200
+        tenant_id, reservation_id, amount, _ = ledger.reserve.await_args.args
+        assert (tenant_id, amount) == ("acme", 0.5)
+        ledger.release.assert_awaited_once_with("acme", reservation_id)
+
+    async def test_denied_call_never_reaches_provider(self, estimator, ledger):
+        ledger.reserve.return_value = False
+        upstream = AsyncMock()
+        transport = BudgetAdmissionTransport("acme", upstream, estimator=estimator, ledger=ledger)
+
+        response = await self._post(transport)
+
+        assert response.status_code == 402
+        error = response.json()["error"]
+        assert error["type"] == BUDGET_ADMISSION_ERROR_TYPE
+        assert error["current_spend"] == 549.8
+        upstream.handle_async_request.assert_not_called()
+        ledger.release.assert_not_awaited()
+
+    async def test_no_ledger_entry_admits_without_release(self, estimator, ledger):
+        ledger.reserve.return_value = None
+        upstream = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        transport = BudgetAdmissionTransport("acme", upstream, estimator=estimator, ledger=ledger)
+
+        response = await self._post(transport)
+
+        assert response.status_code == 200
+        ledger.release.assert_not_awaited()
+
+    async def test_redis_failure_fails_open(self, estimator, ledger):
+        ledger.reserve.side_effect = ConnectionError("redis down")
+        upstream = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        transport = BudgetAdmissionTransport("acme", upstream, estimator=estimator, ledger=ledger)
+
+        response = await self._post(transport)
+
+        assert response.status_code == 200
+
+    async def test_upstream_error_releases_reservation(self, estimator, ledger):
+        def fail(request):
+            raise httpx.ConnectError("refused")
+
+        transport = BudgetAdmissionTransport(
+            "acme", httpx.MockTransport(fail), estimator=estimator, ledger=ledger
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            await self._post(transport)
+
+        ledger.release.assert_awaited_once()
@@ -0,0 +1,190 @@
+"""
+Unit tests for the cluster-wide tool catalog cache.
+
+Tests cover:
+- Catalogs shared between processes through the Redis L2
+- Version bumps superseding catalogs built before an invalidation
+- Pub/sub invalidations dropping other processes' L1 entries
+- invalidate_cache() from synchronous code
+- Failing open when Redis is unavailable
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.schemas.unified_tool import SourceType, UnifiedTool
+from src.services import tool_catalog_cache
+from src.services.tool_catalog_cache import (
+    invalidate_tool_catalog,
+    load_catalog,
+    local_catalog,
+    local_key,
+    store_catalog,
+    sync_invalidations,
+)
+from src.services.unified_tool_service import UnifiedToolService
+
+TENANT = "550e8400-e29b-41d4-a716-446655440000"
+
+
+class FakePubSub:
+    """Subscription receiving messages published on FakeRedis."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue: list[dict] = []
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        return self.queue.pop(0) if self.queue else None
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the shared Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.subscribers: dict[str, list[FakePubSub]] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.decode() if isinstance(value, bytes) else value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def publish(self, channel, message):
+        for pubsub in self.subscribers.get(channel, []):
+            pubsub.queue.append({"type": "message", "channel": channel, "data": message})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+def _tool(name="get_weather"):
+    return UnifiedTool(
+        id=uuid4(),
+        name=name,
+        description="Get weather information",
+        source_type=SourceType.OPENAPI,
+        openapi_tool_id=123,
+        input_schema={"type": "object"},
+    )
+
+
+def _service(tools):
+    """UnifiedToolService whose database holds the given OpenAPI tools."""
+    service = UnifiedToolService(AsyncMock())
+    service._get_openapi_tools = AsyncMock(return_value=tools)
+    service._get_mcp_servers = AsyncMock(return_value=[])
+    return service
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    local_catalog.clear()
+    with patch.object(tool_catalog_cache, "_redis", return_value=redis), patch.object(
+        tool_catalog_cache, "_subscriber", None
+    ):
+        yield redis
+    local_catalog.clear()
+
+
+@pytest.mark.asyncio
+class TestSharedCatalog:
+    """Tests for the Redis L2."""
+
+    async def test_other_process_served_from_redis(self, fake_redis):
+        tools = [_tool()]
+        await _service(tools).list_tools(TENANT)
+
+        # Another process: empty L1, same Redis
+        local_catalog.clear()
+        other = _service([])
+        result = await other.list_tools(TENANT)
+
+        assert [tool.name for tool in result] == ["get_weather"]
+        other._get_openapi_tools.assert_not_awaited()
+
+    async def test_invalidation_supersedes_stale_build(self, fake_redis):
+        version, _ = await load_catalog(TENANT)
+
+        # Catalog built from data read before the change is committed
+        await invalidate_tool_catalog(TENANT)
+        await store_catalog(TENANT, version, [_tool("stale")])
+
+        assert await load_catalog(TENANT) == (version + 1, None)
+
+    async def test_redis_unavailable_fails_open(self):
+        broken = MagicMock()
+        broken.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.pubsub.return_value.subscribe = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.pubsub.return_value.aclose = AsyncMock()
+        local_catalog.clear()
+
+        with patch.object(tool_catalog_cache, "_redis", return_value=broken), patch.object(
+            tool_catalog_cache, "_subscriber", None
+        ):
+            service = _service([_tool()])
+            assert len(await service.list_tools(TENANT)) == 1
+            assert len(await service.list_tools(TENANT)) == 1
+
+        service._get_openapi_tools.assert_awaited_once()
+        local_catalog.clear()
+
+    async def test_metric_failure_does_not_fail_lookup(self, fake_redis):
+        broken_metrics = MagicMock()
+        broken_metrics.tool_catalog_cache_lookups_total.labels.side_effect = ValueError("bad label")
+        local_catalog.clear()
+
+        with patch.dict("sys.modules", {"src.monitoring.metrics": broken_metrics}):
+            assert len(await _service([_tool()]).list_tools(TENANT)) == 1
+
+        local_catalog.clear()
+
+
+@pytest.mark.asyncio
+class TestInvalidation:
+    """Tests for pub/sub invalidation of L1 entries."""
+
+    async def test_published_invalidation_drops_local_entry(self, fake_redis):
+        service = _service([_tool()])
+        await service.list_tools(TENANT)
+        assert local_key(TENANT) in local_catalog
+
+        # Another process commits a change and publishes the tenant
+        await fake_redis.publish(tool_catalog_cache.CHANNEL, TENANT)
+        await sync_invalidations()
+
+        assert local_key(TENANT) not in local_catalog
+
+    async def test_changed_catalog_visible_after_invalidation(self, fake_redis):
+        service = _service([_tool()])
+        await service.list_tools(TENANT)
+
+        service._get_openapi_tools.return_value = [_tool(), _tool("create_ticket")]
+        await invalidate_tool_catalog(TENANT)
+
+        assert len(await service.list_tools(TENANT)) == 2
+
+    async def test_sync_invalidate_cache_schedules_publish(self, fake_redis):
+        local_catalog[local_key(TENANT)] = []
+
+        UnifiedToolService(AsyncMock()).invalidate_cache(TENANT)
+        assert local_key(TENANT) not in local_catalog
+        await asyncio.sleep(0)
+
+        assert fake_redis.data[f"tool_catalog:{TENANT}:version"] == "1"
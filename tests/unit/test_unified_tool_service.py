@@ -18,10 +18,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid5, NAMESPACE_DNS
 
 from src.schemas.unified_tool import UnifiedTool, SourceType, MCPPrimitiveType
+from src.services import tool_catalog_cache
 from src.services.unified_tool_service import UnifiedToolService
 
 
 # Test fixtures
+@pytest.fixture(autouse=True)
+def no_catalog_l2():
+    """Keep list_tools on the in-process cache: no Redis L2 or pub/sub."""
+    with patch.object(tool_catalog_cache.settings, "tool_catalog_cache_enabled", False):
+        yield
+
+
 @pytest.fixture
 def tenant_id():
     """Test tenant ID string (as expected by UnifiedToolService.list_tools)."""
@@ -427,6 +435,69 @@ def test_json_schema_to_pydantic_conversion(unified_service):
     assert "age" in pydantic_model.model_fields
 
 
+
+def test_json_schema_to_pydantic_nested_arrays_and_enums(unified_service):
+    """Test nested objects, typed arrays and enums are converted."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "priority": {"type": "string", "enum": ["low", "high"]},
+            "labels": {"type": "array", "items": {"type": "string"}},
+            "assignee": {
+                "type": "object",
+                "properties": {"email": {"type": "string"}},
+                "required": ["email"],
+            },
+        },
+        "required": ["priority"],
+    }
+
+    model = unified_service._json_schema_to_pydantic(schema, "CreateTicket")
+    args = model(priority="high", labels=["ops"], assignee={"email": "a@example.com"})
+
+    assert args.assignee.email == "a@example.com"
+    assert args.labels == ["ops"]
+    with pytest.raises(ValueError):
+        model(priority="urgent")
+    with pytest.raises(ValueError):
+        model(priority="low", labels=[{"not": "a string"}])
+
+
+def test_json_schema_to_pydantic_required_nullable(unified_service):
+    """Test required nullable fields accept an explicit null but stay required."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "due_date": {"type": ["string", "null"]},
+            "owner": {"type": "string", "nullable": True},
+        },
+        "required": ["due_date", "owner"],
+    }
+
+    model = unified_service._json_schema_to_pydantic(schema, "UpdateTicket")
+    args = model(due_date=None, owner=None)
+
+    assert args.due_date is None
+    assert model(due_date="2025-12-01", owner="ops").due_date == "2025-12-01"
+    with pytest.raises(ValueError):
+        model(owner=None)
+    with pytest.raises(ValueError):
+        model(due_date=1, owner=None)
+
+
+def test_json_schema_to_pydantic_memoized(unified_service):
+    """Test equal schemas reuse one generated model regardless of key order."""
+    UnifiedToolService._schema_models.clear()
+    schema = {"properties": {"a": {"type": "integer"}, "b": {"type": "string"}}, "required": ["a"]}
+    reordered = {"required": ["a"], "properties": {"b": {"type": "string"}, "a": {"type": "integer"}}}
+
+    first = unified_service._json_schema_to_pydantic(schema, "Lookup")
+
+    assert unified_service._json_schema_to_pydantic(reordered, "Lookup") is first
+    assert unified_service._json_schema_to_pydantic(schema, "Other") is not first
+    assert len(UnifiedToolService._schema_models) == 2
+
+
 # AC8: Caching Tests
 @pytest.mark.asyncio
 async def test_cache_hit_on_second_call(
@@ -738,3 +738,57 @@ class TestWebhookQueueing:
         # Verify logger.error was called
         # Note: logger.error is called twice - once in queue_service, once in webhook endpoint
         assert mock_logger.error.call_count >= 1
+
+
+class TestCancelEnhancementJob:
+    """Test signed cancellation of enhancement jobs."""
+
+    JOB_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+    def _cancel(self, client: TestClient, body: dict, signature: str = None):
+        headers = {"Content-Type": "application/json"}
+        if signature:
+            headers["X-ServiceDesk-Signature"] = signature
+        return client.post(
+            f"/webhook/servicedesk/jobs/{self.JOB_ID}/cancel",
+            content=json.dumps(body, separators=(",", ":")),
+            headers=headers,
+        )
+
+    @patch("src.api.webhooks.request_cancellation", new_callable=AsyncMock)
+    def test_missing_signature_returns_401(self, mock_cancel, client: TestClient) -> None:
+        response = self._cancel(client, {"tenant_id": "tenant-abc", "job_id": self.JOB_ID})
+
+        assert response.status_code == 401
+        mock_cancel.assert_not_awaited()
+
+    @patch("src.api.webhooks.request_cancellation", new_callable=AsyncMock)
+    def test_invalid_signature_returns_401(self, mock_cancel, client: TestClient) -> None:
+        body = {"tenant_id": "tenant-abc", "job_id": self.JOB_ID}
+        response = self._cancel(client, body, sign_payload(body, "some-other-tenant-secret"))
+
+        assert response.status_code == 401
+        mock_cancel.assert_not_awaited()
+
+    @patch("src.api.webhooks.request_cancellation", new_callable=AsyncMock)
+    def test_signature_for_other_job_returns_400(
+        self, mock_cancel, client: TestClient, webhook_secret: str
+    ) -> None:
+        body = {"tenant_id": "tenant-abc", "job_id": "00000000-0000-0000-0000-000000000000"}
+        response = self._cancel(client, body, sign_payload(body, webhook_secret))
+
+        assert response.status_code == 400
+        mock_cancel.assert_not_awaited()
+
+    @patch("src.api.webhooks.request_cancellation", new_callable=AsyncMock)
+    def test_signed_request_cancels_job(
+        self, mock_cancel, client: TestClient, webhook_secret: str
+    ) -> None:
+        mock_cancel.return_value = True
+        body = {"tenant_id": "tenant-abc", "job_id": self.JOB_ID}
+        response = self._cancel(client, body, sign_payload(body, webhook_secret))
+
+        assert response.status_code == 202
+        assert response.json()["status"] == "cancelling"
+        mock_cancel.assert_awaited_once()
+        assert mock_cancel.await_args.args[0] == "tenant-abc"
@@ -0,0 +1,166 @@
+"""
+Unit tests for write-behind execution history persistence.
+
+Tests cover:
+- Row states coalesced per primary key (pending + final written once)
+- Multi-row upserts per tenant that never overwrite final statuses
+- Failed batches re-queued without clobbering newer states
+- Rows rejected by the database dropped while the rest is written
+- Final flush on close, and the synchronous path when disabled
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.database.models import AgentTestExecution, EnhancementHistory
+from src.services import write_behind
+from src.services.write_behind import WriteBehindBuffer, persist_row, record_row, write_rows
+
+
+def _row(status="pending", tenant_id="tenant-a", row_id=None):
+    return {
+        "id": row_id or uuid.uuid4(),
+        "tenant_id": tenant_id,
+        "ticket_id": "TKT-1",
+        "status": status,
+        "context_gathered": None,
+        "llm_output": None,
+        "error_message": None,
+        "processing_time_ms": None,
+        "created_at": datetime.now(timezone.utc),
+        "completed_at": None,
+    }
+
+
+def _buffer():
+    # Flusher thread is not started; tests drive _flush() directly
+    buffer = WriteBehindBuffer(flush_interval_seconds=60, max_batch_rows=100)
+    buffer.start = MagicMock()
+    return buffer
+
+
+def test_record_row_leaves_out_unset_defaults():
+    record = AgentTestExecution(
+        id=uuid.uuid4(),
+        agent_id=uuid.uuid4(),
+        tenant_id="tenant-a",
+        payload={},
+        execution_trace={"steps": []},
+        token_usage={},
+        execution_time={"total_duration_ms": 5},
+        errors=None,
+        status="success",
+    )
+
+    row = record_row(record)
+
+    assert "created_at" not in row
+    assert row["errors"] is None
+    assert row["status"] == "success"
+
+
+@pytest.mark.asyncio
+class TestWriteRows:
+    """Tests for the grouped multi-row upserts."""
+
+    async def test_one_statement_per_tenant(self):
+        session = MagicMock(execute=AsyncMock())
+        rows = [_row(), _row(), _row(tenant_id="tenant-b")]
+
+        with patch.object(write_behind, "set_db_tenant_context", AsyncMock()) as set_context:
+            await write_rows(session, EnhancementHistory, rows)
+
+        assert [c.args[1] for c in set_context.await_args_list] == ["tenant-a", "tenant-b"]
+        assert session.execute.await_count == 2
+        sql = str(session.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "enhancement_history.status NOT IN" in sql
+
+
+@pytest.mark.asyncio
+class TestFlush:
+    """Tests for WriteBehindBuffer flushing."""
+
+    async def test_final_state_replaces_pending(self):
+        buffer = _buffer()
+        buffer._write = AsyncMock()
+        pending = _row()
+        buffer.put(EnhancementHistory, pending)
+        buffer.put(EnhancementHistory, {**pending, "status": "completed"})
+
+        assert await buffer._flush() is True
+
+        (rows,) = buffer._write.await_args.args[0].values()
+        assert [row["status"] for row in rows] == ["completed"]
+        assert buffer.pending_count == 0
+
+    async def test_unavailable_database_requeues_older_states_only(self):
+        buffer = _buffer()
+        first, second = _row(), _row()
+        buffer.put(EnhancementHistory, first)
+        buffer.put(EnhancementHistory, second)
+
+        async def failing_write(by_model):
+            # A newer state of the first row arrives during the flush
+            buffer.put(EnhancementHistory, {**first, "status": "completed"})
+            raise ConnectionError("database down")
+
+        buffer._write = failing_write
+        assert await buffer._flush() is False
+
+        pending = {key[1]: row["status"] for key, row in buffer._pending.items()}
+        assert pending == {first["id"]: "completed", second["id"]: "pending"}
+
+    async def test_rejected_row_dropped(self):
+        buffer = _buffer()
+        valid, invalid = _row(), _row(tenant_id="unknown")
+        buffer.put(EnhancementHistory, valid)
+        buffer.put(EnhancementHistory, invalid)
+        written = []
+
+        async def write(by_model):
+            rows = by_model[EnhancementHistory]
+            if any(row["tenant_id"] == "unknown" for row in rows):
+                raise ValueError("violates foreign key constraint")
+            written.extend(rows)
+
+        buffer._write = write
+        assert await buffer._flush() is True
+
+        assert written == [valid]
+        assert buffer.pending_count == 0
+
+
+def test_close_flushes_pending_rows():
+    buffer = WriteBehindBuffer(flush_interval_seconds=60, max_batch_rows=100)
+    written = []
+
+    async def write(by_model):
+        written.extend(by_model[EnhancementHistory])
+
+    buffer._write = write
+    row = _row(status="completed")
+    buffer.put(EnhancementHistory, row)
+    buffer.close(timeout=5)
+
+    assert written == [row]
+    assert not buffer._thread.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_disabled_writes_synchronously():
+    session = MagicMock(commit=AsyncMock())
+    row = _row()
+
+    with patch.object(write_behind.settings, "write_behind_enabled", False), patch.object(
+        write_behind, "write_rows", AsyncMock()
+    ) as write, patch.object(write_behind, "get_write_behind") as get_buffer:
+        await persist_row(EnhancementHistory, row, session)
+
+    write.assert_awaited_once_with(session, EnhancementHistory, [row])
+    session.commit.assert_awaited_once()
+    get_buffer.assert_not_called()